@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Run pipeline
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution. Stages are executed with the ArcGIS Pro Python installation, the Anaconda Python distribution, or R as declared for each stage.
+# Description: "Run pipeline" declares the inputs and outputs of the numbered workflow scripts as pipeline stages and runs them as a dependency graph. Independent branches such as topography, hydrography, and spectral metrics run in parallel within the core and memory budget because each arcpy stage writes scratch data to its own work geodatabase, and stages whose outputs are current with the content of their inputs are skipped. Data downloads and Google Earth Engine scripts are not included because their inputs are external.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+from package_GeospatialProcessing import define_stage
+from package_GeospatialProcessing import run_pipeline
+
+# Define interpreters
+arcgis_python = 'C:/Program Files/ArcGIS/Pro/bin/Python/envs/arcgispro-py3/python.exe'
+anaconda_python = sys.executable
+r_script = 'Rscript'
+
+# Define resource budget
+core_budget = os.cpu_count()
+memory_budget = 120
+
+# Define round and version
+round_date = 'round_20221219'
+version_number = 'v1_0'
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+repository_folder = os.path.split(os.path.dirname(os.path.abspath(__file__)))[0]
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+input_folder = os.path.join(project_folder, 'Data_Input')
+output_folder = os.path.join(project_folder, 'Data_Output')
+log_folder = os.path.join(output_folder, 'pipeline_logs', round_date)
+
+# Define shared datasets
+study_raster = os.path.join(input_folder, 'GMT2_StudyArea.tif')
+composite_folder = os.path.join(input_folder, 'imagery/composite')
+composite_bands = [os.path.join(composite_folder, 'processed', raster_name) for raster_name in
+                   ['GMT2_Comp_01_Blue.tif', 'GMT2_Comp_02_Green.tif', 'GMT2_Comp_03_Red.tif', 'GMT2_Comp_04_NearIR.tif']]
+composite_metrics = [os.path.join(composite_folder, 'processed', raster_name) for raster_name in
+                     ['GMT2_Comp_EVI2.tif', 'GMT2_Comp_NDVI.tif', 'GMT2_Comp_NDWI.tif']]
+maxar_metrics = [os.path.join(input_folder, 'imagery/maxar/processed', raster_name) for raster_name in
+                 ['GMT2_Maxar_NDVI.tif', 'GMT2_Maxar_NDWI.tif']]
+elevation_float = os.path.join(input_folder, 'topography/float/Elevation.tif')
+topography_folder = os.path.join(input_folder, 'topography/integer')
+hydrography_folder = os.path.join(input_folder, 'hydrography/processed')
+stream_rasters = [os.path.join(hydrography_folder, 'Streams.tif'),
+                  os.path.join(hydrography_folder, 'Stream_Distance.tif')]
+estuary_raster = os.path.join(hydrography_folder, 'Estuary_Distance.tif')
+infrastructure_rasters = [os.path.join(input_folder, 'infrastructure/Infrastructure_Developed.tif'),
+                          os.path.join(input_folder, 'infrastructure/Infrastructure_Pipelines.tif')]
+validation_raster = os.path.join(input_folder, 'validation/GMT2_ValidationGroups.tif')
+sampling_raster = os.path.join(input_folder, 'validation/MODIS_SamplingGrid_500m.tif')
+sampling_table = os.path.join(input_folder, 'validation/MODIS_SamplingGrid_500m_Points.csv')
+grid_folder = os.path.join(input_folder, 'imagery/segments/gridded')
+zonal_table_folder = os.path.join(input_folder, 'training_data/table_zonal')
+covariate_table_folder = os.path.join(input_folder, 'training_data/table_revised')
+training_raster = os.path.join(input_folder, 'training_data/processed/Training_SurficialFeatures.tif')
+response_table_folder = os.path.join(input_folder, 'training_data/table_training')
+surficial_model_folder = os.path.join(output_folder, 'model_results', round_date, 'surficial_features')
+predicted_folder = os.path.join(output_folder, 'predicted_tables', round_date)
+predicted_raster_folder = os.path.join(output_folder, 'predicted_rasters', round_date)
+merged_folder = os.path.join(output_folder, 'output_rasters', round_date)
+package_folder = os.path.join(output_folder, 'data_package', version_number)
+
+# Define a function to locate a workflow script
+def script(relative_path):
+    return os.path.join(repository_folder, relative_path)
+
+# Define a function to locate the work geodatabase that an arcpy stage uses as scratch space
+def workspace(stage_name):
+    return os.path.join(project_folder, 'Workspace', stage_name, 'GMT2_Workspace.gdb')
+
+#### DEFINE PIPELINE STAGES
+
+# Define reflectance, topography, hydrography, and ancillary stages
+stage_list = [
+    define_stage('01_composite_bands',
+                 [arcgis_python, script('01_data_reflectance/06_Convert_CompositeToSingleBand.py')],
+                 [study_raster, os.path.join(composite_folder, 'GMT2_Composite_AKALB.tif')],
+                 composite_bands, cores=2, memory=16, duration=2,
+                 workspace_list=[workspace('composite_bands')]),
+    define_stage('01_composite_metrics',
+                 [arcgis_python, script('01_data_reflectance/07_Calculate_SpectralMetrics_Composite.py')],
+                 [study_raster] + composite_bands,
+                 composite_metrics, cores=4, memory=16, duration=2),
+    define_stage('01_maxar_metrics',
+                 [arcgis_python, script('01_data_reflectance/07_Calculate_SpectralMetrics_Maxar.py')],
+                 [os.path.join(input_folder, 'imagery/maxar/composite/GMT2_MaxarComposite_WGS84.tif')],
+                 maxar_metrics, cores=2, memory=32, duration=4,
+                 workspace_list=[workspace('maxar_metrics')]),
+    define_stage('02_topography',
+                 [arcgis_python, script('02_data_topography/03_Calculate_Topography.py')],
+                 [study_raster, elevation_float],
+                 [topography_folder], cores=4, memory=48, duration=8),
+    define_stage('03_streams',
+                 [arcgis_python, script('03_data_hydrography/05_Convert_Streams.py')],
+                 [study_raster],
+                 stream_rasters, cores=2, memory=16, duration=2,
+                 workspace_list=[workspace('streams')]),
+    define_stage('03_estuary_distance',
+                 [arcgis_python, script('03_data_hydrography/06_Convert_EstuaryDistance.py')],
+                 [study_raster],
+                 [estuary_raster], cores=2, memory=16, duration=2,
+                 workspace_list=[workspace('estuary_distance')]),
+    define_stage('04_infrastructure',
+                 [arcgis_python, script('04_data_ancillary/01_Convert_Infrastructure.py')],
+                 [study_raster],
+                 infrastructure_rasters[:1], cores=1, memory=8, duration=1,
+                 workspace_list=[workspace('infrastructure')]),
+    define_stage('04_pipelines',
+                 [arcgis_python, script('04_data_ancillary/02_Convert_Pipelines.py')],
+                 [study_raster],
+                 infrastructure_rasters[1:], cores=1, memory=8, duration=1,
+                 workspace_list=[workspace('pipelines')]),
+    define_stage('06_sampling_grid',
+                 [anaconda_python, script('06_data_partitions/04_SampleGrid_500m.py')],
+                 [study_raster],
+                 [sampling_raster, sampling_table], cores=1, memory=8, duration=1)
+]
+
+# Define segment covariate and surficial feature stages
+stage_list += [
+    define_stage('07_segment_covariates',
+                 [arcgis_python, script('07_data_zonal/04_Extract_SegmentCovariates.py')],
+                 [grid_folder, topography_folder, os.path.join(input_folder, 'imagery/sentinel-1/growing_season'),
+                  os.path.join(input_folder, 'imagery/sentinel-2/growing_season'),
+                  os.path.join(merged_folder, 'surface_water'), os.path.join(input_folder, 'vegetation/foliar_cover')]
+                 + composite_bands + composite_metrics + maxar_metrics + stream_rasters + [estuary_raster]
+                 + infrastructure_rasters,
+                 [zonal_table_folder], cores=core_budget, memory=64, duration=4,
+                 workspace_list=[workspace('segment_covariates')]),
+    define_stage('08_extract_covariates',
+                 [r_script, script('08_data_surficialfeatures/02_ExtractCovariates.R')],
+                 [grid_folder, zonal_table_folder],
+                 [covariate_table_folder], cores=1, memory=16, duration=1),
+    define_stage('08_training_raster',
+                 [arcgis_python, script('08_data_surficialfeatures/01_Create_TrainingRaster.py')],
+                 [study_raster],
+                 [training_raster], cores=1, memory=8, duration=1,
+                 workspace_list=[workspace('training_raster')]),
+    define_stage('08_extract_response',
+                 [r_script, script('08_data_surficialfeatures/03_ExtractResponse.R')],
+                 [validation_raster, training_raster],
+                 [response_table_folder], cores=1, memory=16, duration=2),
+    define_stage('09_train_surficial_features',
+                 [anaconda_python, script('09_statistics_surficialfeatures/01_TrainTest_SurficialFeatures.py')],
+                 [study_raster, covariate_table_folder, response_table_folder],
+                 [surficial_model_folder], cores=4, memory=32, duration=6),
+    define_stage('09_predict_surficial_features',
+                 [anaconda_python, script('09_statistics_surficialfeatures/02_Predict_SurficialFeatures.py')],
+                 [covariate_table_folder, surficial_model_folder],
+                 [os.path.join(predicted_folder, 'surficial_features')], cores=4, memory=64, duration=6),
+    define_stage('10_rasterize_surficial_features',
+                 [r_script, script('10_postprocess_surficialfeatures/02_ConvertToRaster_SurficialFeatures.R')],
+                 [grid_folder, os.path.join(predicted_folder, 'surficial_features')],
+                 [os.path.join(predicted_raster_folder, 'surficial_features')], cores=1, memory=16, duration=4),
+    define_stage('10_merge_surficial_features',
+                 [r_script, script('10_postprocess_surficialfeatures/03_MergeRasters_SurficialFeatures.R')],
+                 [os.path.join(predicted_raster_folder, 'surficial_features')],
+                 [os.path.join(merged_folder, 'surficial_features/GMT2_SurficialFeatures.tif')],
+                 cores=1, memory=16, duration=2),
+    define_stage('10_postprocess_surficial_features',
+                 [arcgis_python, script('10_postprocess_surficialfeatures/04_PostProcess_SurficialFeatures.py')],
+                 [study_raster, os.path.join(merged_folder, 'surficial_features/GMT2_SurficialFeatures.tif')]
+                 + infrastructure_rasters + stream_rasters[:1],
+                 [os.path.join(package_folder, 'surficial_features')], cores=2, memory=32, duration=2,
+                 workspace_list=[workspace('postprocess_surficial_features')])
+]
+
+# Define vegetation type stages
+stage_list += [
+    define_stage('11_assign_vegetation_type',
+                 [anaconda_python, script('11_postprocess_vegetation/01_Assign_ExistingVegetationType.py')],
+                 [os.path.join(predicted_folder, 'surficial_features')],
+                 [os.path.join(predicted_folder, 'vegetation_type')], cores=1, memory=8, duration=1),
+    define_stage('11_rasterize_vegetation_type',
+                 [r_script, script('11_postprocess_vegetation/02_ConvertToRaster_ExistingVegetationType.R')],
+                 [grid_folder, os.path.join(predicted_folder, 'vegetation_type')],
+                 [os.path.join(predicted_raster_folder, 'vegetation_type')], cores=1, memory=16, duration=4),
+    define_stage('11_merge_vegetation_type',
+                 [r_script, script('11_postprocess_vegetation/03_MergeRasters_ExistingVegetationType.R')],
+                 [os.path.join(predicted_raster_folder, 'vegetation_type')],
+                 [os.path.join(merged_folder, 'vegetation_type/GMT2_ExistingVegetationType.tif')],
+                 cores=1, memory=16, duration=2),
+    define_stage('11_postprocess_vegetation_type',
+                 [arcgis_python, script('11_postprocess_vegetation/03_PostProcess_ExistingVegetationType.py')],
+                 [study_raster, os.path.join(merged_folder, 'vegetation_type/GMT2_ExistingVegetationType.tif')]
+                 + infrastructure_rasters + stream_rasters[:1],
+                 [os.path.join(package_folder, 'vegetation_type')], cores=2, memory=32, duration=2,
+                 workspace_list=[workspace('postprocess_vegetation_type')]),
+    define_stage('12_summarize_surface_water',
+                 [arcgis_python, script('12_postprocess_surfacewater/01_Summarize_SurfaceWater.py')],
+                 [study_raster, os.path.join(merged_folder, 'surface_water/GMT2_SeasonalWater_Percentage.tif'),
+                  os.path.join(merged_folder, 'surficial_features/GMT2_SurficialFeatures.tif')],
+                 [os.path.join(package_folder, 'surface_water')], cores=2, memory=32, duration=2,
+                 workspace_list=[workspace('summarize_surface_water')])
+]
+
+# Define vegetation dynamics stages
+stage_list += [
+    define_stage('13_correct_modis',
+                 [arcgis_python, script('13_data_vegetationdynamics/01_Correct_MODIS_NoData.py')],
+                 [sampling_raster, os.path.join(input_folder, 'imagery/modis_productivity/unprocessed'),
+                  os.path.join(input_folder, 'imagery/modis_phenology/unprocessed')],
+                 [os.path.join(input_folder, 'imagery/modis_productivity/processed'),
+                  os.path.join(input_folder, 'imagery/modis_phenology/processed')], cores=8, memory=32, duration=2,
+                 workspace_list=[workspace('correct_modis')]),
+    define_stage('13_dynamics_zonal',
+                 [arcgis_python, script('13_data_vegetationdynamics/02_Calculate_ZonalMean.py')],
+                 [sampling_raster, validation_raster, estuary_raster, infrastructure_rasters[0],
+                  os.path.join(input_folder, 'vegetation/foliar_cover'),
+                  os.path.join(input_folder, 'imagery/modis_productivity/processed'),
+                  os.path.join(input_folder, 'imagery/modis_phenology/processed'),
+                  os.path.join(merged_folder, 'surficial_features/GMT2_SurficialFeatures.tif'),
+                  os.path.join(merged_folder, 'surface_water/GMT2_SeasonalWater_Percentage.tif')],
+                 [os.path.join(input_folder, 'vegetation_dynamics/zonal')], cores=1, memory=32, duration=4,
+                 workspace_list=[workspace('dynamics_zonal')]),
+    define_stage('13_dynamics_sample',
+                 [anaconda_python, script('13_data_vegetationdynamics/03_Sample_ZonalCovariates.py')],
+                 [sampling_raster, sampling_table, os.path.join(input_folder, 'vegetation_dynamics/zonal')],
+                 [os.path.join(input_folder, 'vegetation_dynamics/table/MODIS_SamplingGrid_Sampled.csv')],
+                 cores=1, memory=16, duration=1),
+    define_stage('13_dynamics_covariates',
+                 [r_script, script('13_data_vegetationdynamics/04_Format_Covariates.R')],
+                 [os.path.join(input_folder, 'vegetation_dynamics/table/MODIS_SamplingGrid_Sampled.csv')],
+                 [os.path.join(input_folder, 'vegetation_dynamics/table/MODIS_SamplingGrid_Extracted.csv')],
+                 cores=1, memory=16, duration=1)
+]
+for response, model_name in [('Greendown', 'phen_greendown'), ('Greenup', 'phen_greenup'),
+                             ('Maturity', 'phen_maturity'), ('NPP', 'productivity'),
+                             ('Senescence', 'phen_senescence')]:
+    model_folder = os.path.join(output_folder, 'model_results', round_date, model_name)
+    stage_list += [
+        define_stage(f'14_train_{model_name}',
+                     [anaconda_python, script(f'14_statistics_vegetationdynamics/01_TrainTest_{response}.py')],
+                     [study_raster, os.path.join(input_folder, 'vegetation_dynamics/table')],
+                     [model_folder], cores=4, memory=16, duration=3),
+        define_stage(f'14_predict_{model_name}',
+                     [anaconda_python, script(f'14_statistics_vegetationdynamics/02_Predict_{response}.py')],
+                     [os.path.join(predicted_folder, 'surficial_features'), model_folder],
+                     [os.path.join(predicted_folder, model_name)], cores=4, memory=16, duration=4),
+        define_stage(f'15_postprocess_{model_name}',
+                     [arcgis_python, script(f'15_postprocess_vegetationdynamics/03_PostProcess_{response}.py')],
+                     [study_raster, os.path.join(merged_folder, model_name), infrastructure_rasters[0],
+                      os.path.join(merged_folder, 'vegetation_type/GMT2_ExistingVegetationType.tif')],
+                     [os.path.join(package_folder, model_name)], cores=2, memory=32, duration=2,
+                     workspace_list=[workspace(f'postprocess_{model_name}')])
+    ]
+
+# Define single stages that rasterize, merge, and summarize all vegetation dynamics metrics
+dynamics_list = ['phen_greendown', 'phen_greenup', 'phen_maturity', 'productivity', 'phen_senescence']
+stage_list += [
+    define_stage('15_rasterize_dynamics',
+                 [anaconda_python, script('15_postprocess_vegetationdynamics/01_ConvertToRaster_Dynamics.py')],
+                 [grid_folder] + [os.path.join(predicted_folder, model_name) for model_name in dynamics_list],
+                 [os.path.join(predicted_raster_folder, model_name) for model_name in dynamics_list],
+                 cores=core_budget, memory=64, duration=2),
+    define_stage('15_merge_dynamics',
+                 [anaconda_python, script('15_postprocess_vegetationdynamics/02_Merge_TimeSeries.py')],
+                 [study_raster] + [os.path.join(predicted_raster_folder, model_name) for model_name in dynamics_list],
+                 [os.path.join(merged_folder, model_name) for model_name in dynamics_list],
+                 cores=5, memory=40, duration=1),
+    define_stage('15_summarize_dynamics',
+                 [anaconda_python, script('15_postprocess_vegetationdynamics/04_Summarize_TimeSeries.py')],
+                 [os.path.join(merged_folder, model_name) for model_name in dynamics_list],
+                 [os.path.join(merged_folder, 'dynamics_trends')],
+                 cores=core_budget, memory=32, duration=2)
+]
+
+#### RUN PIPELINE
+
+# Run the selected stages, where stage names passed as arguments limit the run to those targets and their upstream stages
+if __name__ == '__main__':
+    target_list = sys.argv[1:] if len(sys.argv) > 1 else None
+    run_pipeline(stage_list, log_folder, cores=core_budget, memory=memory_budget, target_list=target_list)
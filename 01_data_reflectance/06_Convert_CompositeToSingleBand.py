@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Convert multi-band raster to single-band rasters
 # Author: Timm Nawrocki
-# Last Updated: 2022-11-30
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Convert multi-band raster to single-band rasters" converts a multi-band raster to single band rasters.
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@
 # Import packages
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import parse_raster_band
 
 # Set root directory
@@ -22,7 +23,10 @@ composite_folder = os.path.join(project_folder, 'Data_Input/imagery/composite')
 processed_folder = os.path.join(project_folder, 'Data_Input/imagery/composite/processed')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/composite_bands/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
@@ -2,16 +2,16 @@
 # ---------------------------------------------------------------------------
 # Calculate spectral metrics for composite imagery
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-06
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate spectral metrics" calculates enhanced vegetation index-2, normalized difference vegetation index, and normalized difference water index for the reprojected composite imagery.
+# Description: "Calculate spectral metrics" calculates enhanced vegetation index-2, normalized difference vegetation index, and normalized difference water index for the reprojected composite imagery in a single pass over the bands.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import normalized_metrics
+from package_GeospatialProcessing import calculate_spectral_metrics
 
 # Set root directory
 drive = 'N:/'
@@ -21,9 +21,6 @@ root_folder = 'ACCS_Work'
 project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
 processed_folder = os.path.join(project_folder, 'Data_Input/imagery/composite/processed')
 
-# Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
 blue_raster = os.path.join(processed_folder, 'GMT2_Comp_01_Blue.tif')
@@ -39,59 +36,33 @@ ndwi_raster = os.path.join(processed_folder, 'GMT2_Comp_NDWI.tif')
 # Define conversion factor
 conversion_factor = 1000000
 
-#### CALCULATE EVI-2
-if arcpy.Exists(evi2_raster) == 0:
-    # Create key word arguments
-    kwargs_evi2 = {'metric_type': 'EVI2',
-                   'conversion_factor': conversion_factor,
-                   'work_geodatabase': work_geodatabase,
-                   'input_array': [study_raster, red_raster, green_raster],
-                   'output_array': [evi2_raster]
-                   }
-
-    # Calculate metric
-    print(f'Calculate EVI2...')
-    arcpy_geoprocessing(normalized_metrics, **kwargs_evi2)
-    print('----------')
-
-else:
-    print(f'EVI2 raster already exists.')
-    print('----------')
-
-#### CALCULATE NDVI
-if arcpy.Exists(ndvi_raster) == 0:
-    # Create key word arguments
-    kwargs_ndvi = {'metric_type': 'NORMALIZED',
-                   'conversion_factor': conversion_factor,
-                   'work_geodatabase': work_geodatabase,
-                   'input_array': [study_raster, nearir_raster, red_raster],
-                   'output_array': [ndvi_raster]
-                   }
-
-    # Calculate metric
-    print(f'Calculate NDVI...')
-    arcpy_geoprocessing(normalized_metrics, **kwargs_ndvi)
-    print('----------')
-
-else:
-    print(f'NDVI raster already exists.')
-    print('----------')
-
-#### CALCULATE NDWI
-if arcpy.Exists(ndwi_raster) == 0:
+# Define metrics as type, additive raster, and subtractive raster
+metric_dictionary = {evi2_raster: ('EVI2', red_raster, green_raster),
+                     ndvi_raster: ('NORMALIZED', nearir_raster, red_raster),
+                     ndwi_raster: ('NORMALIZED', green_raster, nearir_raster)}
+
+#### CALCULATE SPECTRAL METRICS
+
+# Identify metrics that do not exist
+output_list = []
+metric_list = []
+for output_raster, metric in metric_dictionary.items():
+    if arcpy.Exists(output_raster) == 0:
+        output_list.append(output_raster)
+        metric_list.append(metric)
+    else:
+        print(f'{os.path.split(output_raster)[1]} already exists.')
+        print('----------')
+
+if len(metric_list) > 0:
     # Create key word arguments
-    kwargs_ndwi = {'metric_type': 'NORMALIZED',
-                   'conversion_factor': conversion_factor,
-                   'work_geodatabase': work_geodatabase,
-                   'input_array': [study_raster, green_raster, nearir_raster],
-                   'output_array': [ndwi_raster]
-                   }
-
-    # Calculate metric
-    print(f'Calculate NDWI...')
-    arcpy_geoprocessing(normalized_metrics, **kwargs_ndwi)
-    print('----------')
-
-else:
-    print(f'NDWI raster already exists.')
+    kwargs_metrics = {'metric_list': metric_list,
+                      'conversion_factor': conversion_factor,
+                      'input_array': [study_raster, green_raster, red_raster, nearir_raster],
+                      'output_array': output_list
+                      }
+
+    # Calculate metrics
+    print(f'Calculate spectral metrics...')
+    arcpy_geoprocessing(calculate_spectral_metrics, **kwargs_metrics)
     print('----------')
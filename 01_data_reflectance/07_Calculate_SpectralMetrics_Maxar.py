@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Calculate spectral metrics for Maxar imagery
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-06
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate spectral metrics" calculates normalized difference vegetation index, and normalized difference water index for the original resolution Maxar composite.
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@
 import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import normalized_metrics
 
 # Set root directory
@@ -23,7 +24,10 @@ imagery_folder = os.path.join(project_folder, 'Data_Input/imagery/maxar')
 processed_folder = os.path.join(imagery_folder, 'processed')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/maxar_metrics/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(imagery_folder, 'composite/GMT2_MaxarComposite_WGS84.tif')
@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Download USGS 3DEP 5m Tiles
 # Author: Timm Nawrocki
-# Last Updated: 2022-02-20
-# Usage: Can be executed in an Anaconda Python 3.7 distribution or an ArcGIS Pro Python 3.6 distribution.
-# Description: "Download USGS 3DEP 5m Tiles" contacts a server to download a series of files specified in a csv table. The full url to the resources must be specified in the table. The table can be generated from The National Map Viewer web application.
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an Anaconda Python 3.8+ distribution or an ArcGIS Pro Python 3.7+ distribution with Requests installed.
+# Description: "Download USGS 3DEP 5m Tiles" contacts a server to download a series of files specified in a csv table. The full url to the resources must be specified in the table. The table can be generated from The National Map Viewer web application. Tiles are downloaded over several concurrent connections and interrupted downloads resume when the script is run again.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -23,5 +23,8 @@ directory = os.path.join(data_folder, 'tiles')
 input_table = os.path.join(data_folder, 'USGS_3DEP_5m_20220220.csv')
 url_column = 'url'
 
+# Define number of tiles downloaded at the same time
+worker_number = 8
+
 # Download files
-download_from_csv(input_table, url_column, directory)
+download_from_csv(input_table, url_column, directory, workers=worker_number)
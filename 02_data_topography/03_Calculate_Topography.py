@@ -2,14 +2,14 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic properties
 # Author: Timm Nawrocki
-# Last Updated: 2022-02-20
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Calculate topographic properties" calculates integer versions of ten topographic indices for each grid using elevation float rasters.
+# Description: "Calculate topographic properties" calculates integer versions of ten topographic indices for each grid using elevation float rasters. Outputs are reused only if the elevation content, function, and parameters are unchanged.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import os
-from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import cache_geoprocessing
 from package_GeospatialProcessing import calculate_topographic_properties
 
 # Set root directory
@@ -21,9 +21,6 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BL
 input_folder = os.path.join(project_folder, 'Data_Input/topography/float')
 output_folder = os.path.join(project_folder, 'Data_Input/topography/integer')
 
-# Define work geodatabase
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-
 # Define input datasets
 gmt2_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
 elevation_float = os.path.join(input_folder, 'Elevation.tif')
@@ -41,9 +38,15 @@ surfacearea_output = os.path.join(output_folder, 'SurfaceArea.tif')
 surfacerelief_output = os.path.join(output_folder, 'SurfaceRelief.tif')
 wetness_output = os.path.join(output_folder, 'Wetness.tif')
 
+# Define intermediate datasets that are reused if they exist
+intermediate_list = [os.path.join(input_folder, 'Flow_Accumulation.tif'),
+                     os.path.join(input_folder, 'Slope.tif'),
+                     os.path.join(input_folder, 'Aspect.tif')]
+
 # Create key word arguments
 kwargs_topography = {'z_unit': 'METER',
                      'position_width': 5000,
+                     'fused': True,
                      'input_array': [gmt2_raster, elevation_float],
                      'output_array': [elevation_integer,
                                       slope_integer,
@@ -60,5 +63,5 @@ kwargs_topography = {'z_unit': 'METER',
 
 # Process the topographic calculations
 print(f'Processing topography...')
-arcpy_geoprocessing(calculate_topographic_properties, **kwargs_topography, check_output=False)
+cache_geoprocessing(calculate_topographic_properties, intermediate_list=intermediate_list, **kwargs_topography)
 print('----------')
@@ -35,6 +35,7 @@ stream_feature = os.path.join(work_geodatabase, 'GMT2_Streams_DEM')
 # Create key word arguments
 kwargs_flow = {'threshold': 20000,
                'fill_value': 5,
+               'native': True,
                'work_geodatabase': work_geodatabase,
                'input_array': [gmt2_feature, elevation_raster],
                'output_array': [river_feature, stream_feature]
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Convert pipelines to raster
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-08
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Convert pipelines to raster" creates a pipelines raster from a manually-delineated or pre-existing feature class source.
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import convert_to_binary_raster
+from package_GeospatialProcessing import create_work_geodatabase
 
 # Set root directory
 drive = 'N:/'
@@ -20,12 +21,16 @@ root_folder = 'ACCS_Work'
 project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
 infrastructure_folder = os.path.join(project_folder, 'Data_Input/infrastructure')
 
-# Define work geodatabase
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+# Define geodatabases
+project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/pipelines/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
-input_feature = os.path.join(work_geodatabase, 'Infrastructure_Pipelines')
+input_feature = os.path.join(project_geodatabase, 'Infrastructure_Pipelines')
 
 # Define output dataset
 output_raster = os.path.join(infrastructure_folder, 'Infrastructure_Pipelines.tif')
@@ -2,17 +2,20 @@
 # ---------------------------------------------------------------------------
 # Create cross-validation grid
 # Author: Timm Nawrocki
-# Last Updated: 2022-11-30
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Create cross-validation grid" creates a validation grid index from a manually-generated study area polygon.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
+# Description: "Create cross-validation grid" creates a validation grid index from a manually-generated study area polygon. The validation group raster is calculated directly from cell coordinates on the study area grid. Refined image segments are partitioned to the validation grids in a single pass and the segments of each grid are written in parallel worker processes that each use a separate work geodatabase, where grids with existing outputs are skipped. The segments of each grid are then copied to the gridded segments geodatabase in a single process.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
 from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import parse_image_segments
 from package_GeospatialProcessing import create_grid_index
-from package_GeospatialProcessing import convert_validation_grid
+from package_GeospatialProcessing import create_validation_raster
+from package_GeospatialProcessing import create_work_geodatabase
+from package_GeospatialProcessing import execute_grids
+from package_GeospatialProcessing import partition_image_segments
+from package_GeospatialProcessing import write_segment_grid
 import os
 
 # Set root directory
@@ -36,51 +39,119 @@ segments_polygon = os.path.join(work_geodatabase, 'GMT2_Segments_Final_Polygon')
 validation_grid = os.path.join(work_geodatabase, 'GMT2_GridIndex_Validation_10km')
 validation_raster = os.path.join(project_folder, 'Data_Input/validation/GMT2_ValidationGroups.tif')
 grid_folder = os.path.join(project_folder, 'Data_Input/imagery/segments/gridded')
+log_folder = os.path.join(project_folder, 'Data_Output/grid_logs/parse_segments')
+workspace_folder = os.path.join(project_folder, 'Workspace/parse_segments')
 
-#### GENERATE VALIDATION GRID INDEX
+# Define partitioned segment datasets
+point_partition = os.path.join(segments_geodatabase, 'points_partitioned')
+polygon_partition = os.path.join(segments_geodatabase, 'polygons_partitioned')
 
-# Create key word arguments for the validation grid index
-validation_kwargs = {'distance': '10 Kilometers',
-                     'grid_field': 'grid_validation',
-                     'work_geodatabase': work_geodatabase,
-                     'input_array': [study_feature],
-                     'output_array': [validation_grid]
+# Define worker resources
+worker_number = 8
+worker_memory = 8
+
+# Define grids
+grid_list = ['A4', 'A5', 'A6', 'A7',
+             'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7',
+             'C1', 'C2', 'C3', 'C4', 'C5', 'C6',
+             'D1', 'D2', 'D3', 'D4', 'D5',
+             'E1', 'E2', 'E3', 'E4', 'E5']
+
+# Define a function to write the segments of a grid in a separate work geodatabase
+def write_grid(**kwargs):
+    work_geodatabase = create_work_geodatabase(os.path.split(kwargs['output_array'][0])[0])
+    return write_segment_grid(work_geodatabase=work_geodatabase, **kwargs)
+
+# Create validation grids and parse segments for the grids in parallel worker processes
+if __name__ == '__main__':
+    #### GENERATE VALIDATION GRID INDEX
+
+    # Create key word arguments for the validation grid index
+    validation_kwargs = {'distance': '10 Kilometers',
+                         'grid_field': 'grid_validation',
+                         'work_geodatabase': work_geodatabase,
+                         'input_array': [study_feature],
+                         'output_array': [validation_grid]
+                         }
+
+    # Create the validation grid index
+    if arcpy.Exists(validation_grid) == 0:
+        print('Creating validation grid index...')
+        arcpy_geoprocessing(create_grid_index, **validation_kwargs)
+        print('----------')
+    else:
+        print('Validation grid index already exists.')
+        print('----------')
+
+    #### CREATE VALIDATION GROUP RASTER
+
+    # Create key word arguments for validation raster
+    raster_kwargs = {'distance': 10000,
+                     'input_array': [study_raster],
+                     'output_array': [validation_raster]
                      }
 
-# Create the validation grid index
-if arcpy.Exists(validation_grid) == 0:
-    print('Creating validation grid index...')
-    arcpy_geoprocessing(create_grid_index, **validation_kwargs)
-    print('----------')
-else:
-    print('Validation grid index already exists.')
-    print('----------')
+    # Generate validation group raster
+    if os.path.exists(validation_raster) == 0:
+        print('Creating validation group raster...')
+        print(create_validation_raster(**raster_kwargs))
+        print('----------')
+    else:
+        print('Validation raster already exists.')
+        print('----------')
 
-#### CONVERT VALIDATION GRIDS TO RASTERS
+    #### PARSE REFINED IMAGE SEGMENTS FOR VALIDATION GRIDS
 
-# Create key word arguments for validation raster
-raster_kwargs = {'work_geodatabase': work_geodatabase,
-                 'input_array': [validation_grid, study_feature, study_raster],
-                 'output_array': [validation_raster]
-                 }
+    # Create key word arguments for the segment partition
+    partition_kwargs = {'tile_name': 'grid_validation',
+                        'work_geodatabase': segments_geodatabase,
+                        'input_array': [validation_grid, segments_point, segments_polygon],
+                        'output_array': [point_partition, polygon_partition]
+                        }
 
-# Generate validation group raster
-if arcpy.Exists(validation_raster) == 0:
-    print('Converting validation grids to raster...')
-    arcpy_geoprocessing(convert_validation_grid, **raster_kwargs)
-    print('----------')
-else:
-    print('Validation raster already exists.')
-    print('----------')
+    # Make workspace folder if it does not already exist
+    if os.path.exists(workspace_folder) == 0:
+        os.makedirs(workspace_folder)
 
-#### PARSE REFINED IMAGE SEGMENTS FOR VALIDATION GRIDS
+    # Create key word arguments for each grid, where each grid writes its features to a separate work geodatabase
+    grid_dictionary = dict()
+    for grid in grid_list:
+        grid_geodatabase = os.path.join(workspace_folder, f'GMT2_Workspace_{grid}.gdb')
+        grid_dictionary[grid] = {'grid_name': grid,
+                                 'input_array': [study_raster, point_partition, polygon_partition],
+                                 'output_array': [os.path.join(grid_geodatabase, 'points_' + grid),
+                                                  os.path.join(grid_geodatabase, 'polygons_' + grid),
+                                                  os.path.join(grid_folder, grid + '.tif')]
+                                 }
 
-parse_kwargs = {'tile_name': 'grid_validation',
-                'work_geodatabase': segments_geodatabase,
-                'input_array': [study_raster, validation_grid, segments_point, segments_polygon],
-                'output_folder': grid_folder
-                }
+    # Partition segments to grids in a single pass
+    if arcpy.Exists(point_partition) == 0 or arcpy.Exists(polygon_partition) == 0:
+        print('Partitioning refined image segments to validation grids...')
+        arcpy_geoprocessing(partition_image_segments, **partition_kwargs)
+        print('----------')
+    else:
+        print('Partitioned image segments already exist.')
+        print('----------')
 
-# Create buffered tiles for the major grid
-arcpy_geoprocessing(parse_image_segments, check_output=False, **parse_kwargs)
-print('----------')
+    # Write segments for grids without existing outputs
+    print(f'Writing image segments for {len(grid_list)} grids...')
+    status_dictionary = execute_grids(write_grid,
+                                      grid_dictionary,
+                                      log_folder,
+                                      workers=worker_number,
+                                      memory_limit=worker_memory,
+                                      retry_count=1)
+    failure_list = [grid for grid, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Parsing segments failed for grids {", ".join(failure_list)}.')
+        quit(1)
+    print('----------')
+
+    # Copy the segments of each grid to the gridded segments geodatabase in a single process
+    print(f'Copying image segments for {len(grid_list)} grids to {os.path.split(segments_geodatabase)[1]}...')
+    for grid in grid_list:
+        for work_features in grid_dictionary[grid]['output_array'][0:2]:
+            output_features = os.path.join(segments_geodatabase, os.path.split(work_features)[1])
+            if arcpy.Exists(output_features) == 0:
+                arcpy.management.Copy(work_features, output_features)
+    print('----------')
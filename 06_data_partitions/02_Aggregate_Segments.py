@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Aggregate segments
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-12
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Aggregate segments" merges adjacent image segments that are within 0.05 threshold of NDVI and NDWI.
+# Description: "Aggregate segments" merges adjacent image segments that are within 0.05 threshold of NDVI and NDWI. Grids are aggregated in parallel worker processes that each use a separate work geodatabase, and grids with existing outputs are skipped.
 # ---------------------------------------------------------------------------
 
 # Import packages
@@ -12,6 +12,7 @@ import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import aggregate_segments
+from package_GeospatialProcessing import execute_grids
 
 # Set root directory
 drive = 'N:/'
@@ -22,15 +23,20 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BL
 imagery_folder = os.path.join(project_folder, 'Data_Input/imagery')
 grid_folder = os.path.join(imagery_folder, 'segments/gridded')
 aggregate_folder = os.path.join(imagery_folder, 'segments/aggregated')
+workspace_folder = os.path.join(project_folder, 'Workspace/aggregate_segments')
+log_folder = os.path.join(project_folder, 'Data_Output/grid_logs/aggregate_segments')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
 segments_geodatabase = os.path.join(project_folder, 'GMT2_Segments_Aggregated.gdb')
 
 # Define input datasets
 ndvi_raster = os.path.join(imagery_folder, 'sentinel-2/growing_season/sent2_07_ndvi.tif')
 ndwi_raster = os.path.join(imagery_folder, 'sentinel-2/growing_season/sent2_07_ndwi.tif')
 
+# Define worker resources
+worker_number = 8
+worker_memory = 24
+
 # Define grids
 grid_list = ['A4', 'A5', 'A6', 'A7',
              'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7',
@@ -38,36 +44,44 @@ grid_list = ['A4', 'A5', 'A6', 'A7',
              'D1', 'D2', 'D3', 'D4', 'D5',
              'E1', 'E2', 'E3', 'E4', 'E5']
 
-# Loop through each grid in grid list and produce zonal summaries
-for grid in grid_list:
-    print(f'Aggregating segments for grid {grid}...')
-
-    # Define input grid raster
-    grid_input = os.path.join(grid_folder, grid + '.tif')
-
-    # Define output grid raster
-    grid_output = os.path.join(aggregate_folder, grid + '.tif')
-
-    # Define feature outputs
-    grid_polygon = os.path.join(segments_geodatabase, 'polygon_' + grid)
-    grid_point = os.path.join(segments_geodatabase, 'points_' + grid)
+# Define a function to aggregate segments for a grid in a separate work geodatabase
+def aggregate_grid(**kwargs):
+    grid = os.path.splitext(os.path.split(kwargs['input_array'][0])[1])[0]
+    work_geodatabase = os.path.join(workspace_folder, f'GMT2_Workspace_{grid}.gdb')
+    if arcpy.Exists(work_geodatabase) == 0:
+        arcpy.management.CreateFileGDB(workspace_folder, f'GMT2_Workspace_{grid}.gdb')
+    arcpy_geoprocessing(aggregate_segments, work_geodatabase=work_geodatabase, **kwargs)
+    return f'Successfully aggregated segments for {grid}.'
 
-    # Create zonal summary if output raster does not already exist
-    if arcpy.Exists(grid_output) == 0:
-        # Create key word arguments
-        kwargs_aggregate = {'threshold': 0.5,
-                            'zone_field': 'VALUE',
-                            'work_geodatabase': work_geodatabase,
-                            'input_array': [grid_input, ndvi_raster, ndwi_raster],
-                            'output_array': [grid_polygon, grid_point, grid_output]
-                            }
+# Aggregate segments for the grids in parallel worker processes
+if __name__ == '__main__':
+    # Make workspace folder if it does not already exist
+    if os.path.exists(workspace_folder) == 0:
+        os.makedirs(workspace_folder)
 
-        # Process the zonal summaries
-        print(f'\tAggregating segments for {grid}...')
-        arcpy_geoprocessing(aggregate_segments, **kwargs_aggregate)
-        print('\t----------')
+    # Create key word arguments for each grid
+    grid_dictionary = dict()
+    for grid in grid_list:
+        grid_input = os.path.join(grid_folder, grid + '.tif')
+        grid_output = os.path.join(aggregate_folder, grid + '.tif')
+        grid_polygon = os.path.join(segments_geodatabase, 'polygon_' + grid)
+        grid_point = os.path.join(segments_geodatabase, 'points_' + grid)
+        grid_dictionary[grid] = {'threshold': 0.5,
+                                 'zone_field': 'VALUE',
+                                 'input_array': [grid_input, ndvi_raster, ndwi_raster],
+                                 'output_array': [grid_polygon, grid_point, grid_output]
+                                 }
 
-    # If raster already exists, print message
-    else:
-        print(f'\tAggregated segments for {grid} already exist.')
-        print('\t----------')
+    # Aggregate segments for grids without existing outputs
+    print(f'Aggregating segments for {len(grid_list)} grids...')
+    status_dictionary = execute_grids(aggregate_grid,
+                                      grid_dictionary,
+                                      log_folder,
+                                      workers=worker_number,
+                                      memory_limit=worker_memory,
+                                      retry_count=1)
+    failure_list = [grid for grid, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Aggregation failed for grids {", ".join(failure_list)}.')
+        quit(1)
+    print('----------')
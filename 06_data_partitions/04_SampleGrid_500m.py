@@ -2,14 +2,13 @@
 # ---------------------------------------------------------------------------
 # Create 500 m sampling grid and points
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-14
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Create 500 m sampling grid and points" creates a 500 m sampling grid for processing MODIS-derived 500 m data.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Create 500 m sampling grid and points" creates a 500 m sampling grid for processing MODIS-derived 500 m data. Point identifiers and cell center coordinates are calculated directly from the grid and study area.
 # ---------------------------------------------------------------------------
 
 # Import packages
-from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import create_sampling_grid
+from package_GeospatialProcessing import create_native_sampling_grid
 import os
 
 # Set root directory
@@ -19,10 +18,6 @@ root_folder = os.path.join(drive, 'ACCS_Work')
 # Define folder structure
 project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
 
-# Define geodatabases
-project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
-
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
 snap_raster = os.path.join(project_folder, 'Data_Input/imagery/modis_phenology/unprocessed',
@@ -30,15 +25,14 @@ snap_raster = os.path.join(project_folder, 'Data_Input/imagery/modis_phenology/u
 
 # Define output grid datasets
 sampling_grid = os.path.join(project_folder, 'Data_Input/validation', 'MODIS_SamplingGrid_500m.tif')
-sampling_points = os.path.join(project_geodatabase, 'MODIS_SamplingGrid_500m_Points')
+sampling_points = os.path.join(project_folder, 'Data_Input/validation', 'MODIS_SamplingGrid_500m_Points.csv')
 
-# Create key word arguments for the validation grid index
-kwargs_sampling = {'work_geodatabase': work_geodatabase,
-                   'input_array': [study_raster, snap_raster],
+# Create key word arguments for the sampling grid
+kwargs_sampling = {'input_array': [study_raster, snap_raster],
                    'output_array': [sampling_grid, sampling_points]
                    }
 
-# Create the validation grid index
+# Create the sampling grid
 print('Creating 500 m sampling grid and points...')
-arcpy_geoprocessing(create_sampling_grid, **kwargs_sampling)
+print(create_native_sampling_grid(**kwargs_sampling))
 print('----------')
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Extract segment covariates to tables
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Extract segment covariates to tables" summarizes covariate rasters to the segments of each grid and writes one table per grid with a column for each covariate statistic. The covariate rasters are indexed under stable covariate names as a raster stack, and the zonal means, standard deviations, and ranges are accumulated directly from the stack so that intermediate zonal rasters are not written. Grids are processed in parallel worker processes, the covariates shared by all grids are hashed once before the workers start, and tables are recomputed only if the content of the segments or covariates has changed.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import arcpy
+import os
+from package_GeospatialProcessing import cache_geoprocessing
+from package_GeospatialProcessing import create_raster_stack
+from package_GeospatialProcessing import create_work_geodatabase
+from package_GeospatialProcessing import execute_grids
+from package_GeospatialProcessing import extract_segment_covariates
+from package_GeospatialProcessing import hash_input
+from package_GeospatialProcessing import list_stack_rasters
+from package_GeospatialProcessing import read_cache_manifest
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+grid_folder = os.path.join(project_folder, 'Data_Input/imagery/segments/gridded')
+topography_folder = os.path.join(project_folder, 'Data_Input/topography/integer')
+hydrography_folder = os.path.join(project_folder, 'Data_Input/hydrography/processed')
+sent1_folder = os.path.join(project_folder, 'Data_Input/imagery/sentinel-1/growing_season')
+sent2_folder = os.path.join(project_folder, 'Data_Input/imagery/sentinel-2/growing_season')
+water_folder = os.path.join(project_folder, 'Data_Output/output_rasters/round_20221219/surface_water')
+composite_folder = os.path.join(project_folder, 'Data_Input/imagery/composite/processed')
+maxar_folder = os.path.join(project_folder, 'Data_Input/imagery/maxar/processed')
+vegetation_folder = os.path.join(project_folder, 'Data_Input/vegetation/foliar_cover')
+infrastructure_folder = os.path.join(project_folder, 'Data_Input/infrastructure')
+table_folder = os.path.join(project_folder, 'Data_Input/training_data/table_zonal')
+log_folder = os.path.join(project_folder, 'Data_Output/grid_logs/extract_segment_covariates')
+
+# Define work geodatabase
+work_geodatabase = os.path.join(project_folder, 'Workspace/segment_covariates/GMT2_Workspace.gdb')
+
+# Define worker resources
+worker_number = os.cpu_count()
+worker_memory = 8
+
+# Define grids
+grid_list = ['A4', 'A5', 'A6', 'A7',
+             'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7',
+             'C1', 'C2', 'C3', 'C4', 'C5', 'C6',
+             'D1', 'D2', 'D3', 'D4', 'D5',
+             'E1', 'E2', 'E3', 'E4', 'E5']
+
+# Define covariate names for each raster
+name_dictionary = {'Aspect': 'top_aspect',
+                   'Elevation': 'top_elevation',
+                   'Exposure': 'top_exposure',
+                   'HeatLoad': 'top_heat_load',
+                   'Position': 'top_position',
+                   'Radiation': 'top_radiation',
+                   'Roughness': 'top_roughness',
+                   'Slope': 'top_slope',
+                   'SurfaceArea': 'top_surface_area',
+                   'SurfaceRelief': 'top_surface_relief',
+                   'Wetness': 'top_wetness',
+                   'River_Position': 'hyd_river_position',
+                   'Stream_Position': 'hyd_stream_position',
+                   'Streams': 'hyd_streams',
+                   'Stream_Distance': 'hyd_stream_dist',
+                   'GMT2_SeasonalWater_Percentage': 'hyd_seasonal_water',
+                   'Estuary_Distance': 'hyd_estuary_dist',
+                   'Infrastructure_Developed': 'inf_developed',
+                   'Infrastructure_Pipelines': 'inf_pipeline',
+                   'GMT2_Comp_01_Blue': 'comp_01_blue',
+                   'GMT2_Comp_02_Green': 'comp_02_green',
+                   'GMT2_Comp_03_Red': 'comp_03_red',
+                   'GMT2_Comp_04_NearIR': 'comp_04_nearir',
+                   'GMT2_Comp_EVI2': 'comp_evi2',
+                   'GMT2_Comp_NDVI': 'comp_ndvi',
+                   'GMT2_Comp_NDWI': 'comp_ndwi',
+                   'GMT2_Maxar_NDVI': 'maxar_ndvi',
+                   'GMT2_Maxar_NDWI': 'maxar_ndwi',
+                   'Sent1_vh': 's1_vh',
+                   'Sent1_vv': 's1_vv',
+                   'Sent2_06_2_blue': 's2_06_02_blue',
+                   'Sent2_06_3_green': 's2_06_03_green',
+                   'Sent2_06_4_red': 's2_06_04_red',
+                   'Sent2_06_5_redEdge1': 's2_06_05_rededge1',
+                   'Sent2_06_6_redEdge2': 's2_06_06_rededge2',
+                   'Sent2_06_7_redEdge3': 's2_06_07_rededge3',
+                   'Sent2_06_8_nearInfrared': 's2_06_08_nearir',
+                   'Sent2_06_8a_redEdge4': 's2_06_08a_rededge4',
+                   'Sent2_06_11_shortInfrared1': 's2_06_11_shortir1',
+                   'Sent2_06_12_shortInfrared2': 's2_06_12_shortir2',
+                   'Sent2_06_evi2': 's2_06_evi2',
+                   'Sent2_06_nbr': 's2_06_nbr',
+                   'Sent2_06_ndmi': 's2_06_ndmi',
+                   'Sent2_06_ndsi': 's2_06_ndsi',
+                   'Sent2_06_ndvi': 's2_06_ndvi',
+                   'Sent2_06_ndwi': 's2_06_ndwi',
+                   'Sent2_07_2_blue': 's2_07_02_blue',
+                   'Sent2_07_3_green': 's2_07_03_green',
+                   'Sent2_07_4_red': 's2_07_04_red',
+                   'Sent2_07_5_redEdge1': 's2_07_05_rededge1',
+                   'Sent2_07_6_redEdge2': 's2_07_06_rededge2',
+                   'Sent2_07_7_redEdge3': 's2_07_07_rededge3',
+                   'Sent2_07_8_nearInfrared': 's2_07_08_nearir',
+                   'Sent2_07_8a_redEdge4': 's2_07_08a_rededge4',
+                   'Sent2_07_11_shortInfrared1': 's2_07_11_shortir1',
+                   'Sent2_07_12_shortInfrared2': 's2_07_12_shortir2',
+                   'Sent2_07_evi2': 's2_07_evi2',
+                   'Sent2_07_nbr': 's2_07_nbr',
+                   'Sent2_07_ndmi': 's2_07_ndmi',
+                   'Sent2_07_ndsi': 's2_07_ndsi',
+                   'Sent2_07_ndvi': 's2_07_ndvi',
+                   'Sent2_07_ndwi': 's2_07_ndwi',
+                   'Sent2_08_2_blue': 's2_08_02_blue',
+                   'Sent2_08_3_green': 's2_08_03_green',
+                   'Sent2_08_4_red': 's2_08_04_red',
+                   'Sent2_08_5_redEdge1': 's2_08_05_rededge1',
+                   'Sent2_08_6_redEdge2': 's2_08_06_rededge2',
+                   'Sent2_08_7_redEdge3': 's2_08_07_rededge3',
+                   'Sent2_08_8_nearInfrared': 's2_08_08_nearir',
+                   'Sent2_08_8a_redEdge4': 's2_08_08a_rededge4',
+                   'Sent2_08_11_shortInfrared1': 's2_08_11_shortir1',
+                   'Sent2_08_12_shortInfrared2': 's2_08_12_shortir2',
+                   'Sent2_08_evi2': 's2_08_evi2',
+                   'Sent2_08_nbr': 's2_08_nbr',
+                   'Sent2_08_ndmi': 's2_08_ndmi',
+                   'Sent2_08_ndsi': 's2_08_ndsi',
+                   'Sent2_08_ndvi': 's2_08_ndvi',
+                   'Sent2_08_ndwi': 's2_08_ndwi',
+                   'Sent2_09_2_blue': 's2_09_02_blue',
+                   'Sent2_09_3_green': 's2_09_03_green',
+                   'Sent2_09_4_red': 's2_09_04_red',
+                   'Sent2_09_5_redEdge1': 's2_09_05_rededge1',
+                   'Sent2_09_6_redEdge2': 's2_09_06_rededge2',
+                   'Sent2_09_7_redEdge3': 's2_09_07_rededge3',
+                   'Sent2_09_8_nearInfrared': 's2_09_08_nearir',
+                   'Sent2_09_8a_redEdge4': 's2_09_08a_rededge4',
+                   'Sent2_09_11_shortInfrared1': 's2_09_11_shortir1',
+                   'Sent2_09_12_shortInfrared2': 's2_09_12_shortir2',
+                   'Sent2_09_evi2': 's2_09_evi2',
+                   'Sent2_09_nbr': 's2_09_nbr',
+                   'Sent2_09_ndmi': 's2_09_ndmi',
+                   'Sent2_09_ndsi': 's2_09_ndsi',
+                   'Sent2_09_ndvi': 's2_09_ndvi',
+                   'Sent2_09_ndwi': 's2_09_ndwi',
+                   'ABoVE_PFT_Top_Cover_Forb_2020': 'foliar_forb',
+                   'ABoVE_PFT_Top_Cover_Graminoid_2020': 'foliar_graminoid',
+                   'ABoVE_PFT_Top_Cover_tmLichenLight_2020': 'foliar_lichen',
+                   'NorthAmericanBeringia_alnus_A6': 'foliar_alnus',
+                   'NorthAmericanBeringia_betshr_A6': 'foliar_betshr',
+                   'NorthAmericanBeringia_dryas_A6': 'foliar_dryas',
+                   'NorthAmericanBeringia_empnig_A6': 'foliar_empnig',
+                   'NorthAmericanBeringia_erivag_A6': 'foliar_erivag',
+                   'NorthAmericanBeringia_rhoshr_A6': 'foliar_rhoshr',
+                   'NorthAmericanBeringia_salshr_A6': 'foliar_salshr',
+                   'NorthAmericanBeringia_sphagn_A6': 'foliar_sphagn',
+                   'NorthAmericanBeringia_vaculi_A6': 'foliar_vaculi',
+                   'NorthAmericanBeringia_vacvit_A6': 'foliar_vacvit',
+                   'NorthAmericanBeringia_wetsed_A6': 'foliar_wetsed'}
+
+# Define a function to extract segment covariates for a grid unless the output table is current with its inputs
+def extract_grid(**kwargs):
+    arcpy.env.workspace = work_geodatabase
+    return cache_geoprocessing(extract_segment_covariates, **kwargs)
+
+# Extract segment covariates for the grids in parallel worker processes
+if __name__ == '__main__':
+    # Create work geodatabase if it does not already exist
+    create_work_geodatabase(work_geodatabase)
+
+    # Create a raster stack of covariates under stable names and validate alignment once
+    mean_folders = [topography_folder, hydrography_folder, sent1_folder, sent2_folder, water_folder,
+                    composite_folder, vegetation_folder, infrastructure_folder]
+    mean_dictionary = list_stack_rasters(mean_folders, name_dictionary)
+    composite_dictionary = list_stack_rasters([composite_folder], name_dictionary)
+    maxar_dictionary = list_stack_rasters([maxar_folder], name_dictionary)
+    raster_stack = create_raster_stack({**mean_dictionary, **maxar_dictionary})
+
+    # Define the statistics to summarize for each covariate
+    statistic_dictionary = dict()
+    for covariate_name in mean_dictionary:
+        statistic_dictionary[covariate_name] = (covariate_name, 'MEAN')
+    for covariate_name in composite_dictionary:
+        statistic_dictionary[covariate_name + '_std'] = (covariate_name, 'STD')
+    for covariate_name in maxar_dictionary:
+        statistic_dictionary[covariate_name + '_std'] = (covariate_name, 'STD')
+        statistic_dictionary[covariate_name + '_rng'] = (covariate_name, 'RANGE')
+    raster_list = [band_properties['path'] for band_properties in raster_stack['bands'].values()]
+
+    # Make output folder if it does not already exist
+    if os.path.exists(table_folder) == 0:
+        os.mkdir(table_folder)
+
+    # Hash the covariates shared by all grids once, reusing hashes recorded for unchanged covariates in any table
+    recorded_inputs = dict()
+    for grid in grid_list:
+        manifest = read_cache_manifest(os.path.join(table_folder, grid + '.csv'))
+        if manifest is not None:
+            recorded_inputs.update(manifest.get('inputs', dict()))
+    input_dictionary = {raster_path: hash_input(raster_path, recorded_inputs.get(raster_path))
+                        for raster_path in raster_list}
+
+    # Create key word arguments for each grid
+    grid_dictionary = dict()
+    for grid in grid_list:
+        grid_raster = os.path.join(grid_folder, grid + '.tif')
+        output_table = os.path.join(table_folder, grid + '.csv')
+        grid_dictionary[grid] = {'raster_stack': raster_stack,
+                                 'statistic_dictionary': statistic_dictionary,
+                                 'input_array': [grid_raster] + raster_list,
+                                 'output_array': [output_table],
+                                 'input_dictionary': input_dictionary
+                                 }
+
+    # Extract segment covariates, where the output cache decides which tables are current
+    print(f'Extracting segment covariates for {len(grid_list)} grids...')
+    status_dictionary = execute_grids(extract_grid,
+                                      grid_dictionary,
+                                      log_folder,
+                                      workers=worker_number,
+                                      memory_limit=worker_memory,
+                                      retry_count=1,
+                                      skip_complete=False)
+    failure_list = [grid for grid, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Extraction failed for grids {", ".join(failure_list)}.')
+        quit(1)
+    print('----------')
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Create training raster
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-15
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Create training raster" creates a raster of training data values from a set of manually delineated polygons representing different types for a classification.
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import convert_class_data
+from package_GeospatialProcessing import create_work_geodatabase
 
 # Set root directory
 drive = 'N:/'
@@ -21,11 +22,15 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BL
 training_folder = os.path.join(project_folder, 'Data_Input/training_data/processed')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/training_raster/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
-class_feature = os.path.join(work_geodatabase, 'Training_SurficialFeatures_v10')
+class_feature = os.path.join(project_geodatabase, 'Training_SurficialFeatures_v10')
 
 # Define output datasets
 class_raster = os.path.join(training_folder, 'Training_SurficialFeatures.tif')
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Train and test surficial feature classifier
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-20
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.9+ distribution.
 # Description: "Train and test surficial feature classifier " trains a random forest model to predict surficial features from a set of training points. This script runs the model train and test steps to output a trained classifier file and predicted data set. The script must be run on a machine that can support 4 cores.
 # ---------------------------------------------------------------------------
@@ -14,7 +14,9 @@ from sklearn.model_selection import LeaveOneGroupOut
 import time
 import datetime
 
-# Import functions from repository statistics package
+# Import functions from repository packages
+from package_GeospatialProcessing import calculate_grid_groups
+from package_GeospatialProcessing import define_grid_extent
 from package_Statistics import multiclass_train_test
 
 # Define round
@@ -32,6 +34,7 @@ data_folder = os.path.join(drive,
                            'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
 covariate_folder = os.path.join(data_folder, 'Data_Input/training_data/table_revised')
 response_folder = os.path.join(data_folder, 'Data_Input/training_data/table_training')
+study_raster = os.path.join(data_folder, 'Data_Input/GMT2_StudyArea.tif')
 output_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date, 'surficial_features')
 
 # Define output data
@@ -68,6 +71,7 @@ predictor_all = ['top_aspect', 'top_elevation', 'top_exposure', 'top_heat_load',
                  'foliar_vaculi', 'foliar_vacvit', 'foliar_wetsed',
                  'inf_developed', 'inf_pipeline']
 cv_groups = ['cv_group']
+validation_distance = 10000
 retain_variables = ['segment_id', 'POINT_X', 'POINT_Y']
 outer_cv_split_n = ['outer_cv_split_n']
 prediction = ['class_predict']
@@ -118,6 +122,10 @@ for grid in grid_list:
     count += 1
 print(f'Input data contains {len(input_data)} rows.')
 
+# Assign cross validation groups from point coordinates on the validation grid
+validation_grid = define_grid_extent(study_raster, validation_distance)
+input_data[cv_groups[0]] = calculate_grid_groups(validation_grid, input_data['POINT_X'], input_data['POINT_Y'])
+
 # Define leave one group out cross validation split methods
 outer_cv_splits = LeaveOneGroupOut()
 
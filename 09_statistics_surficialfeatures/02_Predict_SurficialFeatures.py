@@ -2,19 +2,21 @@
 # ---------------------------------------------------------------------------
 # Predict surficial features to points
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-20
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.9+ distribution.
-# Description: "Predict surficial features to points" predicts a random forest model to a set of grid csv files containing extracted covariate values to produce a set of output predictions. The script must be run on a machine that can support 4 cores.
+# Description: "Predict surficial features to points" predicts a random forest model to a set of grid csv files containing extracted covariate values to produce a set of output predictions. Grids are predicted in parallel worker processes that each load the classifier once and predict with a single core, and grids with existing predictions are skipped.
 # ---------------------------------------------------------------------------
 
 # Import packages
+import functools
 import joblib
 import os
 import pandas as pd
 import time
 import datetime
 
-# Import functions from repository statistics package
+# Import functions from repository packages
+from package_GeospatialProcessing import execute_grids
 from package_Statistics import multiclass_predict
 
 # Define round
@@ -37,6 +39,7 @@ covariate_folder = os.path.join(data_folder, 'Data_Input/training_data/table_rev
 response_folder = os.path.join(data_folder, 'Data_Input/training_data/table_training')
 model_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date, 'surficial_features')
 output_folder = os.path.join(data_folder, 'Data_Output/predicted_tables', round_date, 'surficial_features')
+log_folder = os.path.join(data_folder, 'Data_Output/grid_logs', round_date, 'predict_surficial_features')
 
 # Define input files
 classifier_path = os.path.join(model_folder, 'classifier.joblib')
@@ -76,17 +79,10 @@ output_columns = retain_variables + predictor_all
 # Define random state
 rstate = 21
 
-# Load model into memory
-print('Loading classifier into memory...')
-segment_start = time.time()
-classifier = joblib.load(classifier_path)
-# Report success
-segment_end = time.time()
-segment_elapsed = int(segment_end - segment_start)
-segment_success_time = datetime.datetime.now()
-print(
-    f'Completed at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
-print('----------')
+# Define worker resources within the total memory budget in gigabytes
+total_memory = 64
+worker_memory = 16
+worker_number = max(1, min(os.cpu_count(), total_memory // worker_memory))
 
 # Define grids
 grid_list = ['A4', 'A5', 'A6', 'A7',
@@ -95,69 +91,94 @@ grid_list = ['A4', 'A5', 'A6', 'A7',
              'D1', 'D2', 'D3', 'D4', 'D5',
              'E1', 'E2', 'E3', 'E4', 'E5']
 
-# Predict each input dataset
-count = 1
-input_length = len(grid_list)
-for grid in grid_list:
-    # Define output file
-    output_file = os.path.join(output_folder, grid + '.csv')
-
-    # Predict input dataset if output does not already exist
-    if os.path.exists(output_file) == 0:
-        print(f'Predicting input dataset {count} out of {input_length}...')
-
-        # Load input data
-        print('\tLoading input data')
-        segment_start = time.time()
-        covariate_file = os.path.join(covariate_folder, grid + '.csv')
-        response_file = os.path.join(response_folder, grid + '.csv')
-        covariate_data = pd.read_csv(covariate_file)
-        response_data = pd.read_csv(response_file)
-        covariate_data = covariate_data.drop(['cv_group', 'train_class'], axis=1)
-        join_data = response_data.join(covariate_data.set_index('segment_id'), on='segment_id')
-        input_data = join_data[retain_variables + class_variable + predictor_all].copy()
-        input_data = input_data.fillna(0)
-        print(f'\tInput dataset contains {len(input_data)} rows...')
-        X_data = input_data[predictor_all].astype(float)
-        # Prepare output_data
-        output_data = input_data[output_columns]
-        # Report success
-        segment_end = time.time()
-        segment_elapsed = int(segment_end - segment_start)
-        segment_success_time = datetime.datetime.now()
-        print(
-            f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
-        print('\t----------')
-
-        # Predict data
-        print('\tPredicting classes to points...')
-        segment_start = time.time()
-        output_data = multiclass_predict(classifier, X_data, prediction, class_number, output_data)
-        # Report success
-        segment_end = time.time()
-        segment_elapsed = int(segment_end - segment_start)
-        segment_success_time = datetime.datetime.now()
-        print(
-            f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
-        print('\t----------')
-
-        # Export output data to csv
-        print('\tExporting predictions to csv...')
-        segment_start = time.time()
-        output_data = output_data.drop(['shape_m', 'shape_m2'], axis=1)
-        output_data.to_csv(output_file, header=True, index=False, sep=',', encoding='utf-8')
-        # Report success
-        segment_end = time.time()
-        segment_elapsed = int(segment_end - segment_start)
-        segment_success_time = datetime.datetime.now()
-        print(
-            f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
-        print('\t----------')
-
-    else:
-        # Return message that output already exists
-        print(f'Output dataset {count} out of {input_length} already exists.')
-
-    # Increase count
-    count += 1
+# Define a function to load the classifier once per worker process
+@functools.lru_cache(maxsize=1)
+def load_classifier(classifier_file):
+    classifier = joblib.load(classifier_file)
+    # Predict with a single core because grids are predicted in parallel
+    classifier.n_jobs = 1
+    return classifier
+
+# Define a function to predict a grid
+def predict_grid(**kwargs):
+    # Parse key word argument inputs
+    classifier_file = kwargs['input_array'][0]
+    covariate_file = kwargs['input_array'][1]
+    response_file = kwargs['input_array'][2]
+    output_file = kwargs['output_array'][0]
+
+    # Load input data
+    print('\tLoading input data')
+    segment_start = time.time()
+    classifier = load_classifier(classifier_file)
+    covariate_data = pd.read_csv(covariate_file)
+    response_data = pd.read_csv(response_file)
+    covariate_data = covariate_data.drop(['cv_group', 'train_class'], axis=1)
+    join_data = response_data.join(covariate_data.set_index('segment_id'), on='segment_id')
+    input_data = join_data[retain_variables + class_variable + predictor_all].copy()
+    input_data = input_data.fillna(0)
+    print(f'\tInput dataset contains {len(input_data)} rows...')
+    X_data = input_data[predictor_all].astype(float)
+    # Prepare output_data
+    output_data = input_data[output_columns]
+    # Report success
+    segment_end = time.time()
+    segment_elapsed = int(segment_end - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(
+        f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('\t----------')
+
+    # Predict data
+    print('\tPredicting classes to points...')
+    segment_start = time.time()
+    output_data = multiclass_predict(classifier, X_data, prediction, class_number, output_data)
+    # Report success
+    segment_end = time.time()
+    segment_elapsed = int(segment_end - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(
+        f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('\t----------')
+
+    # Export output data to a temporary csv so that interrupted outputs are not mistaken for complete outputs
+    print('\tExporting predictions to csv...')
+    segment_start = time.time()
+    output_data = output_data.drop(['shape_m', 'shape_m2'], axis=1)
+    temporary_file = os.path.splitext(output_file)[0] + '_temporary.csv'
+    output_data.to_csv(temporary_file, header=True, index=False, sep=',', encoding='utf-8')
+    os.replace(temporary_file, output_file)
+    # Report success
+    segment_end = time.time()
+    segment_elapsed = int(segment_end - segment_start)
+    segment_success_time = datetime.datetime.now()
+    print(
+        f'\tCompleted at {segment_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=segment_elapsed)})')
+    print('\t----------')
+
+    return f'Successfully predicted {len(output_data)} segments.'
+
+# Predict the grids in parallel worker processes
+if __name__ == '__main__':
+    # Define input and output datasets for each grid
+    grid_dictionary = dict()
+    for grid in grid_list:
+        grid_dictionary[grid] = {'input_array': [classifier_path,
+                                                 os.path.join(covariate_folder, grid + '.csv'),
+                                                 os.path.join(response_folder, grid + '.csv')],
+                                 'output_array': [os.path.join(output_folder, grid + '.csv')]
+                                 }
+
+    # Predict each grid
+    print(f'Predicting {len(grid_list)} grids...')
+    status_dictionary = execute_grids(predict_grid,
+                                      grid_dictionary,
+                                      log_folder,
+                                      workers=worker_number,
+                                      memory_limit=worker_memory,
+                                      retry_count=1)
+    failure_list = [grid for grid, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Predictions failed for grids {", ".join(failure_list)}.')
+        quit(1)
     print('----------')
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Post-process surficial features
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-27
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Post-process surficial features" processes the predicted raster into the final deliverable.
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@
 # Import packages
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import postprocess_categorical_raster
 
 # Set round date
@@ -25,7 +26,10 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BL
 
 # Define geodatabases
 project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/postprocess_surficial_features/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
@@ -64,6 +68,7 @@ class_values = {'barren': 1,
 
 # Create key word arguments
 kwargs_process = {'minimum_count': 505,
+                  'native': True,
                   'stream_value': 11,
                   'water_value': 15,
                   'pipeline_value': 16,
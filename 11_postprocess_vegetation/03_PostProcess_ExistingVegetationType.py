@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Post-process existing vegetation type
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-27
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Post-process existing vegetation type" processes the predicted raster into the final deliverable.
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@
 # Import packages
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import postprocess_categorical_raster
 
 # Set round date
@@ -25,7 +26,10 @@ project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BL
 
 # Define geodatabases
 project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/postprocess_vegetation_type/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
@@ -71,6 +75,7 @@ evt_dictionary = {'coastal & estuarine barren': 1,
 
 # Create key word arguments
 kwargs_process = {'minimum_count': 505,
+                  'native': True,
                   'stream_value': 4,
                   'water_value': 5,
                   'pipeline_value': 6,
@@ -66,6 +66,7 @@ for input_raster in input_rasters:
 
         # Create key word arguments
         kwargs_process = {'calculate_mean': False,
+                          'native': True,
                           'conditional_statement': conditional_statement,
                           'data_type': '8_BIT_SIGNED',
                           'work_geodatabase': work_geodatabase,
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Summarize surface water to surficial features
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-23
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Summarize surface water to surficial features" processes the surficial water raster into the final deliverable.
 # ---------------------------------------------------------------------------
@@ -10,6 +10,7 @@
 # Import packages
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import summarize_to_regions
 
 # Set round date
@@ -24,7 +25,10 @@ root_folder = 'ACCS_Work'
 project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/summarize_surface_water/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
@@ -38,7 +42,8 @@ output_raster = os.path.join(project_folder, 'Data_Output/data_package', version
                              'GMT2_SeasonalWater_Percentage.tif')
 
 # Create key word arguments
-kwargs_summarize = {'work_geodatabase': work_geodatabase,
+kwargs_summarize = {'native': True,
+                    'work_geodatabase': work_geodatabase,
                     'input_array': [study_raster, water_raster, surficial_raster],
                     'output_array': [output_raster]
                     }
@@ -2,16 +2,16 @@
 # ---------------------------------------------------------------------------
 # Correct null values for MODIS data
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-14
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Correct null values for MODIS data" corrects null values below a threshold of 1 for MODIS phenology and productivity datasets.
+# Description: "Correct null values for MODIS data" corrects null values below a threshold of 1 for MODIS phenology and productivity datasets. Rasters are corrected as a single batch in parallel worker processes.
 # ---------------------------------------------------------------------------
 
 # Import packages
-import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
-from package_GeospatialProcessing import correct_no_data
+from package_GeospatialProcessing import correct_no_data_batch
+from package_GeospatialProcessing import create_work_geodatabase
 
 # Set root directory
 drive = 'N:/'
@@ -30,84 +30,64 @@ sample_raster = os.path.join(project_folder, 'Data_Input/validation/MODIS_Sampli
 
 # Define work geodatabase
 project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
-
-# Create empty raster lists
-productivity_list = []
-phenology_list = []
-
-# Create list of productivity rasters
-arcpy.env.workspace = productivity_input
-productivity_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in productivity_rasters:
-    raster_path = os.path.join(productivity_input, raster)
-    productivity_list.append(raster_path)
-
-# Create list of phenology rasters
-arcpy.env.workspace = phenology_input
-phenology_rasters = arcpy.ListRasters('*', 'TIF')
-for raster in phenology_rasters:
-    raster_path = os.path.join(phenology_input, raster)
-    phenology_list.append(raster_path)
-
-# Set workspace to default
-arcpy.env.workspace = work_geodatabase
-
-#### CORRECT NO DATA FOR PRODUCTIVITY RASTERS
-count = 1
-raster_length = len(productivity_list) + len(phenology_list)
-for input_raster in productivity_list:
-    # Define output raster
-    raster_name = os.path.split(input_raster)[1]
-    output_raster = os.path.join(productivity_output, raster_name)
-
-    # Create zonal summary if output raster does not already exist
-    if arcpy.Exists(output_raster) == 0:
-        # Create key word arguments
-        kwargs_correct = {'threshold': 1,
-                          'work_geodatabase': work_geodatabase,
-                          'input_array': [sample_raster, input_raster],
-                          'output_array': [output_raster]
-                          }
-
-        # Process the zonal summaries
-        print(f'Processing no data for raster {count} of {raster_length}...')
-        arcpy_geoprocessing(correct_no_data, **kwargs_correct)
-        print('----------')
-
-    # If raster already exists, print message
-    else:
-        print(f'Raster {count} of {raster_length} already exists.')
-        print('----------')
-
-    # Increase counter
-    count += 1
-
-#### CORRECT NO DATA VALUES FOR PHENOLOGY RASTERS
-
-for input_raster in phenology_list:
-    # Define output raster
-    raster_name = os.path.split(input_raster)[1]
-    output_raster = os.path.join(phenology_output, raster_name)
-
-    # Create zonal summary if output raster does not already exist
-    if arcpy.Exists(output_raster) == 0:
+work_geodatabase = os.path.join(project_folder, 'Workspace/correct_modis/GMT2_Workspace.gdb')
+
+# List and process rasters from the main process only so that worker processes do not import arcpy or list the workspace
+if __name__ == '__main__':
+    # Import arcpy
+    import arcpy
+
+    # Create empty raster lists
+    productivity_list = []
+    phenology_list = []
+
+    # Create list of productivity rasters
+    arcpy.env.workspace = productivity_input
+    productivity_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in productivity_rasters:
+        raster_path = os.path.join(productivity_input, raster)
+        productivity_list.append(raster_path)
+
+    # Create list of phenology rasters
+    arcpy.env.workspace = phenology_input
+    phenology_rasters = arcpy.ListRasters('*', 'TIF')
+    for raster in phenology_rasters:
+        raster_path = os.path.join(phenology_input, raster)
+        phenology_list.append(raster_path)
+
+    # Create work geodatabase if it does not already exist and set workspace to default
+    create_work_geodatabase(work_geodatabase)
+    arcpy.env.workspace = work_geodatabase
+
+    #### CORRECT NO DATA FOR PRODUCTIVITY AND PHENOLOGY RASTERS
+
+    # Identify rasters that do not already exist
+    input_list = []
+    output_list = []
+    for input_raster in productivity_list + phenology_list:
+        # Define output raster
+        raster_name = os.path.split(input_raster)[1]
+        if input_raster in productivity_list:
+            output_raster = os.path.join(productivity_output, raster_name)
+        else:
+            output_raster = os.path.join(phenology_output, raster_name)
+
+        # Add raster to batch if output raster does not already exist
+        if arcpy.Exists(output_raster) == 0:
+            input_list.append(input_raster)
+            output_list.append(output_raster)
+    print(f'{len(productivity_list) + len(phenology_list) - len(input_list)} rasters already exist.')
+    print('----------')
+
+    # Process the batch in worker processes
+    if len(input_list) > 0:
         # Create key word arguments
         kwargs_correct = {'threshold': 1,
-                          'work_geodatabase': work_geodatabase,
-                          'input_array': [sample_raster, input_raster],
-                          'output_array': [output_raster]
+                          'input_array': [sample_raster] + input_list,
+                          'output_array': output_list
                           }
 
-        # Process the zonal summaries
-        print(f'Processing no data for raster {count} of {raster_length}...')
-        arcpy_geoprocessing(correct_no_data, **kwargs_correct)
+        # Correct no data
+        print(f'Processing no data for {len(input_list)} rasters...')
+        arcpy_geoprocessing(correct_no_data_batch, check_output=False, **kwargs_correct)
         print('----------')
-
-    # If raster already exists, print message
-    else:
-        print(f'Raster {count} of {raster_length} already exists.')
-        print('----------')
-
-    # Increase counter
-    count += 1
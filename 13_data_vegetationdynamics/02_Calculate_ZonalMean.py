@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Calculate zonal means for MODIS sampling grid
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-14
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate zonal means for MODIS sampling grid" calculates zonal means of input datasets to 500 m raster cells.
 # ---------------------------------------------------------------------------
@@ -12,6 +12,7 @@ import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
 from package_GeospatialProcessing import calculate_zonal_statistics
+from package_GeospatialProcessing import create_work_geodatabase
 
 # Set root directory
 drive = 'N:/'
@@ -39,7 +40,10 @@ surface_water = os.path.join(project_folder, 'Data_Output/output_rasters', round
 
 # Define work geodatabase
 project_geodatabase = os.path.join(project_folder, 'GMT2_RemoteSensing.gdb')
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/dynamics_zonal/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Create empty raster list
 input_rasters = []
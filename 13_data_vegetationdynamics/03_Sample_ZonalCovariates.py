@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sample zonal covariates to MODIS sampling grid points
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Sample zonal covariates to MODIS sampling grid points" extracts the values of the zonal rasters to the MODIS sampling grid points. The zonal rasters are read once block by block as a raster stack on the sampling grid.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+from package_GeospatialProcessing import create_raster_stack
+from package_GeospatialProcessing import sample_raster_stack
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+zonal_folder = os.path.join(project_folder, 'Data_Input/vegetation_dynamics/zonal')
+output_folder = os.path.join(project_folder, 'Data_Input/vegetation_dynamics/table')
+
+# Define input datasets
+sample_raster = os.path.join(project_folder, 'Data_Input/validation/MODIS_SamplingGrid_500m.tif')
+sample_points = os.path.join(project_folder, 'Data_Input/validation/MODIS_SamplingGrid_500m_Points.csv')
+
+# Define output datasets
+output_table = os.path.join(output_folder, 'MODIS_SamplingGrid_Sampled.csv')
+
+# Make output folder if it does not already exist
+if os.path.exists(output_folder) == 0:
+    os.makedirs(output_folder)
+
+# Create a raster stack of zonal rasters named by file name on the sampling grid
+raster_dictionary = dict()
+for file_name in sorted(os.listdir(zonal_folder)):
+    raster_name, extension = os.path.splitext(file_name)
+    if extension.lower() == '.tif':
+        raster_dictionary[raster_name] = os.path.join(zonal_folder, file_name)
+print(f'Number of predictor rasters: {len(raster_dictionary)}')
+raster_stack = create_raster_stack(raster_dictionary, reference_raster=sample_raster)
+
+# Create key word arguments
+kwargs_sample = {'raster_stack': raster_stack,
+                 'input_array': [sample_points] + list(raster_dictionary.values()),
+                 'output_array': [output_table]
+                 }
+
+# Sample zonal rasters to points
+print('Sampling zonal covariates to points...')
+print(sample_raster_stack(**kwargs_sample))
+print('----------')
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Train and test regressor for phenology greendown
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-23
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an Anaconda Python 3.9+ distribution.
 # Description: "Train and test regressor for phenology greendown" trains a Random Forest model to predict greendown day of year from a set of training samples. This script runs the model train and test steps to output a trained regressor file and predicted data set.
 # ---------------------------------------------------------------------------
@@ -19,6 +19,8 @@ from sklearn.metrics import r2_score
 from sklearn.metrics import mean_absolute_error
 from sklearn.metrics import mean_squared_error
 from sklearn.model_selection import LeaveOneGroupOut
+from package_GeospatialProcessing import calculate_grid_groups
+from package_GeospatialProcessing import define_grid_extent
 
 # Define round
 round_date = 'round_20221219'
@@ -40,6 +42,7 @@ data_folder = os.path.join(drive,
 input_file = os.path.join(data_folder,
                           'Data_Input/vegetation_dynamics/table/',
                           'MODIS_SamplingGrid_Extracted.csv')
+study_raster = os.path.join(data_folder, 'Data_Input/GMT2_StudyArea.tif')
 output_folder = os.path.join(data_folder, 'Data_Output/model_results', round_date, 'phen_greendown')
 
 # Define output files
@@ -61,6 +64,7 @@ predictor_all = ['foliar_forb', 'foliar_graminoid', 'foliar_lichen',
                  'year']
 predict_variable = ['pred_greendown']
 cv_groups = ['cv_group']
+validation_distance = 10000
 outer_cv_split_n = ['outer_cv_split_n']
 retain_variables = ['pointid', 'POINT_X', 'POINT_Y']
 input_variables = retain_variables + cv_groups + predictor_all + regress_variable
@@ -88,6 +92,10 @@ rf_params = {'n_estimators': 500,
 
 # Create data frame of input data
 input_data = pd.read_csv(input_file)
+
+# Assign cross validation groups from point coordinates on the validation grid
+validation_grid = define_grid_extent(study_raster, validation_distance)
+input_data[cv_groups[0]] = calculate_grid_groups(validation_grid, input_data['POINT_X'], input_data['POINT_Y'])
 input_data = input_data[input_variables]
 input_data = input_data.dropna()
 input_data = input_data.loc[input_data[regress_variable[0]] > lower_threshold]
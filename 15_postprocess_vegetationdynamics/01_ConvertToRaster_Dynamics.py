@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Convert vegetation dynamics predictions to rasters
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Convert vegetation dynamics predictions to rasters" processes the predicted tables of NPP and the phenology metrics into predicted rasters by grid. The segment raster of each grid is read once and the predictions of every year of all five metrics are painted by segment identifier as the bands of one multi-band raster per metric and grid. Grids are processed in parallel worker processes and grids with existing outputs are skipped.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+from package_GeospatialProcessing import execute_grids
+from package_GeospatialProcessing import rasterize_segment_predictions
+
+# Define round date
+round_date = 'round_20221219'
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+segment_folder = os.path.join(project_folder, 'Data_Input/imagery/segments/gridded')
+prediction_folder = os.path.join(project_folder, 'Data_Output/predicted_tables', round_date)
+raster_folder = os.path.join(project_folder, 'Data_Output/predicted_rasters', round_date)
+log_folder = os.path.join(project_folder, 'Data_Output/grid_logs', round_date, 'rasterize_dynamics')
+
+# Define worker resources
+worker_number = os.cpu_count()
+worker_memory = 8
+
+# Define metrics as the prediction folder, target field, and years since 2000
+metric_dictionary = {'productivity': ('pred_npp', list(range(0, 21, 1))),
+                     'phen_greenup': ('pred_greenup', list(range(1, 21, 1))),
+                     'phen_maturity': ('pred_maturity', list(range(1, 21, 1))),
+                     'phen_senescence': ('pred_senescence', list(range(1, 21, 1))),
+                     'phen_greendown': ('pred_greendown', list(range(1, 21, 1)))}
+
+# Define grids
+grid_list = ['A4', 'A5', 'A6', 'A7',
+             'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7',
+             'C1', 'C2', 'C3', 'C4', 'C5', 'C6',
+             'D1', 'D2', 'D3', 'D4', 'D5',
+             'E1', 'E2', 'E3', 'E4', 'E5']
+
+# Convert predictions for the grids in parallel worker processes
+if __name__ == '__main__':
+    # Make output folders if they do not already exist
+    for metric_folder in metric_dictionary:
+        if os.path.exists(os.path.join(raster_folder, metric_folder)) == 0:
+            os.makedirs(os.path.join(raster_folder, metric_folder))
+
+    # Create key word arguments for each grid
+    grid_dictionary = dict()
+    for grid in grid_list:
+        target_dictionary = dict()
+        table_list = []
+        for metric_folder, (target_field, year_list) in metric_dictionary.items():
+            output_raster = os.path.join(raster_folder, metric_folder, grid + '.tif')
+            metric_tables = [os.path.join(prediction_folder, metric_folder, str(year), grid + '.csv')
+                             for year in year_list]
+            target_dictionary[output_raster] = {'field': target_field,
+                                                'tables': metric_tables,
+                                                'names': [str(year + 2000) for year in year_list]}
+            table_list = table_list + metric_tables
+        grid_dictionary[grid] = {'target_dictionary': target_dictionary,
+                                 'input_array': [os.path.join(segment_folder, grid + '.tif')] + table_list,
+                                 'output_array': list(target_dictionary.keys())
+                                 }
+
+    # Convert predictions to rasters
+    print(f'Converting predictions to rasters for {len(grid_list)} grids...')
+    status_dictionary = execute_grids(rasterize_segment_predictions,
+                                      grid_dictionary,
+                                      log_folder,
+                                      workers=worker_number,
+                                      memory_limit=worker_memory,
+                                      retry_count=1)
+    failure_list = [grid for grid, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Conversion failed for grids {", ".join(failure_list)}.')
+        quit(1)
+    print('----------')
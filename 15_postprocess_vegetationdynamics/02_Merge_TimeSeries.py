@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Merge vegetation dynamics time series
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Merge vegetation dynamics time series" merges the predicted multi-band grid rasters of NPP and the phenology metrics into one time series raster per metric with one band per year. The time series rasters are pixel interleaved with square internal tiles and record the year of each band so that all years of a block can be read in one call. Metrics are merged in parallel worker processes and metrics with existing outputs are skipped.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+from package_GeospatialProcessing import execute_grids
+from package_GeospatialProcessing import merge_time_series
+
+# Define round date
+round_date = 'round_20221219'
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+raster_folder = os.path.join(project_folder, 'Data_Output/predicted_rasters', round_date)
+output_folder = os.path.join(project_folder, 'Data_Output/output_rasters', round_date)
+log_folder = os.path.join(project_folder, 'Data_Output/grid_logs', round_date, 'merge_dynamics')
+
+# Define input datasets
+study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
+
+# Define metrics as the raster folder, output name, and years since 2000
+metric_dictionary = {'productivity': ('GMT2_Productivity', list(range(0, 21, 1))),
+                     'phen_greenup': ('GMT2_Phen_Greenup', list(range(1, 21, 1))),
+                     'phen_maturity': ('GMT2_Phen_Maturity', list(range(1, 21, 1))),
+                     'phen_senescence': ('GMT2_Phen_Senescence', list(range(1, 21, 1))),
+                     'phen_greendown': ('GMT2_Phen_Greendown', list(range(1, 21, 1)))}
+
+# Define grids
+grid_list = ['A4', 'A5', 'A6', 'A7',
+             'B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7',
+             'C1', 'C2', 'C3', 'C4', 'C5', 'C6',
+             'D1', 'D2', 'D3', 'D4', 'D5',
+             'E1', 'E2', 'E3', 'E4', 'E5']
+
+# Merge the metrics in parallel worker processes
+if __name__ == '__main__':
+    # Create key word arguments for each metric
+    metric_kwargs = dict()
+    for metric_folder, (output_name, year_list) in metric_dictionary.items():
+        # Make output folder if it does not already exist
+        if os.path.exists(os.path.join(output_folder, metric_folder)) == 0:
+            os.makedirs(os.path.join(output_folder, metric_folder))
+        # Define input and output datasets
+        grid_rasters = [os.path.join(raster_folder, metric_folder, grid + '.tif') for grid in grid_list]
+        output_raster = os.path.join(output_folder, metric_folder,
+                                     f'{output_name}_{year_list[0] + 2000}_{year_list[-1] + 2000}.tif')
+        metric_kwargs[metric_folder] = {'year_list': [year + 2000 for year in year_list],
+                                        'input_array': [study_raster] + grid_rasters,
+                                        'output_array': [output_raster]
+                                        }
+
+    # Merge grid rasters to time series rasters
+    print(f'Merging time series for {len(metric_kwargs)} metrics...')
+    status_dictionary = execute_grids(merge_time_series,
+                                      metric_kwargs,
+                                      log_folder,
+                                      workers=len(metric_kwargs),
+                                      memory_limit=8,
+                                      retry_count=1)
+    failure_list = [metric for metric, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'ERROR: Merging failed for metrics {", ".join(failure_list)}.')
+        quit(1)
+    print('----------')
@@ -2,15 +2,16 @@
 # ---------------------------------------------------------------------------
 # Post-process Phenology Greendown
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-27
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Post-process Phenology Greendown" calculates mean greendown date and corrects to predicted surface types.
+# Description: "Post-process Phenology Greendown" calculates mean greendown date and corrects to predicted surface types. The annual rasters are read as the bands of the merged time series raster.
 # ---------------------------------------------------------------------------
 
 # Import packages
 import arcpy
 import os
 from package_GeospatialProcessing import arcpy_geoprocessing
+from package_GeospatialProcessing import create_work_geodatabase
 from package_GeospatialProcessing import postprocess_continuous_raster
 
 # Set round date
@@ -27,13 +28,20 @@ input_folder = os.path.join(project_folder, 'Data_Output/output_rasters', round_
 output_folder = os.path.join(project_folder, 'Data_Output/data_package', version_number, 'phen_greendown')
 
 # Define geodatabases
-work_geodatabase = os.path.join(project_folder, 'GMT2_Workspace.gdb')
+work_geodatabase = os.path.join(project_folder, 'Workspace/postprocess_phen_greendown/GMT2_Workspace.gdb')
+
+# Create work geodatabase if it does not already exist
+create_work_geodatabase(work_geodatabase)
 
 # Define input datasets
 study_raster = os.path.join(project_folder, 'Data_Input/GMT2_StudyArea.tif')
 evt_raster = os.path.join(project_folder, 'Data_Output/output_rasters', round_date, 'vegetation_type',
                           'GMT2_ExistingVegetationType.tif')
 infrastructure_raster = os.path.join(project_folder, 'Data_Input/infrastructure/Infrastructure_Developed.tif')
+time_series_raster = os.path.join(input_folder, 'GMT2_Phen_Greendown_2001_2020.tif')
+
+# Define the first year of the time series in years since 2000
+first_year = 1
 
 # Create empty list for input rasters
 input_rasters = []
@@ -53,7 +61,7 @@ for input_set in input_list:
 
     # Define input rasters
     for year in input_set:
-        input_raster = os.path.join(input_folder, f'GMT2_Phen_Greendown_{str(year+2000)}.tif')
+        input_raster = f'{time_series_raster}/Band_{year - first_year + 1}'
         input_rasters.append(input_raster)
 
     # Define output raster
@@ -70,6 +78,7 @@ for input_set in input_list:
     if arcpy.Exists(output_raster) == 0:
         # Create key word arguments
         kwargs_process = {'calculate_mean': True,
+                          'native': True,
                           'conditional_statement': 'VALUE = 1 Or VALUE = 2 Or VALUE = 5',
                           'data_type': '8_BIT_UNSIGNED',
                           'work_geodatabase': work_geodatabase,
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Summarize vegetation dynamics time series
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. The script is fastest with numba installed.
+# Description: "Summarize vegetation dynamics time series" calculates the per-cell mean, standard deviation, Theil-Sen slope, Mann-Kendall statistic and significance, and change from the first to the last year of the NPP and phenology time series rasters. Each time series is read once block by block and blocks are reduced in parallel.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+from package_GeospatialProcessing import reduce_time_series
+
+# Define round date
+round_date = 'round_20221219'
+
+# Set root directory
+drive = 'N:/'
+root_folder = 'ACCS_Work'
+
+# Define folder structure
+project_folder = os.path.join(drive, root_folder, 'Projects/VegetationEcology/BLM_AIM/GMT-2/Data')
+input_folder = os.path.join(project_folder, 'Data_Output/output_rasters', round_date)
+output_folder = os.path.join(project_folder, 'Data_Output/output_rasters', round_date, 'dynamics_trends')
+
+# Define time series rasters by metric folder
+time_series_dictionary = {'productivity': 'GMT2_Productivity_2000_2020',
+                          'phen_greenup': 'GMT2_Phen_Greenup_2001_2020',
+                          'phen_maturity': 'GMT2_Phen_Maturity_2001_2020',
+                          'phen_senescence': 'GMT2_Phen_Senescence_2001_2020',
+                          'phen_greendown': 'GMT2_Phen_Greendown_2001_2020'}
+
+# Summarize each time series
+if __name__ == '__main__':
+    # Make output folder if it does not already exist
+    if os.path.exists(output_folder) == 0:
+        os.makedirs(output_folder)
+
+    count = 1
+    input_length = len(time_series_dictionary)
+    for metric_folder, raster_name in time_series_dictionary.items():
+        # Define input and output rasters
+        time_series_raster = os.path.join(input_folder, metric_folder, raster_name + '.tif')
+        output_raster = os.path.join(output_folder, raster_name + '_Trend.tif')
+
+        # Summarize time series if output does not already exist
+        if os.path.exists(output_raster) == 0:
+            # Create key word arguments
+            kwargs_reduce = {'minimum_count': 3,
+                             'workers': os.cpu_count(),
+                             'input_array': [time_series_raster],
+                             'output_array': [output_raster]
+                             }
+
+            # Reduce time series
+            print(f'Summarizing time series {count} of {input_length}...')
+            print(reduce_time_series(**kwargs_reduce))
+            print('----------')
+        else:
+            print(f'Time series summary {count} of {input_length} already exists.')
+            print('----------')
+        count += 1
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Initialization for Geomorphometry Module
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-19
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an ArcGIS Pro Python 3.6 distribution.
 # Description: This initialization file imports modules in the package so that the contents are accessible. The functions in this package are adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics
 # ---------------------------------------------------------------------------
@@ -11,8 +11,10 @@
 from package_Geomorphometry.calculateAspect import calculate_aspect
 from package_Geomorphometry.calculateExposure import calculate_exposure
 from package_Geomorphometry.calculateFlow import calculate_flow
+from package_Geomorphometry.calculateFusedTopography import calculate_fused_topography
 from package_Geomorphometry.calculateHeatLoad import calculate_heat_load
 from package_Geomorphometry.calculateIntegerElevation import calculate_integer_elevation
+from package_Geomorphometry.calculateNativeFlow import calculate_native_flow
 from package_Geomorphometry.calculatePosition import calculate_position
 from package_Geomorphometry.calculateRadiation import calculate_radiation
 from package_Geomorphometry.calculateRoughness import calculate_roughness
@@ -20,3 +22,21 @@ from package_Geomorphometry.calculateSlope import calculate_slope
 from package_Geomorphometry.calculateSurfaceArea import calculate_surface_area
 from package_Geomorphometry.calculateSurfaceRelief import calculate_surface_relief
 from package_Geomorphometry.calculateWetness import calculate_wetness
+from package_Geomorphometry.focalStatistics import focal_statistics
+from package_Geomorphometry.focalStatistics import neighborhood_extent
+from package_Geomorphometry.focalStatistics import rectangle_maximum
+from package_Geomorphometry.focalStatistics import rectangle_sums
+from package_Geomorphometry.focalStatistics import running_maximum
+from package_Geomorphometry.focalStatistics import summed_area_table
+from package_Geomorphometry.flowRouting import accumulate_flow
+from package_Geomorphometry.flowRouting import d8_codes
+from package_Geomorphometry.flowRouting import fill_depressions
+from package_Geomorphometry.flowRouting import flow_direction_d8
+from package_Geomorphometry.flowRouting import flow_direction_dinf
+from package_Geomorphometry.surfaceKernels import exposure_kernel
+from package_Geomorphometry.surfaceKernels import heat_load_kernel
+from package_Geomorphometry.surfaceKernels import radiation_kernel
+from package_Geomorphometry.surfaceKernels import relief_kernel
+from package_Geomorphometry.surfaceKernels import roughness_kernel
+from package_Geomorphometry.surfaceKernels import slope_aspect_kernel
+from package_Geomorphometry.surfaceKernels import surface_area_kernel
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate aspect
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate aspect" is a function that calculates float and integer aspect.
 # ---------------------------------------------------------------------------
 
@@ -20,6 +20,7 @@ def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import ExtractByMask
     from arcpy.sa import Int
@@ -77,6 +78,8 @@ def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(aspect_float, resampling='nearest')
     print('\t\tExporting aspect as 16-bit integer raster...')
     arcpy.management.CopyRaster(extract_integer,
                                 aspect_integer,
@@ -90,3 +93,5 @@ def calculate_aspect(area_raster, elevation_float, z_unit, aspect_float, aspect_
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(aspect_integer, resampling='nearest')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate exposure
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate exposure" is a function that calculates a continuous index of solar exposure weighted by steepness of the slope. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -21,6 +21,7 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Cos
     from arcpy.sa import ExtractByMask
@@ -75,3 +76,5 @@ def calculate_exposure(area_raster, aspect_float, slope_float, conversion_factor
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(exposure_output, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate flow accumulation
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate flow accumulation" is a function that calculates flow accumulation from a float elevation raster.
 # ---------------------------------------------------------------------------
 
@@ -19,6 +19,7 @@ def calculate_flow(area_raster, elevation_float, flow_accumulation):
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Fill
     from arcpy.sa import FlowAccumulation
@@ -67,3 +68,5 @@ def calculate_flow(area_raster, elevation_float, flow_accumulation):
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(flow_accumulation, resampling='average')
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate fused topography
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Calculate fused topography" is a function that reads each block of a float elevation raster once, calculates slope and aspect in memory, and writes integer elevation, slope, aspect, exposure, heat load, position, radiation, roughness, surface area, and surface relief in the same pass as cloud optimized rasters with overviews.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate multiple topographic properties in a single pass
+def calculate_fused_topography(area_raster, elevation_float, output_dictionary, slope_float=None, position_width=None, block_size=2048):
+    """
+    Description: calculates 16-bit signed topographic properties from a single read of each elevation block
+    Inputs: 'area_raster' -- a raster of the study area that defines the grid and extract area
+            'elevation_float' -- an input float elevation raster aligned to the area raster
+            'output_dictionary' -- a dictionary of output file paths keyed by any of 'elevation', 'slope', 'aspect', 'exposure', 'heat_load', 'position', 'radiation', 'roughness', 'surface_area', 'surface_relief'
+            'slope_float' -- an optional file path for an output float slope raster in degrees
+            'position_width' -- a length in the units of the raster to define the axis length for the topographic position neighborhood square, required if position is an output
+            'block_size' -- the number of rows and columns processed per block
+    Returned Value: Returns a raster dataset on disk for each output in the dictionary
+    Preconditions: requires float input elevation raster on the same grid as the area raster with matching horizontal and vertical units
+    """
+
+    # Import packages
+    from package_Geomorphometry.focalStatistics import focal_statistics
+    from package_Geomorphometry.focalStatistics import neighborhood_extent
+    from package_Geomorphometry.surfaceKernels import exposure_kernel
+    from package_Geomorphometry.surfaceKernels import heat_load_kernel
+    from package_Geomorphometry.surfaceKernels import radiation_kernel
+    from package_Geomorphometry.surfaceKernels import relief_kernel
+    from package_Geomorphometry.surfaceKernels import roughness_kernel
+    from package_Geomorphometry.surfaceKernels import slope_aspect_kernel
+    from package_Geomorphometry.surfaceKernels import surface_area_kernel
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.rasterBlocks import check_alignment
+    from package_GeospatialProcessing.rasterBlocks import convert_integer
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+
+    # Define conversion factors consistent with calculate_topographic_properties
+    conversion_factors = {'elevation': 10,
+                          'slope': 1,
+                          'aspect': 1,
+                          'exposure': 100,
+                          'heat_load': 10000,
+                          'position': 1,
+                          'radiation': 1000,
+                          'roughness': 10,
+                          'surface_area': 10,
+                          'surface_relief': 10000}
+
+    # Define the neighborhood size for roughness and surface relief
+    neighborhood_size = 5
+    halo = neighborhood_size // 2
+
+    # Determine which focal statistics are required
+    calculate_focal = 'roughness' in output_dictionary or 'surface_relief' in output_dictionary
+    calculate_position = 'position' in output_dictionary
+
+    with rasterio.open(area_raster) as area_dataset, rasterio.open(elevation_float) as elevation_dataset:
+        # Check that the elevation raster is on the grid of the area raster
+        if check_alignment(area_dataset, elevation_dataset) == False:
+            print('\t\tERROR: Elevation raster must share the coordinate system, extent, and cell size of the area raster.')
+            quit(1)
+
+        # Determine raster properties
+        cell_size = elevation_dataset.res[0]
+        middle_latitude = (elevation_dataset.bounds.bottom + elevation_dataset.bounds.top) / 2
+
+        # Expand the halo to contain the topographic position neighborhood
+        if calculate_position == True:
+            axis_length = int(position_width / float(cell_size))
+            halo = max(halo, max(neighborhood_extent(axis_length)))
+        focal_trim = halo - neighborhood_size // 2
+
+        # Open output rasters
+        integer_profile = create_block_profile(area_dataset, 'int16', -32768)
+        output_datasets = {}
+        for key, output_path in output_dictionary.items():
+            output_datasets[key] = rasterio.open(output_path, 'w', **integer_profile)
+        slope_dataset = None
+        if slope_float is not None:
+            float_profile = create_block_profile(area_dataset, 'float32', -2147483648)
+            slope_dataset = rasterio.open(slope_float, 'w', **float_profile)
+
+        try:
+            # Process each block
+            block_list = generate_blocks(area_dataset.height, area_dataset.width, block_size)
+            block_count = 1
+            for block in block_list:
+                print(f'\t\tProcessing block {block_count} of {len(block_list)}...')
+                window = Window(block[1], block[0], block[3], block[2])
+
+                # Read the area and elevation blocks once
+                area_block = read_block(area_dataset, block)
+                elevation_block = read_block(elevation_dataset, block, halo=halo)
+                area_mask = np.isfinite(area_block)
+                elevation_center = elevation_block[halo:elevation_block.shape[0] - halo,
+                                                   halo:elevation_block.shape[1] - halo]
+
+                # Calculate slope and aspect in memory
+                slope_block, aspect_block = slope_aspect_kernel(elevation_block, cell_size, halo)
+
+                # Calculate focal statistics for roughness and surface relief
+                property_blocks = {'elevation': elevation_center,
+                                   'slope': slope_block,
+                                   'aspect': aspect_block}
+                if calculate_focal == True:
+                    focal_block = elevation_block[focal_trim:elevation_block.shape[0] - focal_trim,
+                                                  focal_trim:elevation_block.shape[1] - focal_trim]
+                    focal_results = focal_statistics(focal_block,
+                                                     neighborhood_size,
+                                                     neighborhood_size,
+                                                     ['MEAN', 'STD', 'MINIMUM', 'MAXIMUM'],
+                                                     neighborhood_size // 2)
+                    property_blocks['roughness'] = roughness_kernel(focal_results['STD'])
+                    property_blocks['surface_relief'] = relief_kernel(focal_results['MEAN'],
+                                                                      focal_results['MINIMUM'],
+                                                                      focal_results['MAXIMUM'])
+
+                # Calculate topographic position from the focal mean over the position neighborhood
+                if calculate_position == True:
+                    position_mean = focal_statistics(elevation_block, axis_length, axis_length, ['MEAN'], halo)['MEAN']
+                    property_blocks['position'] = elevation_center - position_mean
+
+                # Calculate derived properties from the shared slope and aspect
+                if 'exposure' in output_dictionary:
+                    property_blocks['exposure'] = exposure_kernel(slope_block, aspect_block)
+                if 'heat_load' in output_dictionary:
+                    property_blocks['heat_load'] = heat_load_kernel(slope_block, aspect_block, middle_latitude)
+                if 'radiation' in output_dictionary:
+                    property_blocks['radiation'] = radiation_kernel(aspect_block)
+                if 'surface_area' in output_dictionary:
+                    property_blocks['surface_area'] = surface_area_kernel(slope_block, cell_size)
+
+                # Write integer outputs
+                for key, output_dataset in output_datasets.items():
+                    integer_block = convert_integer(property_blocks[key], conversion_factors[key], area_mask)
+                    output_dataset.write(integer_block, 1, window=window)
+
+                # Write float slope
+                if slope_dataset is not None:
+                    slope_output = np.where(np.isfinite(slope_block), slope_block, -2147483648).astype('float32')
+                    slope_dataset.write(slope_output, 1, window=window)
+
+                block_count += 1
+        finally:
+            # Close output rasters
+            for output_dataset in output_datasets.values():
+                output_dataset.close()
+            if slope_dataset is not None:
+                slope_dataset.close()
+
+    # Rewrite outputs as tiled and compressed rasters with overviews, where aspect overviews are not averaged across north
+    for key, output_path in output_dictionary.items():
+        write_cloud_optimized_raster(output_path, resampling='nearest' if key == 'aspect' else 'average')
+    if slope_float is not None:
+        write_cloud_optimized_raster(slope_float, resampling='average')
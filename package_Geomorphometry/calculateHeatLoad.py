@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate heat load index
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate heat load index" is a function that calculates an index of solar heat. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -22,6 +22,7 @@ def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float,
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Abs
     from arcpy.sa import Cos
@@ -90,3 +91,5 @@ def calculate_heat_load(area_raster, elevation_float, slope_float, aspect_float,
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(heatload_output, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate integer elevation
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate integer elevation" is a function that calculates integer elevation from float elevation.
 # ---------------------------------------------------------------------------
 
@@ -19,6 +19,7 @@ def calculate_integer_elevation(area_raster, elevation_float, elevation_integer)
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import ExtractByMask
     from arcpy.sa import Int
@@ -60,3 +61,5 @@ def calculate_integer_elevation(area_raster, elevation_float, elevation_integer)
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(elevation_integer, resampling='average')
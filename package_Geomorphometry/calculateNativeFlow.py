@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate native flow
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. Numba is used to compile the cell-by-cell kernels if it is installed.
+# Description: "Calculate native flow" is a function that fills depressions with priority-flood, calculates D-infinity or D8 flow direction block by block, and accumulates flow in topological order without arcpy. Per-cell working arrays are memory mapped to a scratch folder, but the fill heap and the accumulation stack are held in memory and can grow with the number of cells, so memory is not bounded and the fill and accumulation are not tiled. The fill heap can reach 16 bytes or more per cell in the worst case.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate flow accumulation without arcpy
+def calculate_native_flow(elevation_float, flow_accumulation, fill_limit=None, method='DINF', mask_raster=None,
+                          direction_output=None, scratch_folder=None, block_size=2048):
+    """
+    Description: calculates 32-bit float flow accumulation and optional flow direction rasters
+    Inputs: 'elevation_float' -- an input float elevation raster that defines the output grid
+            'flow_accumulation' -- a file path for an output float flow accumulation raster
+            'fill_limit' -- an optional maximum depth of depressions to fill in the vertical units of the elevation raster
+            'method' -- a string value of either 'DINF' or 'D8' for the flow direction method
+            'mask_raster' -- an optional raster that shares the cell alignment of the elevation raster, outside of which elevation is treated as no data
+            'direction_output' -- an optional file path for an output flow direction raster, written as ESRI direction codes for 'D8' and as degrees counterclockwise from east for 'DINF'
+            'scratch_folder' -- an optional folder to store memory-mapped working arrays (default is the folder of the flow accumulation output)
+            'block_size' -- the number of rows and columns processed per block
+    Returned Value: Returns a raster dataset on disk
+    Preconditions: requires float input elevation raster in a projected coordinate system with matching horizontal and vertical units and enough memory for a fill heap of 16 bytes or more per cell
+    """
+
+    # Import packages
+    from package_Geomorphometry.flowRouting import accumulate_flow
+    from package_Geomorphometry.flowRouting import d8_codes
+    from package_Geomorphometry.flowRouting import fill_depressions
+    from package_Geomorphometry.flowRouting import flow_direction_d8
+    from package_Geomorphometry.flowRouting import flow_direction_dinf
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    from package_GeospatialProcessing.rasterBlocks import read_array_block
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    import numpy as np
+    import os
+    import rasterio
+    import shutil
+    import tempfile
+    from rasterio.windows import Window
+
+    # Select the flow direction method
+    if method == 'DINF':
+        direction_function = flow_direction_dinf
+    elif method == 'D8':
+        direction_function = flow_direction_d8
+    else:
+        print(f'\t\tERROR: Flow direction method must be either DINF or D8, not {method}.')
+        quit(1)
+
+    # Create a scratch folder for memory-mapped working arrays
+    if scratch_folder is None:
+        scratch_folder = os.path.split(flow_accumulation)[0]
+    work_folder = tempfile.mkdtemp(prefix='flow_', dir=scratch_folder)
+
+    try:
+        with rasterio.open(elevation_float) as elevation_dataset:
+            # Determine raster properties
+            rows = elevation_dataset.height
+            columns = elevation_dataset.width
+            cell_size = elevation_dataset.res[0]
+            block_list = generate_blocks(rows, columns, block_size)
+
+            # Create memory-mapped working arrays
+            filled = np.memmap(os.path.join(work_folder, 'filled.dat'), dtype='float64', mode='w+', shape=(rows, columns))
+            flow_angle = np.memmap(os.path.join(work_folder, 'angle.dat'), dtype='float64', mode='w+', shape=(rows, columns))
+            accumulation = np.memmap(os.path.join(work_folder, 'accumulation.dat'), dtype='float64', mode='w+', shape=(rows, columns))
+            flags = np.memmap(os.path.join(work_folder, 'flags.dat'), dtype='uint8', mode='w+', shape=(rows, columns))
+
+            # Copy elevation to the working array
+            print('\t\tReading elevation raster...')
+            mask_dataset = rasterio.open(mask_raster) if mask_raster is not None else None
+            for block in block_list:
+                row_offset, column_offset, block_rows, block_columns = block
+                elevation_block = read_block(elevation_dataset, block)
+                if mask_dataset is not None:
+                    mask_block = read_aligned_block(mask_dataset, elevation_dataset, block)
+                    elevation_block[np.isnan(mask_block)] = np.nan
+                filled[row_offset:row_offset + block_rows, column_offset:column_offset + block_columns] = elevation_block
+            if mask_dataset is not None:
+                mask_dataset.close()
+
+            # Fill depressions
+            print('\t\tFilling elevation raster...')
+            if fill_limit is None:
+                fill_depressions(filled, closed=flags)
+            else:
+                original = np.memmap(os.path.join(work_folder, 'original.dat'), dtype='float64', mode='w+', shape=(rows, columns))
+                original[:] = filled
+                labels = np.memmap(os.path.join(work_folder, 'labels.dat'), dtype='int32', mode='w+', shape=(rows, columns))
+                fill_depressions(filled, fill_limit, original, labels, closed=flags)
+                del original, labels
+
+            # Calculate flow direction block by block
+            print(f'\t\tCalculating {method} flow direction...')
+            direction_dataset = None
+            if direction_output is not None:
+                if method == 'D8':
+                    direction_profile = create_block_profile(elevation_dataset, 'uint8', 255)
+                else:
+                    direction_profile = create_block_profile(elevation_dataset, 'float32', -2147483648)
+                direction_dataset = rasterio.open(direction_output, 'w', **direction_profile)
+            for block in block_list:
+                row_offset, column_offset, block_rows, block_columns = block
+                angle_block = direction_function(read_array_block(filled, block, halo=1), cell_size, 1)
+                flow_angle[row_offset:row_offset + block_rows, column_offset:column_offset + block_columns] = angle_block
+                if direction_dataset is not None:
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    no_data = np.isnan(read_array_block(filled, block))
+                    if method == 'D8':
+                        direction_block = d8_codes(angle_block)
+                        direction_block[no_data] = 255
+                    else:
+                        direction_block = np.where(np.isfinite(angle_block), np.degrees(angle_block), -1)
+                        direction_block[no_data] = -2147483648
+                        direction_block = direction_block.astype('float32')
+                    direction_dataset.write(direction_block, 1, window=window)
+            if direction_dataset is not None:
+                direction_dataset.close()
+
+            # Accumulate flow in topological order
+            print('\t\tCalculating flow accumulation...')
+            flags[:] = 0
+            accumulate_flow(flow_angle, filled, accumulation, indegree=flags)
+
+            # Export flow accumulation
+            print('\t\tExporting flow accumulation raster as 32-bit float...')
+            output_profile = create_block_profile(elevation_dataset, 'float32', -2147483648)
+            with rasterio.open(flow_accumulation, 'w', **output_profile) as output_dataset:
+                for block in block_list:
+                    row_offset, column_offset, block_rows, block_columns = block
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    accumulation_block = read_array_block(accumulation, block)
+                    accumulation_block[np.isnan(accumulation_block)] = -2147483648
+                    output_dataset.write(accumulation_block.astype('float32'), 1, window=window)
+
+            # Release memory maps
+            del filled, flow_angle, accumulation, flags
+    finally:
+        # Remove working arrays
+        shutil.rmtree(work_folder, ignore_errors=True)
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic position
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate topographic position" is a function that calculates a continuous index of topographic position using a user-defined window, ideally of multiple kilometers. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -20,6 +20,7 @@ def calculate_position(area_raster, elevation_float, position_width, position_ou
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import ExtractByMask
     from arcpy.sa import FocalStatistics
@@ -77,3 +78,5 @@ def calculate_position(area_raster, elevation_float, position_width, position_ou
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(position_output, resampling='average')
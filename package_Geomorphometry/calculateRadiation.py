@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic radiation
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate topographic radiation" is a function that calculates a continuous index of topographic radiation using a 5x5 cell window from the coolest and wettest NNE aspects to the hottest and dryest SSW aspects. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -20,6 +20,7 @@ def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Con
     from arcpy.sa import Cos
@@ -75,3 +76,5 @@ def calculate_radiation(area_raster, aspect_float, conversion_factor, radiation_
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(radiation_output, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate roughness
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate roughness" is a function that calculates roughness as the square of focal standard deviation using a 5x5 cell window. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -20,6 +20,7 @@ def calculate_roughness(area_raster, elevation_float, conversion_factor, roughne
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Con
     from arcpy.sa import ExtractByMask
@@ -81,3 +82,5 @@ def calculate_roughness(area_raster, elevation_float, conversion_factor, roughne
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(roughness_output, resampling='average')
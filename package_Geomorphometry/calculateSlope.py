@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate slope
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate slope" is a function that calculates float and integer slope in degrees.
 # ---------------------------------------------------------------------------
 
@@ -21,6 +21,7 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import ExtractByMask
     from arcpy.sa import Int
@@ -78,6 +79,8 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(slope_float, resampling='average')
     print('\t\tExporting slope as 16-bit integer raster...')
     arcpy.management.CopyRaster(extract_integer,
                                 slope_integer,
@@ -91,3 +94,5 @@ def calculate_slope(area_raster, elevation_float, z_unit, slope_float, slope_int
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(slope_integer, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate surface area ratio
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate surface area ratio" is a function that calculates surface area ratio. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -20,6 +20,7 @@ def calculate_surface_area(area_raster, slope_float, conversion_factor, area_out
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Cos
     from arcpy.sa import ExtractByMask
@@ -74,3 +75,5 @@ def calculate_surface_area(area_raster, slope_float, conversion_factor, area_out
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(area_output, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate surface relief ratio
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate surface relief ratio" is a function that calculates surface relief ratio using a 5x5 cell window. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -19,6 +19,7 @@ def calculate_surface_relief(area_raster, elevation_float, conversion_factor, re
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Con
     from arcpy.sa import ExtractByMask
@@ -91,3 +92,5 @@ def calculate_surface_relief(area_raster, elevation_float, conversion_factor, re
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(relief_output, resampling='average')
@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate topographic wetness
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate topographic wetness" is a function that calculates an index of topographic wetness. This function is adapted from Geomorphometry and Gradient Metrics Toolbox 2.0 by Jeff Evans and Jim Oakleaf (2014) available at https://github.com/jeffreyevans/GradientMetrics.
 # ---------------------------------------------------------------------------
 
@@ -22,6 +22,7 @@ def calculate_wetness(area_raster, elevation_float, flow_accumulation, slope_flo
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Con
     from arcpy.sa import ExtractByMask
@@ -90,3 +91,5 @@ def calculate_wetness(area_raster, elevation_float, flow_accumulation, slope_flo
                                 'NONE',
                                 'TIFF',
                                 'NONE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(wetness_output, resampling='average')
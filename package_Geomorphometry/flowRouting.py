@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Flow routing
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy. Numba is used to compile the cell-by-cell kernels if it is installed.
+# Description: "Flow routing" is a set of functions that fill depressions with the priority-flood algorithm, calculate D-infinity or D8 flow directions for blocks of a filled elevation array, and accumulate flow in topological order. Filling raises depressions and flats by the smallest representable increment so that every filled cell drains to the edge of the data. Only flow directions are calculated block by block. The fill and the accumulation each process the whole grid at once, with per-cell arrays that can be memory maps and a heap or stack held in memory that can grow with the number of cells, so they are not tiled and their memory is not bounded.
+# ---------------------------------------------------------------------------
+
+# Import packages at the module level so that kernels can be compiled
+import heapq
+import numpy as np
+
+# Define the row offsets, column offsets, and ESRI D8 codes of the neighbors counterclockwise from east
+NEIGHBOR_ROWS = (0, -1, -1, -1, 0, 1, 1, 1)
+NEIGHBOR_COLUMNS = (1, 1, 0, -1, -1, -1, 0, 1)
+D8_CODES = (1, 128, 64, 32, 16, 8, 4, 2)
+
+# Define the tolerance in eighths of a circle within which flow angles snap to a single neighbor, sized above single precision rounding
+SNAP_TOLERANCE = 1e-5
+
+# Define a kernel to fill depressions with priority-flood
+def priority_flood_kernel(elevation, rows, columns, labels, track_labels, closed):
+    """
+    Description: fills depressions in place by flooding inward from the data edge in order of elevation and raising each enclosed cell to the smallest value above the cell that flooded it
+    Inputs: 'elevation' -- a flat float64 array of elevation values with NaN as no data
+            'rows' -- the number of rows in the elevation grid
+            'columns' -- the number of columns in the elevation grid
+            'labels' -- a flat int32 array to store the depression label of each raised cell if track_labels is True
+            'track_labels' -- a boolean value that if True labels raised cells by depression
+            'closed' -- a flat unsigned 8-bit array of zeros to mark cells that have entered the heap
+    Returned Value: Returns an array of the maximum fill depth of each depression label, where label 0 is unraised
+    Preconditions: requires a flat elevation array in row-major order, where the heap is held in memory and can grow to the number of cells
+    """
+
+    # Initialize the open cell heap
+    cell_count = rows * columns
+    open_cells = [(0.0, np.int64(0))]
+    open_cells.pop()
+    depths = [0.0]
+
+    # Seed the heap with cells on the edge of the grid or adjacent to no data
+    for index in range(cell_count):
+        if np.isnan(elevation[index]):
+            closed[index] = 1
+            continue
+        row = index // columns
+        column = index % columns
+        seed = row == 0 or row == rows - 1 or column == 0 or column == columns - 1
+        if seed == False:
+            for k in range(8):
+                if np.isnan(elevation[(row + NEIGHBOR_ROWS[k]) * columns + column + NEIGHBOR_COLUMNS[k]]):
+                    seed = True
+                    break
+        if seed == True:
+            closed[index] = 1
+            heapq.heappush(open_cells, (elevation[index], np.int64(index)))
+
+    # Flood inward from the lowest open cell
+    while len(open_cells) > 0:
+        level, index = heapq.heappop(open_cells)
+        row = index // columns
+        column = index % columns
+        for k in range(8):
+            neighbor_row = row + NEIGHBOR_ROWS[k]
+            neighbor_column = column + NEIGHBOR_COLUMNS[k]
+            if neighbor_row < 0 or neighbor_row >= rows or neighbor_column < 0 or neighbor_column >= columns:
+                continue
+            neighbor = neighbor_row * columns + neighbor_column
+            if closed[neighbor] == 1:
+                continue
+            closed[neighbor] = 1
+            # Raise enclosed cells to drain to the cell that flooded them
+            if elevation[neighbor] <= elevation[index]:
+                raised = np.nextafter(elevation[index], np.inf)
+                if track_labels == True:
+                    label = labels[index]
+                    if label == 0:
+                        depths.append(0.0)
+                        label = len(depths) - 1
+                    labels[neighbor] = label
+                    depth = raised - elevation[neighbor]
+                    if depth > depths[label]:
+                        depths[label] = depth
+                elevation[neighbor] = raised
+            heapq.heappush(open_cells, (elevation[neighbor], np.int64(neighbor)))
+
+    return np.array(depths)
+
+# Define a function to fill depressions
+def fill_depressions(elevation, fill_limit=None, original=None, labels=None, closed=None):
+    """
+    Description: fills depressions in an elevation array so that every cell drains to the edge of the data, leaving depressions deeper than the fill limit unfilled
+    Inputs: 'elevation' -- a two-dimensional float64 array or memory map of elevation values with NaN as no data, which is filled in place
+            'fill_limit' -- an optional maximum depth of depressions to fill in the vertical units of the elevation
+            'original' -- an optional copy of the unfilled elevation used to restore depressions deeper than the fill limit, which is copied from the elevation if not provided
+            'labels' -- an optional two-dimensional int32 array or memory map of zeros to store depression labels, which is created if not provided
+            'closed' -- an optional two-dimensional unsigned 8-bit array or memory map of zeros to mark flooded cells, which is created if not provided
+    Returned Value: Returns the filled elevation array
+    Preconditions: requires a contiguous float64 elevation array, where the fill runs over the whole array at once and holds a heap of open cells in memory that can reach 16 bytes or more per cell in the worst case
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.compileKernel import compile_kernel
+    import numpy as np
+
+    # Flatten the elevation array without copying
+    rows, columns = elevation.shape
+    elevation_flat = elevation.reshape(-1).view(np.ndarray)
+    if closed is None:
+        closed = np.zeros((rows, columns), dtype=np.uint8)
+    closed_flat = closed.reshape(-1).view(np.ndarray)
+
+    # Fill depressions
+    flood_kernel = compile_kernel(priority_flood_kernel)
+    if fill_limit is None:
+        flood_kernel(elevation_flat, rows, columns, np.zeros(1, dtype=np.int32), False, closed_flat)
+    else:
+        if original is None:
+            original = elevation.copy()
+        if labels is None:
+            labels = np.zeros((rows, columns), dtype=np.int32)
+        original_flat = original.reshape(-1).view(np.ndarray)
+        labels_flat = labels.reshape(-1).view(np.ndarray)
+        depths = flood_kernel(elevation_flat, rows, columns, labels_flat, True, closed_flat)
+        # Restore depressions that exceed the fill limit in row-major chunks
+        chunk_size = 16777216
+        for start in range(0, rows * columns, chunk_size):
+            chunk = slice(start, min(start + chunk_size, rows * columns))
+            restore = depths[labels_flat[chunk]] > fill_limit
+            elevation_flat[chunk][restore] = original_flat[chunk][restore]
+
+    return elevation
+
+# Define a function to calculate D-infinity flow direction
+def flow_direction_dinf(filled_block, cell_size, halo):
+    """
+    Description: calculates D-infinity flow direction as the steepest downslope direction over eight triangular facets
+    Inputs: 'filled_block' -- a float array of filled elevation with NaN as no data that includes a halo of at least one cell
+            'cell_size' -- the cell size in the same units as the elevation values
+            'halo' -- the number of halo cells on each side of the block
+    Returned Value: Returns a float array of flow angles in radians counterclockwise from east for the block without the halo, where cells without a downslope direction are NaN
+    Preconditions: requires a filled elevation block read with a halo
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Trim the block to a halo of one cell
+    trim = halo - 1
+    z = filled_block[trim:filled_block.shape[0] - trim, trim:filled_block.shape[1] - trim]
+    center = z[1:-1, 1:-1]
+
+    # Define a function to select a neighbor array
+    def neighbor(k):
+        row_offset = 1 + NEIGHBOR_ROWS[k]
+        column_offset = 1 + NEIGHBOR_COLUMNS[k]
+        return z[row_offset:row_offset + center.shape[0], column_offset:column_offset + center.shape[1]]
+
+    # Define facets as the cardinal neighbor, diagonal neighbor, angle multiplier, and angle sign
+    facets = ((0, 1, 0, 1), (2, 1, 1, -1), (2, 3, 1, 1), (4, 3, 2, -1),
+              (4, 5, 2, 1), (6, 5, 3, -1), (6, 7, 3, 1), (0, 7, 4, -1))
+
+    # Determine the steepest downslope facet
+    diagonal_distance = cell_size * np.sqrt(2)
+    maximum_angle = np.pi / 4
+    best_slope = np.zeros(center.shape)
+    flow_angle = np.full(center.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        for cardinal, diagonal, multiplier, sign in facets:
+            cardinal_z = neighbor(cardinal)
+            diagonal_z = neighbor(diagonal)
+            slope_1 = (center - cardinal_z) / cell_size
+            slope_2 = (cardinal_z - diagonal_z) / cell_size
+            facet_angle = np.arctan2(slope_2, slope_1)
+            facet_slope = np.hypot(slope_1, slope_2)
+            # Constrain the direction to the facet
+            below = facet_angle < 0
+            above = facet_angle > maximum_angle
+            facet_slope = np.where(below, slope_1, facet_slope)
+            facet_slope = np.where(above, (center - diagonal_z) / diagonal_distance, facet_slope)
+            facet_angle = np.clip(facet_angle, 0, maximum_angle)
+            # Use the available edge of facets that border no data
+            missing_diagonal = np.isnan(diagonal_z) & np.isfinite(cardinal_z)
+            missing_cardinal = np.isnan(cardinal_z) & np.isfinite(diagonal_z)
+            facet_slope = np.where(missing_diagonal, slope_1, facet_slope)
+            facet_angle = np.where(missing_diagonal, 0, facet_angle)
+            facet_slope = np.where(missing_cardinal, (center - diagonal_z) / diagonal_distance, facet_slope)
+            facet_angle = np.where(missing_cardinal, maximum_angle, facet_angle)
+            # Update the steepest facet
+            steeper = facet_slope > best_slope
+            best_slope = np.where(steeper, facet_slope, best_slope)
+            flow_angle = np.where(steeper, sign * facet_angle + multiplier * np.pi / 2, flow_angle)
+
+    # Wrap angles to the range from zero to two pi
+    flow_angle = np.mod(flow_angle, 2 * np.pi)
+
+    return flow_angle
+
+# Define a function to calculate D8 flow direction
+def flow_direction_d8(filled_block, cell_size, halo):
+    """
+    Description: calculates D8 flow direction as the steepest downslope neighbor
+    Inputs: 'filled_block' -- a float array of filled elevation with NaN as no data that includes a halo of at least one cell
+            'cell_size' -- the cell size in the same units as the elevation values
+            'halo' -- the number of halo cells on each side of the block
+    Returned Value: Returns a float array of flow angles in radians counterclockwise from east in multiples of pi / 4 for the block without the halo, where cells without a downslope neighbor are NaN
+    Preconditions: requires a filled elevation block read with a halo
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Trim the block to a halo of one cell
+    trim = halo - 1
+    z = filled_block[trim:filled_block.shape[0] - trim, trim:filled_block.shape[1] - trim]
+    center = z[1:-1, 1:-1]
+
+    # Determine the steepest downslope neighbor
+    best_drop = np.zeros(center.shape)
+    flow_angle = np.full(center.shape, np.nan)
+    with np.errstate(invalid='ignore'):
+        for k in range(8):
+            row_offset = 1 + NEIGHBOR_ROWS[k]
+            column_offset = 1 + NEIGHBOR_COLUMNS[k]
+            neighbor_z = z[row_offset:row_offset + center.shape[0], column_offset:column_offset + center.shape[1]]
+            distance = cell_size * (np.sqrt(2) if k % 2 == 1 else 1)
+            drop = (center - neighbor_z) / distance
+            steeper = drop > best_drop
+            best_drop = np.where(steeper, drop, best_drop)
+            flow_angle = np.where(steeper, k * np.pi / 4, flow_angle)
+
+    return flow_angle
+
+# Define a function to convert D8 flow angles to ESRI direction codes
+def d8_codes(flow_angle):
+    """
+    Description: converts D8 flow angles to ESRI flow direction codes
+    Inputs: 'flow_angle' -- a float array of D8 flow angles in radians
+    Returned Value: Returns an unsigned 8-bit array of flow direction codes where cells without a direction are 0
+    Preconditions: requires D8 flow angles from flow_direction_d8
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Look up the code for each neighbor
+    code_table = np.array(D8_CODES, dtype=np.uint8)
+    codes = np.zeros(flow_angle.shape, dtype=np.uint8)
+    valid = np.isfinite(flow_angle)
+    codes[valid] = code_table[np.rint(flow_angle[valid] / (np.pi / 4)).astype(int) % 8]
+
+    return codes
+
+# Define a kernel to determine the receivers of a cell
+def receiver_kernel(index, flow_angle, elevation, rows, columns):
+    """
+    Description: determines the two neighbors that receive flow from a cell and the proportion of flow to each
+    Inputs: 'index' -- the flat index of the cell
+            'flow_angle' -- a flat array of flow angles in radians with NaN where there is no direction
+            'elevation' -- a flat array of filled elevation with NaN as no data
+            'rows' -- the number of rows in the grid
+            'columns' -- the number of columns in the grid
+    Returned Value: Returns the flat indices of the two receivers and their proportions, where a receiver of -1 receives no flow
+    Preconditions: requires flow angles from flow_direction_dinf or flow_direction_d8
+    """
+
+    # Return no receivers if the cell has no direction
+    angle = flow_angle[index]
+    if np.isnan(angle):
+        return -1, -1, 0.0, 0.0
+
+    # Divide flow between the neighbors on either side of the angle
+    position = angle / (np.pi / 4)
+    first = int(np.floor(position)) % 8
+    fraction = position - np.floor(position)
+    if fraction < SNAP_TOLERANCE:
+        fraction = 0.0
+    elif fraction > 1 - SNAP_TOLERANCE:
+        first = (first + 1) % 8
+        fraction = 0.0
+    second = (first + 1) % 8
+
+    # Determine the flat indices of valid receivers
+    row = index // columns
+    column = index % columns
+    receiver_1 = -1
+    receiver_2 = -1
+    neighbor_row = row + NEIGHBOR_ROWS[first]
+    neighbor_column = column + NEIGHBOR_COLUMNS[first]
+    if 0 <= neighbor_row < rows and 0 <= neighbor_column < columns:
+        if np.isfinite(elevation[neighbor_row * columns + neighbor_column]):
+            receiver_1 = neighbor_row * columns + neighbor_column
+    if fraction > 0:
+        neighbor_row = row + NEIGHBOR_ROWS[second]
+        neighbor_column = column + NEIGHBOR_COLUMNS[second]
+        if 0 <= neighbor_row < rows and 0 <= neighbor_column < columns:
+            if np.isfinite(elevation[neighbor_row * columns + neighbor_column]):
+                receiver_2 = neighbor_row * columns + neighbor_column
+
+    return receiver_1, receiver_2, 1.0 - fraction, fraction
+
+# Define a kernel to accumulate flow in topological order
+def accumulation_kernel(receiver_function, flow_angle, elevation, rows, columns, accumulation, indegree):
+    """
+    Description: accumulates the weighted number of upslope cells by processing each cell after all of its donors
+    Inputs: 'receiver_function' -- the receiver kernel, compiled if the accumulation kernel is compiled
+            'flow_angle' -- a flat array of flow angles in radians with NaN where there is no direction
+            'elevation' -- a flat array of filled elevation with NaN as no data
+            'rows' -- the number of rows in the grid
+            'columns' -- the number of columns in the grid
+            'accumulation' -- a flat float64 array of zeros to store the flow accumulation
+            'indegree' -- a flat unsigned 8-bit array of zeros to store the number of donors of each cell
+    Returned Value: Returns the number of cells processed
+    Preconditions: requires flow angles from flow_direction_dinf or flow_direction_d8
+    """
+
+    # Count the donors of each cell
+    cell_count = rows * columns
+    for index in range(cell_count):
+        receiver_1, receiver_2, proportion_1, proportion_2 = receiver_function(index, flow_angle, elevation, rows, columns)
+        if receiver_1 >= 0 and proportion_1 > 0:
+            indegree[receiver_1] += 1
+        if receiver_2 >= 0 and proportion_2 > 0:
+            indegree[receiver_2] += 1
+
+    # Process cells once all of their donors have been processed
+    processed = 0
+    stack = [np.int64(0)]
+    stack.pop()
+    for start in range(cell_count):
+        if indegree[start] != 0 or np.isnan(elevation[start]):
+            continue
+        stack.append(np.int64(start))
+        while len(stack) > 0:
+            index = stack.pop()
+            indegree[index] = 255
+            processed += 1
+            receiver_1, receiver_2, proportion_1, proportion_2 = receiver_function(index, flow_angle, elevation, rows, columns)
+            contribution = accumulation[index] + 1
+            if receiver_1 >= 0 and proportion_1 > 0:
+                accumulation[receiver_1] += proportion_1 * contribution
+                indegree[receiver_1] -= 1
+                if indegree[receiver_1] == 0:
+                    stack.append(np.int64(receiver_1))
+            if receiver_2 >= 0 and proportion_2 > 0:
+                accumulation[receiver_2] += proportion_2 * contribution
+                indegree[receiver_2] -= 1
+                if indegree[receiver_2] == 0:
+                    stack.append(np.int64(receiver_2))
+
+    return processed
+
+# Define a function to accumulate flow
+def accumulate_flow(flow_angle, elevation, accumulation=None, indegree=None):
+    """
+    Description: calculates flow accumulation as the weighted number of upslope cells draining through each cell
+    Inputs: 'flow_angle' -- a two-dimensional float array of flow angles in radians with NaN where there is no direction
+            'elevation' -- a two-dimensional float array of filled elevation with NaN as no data
+            'accumulation' -- an optional two-dimensional float64 array or memory map of zeros to store the result
+            'indegree' -- an optional two-dimensional unsigned 8-bit array or memory map of zeros to store the number of donors of each cell, which is created if not provided
+    Returned Value: Returns a float64 array of flow accumulation with NaN as no data
+    Preconditions: requires flow angles calculated from the filled elevation, where accumulation runs over the whole array at once and holds a stack of cells in memory that can grow with the number of cells
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.compileKernel import compile_kernel
+    import numpy as np
+
+    # Prepare flat arrays
+    rows, columns = elevation.shape
+    if accumulation is None:
+        accumulation = np.zeros((rows, columns), dtype=np.float64)
+    angle_flat = flow_angle.reshape(-1).view(np.ndarray)
+    elevation_flat = elevation.reshape(-1).view(np.ndarray)
+    accumulation_flat = accumulation.reshape(-1).view(np.ndarray)
+    if indegree is None:
+        indegree = np.zeros((rows, columns), dtype=np.uint8)
+    indegree_flat = indegree.reshape(-1).view(np.ndarray)
+
+    # Accumulate flow
+    receiver_function = compile_kernel(receiver_kernel)
+    accumulation_function = compile_kernel(accumulation_kernel)
+    accumulation_function(receiver_function, angle_flat, elevation_flat, rows, columns, accumulation_flat, indegree_flat)
+
+    # Set no data
+    accumulation_flat[np.isnan(elevation_flat)] = np.nan
+
+    return accumulation
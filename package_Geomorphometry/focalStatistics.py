@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Focal statistics
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy.
+# Description: "Focal statistics" is a set of functions that calculate rectangular focal statistics in constant time per cell regardless of neighborhood size. Mean, standard deviation, variance, and sum are calculated from summed-area tables of the cell count, values, and squared values, and minimum and maximum are calculated with the van Herk-Gil-Werman running algorithm. No data cells are ignored within each neighborhood, matching the 'DATA' option of FocalStatistics.
+# ---------------------------------------------------------------------------
+
+# Define a function to determine the neighborhood extent around the processing cell
+def neighborhood_extent(size):
+    """
+    Description: determines the number of cells before and after the processing cell along one axis of a rectangular neighborhood
+    Inputs: 'size' -- the number of cells along the axis of the neighborhood
+    Returned Value: Returns the number of cells before and after the processing cell, where even sizes place the extra cell before the processing cell
+    Preconditions: requires a positive integer size
+    """
+
+    # Calculate the extent on each side of the processing cell
+    after = (size - 1) // 2
+    before = size - 1 - after
+
+    return before, after
+
+# Define a function to calculate a summed-area table
+def summed_area_table(values):
+    """
+    Description: calculates a summed-area table with a leading row and column of zeros
+    Inputs: 'values' -- a two-dimensional float array
+    Returned Value: Returns a float array with one more row and column than the input where each cell is the sum of all values above and to the left
+    Preconditions: requires an array with no NaN values
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Accumulate values along both axes
+    table = np.zeros((values.shape[0] + 1, values.shape[1] + 1), dtype='float64')
+    np.cumsum(values, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+
+    return table
+
+# Define a function to calculate rectangular sums from a summed-area table
+def rectangle_sums(table, output_shape, row_start, column_start, rows, columns):
+    """
+    Description: calculates the sum of every rectangular window from a summed-area table
+    Inputs: 'table' -- a summed-area table
+            'output_shape' -- the (rows, columns) shape of the output
+            'row_start' -- the table row of the upper edge of the first window
+            'column_start' -- the table column of the left edge of the first window
+            'rows' -- the number of rows in the window
+            'columns' -- the number of columns in the window
+    Returned Value: Returns a float array of window sums
+    Preconditions: requires a summed-area table that contains every window
+    """
+
+    # Define the corners of each window
+    output_rows, output_columns = output_shape
+    top = slice(row_start, row_start + output_rows)
+    bottom = slice(row_start + rows, row_start + rows + output_rows)
+    left = slice(column_start, column_start + output_columns)
+    right = slice(column_start + columns, column_start + columns + output_columns)
+
+    # Calculate window sums
+    window_sums = table[bottom, right] - table[top, right] - table[bottom, left] + table[top, left]
+
+    return window_sums
+
+# Define a function to calculate a running maximum along the last axis
+def running_maximum(values, size):
+    """
+    Description: calculates the maximum of every window of a given size along the last axis using the van Herk-Gil-Werman algorithm
+    Inputs: 'values' -- a float array with no data as negative infinity
+            'size' -- the number of cells in the window
+    Returned Value: Returns a float array with the last axis shortened by size - 1, where each value is the maximum of the window starting at that index
+    Preconditions: requires a window size no larger than the last axis
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Pad the last axis to a multiple of the window size
+    length = values.shape[-1]
+    segments = -(-length // size)
+    padding = [(0, 0)] * (values.ndim - 1) + [(0, segments * size - length)]
+    padded = np.pad(values, padding, mode='constant', constant_values=-np.inf)
+    segmented = padded.reshape(values.shape[:-1] + (segments, size))
+
+    # Calculate prefix and suffix maxima within each segment
+    prefix = np.maximum.accumulate(segmented, axis=-1).reshape(padded.shape)
+    suffix = np.maximum.accumulate(segmented[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+
+    # Combine the suffix at the window start with the prefix at the window end
+    window_count = length - size + 1
+    window_maximum = np.maximum(suffix[..., :window_count], prefix[..., size - 1:size - 1 + window_count])
+
+    return window_maximum
+
+# Define a function to calculate a rectangular running maximum
+def rectangle_maximum(values, output_shape, row_start, column_start, rows, columns):
+    """
+    Description: calculates the maximum of every rectangular window as two separable running maxima
+    Inputs: 'values' -- a float array with no data as negative infinity
+            'output_shape' -- the (rows, columns) shape of the output
+            'row_start' -- the row of the upper edge of the first window
+            'column_start' -- the column of the left edge of the first window
+            'rows' -- the number of rows in the window
+            'columns' -- the number of columns in the window
+    Returned Value: Returns a float array of window maxima
+    Preconditions: requires an array that contains every window
+    """
+
+    # Restrict the array to the cells covered by the output windows
+    output_rows, output_columns = output_shape
+    subset = values[row_start:row_start + output_rows + rows - 1,
+                    column_start:column_start + output_columns + columns - 1]
+
+    # Calculate running maxima along columns and then along rows
+    column_maximum = running_maximum(subset, columns)
+    window_maximum = running_maximum(column_maximum.T, rows).T
+
+    return window_maximum
+
+# Define a function to calculate focal statistics
+def focal_statistics(values, rows, columns, statistics, halo):
+    """
+    Description: calculates rectangular focal statistics in constant time per cell ignoring no data within each neighborhood
+    Inputs: 'values' -- a float array with NaN as no data that includes a halo around the processing block
+            'rows' -- the number of rows in the rectangular neighborhood
+            'columns' -- the number of columns in the rectangular neighborhood
+            'statistics' -- a list containing any of 'MEAN', 'STD', 'VARIANCE', 'SUM', 'MINIMUM', 'MAXIMUM', 'RANGE'
+            'halo' -- the number of halo cells on each side of the processing block
+    Returned Value: Returns a dictionary of float arrays for the block without the halo keyed by statistic, where neighborhoods with no data are NaN
+    Preconditions: requires a halo at least as large as the neighborhood extent on each side of the processing cell
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Determine the neighborhood extent
+    row_before, row_after = neighborhood_extent(rows)
+    column_before, column_after = neighborhood_extent(columns)
+    if max(row_before, row_after, column_before, column_after) > halo:
+        raise ValueError(f'Halo of {halo} cells is smaller than a {rows} x {columns} neighborhood.')
+
+    # Define output shape and the first window origin
+    output_shape = (values.shape[0] - 2 * halo, values.shape[1] - 2 * halo)
+    row_start = halo - row_before
+    column_start = halo - column_before
+
+    # Calculate valid cell counts
+    valid = np.isfinite(values)
+    count = rectangle_sums(summed_area_table(valid.astype('float64')),
+                           output_shape, row_start, column_start, rows, columns)
+    empty = count == 0
+
+    # Calculate moment statistics from summed-area tables
+    focal_results = {}
+    moment_statistics = {'MEAN', 'STD', 'VARIANCE', 'SUM'}.intersection(statistics)
+    if len(moment_statistics) > 0:
+        # Subtract a reference value to preserve precision in squared sums
+        reference = np.nanmean(values) if valid.any() else 0.0
+        centered = np.where(valid, values - reference, 0.0)
+        value_sum = rectangle_sums(summed_area_table(centered),
+                                   output_shape, row_start, column_start, rows, columns)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = value_sum / count
+            if 'SUM' in statistics:
+                focal_results['SUM'] = np.where(empty, np.nan, value_sum + reference * count)
+            if 'MEAN' in statistics:
+                focal_results['MEAN'] = np.where(empty, np.nan, mean + reference)
+            if 'STD' in statistics or 'VARIANCE' in statistics:
+                square_sum = rectangle_sums(summed_area_table(np.square(centered)),
+                                            output_shape, row_start, column_start, rows, columns)
+                variance = np.maximum(square_sum / count - np.square(mean), 0)
+                variance[empty] = np.nan
+                if 'VARIANCE' in statistics:
+                    focal_results['VARIANCE'] = variance
+                if 'STD' in statistics:
+                    focal_results['STD'] = np.sqrt(variance)
+
+    # Calculate order statistics with running extrema
+    if 'MAXIMUM' in statistics or 'RANGE' in statistics:
+        maximum = rectangle_maximum(np.where(valid, values, -np.inf),
+                                    output_shape, row_start, column_start, rows, columns)
+        maximum[empty] = np.nan
+        focal_results['MAXIMUM'] = maximum
+    if 'MINIMUM' in statistics or 'RANGE' in statistics:
+        minimum = -rectangle_maximum(np.where(valid, -values, -np.inf),
+                                     output_shape, row_start, column_start, rows, columns)
+        minimum[empty] = np.nan
+        focal_results['MINIMUM'] = minimum
+    if 'RANGE' in statistics:
+        focal_results['RANGE'] = focal_results['MAXIMUM'] - focal_results['MINIMUM']
+
+    # Return only the requested statistics
+    focal_results = {key: value for key, value in focal_results.items() if key in statistics}
+
+    return focal_results
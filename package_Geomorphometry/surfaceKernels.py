@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Surface kernels
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy.
+# Description: "Surface kernels" is a set of functions that calculate topographic properties from blocks of elevation, slope, and aspect values held in memory. The equations match the arcpy implementations in this package so that the fused topography pipeline reproduces their outputs.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate slope and aspect
+def slope_aspect_kernel(elevation_block, cell_size, halo):
+    """
+    Description: calculates slope and north-pole aspect in degrees from a quadratic surface fit to the 3 x 3 neighborhood of each cell
+    Inputs: 'elevation_block' -- a float elevation array with NaN as no data that includes a halo of at least one cell
+            'cell_size' -- the cell size in the same units as the elevation values
+            'halo' -- the number of halo cells on each side of the elevation block
+    Returned Value: Returns a float slope array and a float aspect array for the block without the halo, where aspect is -1 for flat cells
+    Preconditions: requires an elevation block read with a halo
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Trim the elevation block to a halo of one cell
+    trim = halo - 1
+    if trim > 0:
+        z = elevation_block[trim:-trim, trim:-trim]
+    else:
+        z = elevation_block
+
+    # Calculate the first derivatives of the quadratic surface
+    dz_dx = ((z[:-2, 2:] + z[1:-1, 2:] + z[2:, 2:])
+             - (z[:-2, :-2] + z[1:-1, :-2] + z[2:, :-2])) / (6 * cell_size)
+    dz_dy = ((z[:-2, :-2] + z[:-2, 1:-1] + z[:-2, 2:])
+             - (z[2:, :-2] + z[2:, 1:-1] + z[2:, 2:])) / (6 * cell_size)
+
+    # Calculate slope in degrees
+    slope_block = np.degrees(np.arctan(np.hypot(dz_dx, dz_dy)))
+
+    # Calculate aspect as the downslope direction clockwise from north
+    aspect_block = np.mod(np.degrees(np.arctan2(-dz_dx, -dz_dy)), 360)
+    aspect_block[(dz_dx == 0) & (dz_dy == 0)] = -1
+
+    return slope_block, aspect_block
+
+# Define a function to calculate solar exposure index
+def exposure_kernel(slope_block, aspect_block):
+    """
+    Description: calculates solar exposure index as the cosine of modified aspect weighted by slope
+    Inputs: 'slope_block' -- a float slope array in degrees
+            'aspect_block' -- a float aspect array in degrees
+    Returned Value: Returns a float exposure array
+    Preconditions: requires slope and aspect blocks of the same shape
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate solar exposure index
+    aspect_radian = aspect_block * 0.0174533
+    exposure_block = np.cos(aspect_radian - 3.31613) * slope_block
+
+    return exposure_block
+
+# Define a function to calculate heat load index
+def heat_load_kernel(slope_block, aspect_block, middle_latitude):
+    """
+    Description: calculates heat load index
+    Inputs: 'slope_block' -- a float slope array in degrees
+            'aspect_block' -- a float aspect array in degrees
+            'middle_latitude' -- the middle y-coordinate of the elevation raster extent, used as in calculate_heat_load
+    Returned Value: Returns a float heat load array
+    Preconditions: requires slope and aspect blocks of the same shape
+    """
+
+    # Import packages
+    import math
+    import numpy as np
+
+    # Calculate latitude terms
+    middle_radian = middle_latitude * 0.0174533
+    cos_latitude = math.cos(middle_radian)
+    sin_latitude = math.sin(middle_radian)
+
+    # Convert degrees to radians
+    slope_radian = slope_block * 0.0174533
+    aspect_radian = aspect_block * 0.0174533
+
+    # Calculate heat load index
+    modified_aspect = np.abs(3.141593 - np.abs(aspect_radian - 3.926991))
+    cos_slope = np.cos(slope_radian)
+    sin_slope = np.sin(slope_radian)
+    cos_aspect = np.cos(modified_aspect)
+    sin_aspect = np.sin(modified_aspect)
+    heat_load_block = np.exp(-1.467
+                             + 1.582 * cos_latitude * cos_slope
+                             - 1.5 * cos_aspect * sin_slope * sin_latitude
+                             - 0.262 * sin_latitude * sin_slope
+                             + 0.607 * sin_aspect * sin_slope)
+
+    return heat_load_block
+
+# Define a function to calculate topographic radiation
+def radiation_kernel(aspect_block):
+    """
+    Description: calculates topographic radiation aspect index with flat cells set to 0.5
+    Inputs: 'aspect_block' -- a float aspect array in degrees
+    Returned Value: Returns a float radiation array
+    Preconditions: requires an aspect block
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate topographic radiation
+    aspect_radian = aspect_block * 0.0174533
+    radiation_block = (1 - np.cos(aspect_radian - 0.523599)) / 2
+    radiation_block = np.where(aspect_radian < 0, 0.5, radiation_block)
+
+    return radiation_block
+
+# Define a function to calculate surface area ratio
+def surface_area_kernel(slope_block, cell_size):
+    """
+    Description: calculates surface area ratio
+    Inputs: 'slope_block' -- a float slope array in degrees
+            'cell_size' -- the cell size of the raster
+    Returned Value: Returns a float surface area array
+    Preconditions: requires a slope block
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate surface area ratio
+    cell_area = float(cell_size) ** 2
+    surface_area_block = cell_area / np.cos(slope_block * 0.0174533)
+
+    return surface_area_block
+
+# Define a function to calculate roughness
+def roughness_kernel(standard_deviation):
+    """
+    Description: calculates roughness as the squared focal standard deviation of elevation with no data set to zero
+    Inputs: 'standard_deviation' -- a float array of focal standard deviation of elevation
+    Returned Value: Returns a float roughness array
+    Preconditions: requires focal standard deviation calculated with 'DATA' no data handling
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate roughness
+    roughness_block = np.square(standard_deviation)
+    roughness_block[np.isnan(roughness_block)] = 0
+
+    return roughness_block
+
+# Define a function to calculate surface relief ratio
+def relief_kernel(focal_mean, focal_minimum, focal_maximum):
+    """
+    Description: calculates surface relief ratio with flat neighborhoods set to zero
+    Inputs: 'focal_mean' -- a float array of focal mean elevation
+            'focal_minimum' -- a float array of focal minimum elevation
+            'focal_maximum' -- a float array of focal maximum elevation
+    Returned Value: Returns a float surface relief array
+    Preconditions: requires focal statistics calculated with 'DATA' no data handling over the same neighborhood
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate surface relief ratio
+    maximum_drop = focal_maximum - focal_minimum
+    with np.errstate(divide='ignore', invalid='ignore'):
+        standardized_drop = (focal_mean - focal_minimum) / maximum_drop
+    relief_block = np.where(maximum_drop == 0, 0, standardized_drop)
+
+    return relief_block
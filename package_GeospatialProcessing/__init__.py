@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Initialization for Geospatial Processing Module
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-14
+# Last Updated: 2026-10-19
 # Usage: Individual functions have varying requirements. All functions that use arcpy must be executed in an ArcGIS Pro Python 3.6+ distribution.
 # Description: This initialization file imports modules in the package so that the contents are accessible.
 # ---------------------------------------------------------------------------
@@ -10,33 +10,132 @@
 # Import functions from modules
 from package_GeospatialProcessing.arcpyGeoprocessing import arcpy_geoprocessing
 from package_GeospatialProcessing.aggregateSegments import aggregate_segments
+from package_GeospatialProcessing.calculateGridIndex import calculate_grid_cells
+from package_GeospatialProcessing.calculateGridIndex import calculate_grid_groups
+from package_GeospatialProcessing.calculateGridIndex import calculate_grid_names
+from package_GeospatialProcessing.calculateGridIndex import create_validation_raster
+from package_GeospatialProcessing.calculateGridIndex import define_grid_extent
+from package_GeospatialProcessing.calculateGridIndex import format_grid_letters
+from package_GeospatialProcessing.calculateNativeDistance import calculate_native_distance
+from package_GeospatialProcessing.calculateNativeSieve import calculate_native_sieve
+from package_GeospatialProcessing.calculateSpectralMetrics import calculate_metric_block
+from package_GeospatialProcessing.calculateSpectralMetrics import calculate_spectral_metrics
 from package_GeospatialProcessing.calculateTopographicProperties import calculate_topographic_properties
 from package_GeospatialProcessing.calculateZonalStatistics import calculate_zonal_statistics
+from package_GeospatialProcessing.cloudOptimizedRaster import select_predictor
+from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+from package_GeospatialProcessing.compileKernel import compile_kernel
 from package_GeospatialProcessing.compileSpotMultiband import compile_spot_multiband
 from package_GeospatialProcessing.compositeSegmentationImagery import composite_segmentation_imagery
 from package_GeospatialProcessing.convertClassData import convert_class_data
 from package_GeospatialProcessing.convertToBinaryRaster import convert_to_binary_raster
 from package_GeospatialProcessing.convertValidationGrid import convert_validation_grid
 from package_GeospatialProcessing.correctNoData import correct_no_data
+from package_GeospatialProcessing.correctNoDataBatch import correct_no_data_batch
+from package_GeospatialProcessing.correctNoDataBatch import correct_raster_blocks
 from package_GeospatialProcessing.createGridIndex import create_grid_index
+from package_GeospatialProcessing.createNativeSamplingGrid import calculate_cell_centers
+from package_GeospatialProcessing.createNativeSamplingGrid import create_native_sampling_grid
 from package_GeospatialProcessing.createSamplingGrid import create_sampling_grid
+from package_GeospatialProcessing.createWorkGeodatabase import create_work_geodatabase
 from package_GeospatialProcessing.distanceFromFeature import distance_from_feature
 from package_GeospatialProcessing.downloadFromCSV import download_from_csv
+from package_GeospatialProcessing.downloadFromDrive import download_drive_folder
 from package_GeospatialProcessing.downloadFromDrive import download_from_drive
+from package_GeospatialProcessing.downloadManifest import check_download
+from package_GeospatialProcessing.downloadManifest import sync_downloads
+from package_GeospatialProcessing.euclideanDistance import distance_transform
+from package_GeospatialProcessing.euclideanDistance import row_distance
 from package_GeospatialProcessing.extractRaster import extract_raster
+from package_GeospatialProcessing.extractSegmentCovariates import accumulate_segment_block
+from package_GeospatialProcessing.extractSegmentCovariates import calculate_segment_statistic
+from package_GeospatialProcessing.extractSegmentCovariates import extract_segment_covariates
+from package_GeospatialProcessing.extractSegmentCovariates import index_segment_block
+from package_GeospatialProcessing.extractSegmentCovariates import resize_aggregates
 from package_GeospatialProcessing.generateHydrographicPosition import generate_hydrographic_position
 from package_GeospatialProcessing.generateFlowlines import generate_flowlines
+from package_GeospatialProcessing.gridExecutor import check_grid_outputs
+from package_GeospatialProcessing.gridExecutor import execute_grids
+from package_GeospatialProcessing.gridExecutor import limit_process_memory
+from package_GeospatialProcessing.gridExecutor import run_grid
 from package_GeospatialProcessing.listFromDrive import list_from_drive
 from package_GeospatialProcessing.mergeElevationTiles import merge_elevation_tiles
 from package_GeospatialProcessing.mergeFloodplains import merge_floodplains
 from package_GeospatialProcessing.mergeSegmentationImagery import merge_segmentation_imagery
 from package_GeospatialProcessing.normalizedMetrics import normalized_metrics
+from package_GeospatialProcessing.outputCache import cache_geoprocessing
+from package_GeospatialProcessing.outputCache import calculate_cache_key
+from package_GeospatialProcessing.outputCache import check_cache
+from package_GeospatialProcessing.outputCache import delete_output
+from package_GeospatialProcessing.outputCache import hash_file
+from package_GeospatialProcessing.outputCache import hash_input
+from package_GeospatialProcessing.outputCache import identify_function
+from package_GeospatialProcessing.outputCache import list_dependent_modules
+from package_GeospatialProcessing.outputCache import read_cache_manifest
+from package_GeospatialProcessing.outputCache import read_signature
+from package_GeospatialProcessing.outputCache import write_cache_manifest
+from package_GeospatialProcessing.parseImageSegments import assign_grid_names
 from package_GeospatialProcessing.parseImageSegments import parse_image_segments
+from package_GeospatialProcessing.parseImageSegments import partition_image_segments
+from package_GeospatialProcessing.parseImageSegments import write_segment_grid
 from package_GeospatialProcessing.parseRasterBand import parse_raster_band
+from package_GeospatialProcessing.pipelineRunner import build_stage_graph
+from package_GeospatialProcessing.pipelineRunner import calculate_stage_priority
+from package_GeospatialProcessing.pipelineRunner import check_path_overlap
+from package_GeospatialProcessing.pipelineRunner import check_stage
+from package_GeospatialProcessing.pipelineRunner import define_stage
+from package_GeospatialProcessing.pipelineRunner import run_pipeline
+from package_GeospatialProcessing.pipelineRunner import run_stage
+from package_GeospatialProcessing.pipelineRunner import select_stages
 from package_GeospatialProcessing.postprocessCategoricalRaster import postprocess_categorical_raster
 from package_GeospatialProcessing.postprocessContinuousRaster import postprocess_continuous_raster
 from package_GeospatialProcessing.postprocessSegments import postprocess_segments
 from package_GeospatialProcessing.predictionsToRaster import predictions_to_raster
+from package_GeospatialProcessing.rasterBlocks import check_alignment
+from package_GeospatialProcessing.rasterBlocks import convert_integer
+from package_GeospatialProcessing.rasterBlocks import create_block_profile
+from package_GeospatialProcessing.rasterBlocks import generate_blocks
+from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+from package_GeospatialProcessing.rasterBlocks import read_array_block
+from package_GeospatialProcessing.rasterBlocks import read_block
+from package_GeospatialProcessing.rasterExpression import cell_mean
+from package_GeospatialProcessing.rasterExpression import con
+from package_GeospatialProcessing.rasterExpression import create_node
+from package_GeospatialProcessing.rasterExpression import evaluate_expression
+from package_GeospatialProcessing.rasterExpression import evaluate_node
+from package_GeospatialProcessing.rasterExpression import extract_by_mask
+from package_GeospatialProcessing.rasterExpression import integer
+from package_GeospatialProcessing.rasterExpression import is_null
+from package_GeospatialProcessing.rasterExpression import list_rasters
+from package_GeospatialProcessing.rasterExpression import map_algebra
+from package_GeospatialProcessing.rasterExpression import raster_input
+from package_GeospatialProcessing.rasterExpression import set_null
+from package_GeospatialProcessing.rasterExpression import where_clause
+from package_GeospatialProcessing.rasterStack import check_snap
+from package_GeospatialProcessing.rasterStack import close_raster_stack
+from package_GeospatialProcessing.rasterStack import create_raster_stack
+from package_GeospatialProcessing.rasterStack import list_stack_rasters
+from package_GeospatialProcessing.rasterStack import open_raster_stack
+from package_GeospatialProcessing.rasterStack import read_stack_block
+from package_GeospatialProcessing.rasterizeSegmentPredictions import create_segment_lookup
+from package_GeospatialProcessing.rasterizeSegmentPredictions import rasterize_segment_predictions
+from package_GeospatialProcessing.regionLabels import label_regions
 from package_GeospatialProcessing.reprojectExtract import reproject_extract
+from package_GeospatialProcessing.sampleRasterStack import locate_points
+from package_GeospatialProcessing.sampleRasterStack import sample_raster_stack
+from package_GeospatialProcessing.sampleRasterStack import sample_stack_points
+from package_GeospatialProcessing.sampleRasterStack import summarize_buffer
 from package_GeospatialProcessing.spliceSegmentsFloodplains import splice_segments_floodplains
+from package_GeospatialProcessing.streamDownload import download_files
+from package_GeospatialProcessing.streamDownload import stream_download
 from package_GeospatialProcessing.summarizeToRegions import summarize_to_regions
+from package_GeospatialProcessing.temporalReduction import reduce_time_series
+from package_GeospatialProcessing.temporalReduction import reduce_time_series_block
+from package_GeospatialProcessing.timeSeriesRaster import create_time_series_profile
+from package_GeospatialProcessing.timeSeriesRaster import merge_time_series
+from package_GeospatialProcessing.timeSeriesRaster import read_time_series_years
+from package_GeospatialProcessing.timeSeriesRaster import write_time_series_years
+from package_GeospatialProcessing.warpedMosaic import create_tile_catalog
+from package_GeospatialProcessing.warpedMosaic import merge_warped_tiles
+from package_GeospatialProcessing.warpedMosaic import read_mosaic_block
+from package_GeospatialProcessing.warpedMosaic import read_mosaic_window
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Arcpy Geoprocessing Wrapper
 # Author: Timm Nawrocki
-# Last Updated: 2019-10-29
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
 # Description: "Arcpy Geoprocessing Wrapper" is a function that wraps other arcpy functions for standardization, input and output checks, and error reporting.
 # ---------------------------------------------------------------------------
@@ -17,7 +17,7 @@ def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input
             **kwargs -- key word arguments that are used in the wrapper and passed to the geoprocessing function
                 'input_array' -- if check_input == True, then the input datasets must be passed as an array
                 'output_array' -- if check_output == True, then the output datasets must be passed as an array
-    Returned Value: Function returns messages, warnings, and errors from geoprocessing functions.
+    Returned Value: Function returns messages, warnings, and errors from geoprocessing functions and exits with code 1 if an input does not exist or geoprocessing fails so that calling processes can detect the failure.
     Preconditions: geoprocessing function and kwargs must be defined, this function does not conduct any geoprocessing on its own
     """
 
@@ -35,7 +35,7 @@ def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input
             for input_data in kwargs['input_array']:
                 if arcpy.Exists(input_data) != True:
                     print(f'{input_data} does not exist. Check that environment workspace is correct.')
-                    quit()
+                    quit(1)
         # Execute geoprocessing function if all input data exists
         out_process = geoprocessing_function(**kwargs)
         # Provide results report
@@ -47,4 +47,4 @@ def arcpy_geoprocessing(geoprocessing_function, check_output = True, check_input
     # Provide arcpy errors for execution error
     except arcpy.ExecuteError as err:
         print(arcpy.GetMessages())
-        quit()
\ No newline at end of file
+        quit(1)
\ No newline at end of file
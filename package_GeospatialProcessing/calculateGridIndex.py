@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate grid index
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Calculate grid index" is a set of functions that assign grid index cells to coordinates by floor division of the coordinates by the grid distance relative to the grid origin. Validation groups and major and minor grid names of points or cells are calculated directly from their coordinates, and a validation group raster can be written block by block on the grid of a study area raster, replacing the sequence of GridIndexFeatures, SpatialJoin, PairwiseClip, and PolygonToRaster.
+# ---------------------------------------------------------------------------
+
+# Define a function to define a grid index over a study area
+def define_grid_extent(area_raster, distance):
+    """
+    Description: defines a grid index that covers the extent of a study area raster in the same way as GridIndexFeatures, with the grid origin at the lower left corner of the study area and rows that extend past the top of the study area
+    Inputs: 'area_raster' -- a raster that defines the study area extent
+            'distance' -- the width and height of the grid cells in map units
+    Returned Value: Returns a grid dictionary with the upper left origin, distance, and number of rows and columns
+    Preconditions: requires a study area raster in a projected coordinate system
+    """
+
+    # Import packages
+    import math
+    import rasterio
+
+    # Define the grid from the lower left corner of the study area
+    with rasterio.open(area_raster) as area_dataset:
+        bounds = area_dataset.bounds
+    row_count = max(int(math.ceil(round((bounds.top - bounds.bottom) / distance, 6))), 1)
+    column_count = max(int(math.ceil(round((bounds.right - bounds.left) / distance, 6))), 1)
+    grid_index = {'origin': (bounds.left, bounds.bottom + row_count * distance),
+                  'distance': distance,
+                  'rows': row_count,
+                  'columns': column_count}
+
+    return grid_index
+
+# Define a function to locate coordinates on a grid index
+def calculate_grid_cells(grid_index, x_coordinates, y_coordinates, distance=None):
+    """
+    Description: calculates the grid index rows and columns that contain a set of coordinates
+    Inputs: 'grid_index' -- a grid dictionary created by define_grid_extent
+            'x_coordinates' -- an array of x coordinates
+            'y_coordinates' -- an array of y coordinates
+            'distance' -- an optional cell distance that overrides the distance of the grid index to locate minor cells from the same origin
+    Returned Value: Returns a tuple of integer row and column arrays numbered from zero at the upper left
+    Preconditions: requires coordinates in the coordinate system of the grid index
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Floor divide coordinates relative to the upper left origin
+    if distance is None:
+        distance = grid_index['distance']
+    origin_x, origin_y = grid_index['origin']
+    rows = np.floor((origin_y - np.asarray(y_coordinates, dtype='float64')) / distance).astype('int64')
+    columns = np.floor((np.asarray(x_coordinates, dtype='float64') - origin_x) / distance).astype('int64')
+
+    return rows, columns
+
+# Define a function to calculate validation groups from coordinates
+def calculate_grid_groups(grid_index, x_coordinates, y_coordinates):
+    """
+    Description: calculates the validation group of a set of coordinates as the row-major number of the grid index cell that contains each coordinate
+    Inputs: 'grid_index' -- a grid dictionary created by define_grid_extent
+            'x_coordinates' -- an array of x coordinates
+            'y_coordinates' -- an array of y coordinates
+    Returned Value: Returns an integer array of validation groups numbered from one at the upper left, with zero for coordinates outside the grid
+    Preconditions: requires coordinates in the coordinate system of the grid index
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Number cells in row-major order
+    rows, columns = calculate_grid_cells(grid_index, x_coordinates, y_coordinates)
+    inside = (rows >= 0) & (rows < grid_index['rows']) & (columns >= 0) & (columns < grid_index['columns'])
+    groups = np.where(inside, rows * grid_index['columns'] + columns + 1, 0)
+
+    return groups
+
+# Define a function to format grid index row letters
+def format_grid_letters(row):
+    """
+    Description: formats a grid index row number as letters in the same way as GridIndexFeatures page names
+    Inputs: 'row' -- a row number starting at zero
+    Returned Value: Returns a string of letters where rows after Z continue as AA, AB, and so on
+    Preconditions: requires a non-negative integer
+    """
+
+    # Convert the row number to base 26 letters
+    letters = ''
+    row = int(row) + 1
+    while row > 0:
+        row, remainder = divmod(row - 1, 26)
+        letters = chr(65 + remainder) + letters
+
+    return letters
+
+# Define a function to calculate grid names from coordinates
+def calculate_grid_names(grid_index, x_coordinates, y_coordinates, minor_distance=None):
+    """
+    Description: calculates the major grid name and optional minor grid name of a set of coordinates
+    Inputs: 'grid_index' -- a grid dictionary created by define_grid_extent that defines the major grid
+            'x_coordinates' -- an array of x coordinates
+            'y_coordinates' -- an array of y coordinates
+            'minor_distance' -- an optional distance of minor grid cells that evenly divides the major grid distance
+    Returned Value: Returns an object array of major grid names such as 'A1' and, if a minor distance is provided, an object array of minor grid names such as 'A1_00001' numbered in row-major order within each major cell, where coordinates outside the grid have empty names
+    Preconditions: requires coordinates in the coordinate system of the grid index
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Name major cells by row letter and column number
+    rows, columns = calculate_grid_cells(grid_index, x_coordinates, y_coordinates)
+    inside = (rows >= 0) & (rows < grid_index['rows']) & (columns >= 0) & (columns < grid_index['columns'])
+    major_numbers = np.where(inside, rows * grid_index['columns'] + columns, -1)
+    unique_numbers, major_inverse = np.unique(major_numbers, return_inverse=True)
+    major_lookup = np.array([format_grid_letters(number // grid_index['columns']) + str(number % grid_index['columns'] + 1)
+                             if number >= 0 else '' for number in unique_numbers], dtype=object)
+    major_names = major_lookup[major_inverse.reshape(major_numbers.shape)]
+    if minor_distance is None:
+        return major_names
+
+    # Name minor cells by their row-major number within the major cell
+    ratio = int(round(grid_index['distance'] / minor_distance))
+    if abs(ratio * minor_distance - grid_index['distance']) > 1e-6 * grid_index['distance']:
+        raise ValueError(f'Minor distance {minor_distance} does not evenly divide major distance {grid_index["distance"]}.')
+    minor_rows, minor_columns = calculate_grid_cells(grid_index, x_coordinates, y_coordinates, minor_distance)
+    minor_numbers = (minor_rows - rows * ratio) * ratio + (minor_columns - columns * ratio) + 1
+    minor_names = np.array([f'{major_name}_{minor_number:05d}' if major_name != '' else ''
+                            for major_name, minor_number in zip(major_names.ravel(), minor_numbers.ravel())],
+                           dtype=object).reshape(major_names.shape)
+
+    return major_names, minor_names
+
+# Define a function to write a validation group raster
+def create_validation_raster(**kwargs):
+    """
+    Description: writes a raster of validation groups on the grid of a study area raster, where each cell within the study area receives the group of the grid index cell that contains its center
+    Inputs: 'distance' -- the width and height of the validation grid cells in map units
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'input_array' -- an array containing the study area raster
+            'output_array' -- an array containing the output validation raster
+    Returned Value: Returns a 32-bit integer raster to disk of validation groups numbered as in calculate_grid_groups
+    Preconditions: requires a study area raster with no data outside the study area
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.createNativeSamplingGrid import calculate_cell_centers
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    import datetime
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import time
+
+    # Parse key word argument inputs
+    distance = kwargs['distance']
+    block_size = kwargs.get('block_size', 2048)
+    area_raster = kwargs['input_array'][0]
+    validation_raster = kwargs['output_array'][0]
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(validation_raster)[0] + '_temporary.tif'
+
+    # Define the validation grid
+    grid_index = define_grid_extent(area_raster, distance)
+
+    # Assign validation groups block by block
+    print(f'\tAssigning validation groups on a grid of {grid_index["rows"]} rows and {grid_index["columns"]} columns...')
+    iteration_start = time.time()
+    with rasterio.open(area_raster) as area_dataset:
+        output_profile = create_block_profile(area_dataset, 'int32', -2147483648)
+        block_list = generate_blocks(area_dataset.height, area_dataset.width, block_size)
+        with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+            for block in block_list:
+                row_offset, column_offset, block_rows, block_columns = block
+                area_values = read_block(area_dataset, block)
+                x_coordinates, y_coordinates = calculate_cell_centers(area_dataset.transform, block)
+                groups = calculate_grid_groups(grid_index, x_coordinates, y_coordinates).astype('int32')
+                groups[~np.isfinite(area_values)] = output_profile['nodata']
+                output_dataset.write(groups,
+                                     1,
+                                     window=Window(column_offset, row_offset, block_columns, block_rows))
+
+    # Move the completed raster to the output path and add overviews
+    os.replace(temporary_raster, validation_raster)
+    write_cloud_optimized_raster(validation_raster, resampling='nearest')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = 'Successfully created validation raster.'
+    return outprocess
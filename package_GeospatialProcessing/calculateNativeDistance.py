@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate native distance
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. Numba is used to compile the lower envelope kernel if it is installed.
+# Description: "Calculate native distance" is a function that calculates the exact Euclidean distance from every cell of an area raster to the nearest source cell without arcpy. The source grid is scanned forward and backward in bands of rows to find the nearest source in each column, and distances are resolved along rows from the lower envelope of parabolas so that memory is bounded by the band size.
+# ---------------------------------------------------------------------------
+
+# Define function to calculate Euclidean distance without arcpy
+def calculate_native_distance(area_raster, source_raster, output_raster, maximum_distance=None,
+                              allocation_output=None, scratch_folder=None, block_size=2048):
+    """
+    Description: calculates a 32-bit signed integer Euclidean distance raster and an optional allocation raster
+    Inputs: 'area_raster' -- an input raster that defines the output grid and study area
+            'source_raster' -- an input raster that shares the cell alignment of the area raster, in which all cells with data are sources
+            'output_raster' -- a file path for an output distance raster in the horizontal units of the area raster
+            'maximum_distance' -- an optional distance beyond which cells are no data
+            'allocation_output' -- an optional file path for an output raster of the source value of the nearest source cell, with the data type and no data value of the source raster
+            'scratch_folder' -- an optional folder to store memory-mapped working arrays (default is the folder of the output raster)
+            'block_size' -- the number of rows processed per band
+    Returned Value: Returns a raster dataset on disk
+    Preconditions: requires an area raster and an aligned source raster in a projected coordinate system
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.euclideanDistance import row_distance
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    import numpy as np
+    import os
+    import rasterio
+    import shutil
+    import tempfile
+    from rasterio.windows import Window
+
+    # Create a scratch folder for memory-mapped working arrays
+    if scratch_folder is None:
+        scratch_folder = os.path.split(output_raster)[0]
+    work_folder = tempfile.mkdtemp(prefix='distance_', dir=scratch_folder)
+
+    try:
+        with rasterio.open(area_raster) as area_dataset, rasterio.open(source_raster) as source_dataset:
+            # Determine raster properties
+            rows = area_dataset.height
+            columns = area_dataset.width
+            cell_size = area_dataset.res[0]
+            band_list = [(row_offset, 0, min(block_size, rows - row_offset), columns)
+                         for row_offset in range(0, rows, block_size)]
+
+            # Limit column scans to the maximum distance in cells
+            if maximum_distance is None:
+                maximum_cells = np.inf
+            else:
+                maximum_cells = maximum_distance / cell_size
+
+            # Create memory-mapped arrays of the nearest source row above each cell
+            above_row = np.memmap(os.path.join(work_folder, 'above_row.dat'), dtype='int32', mode='w+', shape=(rows, columns))
+            above_value = None
+            if allocation_output is not None:
+                above_value = np.memmap(os.path.join(work_folder, 'above_value.dat'), dtype='float64', mode='w+', shape=(rows, columns))
+
+            # Scan columns forward for the nearest source above
+            print('\t\tScanning source cells...')
+            last_row = np.full(columns, -1, dtype=np.int32)
+            last_value = np.full(columns, np.nan)
+            for band in band_list:
+                row_offset, column_offset, band_rows, band_columns = band
+                source_band = read_aligned_block(source_dataset, area_dataset, band)
+                for index in range(band_rows):
+                    source = np.isfinite(source_band[index])
+                    last_row[source] = row_offset + index
+                    above_row[row_offset + index] = last_row
+                    if above_value is not None:
+                        last_value[source] = source_band[index][source]
+                        above_value[row_offset + index] = last_value
+
+            # Create output rasters
+            print('\t\tCalculating distance...')
+            output_profile = create_block_profile(area_dataset, 'int32', -2147483648)
+            output_dataset = rasterio.open(output_raster, 'w', **output_profile)
+            allocation_dataset = None
+            if allocation_output is not None:
+                allocation_nodata = source_dataset.nodata if source_dataset.nodata is not None else -2147483648
+                allocation_profile = create_block_profile(area_dataset, source_dataset.dtypes[0], allocation_nodata)
+                allocation_dataset = rasterio.open(allocation_output, 'w', **allocation_profile)
+
+            # Scan columns backward and resolve distances along rows
+            next_row = np.full(columns, -1, dtype=np.int32)
+            next_value = np.full(columns, np.nan)
+            for band in reversed(band_list):
+                row_offset, column_offset, band_rows, band_columns = band
+                source_band = read_aligned_block(source_dataset, area_dataset, band)
+                column_distance = np.full((band_rows, columns), np.inf)
+                column_value = np.full((band_rows, columns), np.nan)
+                for index in range(band_rows - 1, -1, -1):
+                    row = row_offset + index
+                    source = np.isfinite(source_band[index])
+                    next_row[source] = row
+                    if allocation_dataset is not None:
+                        next_value[source] = source_band[index][source]
+                    # Select the nearer of the sources above and below
+                    previous_row = np.asarray(above_row[row])
+                    above_distance = np.where(previous_row >= 0, row - previous_row, np.inf)
+                    below_distance = np.where(next_row >= 0, next_row - row, np.inf)
+                    use_below = below_distance < above_distance
+                    nearest_distance = np.where(use_below, below_distance, above_distance)
+                    nearest_distance[nearest_distance > maximum_cells] = np.inf
+                    column_distance[index] = nearest_distance
+                    if allocation_dataset is not None:
+                        column_value[index] = np.where(use_below, next_value, above_value[row])
+
+                # Resolve distances along rows
+                squared_distance, nearest_column = row_distance(column_distance)
+                distance_band = np.sqrt(squared_distance) * cell_size
+
+                # Mask distances to the study area and maximum distance
+                area_band = read_block(area_dataset, band)
+                valid = np.isfinite(area_band) & np.isfinite(distance_band)
+                if maximum_distance is not None:
+                    valid = valid & (distance_band <= maximum_distance)
+
+                # Write distance band truncated to integer
+                window = Window(0, row_offset, columns, band_rows)
+                output_band = np.full((band_rows, columns), -2147483648, dtype='int32')
+                output_band[valid] = np.trunc(distance_band[valid]).astype('int32')
+                output_dataset.write(output_band, 1, window=window)
+
+                # Write the value of the nearest source
+                if allocation_dataset is not None:
+                    allocation_band = np.take_along_axis(column_value, np.where(nearest_column >= 0, nearest_column, 0), axis=1)
+                    output_band = np.full((band_rows, columns), allocation_nodata, dtype=allocation_dataset.dtypes[0])
+                    output_band[valid] = allocation_band[valid]
+                    allocation_dataset.write(output_band, 1, window=window)
+
+            # Close output rasters
+            output_dataset.close()
+            if allocation_dataset is not None:
+                allocation_dataset.close()
+
+            # Release memory maps
+            del above_row, above_value
+    finally:
+        # Remove working arrays
+        shutil.rmtree(work_folder, ignore_errors=True)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate native sieve
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. Numba is used to compile the union-find and lower envelope kernels if it is installed.
+# Description: "Calculate native sieve" is a function that removes four-connected regions below a minimum cell count from a categorical raster and fills the removed cells from the nearest retained cell without arcpy. Regions are labelled with union-find and filled with the allocation of the native distance engine, replacing the sequence of RegionGroup, ExtractByAttributes, SetNull, and Nibble.
+# ---------------------------------------------------------------------------
+
+# Define function to sieve a categorical raster without arcpy
+def calculate_native_sieve(input_raster, output_raster, minimum_count, region_raster=None, excluded_value=None,
+                           scratch_folder=None, block_size=2048):
+    """
+    Description: replaces regions of a categorical raster at or below a minimum cell count with the value of the nearest retained cell
+    Inputs: 'input_raster' -- an input categorical raster that provides the fill values and defines the output grid
+            'output_raster' -- a file path for an output raster with the data type and no data value of the input raster
+            'minimum_count' -- the number of cells that a region must exceed to be retained
+            'region_raster' -- an optional raster on the grid of the input raster that defines the regions, in which cells without data are always replaced (default is the input raster)
+            'excluded_value' -- an optional region value that is always replaced
+            'scratch_folder' -- an optional folder to store working datasets (default is the folder of the output raster)
+            'block_size' -- the number of rows and columns processed per block
+    Returned Value: Returns a raster dataset on disk
+    Preconditions: requires a categorical input raster in a projected coordinate system
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.calculateNativeDistance import calculate_native_distance
+    from package_GeospatialProcessing.rasterBlocks import check_alignment
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    from package_GeospatialProcessing.regionLabels import label_regions
+    import numpy as np
+    import os
+    import rasterio
+    import shutil
+    import tempfile
+    from rasterio.windows import Window
+
+    # Set the region raster
+    if region_raster is None:
+        region_raster = input_raster
+
+    # Create a scratch folder for working datasets
+    if scratch_folder is None:
+        scratch_folder = os.path.split(output_raster)[0]
+    work_folder = tempfile.mkdtemp(prefix='sieve_', dir=scratch_folder)
+    retained_raster = os.path.join(work_folder, 'retained.tif')
+    distance_raster = os.path.join(work_folder, 'distance.tif')
+
+    try:
+        with rasterio.open(input_raster) as input_dataset, rasterio.open(region_raster) as region_dataset:
+            # Check alignment of the region raster
+            if check_alignment(input_dataset, region_dataset) == False:
+                print('\t\tERROR: Region raster must share the grid of the input raster.')
+                quit(1)
+
+            # Determine raster properties
+            rows = input_dataset.height
+            columns = input_dataset.width
+            block_list = generate_blocks(rows, columns, block_size)
+            input_nodata = input_dataset.nodata
+
+            # Label regions and calculate region sizes
+            print('\t\tLabelling contiguous value areas...')
+            labels = np.memmap(os.path.join(work_folder, 'labels.dat'), dtype='int64', mode='w+', shape=(rows, columns))
+            parent, region_counts = label_regions(region_dataset, input_dataset, labels, block_list, excluded_value)
+
+            # Write the input values of retained regions
+            print(f'\t\tRemoving contiguous areas at or below {minimum_count} cells...')
+            retained_profile = create_block_profile(input_dataset, input_dataset.dtypes[0], input_nodata)
+            with rasterio.open(retained_raster, 'w', **retained_profile) as retained_dataset:
+                for block in block_list:
+                    row_offset, column_offset, block_rows, block_columns = block
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    input_block = input_dataset.read(1, window=window)
+                    block_labels = np.asarray(labels[row_offset:row_offset + block_rows,
+                                                     column_offset:column_offset + block_columns])
+                    retained = block_labels >= 0
+                    retained[retained] = region_counts[block_labels[retained]] > minimum_count
+                    retained = retained & np.isfinite(read_block(input_dataset, block))
+                    output_block = np.where(retained, input_block, input_nodata).astype(input_dataset.dtypes[0])
+                    retained_dataset.write(output_block, 1, window=window)
+            del labels
+
+        # Fill removed cells from the nearest retained cell within the input data
+        print('\t\tReplacing removed data...')
+        calculate_native_distance(input_raster,
+                                  retained_raster,
+                                  distance_raster,
+                                  allocation_output=output_raster,
+                                  scratch_folder=work_folder,
+                                  block_size=block_size)
+    finally:
+        # Remove working datasets
+        shutil.rmtree(work_folder, ignore_errors=True)
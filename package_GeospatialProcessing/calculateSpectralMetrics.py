@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Calculate spectral metrics
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Calculate spectral metrics" is a function that calculates any number of normalized difference spectral metrics and enhanced vegetation index-2 metrics in a single pass. Each input band is read once per block, all metrics are calculated from the shared bands, and blocks are processed in parallel threads.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate a spectral metric for a block
+def calculate_metric_block(metric_type, add_values, subtract_values):
+    """
+    Description: calculates a normalized difference or EVI2 metric from two bands
+    Inputs: 'metric_type' -- a string value of either "EVI2" or "NORMALIZED"
+            'add_values' -- a float array of the additive band
+            'subtract_values' -- a float array of the subtractive band
+    Returned Value: Returns a float array with NaN where either band is no data or the denominator is zero
+    Preconditions: requires float arrays with NaN as no data
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate metric
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if metric_type == 'EVI2':
+            denominator = 1 + add_values + (2.4 * subtract_values)
+        else:
+            denominator = add_values + subtract_values
+        metric_values = np.where(denominator == 0, np.nan, (add_values - subtract_values) / denominator)
+
+    return metric_values
+
+# Define a function to calculate spectral metrics
+def calculate_spectral_metrics(**kwargs):
+    """
+    Description: calculates multiple normalized metrics and EVI2 from shared bands in a single pass
+    Inputs: 'metric_list' -- a list of (metric type, additive raster, subtractive raster) tuples in the order of the output array, where the metric type is either "EVI2" or "NORMALIZED"
+            'conversion_factor' -- a number that will be multiplied with the original value before being converted to integer
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'workers' -- an optional number of threads that process blocks in parallel (default is the number of processors)
+            'input_array' -- an array containing the area raster (must be first) and the band rasters
+            'output_array' -- an array containing an output raster for each metric
+    Returned Value: Returns rasters to disk
+    Preconditions: requires single band image rasters that share the cell alignment of the area raster
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import convert_integer
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    from concurrent.futures import ThreadPoolExecutor
+    import datetime
+    import numpy as np
+    import os
+    import rasterio
+    import time
+    from rasterio.windows import Window
+
+    # Parse key word argument inputs
+    metric_list = kwargs['metric_list']
+    conversion_factor = kwargs['conversion_factor']
+    block_size = kwargs.get('block_size', 2048)
+    workers = kwargs.get('workers', os.cpu_count())
+    area_raster = kwargs['input_array'][0]
+    output_list = kwargs['output_array']
+
+    # Check that each metric has an output
+    if len(metric_list) != len(output_list):
+        print('\tERROR: Metric list and output array must have the same length.')
+        quit(1)
+
+    # Identify the bands required by all metrics
+    band_list = []
+    for metric_type, add_raster, subtract_raster in metric_list:
+        for band_raster in (add_raster, subtract_raster):
+            if band_raster not in band_list:
+                band_list.append(band_raster)
+
+    # Define a function to calculate all metrics for a block
+    def process_block(block):
+        # Read each band once
+        band_values = {}
+        with rasterio.open(area_raster) as area_dataset:
+            for band_raster in band_list:
+                with rasterio.open(band_raster) as band_dataset:
+                    band_values[band_raster] = read_aligned_block(band_dataset, area_dataset, block)
+        # Calculate each metric and convert to integer
+        mask = np.ones((block[2], block[3]), dtype=bool)
+        metric_blocks = []
+        for metric_type, add_raster, subtract_raster in metric_list:
+            metric_values = calculate_metric_block(metric_type, band_values[add_raster], band_values[subtract_raster])
+            metric_blocks.append(convert_integer(metric_values, conversion_factor, mask, 'int32', -2147483648))
+        return metric_blocks
+
+    # Calculate spectral metrics
+    print(f'\tCalculating {len(metric_list)} spectral metrics from {len(band_list)} bands...')
+    iteration_start = time.time()
+    with rasterio.open(area_raster) as area_dataset:
+        output_profile = create_block_profile(area_dataset, 'int32', -2147483648)
+        block_list = generate_blocks(area_dataset.height, area_dataset.width, block_size)
+    output_datasets = [rasterio.open(output_raster, 'w', **output_profile) for output_raster in output_list]
+    try:
+        # Process blocks in parallel in batches so that pending results are bounded in memory
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            batch_size = workers * 2
+            for batch_start in range(0, len(block_list), batch_size):
+                batch_list = block_list[batch_start:batch_start + batch_size]
+                # Write results in block order
+                for block, metric_blocks in zip(batch_list, executor.map(process_block, batch_list)):
+                    row_offset, column_offset, block_rows, block_columns = block
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    for output_dataset, metric_block in zip(output_datasets, metric_blocks):
+                        output_dataset.write(metric_block, 1, window=window)
+    finally:
+        for output_dataset in output_datasets:
+            output_dataset.close()
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success for iteration
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Report success
+    out_process = f'Successfully calculated {len(metric_list)} spectral metrics.'
+    return out_process
@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Calculate Topographic Properties
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Calculate Topographic Properties" is a function that calculates multiple integer topographic properties from a float elevation raster.
 # ---------------------------------------------------------------------------
@@ -13,6 +13,8 @@ def calculate_topographic_properties(**kwargs):
     Description: calculates integer topographic properties from a float elevation raster
     Inputs: 'z_unit' -- a string value of either 'Meter' or 'Foot' representing the vertical unit of the elevation raster
             'position_width' -- an integer value of the distance to consider for topographic position in the same units as the input raster
+            'fused' -- an optional boolean value that if True calculates elevation, slope, aspect, exposure, heat load, position, radiation, roughness, surface area, and surface relief in a single pass over the elevation raster and calculates flow accumulation with the native flow routing engine (default is False)
+            'block_size' -- an optional integer number of rows and columns to process per block in fused mode (default is 2048)
             'input_array' -- an array containing the grid raster (must be first) and the float elevation raster
             'output_array' -- an array containing the output rasters for elevation (integer), slope, aspect, exposure, heat load, position, radiation, roughness, surface area, surface relief, wetness (in that order).
     Returned Value: Returns a raster dataset on disk for each topographic property
@@ -24,8 +26,10 @@ def calculate_topographic_properties(**kwargs):
     from package_Geomorphometry import calculate_aspect
     from package_Geomorphometry import calculate_exposure
     from package_Geomorphometry import calculate_flow
+    from package_Geomorphometry import calculate_fused_topography
     from package_Geomorphometry import calculate_heat_load
     from package_Geomorphometry import calculate_integer_elevation
+    from package_Geomorphometry import calculate_native_flow
     from package_Geomorphometry import calculate_position
     from package_Geomorphometry import calculate_radiation
     from package_Geomorphometry import calculate_roughness
@@ -40,6 +44,8 @@ def calculate_topographic_properties(**kwargs):
     # Parse key word argument inputs
     z_unit = kwargs['z_unit']
     position_width = kwargs['position_width']
+    fused = kwargs.get('fused', False)
+    block_size = kwargs.get('block_size', 2048)
     area_raster = kwargs['input_array'][0]
     elevation_float = kwargs['input_array'][1]
     elevation_integer = kwargs['output_array'][0]
@@ -74,7 +80,7 @@ def calculate_topographic_properties(**kwargs):
     if reference_type == "Geographic":
         print(
             '\tERROR: Elevation raster must be in a projected spatial reference, not a geographic spatial reference.')
-        quit()
+        quit(1)
     # Check units
     else:
         print('\tElevation raster is in a projected spatial reference.')
@@ -82,12 +88,47 @@ def calculate_topographic_properties(**kwargs):
     reference_unit = spatial_reference.linearUnitName.upper()
     if reference_unit != z_unit:
         print(f'\tERROR: Vertical units ({z_unit}) and horizontal units ({reference_unit}) do not match.')
-        quit()
+        quit(1)
     # If the vertical and horizontal units are the same, then proceed with calculations
     else:
         print(f'\tVertical units ({z_unit}) and horizontal units ({reference_unit}) match.')
     print('\t----------')
 
+    #### CALCULATE FUSED TOPOGRAPHY DATASETS
+
+    # Calculate all single-pass properties from one read of the elevation raster if fused mode is selected
+    if fused == True:
+        fused_outputs = {'elevation': elevation_integer,
+                         'slope': slope_integer,
+                         'aspect': aspect_integer,
+                         'exposure': exposure_output,
+                         'heat_load': heatload_output,
+                         'position': position_output,
+                         'radiation': radiation_output,
+                         'roughness': roughness_output,
+                         'surface_area': surfacearea_output,
+                         'surface_relief': surfacerelief_output}
+        fused_outputs = {key: value for key, value in fused_outputs.items() if os.path.exists(value) == 0}
+        # Write float slope only if topographic wetness still requires it
+        fused_slope = None
+        if arcpy.Exists(wetness_output) == 0 and os.path.exists(slope_float) == 0:
+            fused_slope = slope_float
+        if len(fused_outputs) > 0 or fused_slope is not None:
+            print(f'\tCalculating fused topographic properties...')
+            iteration_start = time.time()
+            calculate_fused_topography(area_raster, elevation_float, fused_outputs, fused_slope, position_width, block_size)
+            # End timing
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            # Report success
+            print(
+                f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            print('\t----------')
+        else:
+            print(f'\tFused topographic properties already exist.')
+            print('\t----------')
+
     #### CALCULATE FOUNDATIONAL TOPOGRAPHY DATASETS
 
     # Calculate integer elevation if it does not already exist
@@ -148,7 +189,10 @@ def calculate_topographic_properties(**kwargs):
         # Calculate flow direction
         print(f'\tCalculating flow direction...')
         iteration_start = time.time()
-        calculate_flow(area_raster, elevation_float, flow_accumulation)
+        if fused == True:
+            calculate_native_flow(elevation_float, flow_accumulation, 3, 'DINF')
+        else:
+            calculate_flow(area_raster, elevation_float, flow_accumulation)
         # End timing
         iteration_end = time.time()
         iteration_elapsed = int(iteration_end - iteration_start)
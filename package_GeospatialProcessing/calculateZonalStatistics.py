@@ -2,8 +2,8 @@
 # ---------------------------------------------------------------------------
 # Calculate zonal statistics
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-02
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
 # Description: "Calculate zonal statistics" is a function that calculates zonal statistics of an input raster to a zone raster.
 # ---------------------------------------------------------------------------
 
@@ -21,6 +21,7 @@ def calculate_zonal_statistics(**kwargs):
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Raster
     from arcpy.sa import ZonalStatistics
@@ -102,6 +103,8 @@ def calculate_zonal_statistics(**kwargs):
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(output_raster, resampling='average')
     # End timing
     iteration_end = time.time()
     iteration_elapsed = int(iteration_end - iteration_start)
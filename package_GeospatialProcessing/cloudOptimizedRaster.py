@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Cloud optimized raster
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.9+ distribution with numpy and rasterio.
+# Description: "Cloud optimized raster" is a set of functions that rewrite product rasters as cloud optimized GeoTIFFs with square internal tiles, lossless compression with a predictor chosen for the data type, and internal overviews so that windowed reads and viewers only read the tiles and resolutions that they need.
+# ---------------------------------------------------------------------------
+
+# Define a function to select a compression predictor for a data type
+def select_predictor(dtype):
+    """
+    Description: selects the GeoTIFF compression predictor for a data type, where floating point differencing is used for float data, horizontal differencing is used for integer data of 16 bits or more, and no predictor is used for 8-bit data
+    Inputs: 'dtype' -- a numpy data type or data type name
+    Returned Value: Returns the integer GeoTIFF predictor code 1, 2, or 3
+    Preconditions: requires a numeric data type
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Select predictor by data type
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return 3
+    if dtype.itemsize >= 2:
+        return 2
+    return 1
+
+# Define a function to write a cloud optimized raster
+def write_cloud_optimized_raster(input_raster, output_raster=None, resampling='nearest', tile_size=512, threads='ALL_CPUS'):
+    """
+    Description: rewrites a raster as a tiled and compressed cloud optimized GeoTIFF with internal overviews built in parallel
+    Inputs: 'input_raster' -- an input raster readable by rasterio
+            'output_raster' -- an optional output raster path (default is to replace the input raster)
+            'resampling' -- the overview resampling method, where 'nearest' preserves categorical values and 'average' or 'bilinear' smooths continuous values
+            'tile_size' -- the number of rows and columns of the internal tiles
+            'threads' -- the number of threads used to compress tiles and build overviews, or 'ALL_CPUS'
+    Returned Value: Returns a cloud optimized GeoTIFF to disk with the same values, grid, and no data as the input
+    Preconditions: requires a GDAL build with the COG driver and a tile size that is a multiple of 16
+    """
+
+    # Import packages
+    import os
+    import rasterio
+    import rasterio.shutil
+
+    # Replace the input raster if no output raster is provided
+    if output_raster is None:
+        output_raster = input_raster
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_cog_temporary.tif'
+
+    # Select compression predictor for the data type
+    with rasterio.open(input_raster) as input_dataset:
+        predictor = select_predictor(input_dataset.dtypes[0])
+    predictor_names = {1: 'NO', 2: 'STANDARD', 3: 'FLOATING_POINT'}
+
+    # Copy the raster to a cloud optimized GeoTIFF
+    rasterio.shutil.copy(input_raster,
+                         temporary_raster,
+                         driver='COG',
+                         COMPRESS='DEFLATE',
+                         PREDICTOR=predictor_names[predictor],
+                         BLOCKSIZE=str(tile_size),
+                         OVERVIEW_RESAMPLING=resampling.upper(),
+                         NUM_THREADS=str(threads),
+                         BIGTIFF='IF_SAFER')
+
+    # Move the completed raster to the output path and remove external pyramids that would hide the internal overviews
+    os.replace(temporary_raster, output_raster)
+    if os.path.exists(output_raster + '.ovr') == 1:
+        os.remove(output_raster + '.ovr')
+
+    return output_raster
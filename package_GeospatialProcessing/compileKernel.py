@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Compile kernel
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an Anaconda Python 3.9+ distribution or an ArcGIS Pro Python 3.7+ distribution. Numba is used if it is installed.
+# Description: "Compile kernel" is a function that compiles a cell-by-cell kernel to machine code with numba when numba is available and otherwise returns the kernel unchanged so that it runs as plain Python.
+# ---------------------------------------------------------------------------
+
+# Define a function to compile a kernel
+def compile_kernel(kernel):
+    """
+    Description: compiles a kernel written in the numba-compatible subset of Python and numpy
+    Inputs: 'kernel' -- a module-level function that operates on numpy arrays and scalars
+    Returned Value: Returns a compiled kernel if numba is installed, otherwise returns the input kernel
+    Preconditions: requires a kernel that uses only numba-compatible operations
+    """
+
+    # Return the plain Python kernel if numba is not installed
+    try:
+        from numba import njit
+    except ImportError:
+        return kernel
+
+    # Compile the kernel with caching so that compilation occurs once per environment
+    compiled_kernel = njit(cache=True)(kernel)
+
+    return compiled_kernel
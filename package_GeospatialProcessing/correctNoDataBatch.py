@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Correct no data batch
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Correct no data batch" is a set of functions that correct no data values for a list of rasters by setting null where less than a threshold. Each raster is streamed block by block onto the grid of an area raster and written with compression, and rasters are processed in parallel worker processes.
+# ---------------------------------------------------------------------------
+
+# Define a function to correct no data for a single raster
+def correct_raster_blocks(area_raster, input_raster, output_raster, threshold, block_size=2048):
+    """
+    Description: sets values less than a threshold to no data block by block and writes a compressed 32-bit float raster
+    Inputs: 'area_raster' -- a raster that defines the output grid
+            'input_raster' -- an input raster that shares the coordinate system and cell alignment of the area raster
+            'output_raster' -- a file path for the output raster
+            'threshold' -- a numeric threshold below which to set null
+            'block_size' -- the number of rows and columns processed per block
+    Returned Value: Returns the output raster path after writing the raster to disk
+    Preconditions: requires an input raster aligned to the area raster
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+
+    with rasterio.open(area_raster) as area_dataset, rasterio.open(input_raster) as input_dataset:
+        # Check that the input raster shares the coordinate system and cell size of the area raster
+        if input_dataset.crs != area_dataset.crs or not np.allclose(input_dataset.res, area_dataset.res):
+            raise ValueError(f'{input_raster} does not share the coordinate system and cell size of the area raster.')
+
+        # Create a compressed output profile
+        output_profile = create_block_profile(area_dataset, 'float32', -32764)
+
+        # Set null where less than threshold block by block
+        block_list = generate_blocks(area_dataset.height, area_dataset.width, block_size)
+        with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+            for block in block_list:
+                row_offset, column_offset, block_rows, block_columns = block
+                values = read_aligned_block(input_dataset, area_dataset, block)
+                values[values < threshold] = np.nan
+                output_block = np.where(np.isnan(values), -32764, values).astype('float32')
+                window = Window(column_offset, row_offset, block_columns, block_rows)
+                output_dataset.write(output_block, 1, window=window)
+
+    # Move the completed raster to the output path
+    os.replace(temporary_raster, output_raster)
+
+    return output_raster
+
+# Define a function to correct no data for a batch of rasters
+def correct_no_data_batch(**kwargs):
+    """
+    Description: corrects no data values for a list of rasters by setting null where less than a threshold
+    Inputs: 'threshold' -- a numeric threshold to below which to set null
+            'workers' -- an optional number of worker processes (default is the number of processors)
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'input_array' -- an array containing the area raster (must be first) and the input rasters
+            'output_array' -- an array containing an output raster for each input raster
+    Returned Value: Returns rasters to disk and exits with code 1 after the batch if any raster failed
+    Preconditions: requires input rasters exported from Google Earth Engine or other source that are aligned to the area raster and a calling script protected by if __name__ == '__main__'
+    """
+
+    # Import packages
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import as_completed
+    import datetime
+    import os
+    import time
+
+    # Parse key word argument inputs
+    threshold = kwargs['threshold']
+    workers = kwargs.get('workers', os.cpu_count())
+    block_size = kwargs.get('block_size', 2048)
+    area_raster = kwargs['input_array'][0]
+    input_list = kwargs['input_array'][1:]
+    output_list = kwargs['output_array']
+
+    # Check that each input has an output
+    if len(input_list) != len(output_list):
+        print('\tERROR: Input rasters and output array must have the same length.')
+        quit(1)
+
+    # Correct rasters in parallel worker processes
+    print(f'\tCorrecting no data below values of {str(threshold)} for {len(input_list)} rasters...')
+    iteration_start = time.time()
+    failure_list = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        future_dictionary = {executor.submit(correct_raster_blocks,
+                                             area_raster,
+                                             input_raster,
+                                             output_raster,
+                                             threshold,
+                                             block_size): input_raster
+                             for input_raster, output_raster in zip(input_list, output_list)}
+        count = 1
+        for future in as_completed(future_dictionary):
+            input_raster = future_dictionary[future]
+            try:
+                future.result()
+                print(f'\t\tCorrected raster {count} of {len(input_list)}: {os.path.split(input_raster)[1]}')
+            except Exception as error:
+                failure_list.append(input_raster)
+                print(f'\t\tERROR: Failed to correct {os.path.split(input_raster)[1]}: {error}')
+            count += 1
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Report failed rasters so that the calling process fails
+    if len(failure_list) > 0:
+        print(f'\tERROR: Failed to correct {len(failure_list)} of {len(input_list)} rasters: '
+              f'{", ".join(os.path.split(input_raster)[1] for input_raster in failure_list)}')
+        quit(1)
+
+    # Return success message
+    outprocess = f'Successfully corrected no data for {len(input_list)} rasters.'
+    return outprocess
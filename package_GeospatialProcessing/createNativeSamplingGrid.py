@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Create native sampling grid
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Create native sampling grid" is a set of functions that generate a sampling raster grid and its point representation without arcpy. Cell center coordinates and point identifiers are calculated directly from the grid transform and the study area mask in full-width strips, replacing the sequence of ExtractByMask, RasterToPoint, DeleteField, AddXY, and PointToRaster.
+# ---------------------------------------------------------------------------
+
+# Define a function to calculate the cell center coordinates of a block
+def calculate_cell_centers(transform, block):
+    """
+    Description: calculates the coordinates of the cell centers of a block from the grid transform
+    Inputs: 'transform' -- the affine transform of the grid
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+    Returned Value: Returns a tuple of x and y coordinate arrays of shape (rows, columns)
+    Preconditions: requires an affine transform such as the transform of a rasterio dataset
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Calculate cell centers from the row and column indices
+    row_offset, column_offset, block_rows, block_columns = block
+    rows = np.arange(row_offset, row_offset + block_rows, dtype='float64')[:, np.newaxis] + 0.5
+    columns = np.arange(column_offset, column_offset + block_columns, dtype='float64')[np.newaxis, :] + 0.5
+    x_coordinates = transform.c + transform.a * columns + transform.b * rows
+    y_coordinates = transform.f + transform.d * columns + transform.e * rows
+
+    return x_coordinates, y_coordinates
+
+# Define a function to generate a sampling grid without arcpy
+def create_native_sampling_grid(**kwargs):
+    """
+    Description: creates a raster sampling grid of point identifiers on the cells of a snap raster within a study area and writes the cell centers to a point table
+    Inputs: 'block_size' -- an optional number of rows processed per strip (default is 2048)
+            'input_array' -- an array containing the study area raster and the snap raster
+            'output_array' -- an array containing the output raster and the output csv point table
+    Returned Value: Returns a 32-bit integer raster and a csv table to disk with pointid, POINT_X, and POINT_Y columns, where point identifiers increase in row-major order from one
+    Preconditions: requires a snap raster that shares the coordinate system of the study area raster and has the target cell size
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import select_predictor
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    from package_GeospatialProcessing.warpedMosaic import create_tile_catalog
+    from package_GeospatialProcessing.warpedMosaic import read_mosaic_window
+    import datetime
+    import math
+    import numpy as np
+    import os
+    import pandas as pd
+    import rasterio
+    from rasterio.transform import Affine
+    from rasterio.windows import Window
+    from rasterio.windows import transform as window_transform
+    import time
+
+    # Parse key word argument inputs
+    block_size = kwargs.get('block_size', 2048)
+    area_raster = kwargs['input_array'][0]
+    snap_raster = kwargs['input_array'][1]
+    output_raster = kwargs['output_array'][0]
+    output_table = kwargs['output_array'][1]
+
+    # Write to temporary outputs so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+    temporary_table = os.path.splitext(output_table)[0] + '_temporary.csv'
+
+    # Generate sampling grid
+    print(f'\tGenerating sampling grid points...')
+    iteration_start = time.time()
+    with rasterio.open(area_raster) as area_dataset, rasterio.open(snap_raster) as snap_dataset:
+        # Check that the snap raster shares the coordinate system of the study area
+        if snap_dataset.crs != area_dataset.crs:
+            raise ValueError(f'{snap_raster} does not share the coordinate system of the study area raster.')
+
+        # Define the output grid on the snap grid over the extent of the study area
+        cell_size = snap_dataset.res[0]
+        origin_x = snap_dataset.transform.c
+        origin_y = snap_dataset.transform.f
+        left = origin_x + math.floor(round((area_dataset.bounds.left - origin_x) / cell_size, 6)) * cell_size
+        right = origin_x + math.ceil(round((area_dataset.bounds.right - origin_x) / cell_size, 6)) * cell_size
+        bottom = origin_y + math.floor(round((area_dataset.bounds.bottom - origin_y) / cell_size, 6)) * cell_size
+        top = origin_y + math.ceil(round((area_dataset.bounds.top - origin_y) / cell_size, 6)) * cell_size
+        output_profile = {'driver': 'GTiff',
+                          'dtype': 'int32',
+                          'nodata': -2147483648,
+                          'count': 1,
+                          'width': int(round((right - left) / cell_size)),
+                          'height': int(round((top - bottom) / cell_size)),
+                          'crs': area_dataset.crs,
+                          'transform': Affine(cell_size, 0, left, 0, -cell_size, top),
+                          'tiled': True,
+                          'blockxsize': 512,
+                          'blockysize': 512,
+                          'compress': 'DEFLATE',
+                          'predictor': select_predictor('int32'),
+                          'BIGTIFF': 'IF_SAFER'}
+        grid_transform = output_profile['transform']
+        grid_width = output_profile['width']
+
+        # Index the study area so that it can be sampled at the cell centers of the grid
+        area_catalog = create_tile_catalog([area_raster], area_dataset.crs)
+
+        # Process full-width strips so that identifiers follow row-major order in a single pass
+        point_count = 0
+        with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+            for row_offset in range(0, output_profile['height'], block_size):
+                block = (row_offset, 0, min(block_size, output_profile['height'] - row_offset), grid_width)
+                block_rows = block[2]
+                window = Window(0, row_offset, grid_width, block_rows)
+
+                # Select cells with snap raster data whose centers fall within the study area
+                snap_values = read_aligned_block(snap_dataset, output_dataset, block)
+                area_values = read_mosaic_window(area_catalog,
+                                                 window_transform(window, grid_transform),
+                                                 block_rows,
+                                                 grid_width,
+                                                 'nearest')
+                valid = np.isfinite(snap_values) & np.isfinite(area_values)
+
+                # Number valid cells and calculate their centers
+                point_ids = np.full((block_rows, grid_width), output_profile['nodata'], dtype='int32')
+                valid_count = int(valid.sum())
+                point_ids[valid] = np.arange(point_count + 1, point_count + valid_count + 1, dtype='int32')
+                output_dataset.write(point_ids, 1, window=window)
+                x_coordinates, y_coordinates = calculate_cell_centers(grid_transform, block)
+                point_data = pd.DataFrame({'pointid': point_ids[valid],
+                                           'POINT_X': x_coordinates[valid],
+                                           'POINT_Y': y_coordinates[valid]})
+                point_data.to_csv(temporary_table, header=(row_offset == 0), index=False, sep=',',
+                                  encoding='utf-8', mode='w' if row_offset == 0 else 'a')
+                point_count += valid_count
+
+    # Move the completed outputs to the output paths and add overviews to the raster
+    os.replace(temporary_raster, output_raster)
+    os.replace(temporary_table, output_table)
+    write_cloud_optimized_raster(output_raster, resampling='nearest')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tGenerated {point_count} points on a grid of {output_profile["height"]} rows and {grid_width} columns.')
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully created sampling grid with {point_count} points.'
+    return outprocess
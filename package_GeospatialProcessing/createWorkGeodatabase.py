@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Create work geodatabase
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Create work geodatabase" is a function that creates the scratch geodatabase of a workflow script and its folder if they do not already exist, so that scripts that run at the same time do not write to the same geodatabase.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a work geodatabase
+def create_work_geodatabase(work_geodatabase):
+    """
+    Description: creates a file geodatabase and its parent folder if they do not already exist
+    Inputs: 'work_geodatabase' -- a path to a file geodatabase
+    Returned Value: Returns the path of the file geodatabase and a file geodatabase to disk
+    Preconditions: requires a geodatabase that is written only by one script at a time
+    """
+
+    # Import packages
+    import arcpy
+    import os
+
+    # Make workspace folder if it does not already exist
+    workspace_folder, geodatabase_name = os.path.split(work_geodatabase)
+    if os.path.exists(workspace_folder) == 0:
+        os.makedirs(workspace_folder)
+
+    # Create geodatabase if it does not already exist
+    if arcpy.Exists(work_geodatabase) == 0:
+        arcpy.management.CreateFileGDB(workspace_folder, geodatabase_name)
+
+    return work_geodatabase
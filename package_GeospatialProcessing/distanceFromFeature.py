@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Distance from feature
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-08
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Distance from feature" is a function that calculates euclidean distance from a feature class.
+# Description: "Distance from feature" is a function that calculates euclidean distance from a feature class. The native option rasterizes the feature class to the area grid and calculates an exact Euclidean distance transform without the Spatial Analyst extension.
 # ---------------------------------------------------------------------------
 
 # Define a function to calculate Euclidean distance from a feature class
@@ -14,6 +14,8 @@ def distance_from_feature(**kwargs):
     Inputs: 'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area raster and the input feature class
             'output_array' -- an array containing the output distance raster
+            'native' -- an optional boolean value that if True calculates distance from the rasterized feature class with the native distance engine (default is False)
+            'maximum_distance' -- an optional distance beyond which cells are no data for the native distance engine
     Returned Value: Returns a raster dataset on disk
     Preconditions: requires a manually-delineated or pre-existing feature class
     """
@@ -33,6 +35,8 @@ def distance_from_feature(**kwargs):
     area_raster = kwargs['input_array'][0]
     input_feature = kwargs['input_array'][1]
     output_raster = kwargs['output_array'][0]
+    native = kwargs.get('native', False)
+    maximum_distance = kwargs.get('maximum_distance', None)
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -54,6 +58,48 @@ def distance_from_feature(**kwargs):
     cell_size = arcpy.management.GetRasterProperties(area_raster, 'CELLSIZEX', '').getOutput(0)
     arcpy.env.cellSize = int(cell_size)
 
+    # Calculate Euclidean distance with the native distance engine
+    if native == True:
+        # Import packages
+        from package_GeospatialProcessing.calculateNativeDistance import calculate_native_distance
+
+        # Rasterize feature class to the area grid
+        print(f'\tConverting feature to raster...')
+        iteration_start = time.time()
+        source_raster = os.path.join(os.path.split(output_raster)[0], 'distance_source.tif')
+        arcpy.conversion.FeatureToRaster(input_feature,
+                                         arcpy.Describe(input_feature).OIDFieldName,
+                                         source_raster,
+                                         cell_size)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Calculate distance to the nearest source cell
+        print(f'\tCalculating distance...')
+        iteration_start = time.time()
+        calculate_native_distance(area_raster, source_raster, output_raster, maximum_distance)
+        # Delete intermediate dataset
+        if arcpy.Exists(source_raster) == 1:
+            arcpy.management.Delete(source_raster)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Return success message
+        outprocess = f'Successfully calculated Euclidean distance.'
+        return outprocess
+
     # Calculate Euclidean distance
     print(f'\tCalculating distance...')
     iteration_start = time.time()
@@ -2,66 +2,58 @@
 # ---------------------------------------------------------------------------
 # Download Files From CSV
 # Author: Timm Nawrocki
-# Last Updated: 2021-03-10
-# Usage: Can be executed in an Anaconda Python 3.7 distribution or an ArcGIS Pro Python 3.6 distribution.
-# Description: "Download Files From CSV" contacts a server to download a series of files specified in a csv table. The full path to the download must be specified in the table.
+# Last Updated: 2026-10-19
+# Usage: Can be executed in an Anaconda Python 3.8+ distribution or an ArcGIS Pro Python 3.7+ distribution with Requests installed.
+# Description: "Download Files From CSV" contacts a server to download a series of files specified in a csv table. The full path to the download must be specified in the table. Files are streamed to disk over several concurrent connections that are reused between files, interrupted downloads resume with range requests, and failed downloads are retried with backoff. A download manifest in the directory records completed files so that reruns download only files that are missing, changed, or corrupt.
 # ---------------------------------------------------------------------------
 
 # Define a function to download files from a csv
-def download_from_csv(input_table, url_column, directory):
+def download_from_csv(input_table, url_column, directory, workers=8, retry_count=3, size_column=None,
+                      checksum_column=None):
     """
     Description: downloads set of files specified in a particular column of a csv table.
     Inputs: input_table -- csv table containing rows for download items.
             url_column -- title for column containing download urls.
-            destination -- folder to store download results.
-    Returned Value: Function returns status messages only. Downloaded data are stored on drive.
+            directory -- folder to store download results.
+            workers -- number of files downloaded at the same time.
+            retry_count -- number of times a failed download is resumed before the file is reported as failed.
+            size_column -- optional title for column containing file sizes in bytes to verify downloads.
+            checksum_column -- optional title for column containing md5 checksums to verify downloads.
+    Returned Value: Function returns a dictionary of 'skipped', 'completed', or 'failed' status by file name. Downloaded data are stored on drive.
     Preconditions: csv tables must be generated from web application tools or manually.
     """
 
     # Import packages
-    import datetime
+    from package_GeospatialProcessing.downloadManifest import sync_downloads
     import os
     import pandas as pd
-    import time
-    import urllib.request
+    import requests
 
-    # Import a csv file with the download urls for the Arctic DEM tiles
+    # Import a csv file with the download urls for the tiles
     download_items = pd.read_csv(input_table)
 
-    # Initialize download count
-    n = len(download_items[url_column])
-    print(f'Beginning download of {n} files...')
-    count = 1
+    # Create a download item for each url
+    download_list = []
+    for index, row in download_items.iterrows():
+        url = row[url_column]
+        download_item = {'url': url,
+                         'output': os.path.join(directory, os.path.split(url)[1]),
+                         'id': url}
+        if size_column is not None and pd.notna(row[size_column]):
+            download_item['size'] = int(row[size_column])
+        if checksum_column is not None and pd.notna(row[checksum_column]):
+            download_item['md5'] = str(row[checksum_column])
+        download_list.append(download_item)
 
-    # Loop through urls in the downloadURL column and download
-    for url in download_items[url_column]:
-        target = os.path.join(directory, os.path.split(url)[1])
-        # Download file if it does not already exist on local disk
-        if os.path.exists(target) == 0:
-            try:
-                print(f'\tDownloading {count} of {n} files...')
-                iteration_start = time.time()
-                # Download data
-                filedata = urllib.request.urlopen(url)
-                datatowrite = filedata.read()
-                with open(target, 'wb') as file:
-                    file.write(datatowrite)
-                    file.close()
-                # End timing
-                iteration_end = time.time()
-                iteration_elapsed = int(iteration_end - iteration_start)
-                iteration_success_time = datetime.datetime.now()
-                # Report success
-                print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-                print('\t----------')
-            except:
-                print(f'\tFile {count} of {n} not available for download. Check url.')
-                print('\t----------')
-        else:
-            print(f'\tFile {count} of {n} already exists...')
-            print('\t----------')
-        # Increase counter
-        count += 1
+    # Download missing, changed, and corrupt files with one session per thread that keeps its connection open between files
+    print(f'Beginning download of {len(download_list)} files...')
+    status_dictionary = sync_downloads(download_list, directory, requests.Session, workers=workers,
+                                       retry_count=retry_count)
 
     # Report end status
+    failure_list = [file_name for file_name, status in status_dictionary.items() if status == 'failed']
+    if len(failure_list) > 0:
+        print(f'\tERROR: {len(failure_list)} files failed to download. Run the download again to resume.')
     print('Finished downloading tiles.')
+
+    return status_dictionary
@@ -2,33 +2,84 @@
 # ---------------------------------------------------------------------------
 # Download file from Google Drive
 # Author: Timm Nawrocki
-# Last Updated: 2021-11-13
-# Usage: Must be executed in a Python 3.7 environment with Google Drive API v2.
-# Description: "Download file From Google Drive" is a function that downloads a file from Google Drive by file id.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.8+ environment with Google Auth and Requests installed.
+# Description: "Download file From Google Drive" is a set of functions that download files from Google Drive by file id with the stream download engine. Files resume after an interruption and are verified against the size and checksum listed in the file metadata. Folders are synchronized with a download manifest so that only missing, changed, or corrupt files are downloaded in a bounded pool of threads that share credentials, which are refreshed only when they expire.
 # ---------------------------------------------------------------------------
 
-# Define a function to download data files from Google Drive
-def download_from_drive(service, file_id, file_title, output_file):
+# Define a function to download a data file from Google Drive
+def download_from_drive(session, file_meta, output_file, api_url='https://www.googleapis.com/drive/v2',
+                        chunk_size=8388608):
     """
-    Description: downloads a file from Google Drive by file ID.
-    Inputs: file_id -- ID of the file to download.
-            output_directory -- directory in which to save the downloaded file.
-    Returned Value: Return a files to local disk for the file on Google Drive
+    Description: downloads a file from Google Drive by file id, resuming a partial download if one exists
+    Inputs: 'session' -- an authorized requests session such as google.auth.transport.requests.AuthorizedSession
+            'file_meta' -- a dictionary with the 'id', 'title', 'size', and 'md5' of the file as returned by list_from_drive
+            'output_file' -- the file path to save the downloaded file
+            'api_url' -- the base url of the Drive API v2
+            'chunk_size' -- the number of bytes streamed to disk per write
+    Returned Value: Returns the number of bytes downloaded and a file to local disk for the file on Google Drive
     Preconditions: files containing imagery tiles must have been exported to Google Drive from Google Earth Engine
     """
 
     # Import packages
-    from googleapiclient.http import MediaIoBaseDownload
-    import io
-
-    # Create request, file handler, and downloader
-    print(f'\tSaving {file_title}...')
-    request = service.files().get_media(fileId=file_id)
-    file_handler = io.FileIO(output_file, 'wb')
-    downloader = MediaIoBaseDownload(file_handler, request, chunksize=16384*16384)
-    # Download file and report progress
-    done = False
-    while done is False:
-        status, done = downloader.next_chunk()
-        print('\t\tDownload {0}%...'.format(int(status.progress() * 100)))
-    file_handler.close()
+    from package_GeospatialProcessing.streamDownload import stream_download
+
+    # Stream the file content to disk
+    downloaded = stream_download(session,
+                                 f'{api_url}/files/{file_meta["id"]}',
+                                 output_file,
+                                 expected_size=file_meta['size'],
+                                 expected_md5=file_meta.get('md5'),
+                                 params={'alt': 'media'},
+                                 chunk_size=chunk_size)
+
+    return downloaded
+
+# Define a function to download all data files in a Google Drive folder
+def download_drive_folder(credentials, folder_id, output_folder, workers=8, retry_count=2, verify_checksum=False,
+                          api_url='https://www.googleapis.com/drive/v2'):
+    """
+    Description: synchronizes a local folder with a Google Drive folder in a bounded pool of threads, downloading only files that are missing, changed in Drive, or corrupt locally
+    Inputs: 'credentials' -- Google credentials with read access to the folder
+            'folder_id' -- the id of the folder from which to download files
+            'output_folder' -- the folder in which to save the downloaded files
+            'workers' -- the number of files downloaded at the same time
+            'retry_count' -- the number of times a failed download is resumed before the file is reported as failed
+            'verify_checksum' -- a boolean value that if True verifies the checksum of every local file against Drive
+            'api_url' -- the base url of the Drive API v2
+    Returned Value: Returns a dictionary of 'skipped', 'completed', or 'failed' status by file title and files to local disk
+    Preconditions: files containing imagery tiles must have been exported to Google Drive from Google Earth Engine
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.downloadManifest import sync_downloads
+    from package_GeospatialProcessing.listFromDrive import list_from_drive
+    from google.auth.transport.requests import AuthorizedSession
+    import os
+
+    # List all files in the folder
+    print('\tListing files in Google Drive folder...')
+    file_list = list_from_drive(AuthorizedSession(credentials), folder_id, api_url)
+
+    # Keep the most recent file of each title where repeated exports created files with the same title
+    file_dictionary = dict()
+    for file_meta in sorted(file_list, key=lambda item: item['modified'] or ''):
+        file_dictionary[file_meta['title']] = file_meta
+
+    # Download missing, changed, and corrupt files with one authorized session per thread, where credentials are refreshed by the session only when expired
+    download_list = [{'url': f'{api_url}/files/{file_meta["id"]}',
+                      'output': os.path.join(output_folder, file_meta['title']),
+                      'id': file_meta['id'],
+                      'size': file_meta['size'],
+                      'md5': file_meta['md5'],
+                      'modified': file_meta['modified'],
+                      'params': {'alt': 'media'}}
+                     for file_meta in file_dictionary.values()]
+    status_dictionary = sync_downloads(download_list,
+                                       output_folder,
+                                       lambda: AuthorizedSession(credentials),
+                                       workers=workers,
+                                       retry_count=retry_count,
+                                       verify_checksum=verify_checksum)
+
+    return status_dictionary
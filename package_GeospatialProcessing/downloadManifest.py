@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Download manifest
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.8+ environment with Requests installed.
+# Description: "Download manifest" is a set of functions that synchronize a local folder with a list of remote files. A manifest in the folder records the remote id, size, checksum, and modification time of each file together with the size and modification time of the local copy, so that reruns download only files that are missing, changed upstream, or corrupt locally and report the files that were skipped. The remote properties of downloads in progress are recorded before they start so that a partial download is resumed only if the remote file is unchanged.
+# ---------------------------------------------------------------------------
+
+# Define a function to read a download manifest
+def read_download_manifest(output_folder):
+    """
+    Description: reads the download manifest of a folder
+    Inputs: 'output_folder' -- the folder that contains the downloaded files
+    Returned Value: Returns a dictionary of file records by file name, which is empty if no manifest exists
+    Preconditions: manifests are stored in the folder as download_manifest.json
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Read the manifest if it exists
+    manifest_path = os.path.join(output_folder, 'download_manifest.json')
+    if os.path.exists(manifest_path) == 0:
+        return dict()
+    with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+        return json.load(manifest_file)
+
+# Define a function to write a download manifest
+def write_download_manifest(output_folder, manifest):
+    """
+    Description: writes the download manifest of a folder
+    Inputs: 'output_folder' -- the folder that contains the downloaded files
+            'manifest' -- a dictionary of file records by file name
+    Returned Value: Returns a manifest file to disk
+    Preconditions: requires an existing output folder
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Write the manifest to a temporary file and move it to the manifest path
+    manifest_path = os.path.join(output_folder, 'download_manifest.json')
+    temporary_path = manifest_path + '.temporary'
+    with open(temporary_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    os.replace(temporary_path, manifest_path)
+
+# Define a function to calculate the md5 checksum of a local file
+def calculate_md5(file_path):
+    """
+    Description: calculates the md5 checksum of a local file
+    Inputs: 'file_path' -- a path to a file
+    Returned Value: Returns a hexadecimal md5 checksum string
+    Preconditions: requires an existing file
+    """
+
+    # Import packages
+    import hashlib
+
+    # Hash the file in chunks
+    md5_hash = hashlib.md5()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(16777216), b''):
+            md5_hash.update(chunk)
+
+    return md5_hash.hexdigest()
+
+# Define a function to create a manifest record
+def create_download_record(download_item, partial=False):
+    """
+    Description: creates a manifest record of the remote properties and local copy of a downloaded file or of the remote properties of a download in progress
+    Inputs: 'download_item' -- a dictionary with 'output' and optional 'id', 'size', 'md5', and 'modified' keys describing the remote file
+            'partial' -- a boolean value that if True records a download in progress without a local copy
+    Returned Value: Returns a dictionary of the remote properties and the local size and modification time or a partial flag
+    Preconditions: requires an existing local copy unless the record is partial
+    """
+
+    # Import packages
+    import os
+
+    # Record the remote properties
+    record = {'id': download_item.get('id'),
+              'size': download_item.get('size'),
+              'md5': download_item.get('md5'),
+              'modified': download_item.get('modified')}
+
+    # Record the local size and modification time of completed files
+    if partial == True:
+        record['partial'] = True
+    else:
+        file_status = os.stat(download_item['output'])
+        record['local_size'] = file_status.st_size
+        record['local_modified'] = file_status.st_mtime_ns
+
+    return record
+
+# Define a function to decide whether a file must be downloaded
+def check_download(download_item, record, verify_checksum=False):
+    """
+    Description: compares a remote file to its manifest record and local copy
+    Inputs: 'download_item' -- a dictionary with 'output' and optional 'id', 'size', 'md5', and 'modified' keys describing the remote file
+            'record' -- the manifest record of the file or None if the file is not recorded
+            'verify_checksum' -- a boolean value that if True verifies the checksum of every local copy that has a remote checksum
+    Returned Value: Returns 'unchanged', 'missing', 'changed', or 'corrupt'
+    Preconditions: remote properties that are not known should be omitted or None
+    """
+
+    # Import packages
+    import os
+
+    # Download files that do not exist locally, where partial downloads are resumed only if they were recorded for the same remote file
+    output_file = download_item['output']
+    if os.path.exists(output_file) == 0:
+        if os.path.exists(output_file + '.partial') == 1:
+            if record is None or record.get('partial') != True:
+                return 'changed'
+            for key in ['id', 'size', 'md5', 'modified']:
+                if download_item.get(key) != record.get(key):
+                    return 'changed'
+        return 'missing'
+
+    # Download files that changed upstream since they were recorded
+    if record is not None:
+        for key in ['id', 'size', 'md5', 'modified']:
+            if download_item.get(key) is not None and record.get(key) is not None \
+                    and download_item[key] != record[key]:
+                return 'changed'
+
+    # Download files whose local copy does not match the remote size
+    file_status = os.stat(output_file)
+    if download_item.get('size') is not None and file_status.st_size != download_item['size']:
+        return 'corrupt'
+
+    # Verify the checksum of local copies that are unrecorded or were modified since they were recorded
+    local_changed = record is None \
+        or record.get('local_size') != file_status.st_size \
+        or record.get('local_modified') != file_status.st_mtime_ns
+    if download_item.get('md5') is not None and (local_changed or verify_checksum):
+        if calculate_md5(output_file).lower() != download_item['md5'].lower():
+            return 'corrupt'
+    elif local_changed and download_item.get('size') is None:
+        return 'corrupt'
+
+    return 'unchanged'
+
+# Define a function to synchronize a folder with a list of remote files
+def sync_downloads(download_list, output_folder, create_session, workers=8, retry_count=3, verify_checksum=False):
+    """
+    Description: downloads only the remote files that are missing, changed, or corrupt in a local folder and records the downloaded files in the download manifest of the folder
+    Inputs: 'download_list' -- a list of dictionaries with 'url' and 'output' keys and optional 'id', 'size', 'md5', 'modified', and 'params' keys, where outputs are file paths within the output folder
+            'output_folder' -- the folder that contains the downloaded files and the download manifest
+            'create_session' -- a function that returns a new requests session, called once per thread
+            'workers' -- the number of files downloaded at the same time
+            'retry_count' -- the number of times a failed download is resumed before the file is reported as failed
+            'verify_checksum' -- a boolean value that if True verifies the checksum of every local copy that has a remote checksum
+    Returned Value: Returns a dictionary of 'skipped', 'completed', or 'failed' status by file name, files to local disk, and an updated manifest
+    Preconditions: requires output file names that are unique within the list, where failed downloads keep a partial record in the manifest while their partial download exists
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.streamDownload import download_files
+    import os
+
+    # Make output folder if it does not already exist
+    if os.path.exists(output_folder) == 0:
+        os.makedirs(output_folder)
+
+    # Compare each remote file to the manifest and local copy
+    manifest = read_download_manifest(output_folder)
+    status_dictionary = dict()
+    reason_dictionary = {'unchanged': 0, 'missing': 0, 'changed': 0, 'corrupt': 0}
+    fetch_list = []
+    for download_item in download_list:
+        file_name = os.path.split(download_item['output'])[1]
+        reason = check_download(download_item, manifest.get(file_name), verify_checksum)
+        reason_dictionary[reason] += 1
+        if reason == 'unchanged':
+            status_dictionary[file_name] = 'skipped'
+            manifest[file_name] = create_download_record(download_item)
+        else:
+            # Remove outdated copies and partial downloads so that they are not resumed
+            for old_file in [download_item['output'], download_item['output'] + '.partial',
+                             download_item['output'] + '.partial.validator']:
+                if reason in ['changed', 'corrupt'] and os.path.exists(old_file) == 1:
+                    os.remove(old_file)
+            fetch_list.append(download_item)
+    print(f'\tSkipping {reason_dictionary["unchanged"]} unchanged files and downloading '
+          f'{reason_dictionary["missing"]} missing, {reason_dictionary["changed"]} changed, '
+          f'and {reason_dictionary["corrupt"]} corrupt files...')
+
+    # Record the remote properties of files before they are downloaded so that interrupted partial downloads can be checked
+    for download_item in fetch_list:
+        manifest[os.path.split(download_item['output'])[1]] = create_download_record(download_item, partial=True)
+    write_download_manifest(output_folder, manifest)
+
+    # Download files and record completed files in the manifest
+    try:
+        if len(fetch_list) > 0:
+            status_dictionary.update(download_files(fetch_list, create_session, workers=workers,
+                                                    retry_count=retry_count))
+    finally:
+        for download_item in fetch_list:
+            file_name = os.path.split(download_item['output'])[1]
+            if status_dictionary.get(file_name) == 'completed':
+                manifest[file_name] = create_download_record(download_item)
+            elif os.path.exists(download_item['output'] + '.partial') == 0:
+                manifest.pop(file_name, None)
+        write_download_manifest(output_folder, manifest)
+
+    return status_dictionary
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Euclidean distance
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy. Numba is used to compile the lower envelope kernel if it is installed.
+# Description: "Euclidean distance" is a set of functions that calculate the exact Euclidean distance transform of a source grid with the separable algorithm of Felzenszwalb and Huttenlocher (2012). Distances are first resolved along each column and then along each row from the lower envelope of parabolas, which takes linear time and returns the nearest source cell of every cell for allocation.
+# ---------------------------------------------------------------------------
+
+# Import packages at the module level so that kernels can be compiled
+import numpy as np
+
+# Define a kernel to calculate the lower envelope of parabolas along rows
+def lower_envelope_kernel(squared, distance, nearest):
+    """
+    Description: calculates the squared distance to the nearest source along each row given squared column distances, using the lower envelope of parabolas rooted at each column
+    Inputs: 'squared' -- a two-dimensional float64 array of squared distances to the nearest source in the same column, with infinity where a column has no source
+            'distance' -- a two-dimensional float64 array to store the squared distance to the nearest source
+            'nearest' -- a two-dimensional int64 array to store the column of the nearest source, or -1 if a row has no source
+    Returned Value: Returns the number of rows processed
+    Preconditions: requires output arrays of the same shape as the squared distance array
+    """
+
+    # Initialize the envelope arrays
+    rows, columns = squared.shape
+    vertices = np.zeros(columns, dtype=np.int64)
+    boundaries = np.zeros(columns + 1, dtype=np.float64)
+
+    for row in range(rows):
+        # Build the lower envelope from columns that contain a source
+        k = -1
+        for q in range(columns):
+            value = squared[row, q]
+            if value == np.inf:
+                continue
+            if k < 0:
+                k = 0
+                vertices[0] = q
+                boundaries[0] = -np.inf
+                boundaries[1] = np.inf
+                continue
+            p = vertices[k]
+            s = ((value + q * q) - (squared[row, p] + p * p)) / (2.0 * q - 2.0 * p)
+            while s <= boundaries[k]:
+                k -= 1
+                p = vertices[k]
+                s = ((value + q * q) - (squared[row, p] + p * p)) / (2.0 * q - 2.0 * p)
+            k += 1
+            vertices[k] = q
+            boundaries[k] = s
+            boundaries[k + 1] = np.inf
+
+        # Set rows without a source to infinity
+        if k < 0:
+            for q in range(columns):
+                distance[row, q] = np.inf
+                nearest[row, q] = -1
+            continue
+
+        # Evaluate the lower envelope at each column
+        j = 0
+        for q in range(columns):
+            while boundaries[j + 1] < q:
+                j += 1
+            p = vertices[j]
+            distance[row, q] = (q - p) * (q - p) + squared[row, p]
+            nearest[row, q] = p
+
+    return rows
+
+# Define a function to resolve distances along rows
+def row_distance(column_distance):
+    """
+    Description: resolves the exact squared distance to the nearest source along each row from distances to the nearest source in each column
+    Inputs: 'column_distance' -- a two-dimensional float array of distances in cells to the nearest source in the same column, with infinity where a column has no source
+    Returned Value: Returns a float64 array of squared distances in cells and an int64 array of the column of the nearest source, where rows without a source are infinity and -1
+    Preconditions: requires column distances from a forward and backward scan of the source grid
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.compileKernel import compile_kernel
+
+    # Calculate the lower envelope along each row
+    squared = np.square(column_distance.astype(np.float64))
+    distance = np.empty(squared.shape, dtype=np.float64)
+    nearest = np.empty(squared.shape, dtype=np.int64)
+    envelope_kernel = compile_kernel(lower_envelope_kernel)
+    envelope_kernel(squared, distance, nearest)
+
+    return distance, nearest
+
+# Define a function to calculate the Euclidean distance transform
+def distance_transform(source, cell_size=1, return_indices=False):
+    """
+    Description: calculates the exact Euclidean distance from every cell to the nearest source cell
+    Inputs: 'source' -- a two-dimensional boolean array that is True for source cells
+            'cell_size' -- the cell size used to scale distances
+            'return_indices' -- a boolean value that if True also returns the row and column of the nearest source of each cell
+    Returned Value: Returns a float array of distances in the units of the cell size with infinity where there are no sources, and optionally int64 arrays of the row and column of the nearest source
+    Preconditions: requires a boolean source array
+    """
+
+    # Scan each column forward and backward for the nearest source row
+    rows, columns = source.shape
+    above = np.full(columns, -1, dtype=np.int64)
+    source_row = np.full((rows, columns), -1, dtype=np.int64)
+    for row in range(rows):
+        above[source[row]] = row
+        source_row[row] = above
+    below = np.full(columns, -1, dtype=np.int64)
+    for row in range(rows - 1, -1, -1):
+        below[source[row]] = row
+        use_below = (below >= 0) & ((source_row[row] < 0) | (below - row < row - source_row[row]))
+        source_row[row] = np.where(use_below, below, source_row[row])
+
+    # Calculate the distance to the nearest source in each column
+    row_index = np.arange(rows)[:, None]
+    column_distance = np.where(source_row >= 0, np.abs(row_index - source_row), np.inf)
+
+    # Resolve distances along rows
+    squared_distance, nearest_column = row_distance(column_distance)
+    distance = np.sqrt(squared_distance) * cell_size
+
+    # Return the nearest source indices if requested
+    if return_indices == True:
+        valid = nearest_column >= 0
+        nearest_row = np.full((rows, columns), -1, dtype=np.int64)
+        nearest_row[valid] = np.take_along_axis(source_row, np.where(valid, nearest_column, 0), axis=1)[valid]
+        return distance, nearest_row, nearest_column
+
+    return distance
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Extract segment covariates
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Extract segment covariates" is a set of functions that summarize covariate rasters to the segments of a gridded segment raster and write the summaries directly to a table. The segment raster is streamed block by block, all covariates of a raster stack are read once per block on the segment grid, and per-segment aggregates are accumulated so that no intermediate zonal rasters are written. The cells of each block are sorted by segment once, and the counts, sums, minimums, and maximums of every covariate are reduced over the run of cells of each segment and added to the segments present in the block.
+# ---------------------------------------------------------------------------
+
+# Define a function to resize per-segment aggregate arrays
+def resize_aggregates(aggregate_dictionary, length):
+    """
+    Description: enlarges per-segment aggregate arrays so that they can be indexed by segment identifiers up to a length
+    Inputs: 'aggregate_dictionary' -- a dictionary of aggregate name to one-dimensional array
+            'length' -- the minimum length of the aggregate arrays
+    Returned Value: Returns the aggregate dictionary with enlarged arrays
+    Preconditions: requires aggregate arrays created by accumulate_segment_block
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Define fill values for new segments
+    fill_dictionary = {'count': 0, 'sum': 0, 'square': 0, 'minimum': np.inf, 'maximum': -np.inf}
+
+    # Enlarge each array geometrically to limit copies
+    current_length = len(aggregate_dictionary['count'])
+    if length > current_length:
+        new_length = max(length, current_length * 2)
+        for name, values in aggregate_dictionary.items():
+            new_values = np.full(new_length, fill_dictionary[name], dtype=values.dtype)
+            new_values[:current_length] = values
+            aggregate_dictionary[name] = new_values
+
+    return aggregate_dictionary
+
+# Define a function to index the segments of a block
+def index_segment_block(segment_values):
+    """
+    Description: sorts the cells of a block by segment once so that aggregates of every covariate can be reduced over runs of cells of the segments present in the block
+    Inputs: 'segment_values' -- an integer array of segment identifiers for the valid cells of the block
+    Returned Value: Returns a dictionary of the unique segment identifiers of the block, the order of cells sorted by segment, the local segment index of each sorted cell, and the start of the run of each segment
+    Preconditions: requires segment identifiers without no data
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Sort cells by segment and find the run of each segment
+    order = np.argsort(segment_values, kind='stable')
+    sorted_segments = segment_values[order]
+    boundaries = np.empty(len(sorted_segments), dtype=bool)
+    boundaries[:1] = True
+    np.not_equal(sorted_segments[1:], sorted_segments[:-1], out=boundaries[1:])
+    starts = np.flatnonzero(boundaries)
+    segment_index = {'segments': sorted_segments[starts],
+                     'order': order,
+                     'local_ids': np.cumsum(boundaries) - 1,
+                     'starts': starts}
+
+    return segment_index
+
+# Define a function to accumulate per-segment aggregates for a block
+def accumulate_segment_block(aggregate_dictionary, segment_index, covariate_values, shift, valid=None):
+    """
+    Description: adds the count, shifted sum, shifted sum of squares, minimum, and maximum of covariate values in a block to per-segment aggregates
+    Inputs: 'aggregate_dictionary' -- a dictionary of aggregate name to one-dimensional array indexed by segment identifier
+            'segment_index' -- a dictionary of the segments of the block created by index_segment_block
+            'covariate_values' -- a float array of covariate values for the same cells as the segment index
+            'shift' -- a value subtracted from covariate values before summing to preserve precision of the variance
+            'valid' -- an optional boolean array of the cells with covariate values (default is all cells)
+    Returned Value: Returns the updated aggregate dictionary
+    Preconditions: requires a segment index created by index_segment_block and covariate values without no data where valid
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Sort covariate values by segment, keeping the runs of the segment index if all cells are valid
+    segments = segment_index['segments']
+    sorted_values = covariate_values[segment_index['order']]
+    starts = segment_index['starts']
+    if valid is not None and not valid.all():
+        sorted_valid = valid[segment_index['order']]
+        sorted_values = sorted_values[sorted_valid]
+        local_ids = segment_index['local_ids'][sorted_valid]
+        if local_ids.size == 0:
+            return aggregate_dictionary
+        boundaries = np.empty(len(local_ids), dtype=bool)
+        boundaries[:1] = True
+        np.not_equal(local_ids[1:], local_ids[:-1], out=boundaries[1:])
+        starts = np.flatnonzero(boundaries)
+        segments = segments[local_ids[starts]]
+
+    # Return unchanged aggregates if there are no values
+    if segments.size == 0:
+        return aggregate_dictionary
+
+    # Enlarge aggregate arrays to the largest segment identifier
+    aggregate_dictionary = resize_aggregates(aggregate_dictionary, int(segments[-1]) + 1)
+
+    # Reduce aggregates over the run of each segment and add them to the segments of the block
+    shifted_values = sorted_values - shift
+    aggregate_dictionary['count'][segments] += np.diff(np.append(starts, len(sorted_values)))
+    aggregate_dictionary['sum'][segments] += np.add.reduceat(shifted_values, starts)
+    aggregate_dictionary['square'][segments] += np.add.reduceat(shifted_values ** 2, starts)
+    aggregate_dictionary['minimum'][segments] = np.minimum(aggregate_dictionary['minimum'][segments],
+                                                           np.minimum.reduceat(sorted_values, starts))
+    aggregate_dictionary['maximum'][segments] = np.maximum(aggregate_dictionary['maximum'][segments],
+                                                           np.maximum.reduceat(sorted_values, starts))
+
+    return aggregate_dictionary
+
+# Define a function to calculate a statistic from per-segment aggregates
+def calculate_segment_statistic(aggregate_dictionary, statistic, shift):
+    """
+    Description: calculates a zonal statistic for each segment from accumulated aggregates
+    Inputs: 'aggregate_dictionary' -- a dictionary of aggregate name to one-dimensional array indexed by segment identifier
+            'statistic' -- a string value of the statistic: "MEAN", "STD", "RANGE", "MINIMUM", "MAXIMUM", or "SUM"
+            'shift' -- the value that was subtracted from covariate values before summing
+    Returned Value: Returns a float array indexed by segment identifier with NaN for segments without values
+    Preconditions: requires aggregate arrays created by accumulate_segment_block
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Parse aggregates
+    count = aggregate_dictionary['count']
+    valid = count > 0
+    safe_count = np.where(valid, count, 1)
+    shifted_mean = aggregate_dictionary['sum'] / safe_count
+
+    # Calculate statistic
+    if statistic == 'MEAN':
+        values = shifted_mean + shift
+    elif statistic == 'STD':
+        # Calculate the population standard deviation to match ZonalStatistics
+        variance = aggregate_dictionary['square'] / safe_count - shifted_mean ** 2
+        values = np.sqrt(np.maximum(variance, 0))
+    elif statistic == 'RANGE':
+        values = aggregate_dictionary['maximum'] - aggregate_dictionary['minimum']
+    elif statistic == 'MINIMUM':
+        values = aggregate_dictionary['minimum'].copy()
+    elif statistic == 'MAXIMUM':
+        values = aggregate_dictionary['maximum'].copy()
+    elif statistic == 'SUM':
+        values = aggregate_dictionary['sum'] + shift * count
+    else:
+        raise ValueError(f'Statistic {statistic} is not supported.')
+    values = np.where(valid, values, np.nan)
+
+    return values
+
+# Define a function to extract segment covariates to a table
+def extract_segment_covariates(**kwargs):
+    """
+    Description: summarizes the bands of a raster stack to segments and writes a table with one column per covariate statistic
+    Inputs: 'raster_stack' -- a stack dictionary of covariate rasters created by create_raster_stack
+            'statistic_dictionary' -- a dictionary of output column name to (covariate name, statistic) tuples, where the statistic is "MEAN", "STD", "RANGE", "MINIMUM", "MAXIMUM", or "SUM"
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'input_array' -- an array containing the segment raster (must be first) and the covariate rasters
+            'output_array' -- an array containing the output csv table
+    Returned Value: Returns a csv table to disk with a segment_id column and a column for each covariate statistic
+    Preconditions: requires a segment raster of integer segment identifiers that is snapped to the grid of the raster stack
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    from package_GeospatialProcessing.rasterStack import close_raster_stack
+    from package_GeospatialProcessing.rasterStack import open_raster_stack
+    from package_GeospatialProcessing.rasterStack import read_stack_block
+    import datetime
+    import numpy as np
+    import os
+    import pandas as pd
+    import rasterio
+    import time
+
+    # Parse key word argument inputs
+    raster_stack = kwargs['raster_stack']
+    statistic_dictionary = kwargs['statistic_dictionary']
+    block_size = kwargs.get('block_size', 2048)
+    segment_raster = kwargs['input_array'][0]
+    output_table = kwargs['output_array'][0]
+
+    # Group output columns by covariate so that each band is read once per block
+    covariate_dictionary = dict()
+    for column_name, (covariate_name, statistic) in statistic_dictionary.items():
+        covariate_dictionary.setdefault(covariate_name, []).append((column_name, statistic))
+    covariate_list = list(covariate_dictionary.keys())
+
+    # Create per-segment aggregates for each covariate
+    aggregate_list = [{'count': np.zeros(1, dtype='int64'),
+                       'sum': np.zeros(1),
+                       'square': np.zeros(1),
+                       'minimum': np.full(1, np.inf),
+                       'maximum': np.full(1, -np.inf)} for covariate_name in covariate_list]
+    shift_list = [None] * len(covariate_list)
+
+    # Accumulate per-segment aggregates
+    print(f'\tSummarizing {len(covariate_list)} covariates to segments...')
+    iteration_start = time.time()
+    with rasterio.open(segment_raster) as segment_dataset:
+        block_list = generate_blocks(segment_dataset.height, segment_dataset.width, block_size)
+        stack_reader = open_raster_stack(raster_stack, segment_dataset)
+        try:
+            # Stream segment blocks
+            segment_count = np.zeros(1, dtype='int64')
+            for block in block_list:
+                segment_block = read_block(segment_dataset, block)
+                segment_valid = np.isfinite(segment_block)
+                if not segment_valid.any():
+                    continue
+                segment_ids = segment_block[segment_valid].astype('int64')
+                # Index the segments of the block once for all covariates
+                segment_index = index_segment_block(segment_ids)
+                if segment_index['segments'][-1] + 1 > len(segment_count):
+                    new_count = np.zeros(max(int(segment_index['segments'][-1]) + 1, len(segment_count) * 2),
+                                         dtype='int64')
+                    new_count[:len(segment_count)] = segment_count
+                    segment_count = new_count
+                segment_count[segment_index['segments']] += np.diff(np.append(segment_index['starts'],
+                                                                              len(segment_ids)))
+                # Read all covariates for the block in one call
+                stack_block = read_stack_block(stack_reader, block, covariate_list)
+                for index in range(len(covariate_list)):
+                    covariate_values = stack_block[index][segment_valid]
+                    valid = np.isfinite(covariate_values)
+                    if not valid.any():
+                        continue
+                    if shift_list[index] is None:
+                        shift_list[index] = float(covariate_values[valid][0])
+                    aggregate_list[index] = accumulate_segment_block(aggregate_list[index],
+                                                                     segment_index,
+                                                                     covariate_values,
+                                                                     shift_list[index],
+                                                                     valid)
+        finally:
+            close_raster_stack(stack_reader)
+
+    # Create output table for segments with cells
+    segment_ids = np.flatnonzero(segment_count)
+    output_data = pd.DataFrame({'segment_id': segment_ids})
+    for index, covariate_name in enumerate(covariate_list):
+        aggregate_dictionary = resize_aggregates(aggregate_list[index], len(segment_count))
+        shift = shift_list[index] if shift_list[index] is not None else 0
+        integer_input = np.issubdtype(np.dtype(raster_stack['bands'][covariate_name]['dtype']), np.integer)
+        for column_name, statistic in covariate_dictionary[covariate_name]:
+            statistic_values = calculate_segment_statistic(aggregate_dictionary, statistic, shift)[segment_ids]
+            # Truncate statistics of integer covariates to match conversion to the input value type
+            if integer_input:
+                statistic_values = pd.array(np.trunc(statistic_values), dtype='Float64').astype('Int64')
+            output_data[column_name] = statistic_values
+    output_data = output_data[['segment_id'] + list(statistic_dictionary.keys())]
+
+    # Write the table to a temporary file so that interrupted outputs are not mistaken for complete outputs
+    temporary_table = os.path.splitext(output_table)[0] + '_temporary.csv'
+    output_data.to_csv(temporary_table, header=True, index=False, sep=',', encoding='utf-8')
+    os.replace(temporary_table, output_table)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully extracted {len(statistic_dictionary)} covariates for {len(segment_ids)} segments.'
+    return outprocess
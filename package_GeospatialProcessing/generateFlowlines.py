@@ -2,7 +2,7 @@
 # ---------------------------------------------------------------------------
 # Generate flowlines
 # Author: Timm Nawrocki
-# Last Updated: 2022-01-17
+# Last Updated: 2026-10-19
 # Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
 # Description: "Generate flowlines" is a function that calculates flowlines from a float elevation raster.
 # ---------------------------------------------------------------------------
@@ -13,6 +13,7 @@ def generate_flowlines(**kwargs):
     Description: generates flowlines from a float elevation raster
     Inputs: 'threshold' -- flow accumulation threshold for minimum stream size
             'fill_value' -- a value in the vertical units of the elevation raster to set as the fill limit
+            'native' -- an optional boolean value that if True fills, calculates flow direction, and calculates flow accumulation with the native flow routing engine instead of arcpy (default is False)
             'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area feature class (must be first), the float elevation raster (must be second), and an optional mask raster (if present, must be last)
             'output_array' -- an array containing the the river feature class and the stream feature class
@@ -29,6 +30,7 @@ def generate_flowlines(**kwargs):
     from arcpy.sa import FlowDirection
     from arcpy.sa import Raster
     from arcpy.sa import StreamOrder
+    from package_Geomorphometry import calculate_native_flow
     import datetime
     import os
     import time
@@ -36,6 +38,7 @@ def generate_flowlines(**kwargs):
     # Parse key word argument inputs
     threshold = kwargs['threshold']
     fill_value = kwargs['fill_value']
+    native = kwargs.get('native', False)
     work_geodatabase = kwargs['work_geodatabase']
     area_feature = kwargs['input_array'][0]
     elevation_raster = kwargs['input_array'][1]
@@ -46,6 +49,8 @@ def generate_flowlines(**kwargs):
     topography_folder = os.path.split(elevation_raster)[0]
     area_buffer = os.path.join(work_geodatabase, 'StudyArea_Buffer_5km')
     buffer_raster = os.path.join(topography_folder, 'Buffer_Raster.tif')
+    direction_native = os.path.join(topography_folder, 'Flow_Direction_D8.tif')
+    accumulation_native = os.path.join(topography_folder, 'Flow_Accumulation_D8.tif')
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -87,57 +92,78 @@ def generate_flowlines(**kwargs):
     print(f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
     print('\t----------')
 
-    # Extract elevation to calculation area
-    print('\tExtracting elevation raster...')
-    iteration_start = time.time()
-    elevation_extract = ExtractByMask(Raster(elevation_raster), buffer_raster)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+    # Calculate flow direction and accumulation with the native engine if selected
+    if native == True:
+        print('\tCalculating flow direction and accumulation with native engine...')
+        iteration_start = time.time()
+        calculate_native_flow(elevation_raster,
+                              accumulation_native,
+                              fill_value,
+                              'D8',
+                              mask_raster=buffer_raster,
+                              direction_output=direction_native)
+        direction_raster = Raster(direction_native)
+        accumulation_raster = Raster(accumulation_native)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+    else:
+        # Extract elevation to calculation area
+        print('\tExtracting elevation raster...')
+        iteration_start = time.time()
+        elevation_extract = ExtractByMask(Raster(elevation_raster), buffer_raster)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Fill elevation
-    print('\tFilling elevation raster...')
-    iteration_start = time.time()
-    fill_raster = Fill(elevation_extract, fill_value)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Fill elevation
+        print('\tFilling elevation raster...')
+        iteration_start = time.time()
+        fill_raster = Fill(elevation_extract, fill_value)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Calculate flow direction
-    print('\tCalculating flow direction...')
-    iteration_start = time.time()
-    direction_raster = FlowDirection(fill_raster, 'NORMAL', '', 'D8')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Calculate flow direction
+        print('\tCalculating flow direction...')
+        iteration_start = time.time()
+        direction_raster = FlowDirection(fill_raster, 'NORMAL', '', 'D8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Calculate flow accumulation
-    print('\tCalculating flow accumulation...')
-    iteration_start = time.time()
-    accumulation_raster = FlowAccumulation(direction_raster, '', 'FLOAT', 'D8')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Calculate flow accumulation
+        print('\tCalculating flow accumulation...')
+        iteration_start = time.time()
+        accumulation_raster = FlowAccumulation(direction_raster, '', 'FLOAT', 'D8')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
     # Apply threshold to the flow accumulation
     print('\tDefining stream network from flow accumulation...')
@@ -208,6 +234,10 @@ def generate_flowlines(**kwargs):
         arcpy.management.Delete(buffer_raster)
     if arcpy.Exists(area_buffer) == 1:
         arcpy.management.Delete(area_buffer)
+    if arcpy.Exists(direction_native) == 1:
+        arcpy.management.Delete(direction_native)
+    if arcpy.Exists(accumulation_native) == 1:
+        arcpy.management.Delete(accumulation_native)
     # End timing
     iteration_end = time.time()
     iteration_elapsed = int(iteration_end - iteration_start)
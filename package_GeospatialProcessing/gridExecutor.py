@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Grid executor
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution or an ArcGIS Pro Python 3.7 installation.
+# Description: "Grid executor" is a set of functions that run a processing function for each grid of a grid list in a pool of worker processes. Each worker process is limited to a memory budget, each grid is retried after failures, grids with complete outputs are skipped, and the messages of each grid are written to a log file for the grid.
+# ---------------------------------------------------------------------------
+
+# Define a function to limit the memory of the current process
+def limit_process_memory(memory_limit):
+    """
+    Description: limits the memory that the current process can allocate so that a worker fails with a memory error instead of exhausting the machine
+    Inputs: 'memory_limit' -- the memory limit in gigabytes or None for no limit
+    Returned Value: Returns True if a limit was applied, otherwise False
+    Preconditions: limits are applied with a job object on Windows and with an address space limit on other systems
+    """
+
+    # Import packages
+    import os
+
+    # Return if no limit is requested
+    if memory_limit is None:
+        return False
+    limit_bytes = int(memory_limit * 1073741824)
+
+    # Assign the process to a job object with a process memory limit on Windows
+    if os.name == 'nt':
+        import ctypes
+        from ctypes import wintypes
+
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [(field_name, ctypes.c_ulonglong) for field_name in
+                        ('ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+                         'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+
+        class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [('PerProcessUserTimeLimit', ctypes.c_int64),
+                        ('PerJobUserTimeLimit', ctypes.c_int64),
+                        ('LimitFlags', wintypes.DWORD),
+                        ('MinimumWorkingSetSize', ctypes.c_size_t),
+                        ('MaximumWorkingSetSize', ctypes.c_size_t),
+                        ('ActiveProcessLimit', wintypes.DWORD),
+                        ('Affinity', ctypes.c_size_t),
+                        ('PriorityClass', wintypes.DWORD),
+                        ('SchedulingClass', wintypes.DWORD)]
+
+        class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                        ('IoInfo', IO_COUNTERS),
+                        ('ProcessMemoryLimit', ctypes.c_size_t),
+                        ('JobMemoryLimit', ctypes.c_size_t),
+                        ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                        ('PeakJobMemoryUsed', ctypes.c_size_t)]
+
+        # Define the job object limit
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        limit_information = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+        limit_information.BasicLimitInformation.LimitFlags = 0x00000100
+        limit_information.ProcessMemoryLimit = limit_bytes
+
+        # Create the job object and assign the current process
+        job_handle = kernel32.CreateJobObjectW(None, None)
+        if not job_handle:
+            return False
+        if not kernel32.SetInformationJobObject(wintypes.HANDLE(job_handle), 9,
+                                                ctypes.byref(limit_information),
+                                                ctypes.sizeof(limit_information)):
+            return False
+        if not kernel32.AssignProcessToJobObject(wintypes.HANDLE(job_handle),
+                                                 wintypes.HANDLE(kernel32.GetCurrentProcess())):
+            return False
+        return True
+
+    # Limit the address space on other systems
+    try:
+        import resource
+    except ImportError:
+        return False
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+    return True
+
+# Define a function to check whether the outputs of a grid exist
+def check_grid_outputs(output_list):
+    """
+    Description: checks that all outputs of a grid exist
+    Inputs: 'output_list' -- a list of output files, folders, or datasets within a file geodatabase
+    Returned Value: Returns True if all outputs exist, otherwise False
+    Preconditions: datasets within a file geodatabase are checked with arcpy
+    """
+
+    # Import packages
+    import os
+
+    # Check each output
+    for output_path in output_list:
+        if os.path.exists(output_path):
+            continue
+        if '.gdb' in output_path:
+            import arcpy
+            if arcpy.Exists(output_path):
+                continue
+        return False
+
+    return True
+
+# Define a function to run a processing function for a grid
+def run_grid(grid_function, grid, grid_kwargs, log_folder, retry_count=1):
+    """
+    Description: runs a processing function for a grid with its messages written to a grid log and retries after failures
+    Inputs: 'grid_function' -- a function that receives ** kwargs arguments
+            'grid' -- the name of the grid
+            'grid_kwargs' -- a dictionary of key word arguments for the grid, including an 'output_array' of the grid outputs
+            'log_folder' -- a folder to store the log file of the grid
+            'retry_count' -- the number of times a failed grid is run again
+    Returned Value: Returns a tuple of the grid, the number of attempts, and the returned message of the function
+    Preconditions: requires a processing function that can be imported by worker processes and overwrites existing outputs
+    """
+
+    # Import packages
+    import contextlib
+    import datetime
+    import os
+    import time
+    import traceback
+
+    # Define log and marker files
+    log_path = os.path.join(log_folder, grid + '.log')
+    running_path = os.path.join(log_folder, grid + '.running')
+
+    # Mark the grid as running so that interrupted outputs are not mistaken for complete outputs
+    with open(running_path, 'w', encoding='utf-8') as running_file:
+        running_file.write(str(os.getpid()))
+
+    # Run the function with retries
+    attempt = 1
+    while True:
+        with open(log_path, 'a', encoding='utf-8') as log_file:
+            with contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+                print(f'Processing grid {grid} (attempt {attempt} of {retry_count + 1})...')
+                attempt_start = time.time()
+                try:
+                    outprocess = grid_function(**grid_kwargs)
+                    failure = None
+                except (Exception, SystemExit) as error:
+                    # Catch exits so that functions that quit after errors are retried
+                    traceback.print_exc()
+                    failure = error
+                attempt_end = time.time()
+                attempt_elapsed = int(attempt_end - attempt_start)
+                attempt_success_time = datetime.datetime.now()
+                attempt_status = 'Completed' if failure is None else 'Failed'
+                print(
+                    f'{attempt_status} at {attempt_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=attempt_elapsed)})')
+                print('----------')
+        if failure is None:
+            os.remove(running_path)
+            return grid, attempt, outprocess
+        if attempt > retry_count:
+            raise RuntimeError(f'Grid {grid} failed after {attempt} attempts: {failure!r}')
+        attempt += 1
+
+# Define a function to run a processing function for each grid in parallel
+def execute_grids(grid_function, grid_dictionary, log_folder, workers=None, memory_limit=None, retry_count=1,
+                  skip_complete=True):
+    """
+    Description: runs a processing function for each grid in a pool of worker processes
+    Inputs: 'grid_function' -- a function that receives ** kwargs arguments
+            'grid_dictionary' -- a dictionary of grid name to key word arguments for the grid, including an 'output_array' of the grid outputs
+            'log_folder' -- a folder to store a log file for each grid
+            'workers' -- an optional number of worker processes (default is the number of processors)
+            'memory_limit' -- an optional memory limit in gigabytes for each worker process
+            'retry_count' -- the number of times a failed grid is run again
+            'skip_complete' -- a boolean value to skip grids whose outputs exist and were not interrupted
+    Returned Value: Returns a dictionary of grid name to status, which is "skipped", "completed", or "failed"
+    Preconditions: requires a processing function defined at the top level of a module or script and a calling script protected by if __name__ == '__main__'
+    """
+
+    # Import packages
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import as_completed
+    import datetime
+    import os
+    import time
+
+    # Use the number of processors if no worker count is provided
+    if workers is None:
+        workers = os.cpu_count()
+
+    # Make the log folder if it does not already exist
+    if os.path.exists(log_folder) == 0:
+        os.makedirs(log_folder)
+
+    # Skip grids with complete outputs
+    status_dictionary = dict()
+    run_list = []
+    for grid, grid_kwargs in grid_dictionary.items():
+        running_path = os.path.join(log_folder, grid + '.running')
+        if (skip_complete == True
+                and check_grid_outputs(grid_kwargs['output_array'])
+                and os.path.exists(running_path) == 0):
+            status_dictionary[grid] = 'skipped'
+        else:
+            run_list.append(grid)
+    if len(status_dictionary) > 0:
+        print(f'\tOutputs already exist for {len(status_dictionary)} of {len(grid_dictionary)} grids.')
+
+    # Run the remaining grids in parallel worker processes
+    print(f'\tProcessing {len(run_list)} grids with {min(workers, max(len(run_list), 1))} workers...')
+    iteration_start = time.time()
+    if len(run_list) > 0:
+        with ProcessPoolExecutor(max_workers=min(workers, len(run_list)),
+                                 initializer=limit_process_memory,
+                                 initargs=(memory_limit,)) as executor:
+            future_dictionary = {executor.submit(run_grid,
+                                                 grid_function,
+                                                 grid,
+                                                 grid_dictionary[grid],
+                                                 log_folder,
+                                                 retry_count): grid
+                                 for grid in run_list}
+            count = 1
+            for future in as_completed(future_dictionary):
+                grid = future_dictionary[future]
+                try:
+                    grid, attempt, outprocess = future.result()
+                    status_dictionary[grid] = 'completed'
+                    print(f'\t\tCompleted grid {grid} ({count} of {len(run_list)}) in {attempt} attempts: {outprocess}')
+                except Exception as error:
+                    status_dictionary[grid] = 'failed'
+                    print(f'\t\tERROR: Failed to process grid {grid} ({count} of {len(run_list)}): {error}')
+                    print(f'\t\tSee {os.path.join(log_folder, grid + ".log")}')
+                count += 1
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return grid statuses in grid order
+    status_dictionary = {grid: status_dictionary[grid] for grid in grid_dictionary}
+    return status_dictionary
@@ -2,35 +2,45 @@
 # ---------------------------------------------------------------------------
 # List Files from Google Drive
 # Author: Timm Nawrocki
-# Last Updated: 2021-03-10
-# Usage: Must be executed in a Python 3.7 environment with Google Drive API v2.
-# Description: "List Files From Google Drive" is a function that creates a list of all files in a Google Drive folder by id.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.8+ environment with Google Auth and Requests installed.
+# Description: "List Files From Google Drive" is a function that creates a list of the metadata of all files in a Google Drive folder by id. The id, title, size, checksum, and modification time of up to one thousand files are returned by each call to the Drive API v2 files list.
 # ---------------------------------------------------------------------------
 
-# Define a function to create a list of all file IDs within a folder
-def list_from_drive(service, folder_id):
+# Define a function to create a list of the metadata of all files within a folder
+def list_from_drive(session, folder_id, api_url='https://www.googleapis.com/drive/v2', page_size=1000):
     """
-    Description: creates a list of files by ID belonging to a Google Drive folder.
-    Inputs: service -- Drive API service instance.
-            folder_id -- ID of the folder from which to list files.
+    Description: creates a list of the id, title, size, checksum, and modification time of all files belonging to a Google Drive folder
+    Inputs: 'session' -- an authorized requests session such as google.auth.transport.requests.AuthorizedSession
+            'folder_id' -- the id of the folder from which to list files
+            'api_url' -- the base url of the Drive API v2
+            'page_size' -- the maximum number of files returned by each call
+    Returned Value: Returns a list of dictionaries with 'id', 'title', 'size', 'md5', and 'modified' keys, where size and md5 are None for files without binary content
+    Preconditions: requires an authorized session with read access to the folder
     """
-    # Create empty list to store file IDs
-    file_id_list = []
-    page_token = None
-    # Search folder for files
+
+    # Request only the metadata needed to name and verify downloads
+    parameters = {'q': f"'{folder_id}' in parents and trashed = false",
+                  'fields': 'nextPageToken,items(id,title,fileSize,md5Checksum,modifiedDate)',
+                  'maxResults': page_size}
+
+    # List files by page
+    file_list = []
     while True:
-        try:
-            param = {}
-            if page_token:
-                param['pageToken'] = page_token
-            children = service.children().list(folderId=folder_id, **param).execute()
-            for child in children.get('items', []):
-                file_id_list = file_id_list + [child['id']]
-            page_token = children.get('nextPageToken')
-            if not page_token:
-                break
-        except:
-            print('An error occurred.')
+        response = session.get(f'{api_url}/files', params=parameters, timeout=60)
+        response.raise_for_status()
+        response_json = response.json()
+        for item in response_json.get('items', []):
+            file_size = item.get('fileSize')
+            file_list.append({'id': item['id'],
+                              'title': item['title'],
+                              'size': int(file_size) if file_size is not None else None,
+                              'md5': item.get('md5Checksum'),
+                              'modified': item.get('modifiedDate')})
+        page_token = response_json.get('nextPageToken')
+        if not page_token:
             break
-    # Return file ID list
-    return file_id_list
+        parameters['pageToken'] = page_token
+
+    # Return file metadata list
+    return file_list
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Output cache
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution or an ArcGIS Pro Python 3.7 installation.
+# Description: "Output cache" is a set of functions that decide whether outputs can be reused from a hash of the content of their inputs, the processing function and the local modules it imports, and the processing parameters. The hash is stored in a sidecar manifest next to each output so that unchanged outputs are reused and outputs with changed inputs, functions, or parameters are deleted and recomputed.
+# ---------------------------------------------------------------------------
+
+# Import packages at the module level so that file hashes can be reused within a session
+import functools
+
+# Define a function to hash the content of a file
+@functools.lru_cache(maxsize=4096)
+def hash_file(file_path, size, modified):
+    """
+    Description: calculates a hash of the content of a file, where results are reused within a session for an unchanged size and modification time
+    Inputs: 'file_path' -- a path to a file
+            'size' -- the size of the file in bytes
+            'modified' -- the modification time of the file in nanoseconds
+    Returned Value: Returns a hexadecimal hash string
+    Preconditions: requires an existing file
+    """
+
+    # Import packages
+    import hashlib
+
+    # Hash the file in chunks
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(16777216), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+# Define a function to read the signature of an input
+def read_signature(input_path):
+    """
+    Description: reads the size and modification time of a file or of all files in a folder
+    Inputs: 'input_path' -- a path to a file, a folder, or a dataset within a file geodatabase
+    Returned Value: Returns a list of [relative path, size, modification time] lists, which is empty if the input does not exist
+    Preconditions: datasets within a file geodatabase are represented by the files of the geodatabase
+    """
+
+    # Import packages
+    import os
+
+    # Represent datasets within a geodatabase by the geodatabase folder
+    search_path = input_path
+    while not os.path.exists(search_path) and os.path.split(search_path)[0] not in ('', search_path):
+        search_path = os.path.split(search_path)[0]
+    if not os.path.exists(search_path):
+        return []
+
+    # Read the signature of a file or of each file in a folder
+    if os.path.isfile(search_path):
+        file_status = os.stat(search_path)
+        return [['', file_status.st_size, file_status.st_mtime_ns]]
+    signature = []
+    for folder, folder_list, file_list in os.walk(search_path):
+        folder_list.sort()
+        for file_name in sorted(file_list):
+            # Exclude cache manifests so that recording outputs within a folder does not change the folder
+            if file_name.endswith(('.cache.json', '.cache.json.temporary')):
+                continue
+            file_path = os.path.join(folder, file_name)
+            file_status = os.stat(file_path)
+            signature.append([os.path.relpath(file_path, search_path), file_status.st_size, file_status.st_mtime_ns])
+
+    return signature
+
+# Define a function to hash the content of an input
+def hash_input(input_path, recorded_input=None):
+    """
+    Description: calculates a hash of the content of an input, reusing a recorded hash if the signature of the input is unchanged
+    Inputs: 'input_path' -- a path to a file, a folder, or a dataset within a file geodatabase
+            'recorded_input' -- an optional dictionary of the signature and hash recorded for the input in a manifest
+    Returned Value: Returns a dictionary of the signature and hash of the input
+    Preconditions: requires an input path
+    """
+
+    # Import packages
+    import hashlib
+    import os
+
+    # Reuse the recorded hash if the signature is unchanged
+    signature = read_signature(input_path)
+    if recorded_input is not None and recorded_input.get('signature') == signature:
+        return recorded_input
+
+    # Identify the file or folder that represents the input
+    search_path = input_path
+    while not os.path.exists(search_path) and os.path.split(search_path)[0] not in ('', search_path):
+        search_path = os.path.split(search_path)[0]
+
+    # Hash the content of each file
+    input_hash = hashlib.sha256()
+    for relative_path, size, modified in signature:
+        file_path = os.path.join(search_path, relative_path) if relative_path != '' else search_path
+        input_hash.update(relative_path.encode('utf-8'))
+        input_hash.update(hash_file(file_path, size, modified).encode('utf-8'))
+
+    return {'signature': signature, 'hash': input_hash.hexdigest()}
+
+# Define a function to list the local modules that a processing function depends on
+def list_dependent_modules(geoprocessing_function):
+    """
+    Description: lists the module of a processing function and every module of the same source tree that it imports, following imports within function bodies and imported modules recursively
+    Inputs: 'geoprocessing_function' -- a function
+    Returned Value: Returns a sorted list of module names
+    Preconditions: requires a function defined in a module within a package folder, where modules outside of the parent folder of the package such as installed libraries are excluded
+    """
+
+    # Import packages
+    import ast
+    import importlib
+    import importlib.util
+    import inspect
+    import os
+
+    # Define the source tree as the parent folder of the top-level package of the function
+    top_module = importlib.import_module(geoprocessing_function.__module__.split('.')[0])
+    source_root = os.path.dirname(os.path.dirname(os.path.abspath(top_module.__file__)))
+
+    # Define a function to find a module within the source tree
+    def find_local_module(module_name):
+        try:
+            module_spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        if module_spec is None or module_spec.origin is None or os.path.isfile(module_spec.origin) == 0:
+            return None
+        if not os.path.abspath(module_spec.origin).startswith(source_root + os.sep):
+            return None
+        return module_name
+
+    # Collect imported modules from the source of each module
+    module_list = []
+    search_list = [geoprocessing_function.__module__]
+    while len(search_list) > 0:
+        module_name = search_list.pop()
+        if module_name in module_list:
+            continue
+        module_list.append(module_name)
+        try:
+            module_tree = ast.parse(inspect.getsource(importlib.import_module(module_name)))
+        except (OSError, TypeError, SyntaxError):
+            continue
+        for node in ast.walk(module_tree):
+            if isinstance(node, ast.Import):
+                import_list = [find_local_module(alias.name) for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module is not None:
+                if find_local_module(node.module) is None:
+                    continue
+                import_list = [node.module]
+                for alias in node.names:
+                    # Resolve names imported from a package to the module that defines them
+                    submodule_name = find_local_module(node.module + '.' + alias.name)
+                    if submodule_name is None:
+                        imported_object = getattr(importlib.import_module(node.module), alias.name, None)
+                        submodule_name = find_local_module(getattr(imported_object, '__module__', None) or '')
+                    import_list.append(submodule_name)
+            else:
+                continue
+            search_list.extend(name for name in import_list if name is not None and name not in module_list)
+
+    return sorted(module_list)
+
+# Define a function to identify a processing function
+def identify_function(geoprocessing_function):
+    """
+    Description: identifies a processing function by its name and a hash of the source code of its module and the local modules it depends on
+    Inputs: 'geoprocessing_function' -- a function
+    Returned Value: Returns a string of the module, name, and source hash of the function
+    Preconditions: requires a function defined in a module
+    """
+
+    # Import packages
+    import hashlib
+    import importlib
+    import inspect
+
+    # Hash the source code of the function and its dependencies so that changes to imported helpers invalidate outputs
+    source_hash = hashlib.sha256()
+    try:
+        source_hash.update(inspect.getsource(geoprocessing_function).encode('utf-8'))
+    except (OSError, TypeError):
+        pass
+    for module_name in list_dependent_modules(geoprocessing_function):
+        try:
+            source = inspect.getsource(importlib.import_module(module_name))
+        except (OSError, TypeError):
+            source = ''
+        source_hash.update(module_name.encode('utf-8'))
+        source_hash.update(hashlib.sha256(source.encode('utf-8')).hexdigest().encode('utf-8'))
+
+    return f'{geoprocessing_function.__module__}.{geoprocessing_function.__name__}:{source_hash.hexdigest()}'
+
+# Define a function to calculate a cache key
+def calculate_cache_key(function_identity, input_dictionary, parameter_dictionary):
+    """
+    Description: calculates a cache key from a function identity, input hashes, and parameters
+    Inputs: 'function_identity' -- a string that identifies the processing function
+            'input_dictionary' -- a dictionary of input path to a dictionary of signature and hash
+            'parameter_dictionary' -- a dictionary of parameter name to value
+    Returned Value: Returns a hexadecimal cache key
+    Preconditions: requires parameters that can be represented as text
+    """
+
+    # Import packages
+    import hashlib
+    import json
+
+    # Hash the function, the input content in input order, and the sorted parameters
+    cache_hash = hashlib.sha256()
+    cache_hash.update(function_identity.encode('utf-8'))
+    for input_path, input_properties in input_dictionary.items():
+        cache_hash.update(input_properties['hash'].encode('utf-8'))
+    cache_hash.update(json.dumps(parameter_dictionary, sort_keys=True, default=str).encode('utf-8'))
+
+    return cache_hash.hexdigest()
+
+# Define a function to read a cache manifest
+def read_cache_manifest(output_path):
+    """
+    Description: reads the sidecar manifest of an output
+    Inputs: 'output_path' -- a path to an output
+    Returned Value: Returns the manifest dictionary or None if the manifest does not exist or cannot be read
+    Preconditions: manifests are stored next to the output with a .cache.json extension
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Read manifest
+    manifest_path = output_path + '.cache.json'
+    if os.path.exists(manifest_path) == 0:
+        return None
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+# Define a function to write a cache manifest
+def write_cache_manifest(output_path, cache_key, function_identity, input_dictionary, parameter_dictionary):
+    """
+    Description: writes the sidecar manifest of an output
+    Inputs: 'output_path' -- a path to an existing output
+            'cache_key' -- the cache key of the output
+            'function_identity' -- a string that identifies the processing function
+            'input_dictionary' -- a dictionary of input path to a dictionary of signature and hash
+            'parameter_dictionary' -- a dictionary of parameter name to value
+    Returned Value: Returns the manifest path after writing the manifest to disk
+    Preconditions: requires an existing output
+    """
+
+    # Import packages
+    import json
+    import os
+
+    # Create manifest
+    manifest = {'key': cache_key,
+                'function': function_identity,
+                'inputs': input_dictionary,
+                'parameters': json.loads(json.dumps(parameter_dictionary, sort_keys=True, default=str)),
+                'output': read_signature(output_path)}
+
+    # Write the manifest to a temporary file and move it to the manifest path
+    manifest_path = output_path + '.cache.json'
+    temporary_path = manifest_path + '.temporary'
+    with open(temporary_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(temporary_path, manifest_path)
+
+    return manifest_path
+
+# Define a function to check whether an output is current
+def check_cache(output_path, cache_key):
+    """
+    Description: checks that an output exists, is unchanged since its manifest was written, and was produced with a cache key
+    Inputs: 'output_path' -- a path to an output
+            'cache_key' -- the expected cache key
+    Returned Value: Returns True if the output can be reused, otherwise False
+    Preconditions: requires a cache key calculated by calculate_cache_key
+    """
+
+    # Compare the manifest with the output and the cache key
+    manifest = read_cache_manifest(output_path)
+    if manifest is None or manifest.get('key') != cache_key:
+        return False
+    output_signature = read_signature(output_path)
+    if len(output_signature) == 0 or manifest.get('output') != output_signature:
+        return False
+
+    return True
+
+# Define a function to delete an output and its sidecar files
+def delete_output(output_path):
+    """
+    Description: deletes an output file or folder with its manifest and auxiliary files
+    Inputs: 'output_path' -- a path to an output
+    Returned Value: Returns no value
+    Preconditions: datasets within a file geodatabase must be deleted by the processing function
+    """
+
+    # Import packages
+    import os
+    import shutil
+
+    # Delete the output
+    if os.path.isdir(output_path):
+        shutil.rmtree(output_path)
+    elif os.path.isfile(output_path):
+        os.remove(output_path)
+
+    # Delete sidecar files
+    sidecar_list = [output_path + '.cache.json',
+                    output_path + '.aux.xml',
+                    output_path + '.ovr',
+                    output_path + '.xml',
+                    os.path.splitext(output_path)[0] + '.tfw']
+    for sidecar_path in sidecar_list:
+        if os.path.isfile(sidecar_path):
+            os.remove(sidecar_path)
+
+# Define a function to run a geoprocessing function only if its outputs are not current
+def cache_geoprocessing(geoprocessing_function, check_output=False, check_input=True, intermediate_list=None,
+                        input_dictionary=None, **kwargs):
+    """
+    Description: wraps arcpy_geoprocessing so that outputs are reused when the content of the inputs, the function, and the parameters are unchanged and stale outputs are deleted and recomputed otherwise
+    Inputs: geoprocessing function -- any geoprocessing function that receives ** kwargs arguments
+            check_output -- boolean input passed to arcpy_geoprocessing
+            check_input -- boolean input passed to arcpy_geoprocessing
+            intermediate_list -- an optional list of intermediate datasets that the function reuses if they exist, which are invalidated and recorded with the outputs
+            input_dictionary -- an optional dictionary of input path to content hash for inputs already hashed by the caller, such as inputs shared by parallel workers
+            **kwargs -- key word arguments that are passed to the geoprocessing function
+                'input_array' -- the input datasets, whose content is hashed
+                'output_array' -- the output datasets, which each receive a sidecar manifest
+    Returned Value: Returns messages from the geoprocessing function or a message that the outputs are current
+    Preconditions: requires a geoprocessing function that skips or overwrites existing outputs and file-based outputs
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.arcpyGeoprocessing import arcpy_geoprocessing
+    import os
+
+    # Parse key word argument inputs
+    input_list = kwargs['input_array']
+    output_list = kwargs['output_array']
+    if intermediate_list is None:
+        intermediate_list = []
+    parameter_dictionary = {key: value for key, value in kwargs.items() if key not in ('input_array', 'output_array')}
+
+    # Hash the inputs that were not hashed by the caller, reusing hashes recorded for unchanged inputs
+    if input_dictionary is None:
+        input_dictionary = dict()
+    recorded_inputs = dict()
+    for output_path in output_list + intermediate_list:
+        manifest = read_cache_manifest(output_path)
+        if manifest is not None:
+            recorded_inputs = manifest.get('inputs', dict())
+            break
+    input_dictionary = {input_path: input_dictionary[input_path] if input_path in input_dictionary
+                        else hash_input(input_path, recorded_inputs.get(input_path))
+                        for input_path in input_list}
+
+    # Calculate the cache key
+    function_identity = identify_function(geoprocessing_function)
+    cache_key = calculate_cache_key(function_identity, input_dictionary, parameter_dictionary)
+
+    # Return if all outputs are current
+    stale_list = [output_path for output_path in output_list + intermediate_list
+                  if check_cache(output_path, cache_key) == False]
+    if len([output_path for output_path in stale_list if output_path in output_list]) == 0:
+        print(f'\tAll {len(output_list)} outputs are current and will be reused.')
+        return f'Reused {len(output_list)} current outputs.'
+
+    # Delete stale outputs so that the function recomputes them
+    for output_path in stale_list:
+        if os.path.exists(output_path):
+            print(f'\t{os.path.split(output_path)[1]} is stale and will be recomputed.')
+        delete_output(output_path)
+
+    # Run the geoprocessing function
+    arcpy_geoprocessing(geoprocessing_function, check_output=check_output, check_input=check_input, **kwargs)
+
+    # Write manifests for outputs that were produced
+    for output_path in output_list + intermediate_list:
+        if os.path.exists(output_path):
+            write_cache_manifest(output_path, cache_key, function_identity, input_dictionary, parameter_dictionary)
+
+    return f'Cached {len(output_list)} outputs.'
@@ -2,38 +2,182 @@
 # ---------------------------------------------------------------------------
 # Parse image segments
 # Author: Timm Nawrocki
-# Last Updated: 2022-03-26
-# Usage: Must be executed in an ArcGIS Pro Python 3.6 installation.
-# Description: "Parse image segments" is a function that extracts the image segments that overlap a validation grid.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
+# Description: "Parse image segments" is a set of functions that extract the image segments that overlap the grids of a grid index. The segment points are assigned to grids in a single pass by binning their coordinates on the regular grid index, the segment polygons are assigned the grid of the points that they contain in a single spatial join, and the points, polygons, and raster of each grid are then written from an attribute selection on the indexed grid field so that grids can be written in parallel worker processes.
 # ---------------------------------------------------------------------------
 
-# Define a function to parse image segments for a grid index
-def parse_image_segments(**kwargs):
+# Define a function to assign grid names to coordinates from grid index extents
+def assign_grid_names(extent_dictionary, x_coordinates, y_coordinates):
+    """
+    Description: assigns the name of the grid that contains each coordinate by binning the coordinates on a regular grid index
+    Inputs: 'extent_dictionary' -- a dictionary of grid name to (xmin, ymin, xmax, ymax) extent of each grid in the grid index
+            'x_coordinates' -- an array of x coordinates
+            'y_coordinates' -- an array of y coordinates
+    Returned Value: Returns an object array of grid names, where coordinates outside the grids of the grid index have empty names
+    Preconditions: grid index must be a regular grid of square cells such as one generated using create_grid_index
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.calculateGridIndex import calculate_grid_cells
+    import numpy as np
+
+    # Define the regular grid from the extents of the grid index
+    extent_array = np.array(list(extent_dictionary.values()), dtype='float64')
+    distance = float(np.median(extent_array[:, 2] - extent_array[:, 0]))
+    origin_x = float(extent_array[:, 0].min())
+    origin_y = float(extent_array[:, 3].max())
+    row_count = int(round((origin_y - extent_array[:, 1].min()) / distance))
+    column_count = int(round((extent_array[:, 2].max() - origin_x) / distance))
+    grid_index = {'origin': (origin_x, origin_y),
+                  'distance': distance,
+                  'rows': row_count,
+                  'columns': column_count}
+
+    # Locate each grid on the regular grid
+    grid_names = np.full(row_count * column_count + 1, '', dtype=object)
+    for grid_name, (xmin, ymin, xmax, ymax) in extent_dictionary.items():
+        grid_row = (origin_y - ymax) / distance
+        grid_column = (xmin - origin_x) / distance
+        if (abs(grid_row - round(grid_row)) > 1e-6
+                or abs(grid_column - round(grid_column)) > 1e-6
+                or abs((xmax - xmin) - distance) > 1e-6 * distance
+                or abs((ymax - ymin) - distance) > 1e-6 * distance):
+            raise ValueError(f'Grid {grid_name} is not aligned to a regular grid of {distance} map units.')
+        grid_names[int(round(grid_row)) * column_count + int(round(grid_column))] = grid_name
+
+    # Bin coordinates to grids, where the last lookup position holds the empty name of coordinates outside the grid
+    rows, columns = calculate_grid_cells(grid_index, x_coordinates, y_coordinates)
+    inside = (rows >= 0) & (rows < row_count) & (columns >= 0) & (columns < column_count)
+    grid_numbers = np.where(inside, rows * column_count + columns, row_count * column_count)
+
+    return grid_names[grid_numbers]
+
+# Define a function to partition image segments to the grids of a grid index
+def partition_image_segments(**kwargs):
     """
-    Description: extracts the image segments that overlap a selected grid
+    Description: assigns every image segment point and polygon to the grid of a grid index that contains the segment point in a single pass
     Inputs: 'tile_name' -- a field name in the grid index that stores the tile name
             'work_geodatabase' -- a geodatabase to store results
-            'input_array' -- an array containing the study area raster, the input grid index, the input image segment points, and the input image segment polygons
-            'output_folder' -- an empty folder to store the parsed image segment rasters
-    Returned Value: Returns a raster dataset for each grid in grid index
-    Preconditions: grid index must have been generated using create_grid_indices
+            'input_array' -- an array containing the input grid index, the input image segment points, and the input image segment polygons
+            'output_array' -- an array containing the output partitioned segment points and the output partitioned segment polygons
+    Returned Value: Returns point and polygon feature classes with an indexed grid_name field that stores the name of the grid of each segment
+    Preconditions: grid index must have been generated using create_grid_index
     """
 
     # Import packages
     import arcpy
-    from arcpy.sa import Raster
     import datetime
+    import numpy as np
     import os
     import time
 
     # Parse key word argument inputs
     tile_name = kwargs['tile_name']
     work_geodatabase = kwargs['work_geodatabase']
+    grid_index = kwargs['input_array'][0]
+    segments_point = kwargs['input_array'][1]
+    segments_polygon = kwargs['input_array'][2]
+    point_partition = kwargs['output_array'][0]
+    polygon_partition = kwargs['output_array'][1]
+
+    # Set overwrite option
+    arcpy.env.overwriteOutput = True
+
+    # Specify core usage
+    arcpy.env.parallelProcessingFactor = '0'
+
+    # Set workspace
+    arcpy.env.workspace = work_geodatabase
+
+    # Read grid extents from grid index
+    extent_dictionary = dict()
+    with arcpy.da.SearchCursor(grid_index, ['SHAPE@', tile_name]) as cursor:
+        for row in cursor:
+            extent_dictionary[row[1]] = (row[0].extent.XMin, row[0].extent.YMin,
+                                         row[0].extent.XMax, row[0].extent.YMax)
+
+    # Assign segment points to grids
+    print(f'\tAssigning segment points to {len(extent_dictionary)} grids...')
+    iteration_start = time.time()
+    # Copy segment points and remove unnecessary fields
+    arcpy.management.CopyFeatures(segments_point, point_partition)
+    drop_point_fields = [field.name for field in arcpy.ListFields(point_partition) if not field.required]
+    if len(drop_point_fields) > 0:
+        arcpy.management.DeleteField(point_partition, drop_point_fields)
+    # Bin point coordinates to grids
+    oid_field = arcpy.Describe(point_partition).OIDFieldName
+    point_array = arcpy.da.FeatureClassToNumPyArray(point_partition, ['OID@', 'SHAPE@X', 'SHAPE@Y'])
+    grid_names = assign_grid_names(extent_dictionary, point_array['SHAPE@X'], point_array['SHAPE@Y'])
+    name_length = max([len(grid_name) for grid_name in extent_dictionary] + [1])
+    grid_array = np.empty(len(point_array), dtype=[('point_oid', '<i4'), ('grid_name', f'<U{name_length}')])
+    grid_array['point_oid'] = point_array['OID@']
+    grid_array['grid_name'] = grid_names
+    arcpy.da.ExtendTable(point_partition, oid_field, grid_array, 'point_oid', append_only=False)
+    arcpy.management.AddIndex(point_partition, ['grid_name'], 'grid_name_index')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tAssigned {int((grid_names != "").sum())} of {len(grid_names)} points to grids.')
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Assign segment polygons to the grids of the points that they contain
+    print(f'\tAssigning segment polygons to grids...')
+    iteration_start = time.time()
+    field_map = arcpy.FieldMap()
+    field_map.addInputField(point_partition, 'grid_name')
+    field_mappings = arcpy.FieldMappings()
+    field_mappings.addFieldMap(field_map)
+    arcpy.analysis.SpatialJoin(segments_polygon,
+                               point_partition,
+                               polygon_partition,
+                               'JOIN_ONE_TO_ONE',
+                               'KEEP_COMMON',
+                               field_mappings,
+                               'INTERSECT')
+    arcpy.management.AddIndex(polygon_partition, ['grid_name'], 'grid_name_index')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    out_process = f'Successfully partitioned segments to grids in {os.path.split(point_partition)[1]} and {os.path.split(polygon_partition)[1]}.'
+    return out_process
+
+# Define a function to write the image segments of a grid from partitioned segments
+def write_segment_grid(**kwargs):
+    """
+    Description: writes the image segment points, polygons, and raster of a grid from image segments partitioned to grids
+    Inputs: 'grid_name' -- the name of the grid to write
+            'work_geodatabase' -- a geodatabase to store results, which must not be written by other processes
+            'input_array' -- an array containing the study area raster, the partitioned segment points, and the partitioned segment polygons
+            'output_array' -- an array containing the output segment points, the output segment polygons, and the output segment raster
+    Returned Value: Returns point and polygon feature classes and a raster dataset of the image segments of the grid
+    Preconditions: segments must have been partitioned using partition_image_segments, and grids written in parallel must each use a separate work geodatabase for their output features
+    """
+
+    # Import packages
+    import arcpy
+    import os
+
+    # Parse key word argument inputs
+    grid_name = kwargs['grid_name']
+    work_geodatabase = kwargs['work_geodatabase']
     area_raster = kwargs['input_array'][0]
-    grid_index = kwargs['input_array'][1]
-    segments_point = kwargs['input_array'][2]
-    segments_polygon = kwargs['input_array'][3]
-    output_folder = kwargs['output_folder']
+    point_partition = kwargs['input_array'][1]
+    polygon_partition = kwargs['input_array'][2]
+    output_points = kwargs['output_array'][0]
+    output_polygons = kwargs['output_array'][1]
+    output_grid = kwargs['output_array'][2]
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -51,111 +195,108 @@ def parse_image_segments(**kwargs):
     cell_size = arcpy.management.GetRasterProperties(area_raster, 'CELLSIZEX', '').getOutput(0)
     arcpy.env.cellSize = int(cell_size)
 
+    # Select the points and polygons of the grid and remove unnecessary fields
+    for partition, output_features in [(point_partition, output_points), (polygon_partition, output_polygons)]:
+        where_clause = f"{arcpy.AddFieldDelimiters(partition, 'grid_name')} = '{grid_name}'"
+        arcpy.analysis.Select(partition, output_features, where_clause)
+        drop_fields = [field.name for field in arcpy.ListFields(output_features) if not field.required]
+        arcpy.management.DeleteField(output_features, drop_fields)
+        arcpy.management.CalculateField(output_features,
+                                        'segment_id',
+                                        '!OBJECTID!',
+                                        'PYTHON3',
+                                        '',
+                                        'LONG',
+                                        'NO_ENFORCE_DOMAINS')
+
+    # Set extent to the polygons of the grid
+    desc = arcpy.Describe(output_polygons)
+    arcpy.env.extent = arcpy.Extent(desc.extent.XMin, desc.extent.YMin, desc.extent.XMax, desc.extent.YMax)
+
+    # Copy features to raster
+    arcpy.conversion.PolygonToRaster(output_polygons,
+                                     'OBJECTID',
+                                     output_grid,
+                                     'CELL_CENTER',
+                                     '',
+                                     cell_size,
+                                     'BUILD')
+
+    # Add XY coordinates to points
+    arcpy.management.AddXY(output_points)
+
+    # Return success message
+    out_process = f'Successfully wrote segments for grid {grid_name} to {os.path.split(output_grid)[1]}.'
+    return out_process
+
+# Define a function to parse image segments for a grid index
+def parse_image_segments(**kwargs):
+    """
+    Description: extracts the image segments that overlap each grid of a grid index
+    Inputs: 'tile_name' -- a field name in the grid index that stores the tile name
+            'work_geodatabase' -- a geodatabase to store results
+            'input_array' -- an array containing the study area raster, the input grid index, the input image segment points, and the input image segment polygons
+            'output_folder' -- an empty folder to store the parsed image segment rasters
+    Returned Value: Returns a raster dataset for each grid in grid index
+    Preconditions: grid index must have been generated using create_grid_index
+    """
+
+    # Import packages
+    import arcpy
+    import datetime
+    import os
+    import time
+
+    # Parse key word argument inputs
+    tile_name = kwargs['tile_name']
+    work_geodatabase = kwargs['work_geodatabase']
+    area_raster = kwargs['input_array'][0]
+    grid_index = kwargs['input_array'][1]
+    segments_point = kwargs['input_array'][2]
+    segments_polygon = kwargs['input_array'][3]
+    output_folder = kwargs['output_folder']
+
+    # Define partitioned segments
+    point_partition = os.path.join(work_geodatabase, 'points_partitioned')
+    polygon_partition = os.path.join(work_geodatabase, 'polygons_partitioned')
+
     # Print initial status
     print(f'Extracting grid tiles from {os.path.split(grid_index)[1]}...')
 
-    # Define fields for search cursor
-    fields = ['SHAPE@', tile_name]
-    # Initiate search cursor on grid index with defined fields
-    with arcpy.da.SearchCursor(grid_index, fields) as cursor:
-        # Iterate through each feature in the feature class
-        for row in cursor:
-            # Define output datasets
-            output_points = os.path.join(work_geodatabase, 'points_' + row[1])
-            output_polygons = os.path.join(work_geodatabase, 'polygons_' + row[1])
-            output_grid = os.path.join(output_folder, row[1] + '.tif')
-
-            # Define layers
-            point_layer = 'point_layer'
-            polygon_layer = 'polygon_layer'
-
-            # Set initial extent
-            arcpy.env.extent = Raster(area_raster).extent
-
-            # If tile does not exist, then create tile
-            if arcpy.Exists(output_grid) == 0:
-                print(f'\tProcessing grid tile {os.path.split(output_grid)[1]}...')
-                iteration_start = time.time()
-                # Delete feature classes if they exist
-                if arcpy.Exists(output_points) == 1:
-                    arcpy.management.Delete(output_points)
-                if arcpy.Exists(output_polygons) == 1:
-                    arcpy.management.Delete(output_polygons)
-                # Make segment point layer
-                arcpy.management.MakeFeatureLayer(segments_point, point_layer)
-                # Select points by overlap with grid
-                arcpy.management.SelectLayerByLocation(point_layer,
-                                                       'INTERSECT',
-                                                       row[0],
-                                                       '',
-                                                       'NEW_SELECTION',
-                                                       'NOT_INVERT')
-                # Copy selected points to new feature class and remove unnecessary fields
-                arcpy.management.CopyFeatures(point_layer, output_points)
-                point_field_list = arcpy.ListFields(output_points)
-                drop_point_fields = []
-                for field in point_field_list:
-                    if not field.required:
-                        drop_point_fields.append(field.name)
-                arcpy.management.DeleteField(output_points, drop_point_fields)
-                arcpy.management.CalculateField(output_points,
-                                                'segment_id',
-                                                '!OBJECTID!',
-                                                'PYTHON3',
-                                                '',
-                                                'LONG',
-                                                'NO_ENFORCE_DOMAINS')
-                # Make segment polygon layer
-                arcpy.management.MakeFeatureLayer(segments_polygon, polygon_layer)
-                # Select polygons by overlap with points
-                arcpy.management.SelectLayerByLocation(polygon_layer,
-                                                       'INTERSECT',
-                                                       output_points,
-                                                       '',
-                                                       'NEW_SELECTION',
-                                                       'NOT_INVERT')
-                # Copy selected points to new feature class and remove unnecessary fields
-                arcpy.management.CopyFeatures(polygon_layer, output_polygons)
-                polygon_field_list = arcpy.ListFields(output_polygons)
-                drop_polygon_fields = []
-                for field in polygon_field_list:
-                    if not field.required:
-                        drop_polygon_fields.append(field.name)
-                arcpy.management.DeleteField(output_polygons, drop_polygon_fields)
-                arcpy.management.CalculateField(output_polygons,
-                                                'segment_id',
-                                                '!OBJECTID!',
-                                                'PYTHON3',
-                                                '',
-                                                'LONG',
-                                                'NO_ENFORCE_DOMAINS')
-                # Update extent
-                desc = arcpy.Describe(output_polygons)
-                xmin = desc.extent.XMin
-                xmax = desc.extent.XMax
-                ymin = desc.extent.YMin
-                ymax = desc.extent.YMax
-                arcpy.env.extent = arcpy.Extent(xmin, ymin, xmax, ymax)
-                # Copy features to raster
-                arcpy.conversion.PolygonToRaster(output_polygons,
-                                                 'OBJECTID',
-                                                 output_grid,
-                                                 'CELL_CENTER',
-                                                 '',
-                                                 cell_size,
-                                                 'BUILD')
-                # Add XY coordinates to points
-                arcpy.management.AddXY(output_points)
-                # End timing
-                iteration_end = time.time()
-                iteration_elapsed = int(iteration_end - iteration_start)
-                iteration_success_time = datetime.datetime.now()
-                # Report success
-                print(f'\tOutput grid {os.path.split(output_grid)[1]} completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-                print('\t----------')
-            else:
-                print(f'\tOutput grid {os.path.split(output_grid)[1]} already exists...')
-                print('\t----------')
+    # Partition segments to grids in a single pass
+    with arcpy.da.SearchCursor(grid_index, [tile_name]) as cursor:
+        grid_list = [row[0] for row in cursor]
+    if len([grid for grid in grid_list if arcpy.Exists(os.path.join(output_folder, grid + '.tif')) == 0]) > 0:
+        print(partition_image_segments(tile_name=tile_name,
+                                       work_geodatabase=work_geodatabase,
+                                       input_array=[grid_index, segments_point, segments_polygon],
+                                       output_array=[point_partition, polygon_partition]))
+
+    # Write segments for each grid
+    for grid in grid_list:
+        # Define output datasets
+        output_points = os.path.join(work_geodatabase, 'points_' + grid)
+        output_polygons = os.path.join(work_geodatabase, 'polygons_' + grid)
+        output_grid = os.path.join(output_folder, grid + '.tif')
+
+        # If tile does not exist, then create tile
+        if arcpy.Exists(output_grid) == 0:
+            print(f'\tProcessing grid tile {os.path.split(output_grid)[1]}...')
+            iteration_start = time.time()
+            write_segment_grid(grid_name=grid,
+                               work_geodatabase=work_geodatabase,
+                               input_array=[area_raster, point_partition, polygon_partition],
+                               output_array=[output_points, output_polygons, output_grid])
+            # End timing
+            iteration_end = time.time()
+            iteration_elapsed = int(iteration_end - iteration_start)
+            iteration_success_time = datetime.datetime.now()
+            # Report success
+            print(f'\tOutput grid {os.path.split(output_grid)[1]} completed at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+            print('\t----------')
+        else:
+            print(f'\tOutput grid {os.path.split(output_grid)[1]} already exists...')
+            print('\t----------')
 
     # Return final status
     out_process = 'Finished parsing segments to grids.'
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Pipeline runner
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution or an ArcGIS Pro Python 3.7 installation. Each stage is executed as a separate process with the interpreter declared for the stage.
+# Description: "Pipeline runner" is a set of functions that run workflow scripts as stages of a dependency graph. Each stage declares its inputs and outputs, stages are connected where the outputs of one stage are the inputs of another, and independent stages run in parallel under a budget of processor cores and memory unless they share a work geodatabase. The inputs of ready stages are hashed in worker threads so that hashing does not delay the dispatch of other stages. Stages whose outputs are current with the content of their inputs are skipped so that only outputs downstream of a change are rebuilt.
+# ---------------------------------------------------------------------------
+
+# Define a function to define a pipeline stage
+def define_stage(name, command, input_list, output_list, cores=1, memory=0, duration=1, workspace_list=None):
+    """
+    Description: defines a pipeline stage as a command with declared inputs, outputs, and resources
+    Inputs: 'name' -- a unique string name of the stage
+            'command' -- a list of the interpreter and script path and any arguments that execute the stage
+            'input_list' -- a list of files or folders read by the stage
+            'output_list' -- a list of files or folders written by the stage
+            'cores' -- the number of processor cores used by the stage
+            'memory' -- the memory in gigabytes used by the stage
+            'duration' -- a relative estimate of the run time of the stage used to prioritize the critical path
+            'workspace_list' -- an optional list of work geodatabases or folders written by the stage as scratch space, where stages that share a workspace do not run at the same time
+    Returned Value: Returns a stage dictionary
+    Preconditions: requires file or folder outputs that are not written by any other stage so that outputs can be checked against their inputs
+    """
+
+    # Create stage
+    stage = {'name': name,
+             'command': list(command),
+             'inputs': list(input_list),
+             'outputs': list(output_list),
+             'cores': cores,
+             'memory': memory,
+             'duration': duration,
+             'workspaces': list(workspace_list) if workspace_list is not None else []}
+
+    return stage
+
+# Define a function to check whether a path is within another path
+def check_path_overlap(first_path, second_path):
+    """
+    Description: checks whether two paths refer to the same dataset or one path is within the other
+    Inputs: 'first_path' -- a file or folder path
+            'second_path' -- a file or folder path
+    Returned Value: Returns True if the paths are equal or nested, otherwise False
+    Preconditions: requires absolute paths
+    """
+
+    # Import packages
+    import os
+
+    # Normalize paths
+    first_path = os.path.normcase(os.path.normpath(first_path))
+    second_path = os.path.normcase(os.path.normpath(second_path))
+
+    # Compare paths
+    if first_path == second_path:
+        return True
+    if first_path.startswith(second_path + os.sep) or second_path.startswith(first_path + os.sep):
+        return True
+
+    return False
+
+# Define a function to build a stage dependency graph
+def build_stage_graph(stage_list):
+    """
+    Description: connects stages where an input of a stage overlaps an output of another stage and orders the stages topologically
+    Inputs: 'stage_list' -- a list of stage dictionaries created by define_stage
+    Returned Value: Returns a graph dictionary of stage name to a dictionary of the stage, upstream stage names, and downstream stage names, and a list of stage names in topological order
+    Preconditions: requires stages without circular dependencies or overlapping outputs
+    """
+
+    # Create graph nodes
+    stage_graph = dict()
+    for stage in stage_list:
+        if stage['name'] in stage_graph:
+            raise ValueError(f'Stage name {stage["name"]} is used more than once.')
+        stage_graph[stage['name']] = {'stage': stage, 'upstream': set(), 'downstream': set()}
+
+    # Reject outputs shared between stages, since each stage records its outputs as current with its own inputs
+    for first_index, first_stage in enumerate(stage_list):
+        for second_stage in stage_list[first_index + 1:]:
+            for output_path in first_stage['outputs']:
+                if any(check_path_overlap(output_path, other_path) for other_path in second_stage['outputs']):
+                    raise ValueError(f'Stages {first_stage["name"]} and {second_stage["name"]} both write {output_path}.')
+
+    # Connect stages where inputs overlap the outputs of other stages
+    for stage in stage_list:
+        for producer in stage_list:
+            if producer['name'] == stage['name']:
+                continue
+            if any(check_path_overlap(input_path, output_path)
+                   for input_path in stage['inputs'] for output_path in producer['outputs']):
+                stage_graph[stage['name']]['upstream'].add(producer['name'])
+                stage_graph[producer['name']]['downstream'].add(stage['name'])
+
+    # Order stages topologically in declaration order where possible
+    stage_order = []
+    remaining = {name: len(node['upstream']) for name, node in stage_graph.items()}
+    ready_list = [stage['name'] for stage in stage_list if remaining[stage['name']] == 0]
+    while len(ready_list) > 0:
+        name = ready_list.pop(0)
+        stage_order.append(name)
+        for downstream_name in sorted(stage_graph[name]['downstream']):
+            remaining[downstream_name] -= 1
+            if remaining[downstream_name] == 0:
+                ready_list.append(downstream_name)
+    if len(stage_order) != len(stage_graph):
+        cycle_list = sorted(name for name in stage_graph if name not in stage_order)
+        raise ValueError(f'Stages have circular dependencies: {", ".join(cycle_list)}')
+
+    return stage_graph, stage_order
+
+# Define a function to calculate critical path priorities
+def calculate_stage_priority(stage_graph, stage_order):
+    """
+    Description: calculates the longest duration from the start of each stage to the end of the pipeline
+    Inputs: 'stage_graph' -- a graph dictionary created by build_stage_graph
+            'stage_order' -- a list of stage names in topological order
+    Returned Value: Returns a dictionary of stage name to critical path duration
+    Preconditions: requires a graph without circular dependencies
+    """
+
+    # Accumulate durations from the last stages backward
+    priority_dictionary = dict()
+    for name in reversed(stage_order):
+        node = stage_graph[name]
+        downstream_priority = [priority_dictionary[downstream_name] for downstream_name in node['downstream']]
+        priority_dictionary[name] = node['stage']['duration'] + max(downstream_priority, default=0)
+
+    return priority_dictionary
+
+# Define a function to select stages for a set of targets
+def select_stages(stage_graph, target_list=None):
+    """
+    Description: selects the target stages and all stages upstream of them
+    Inputs: 'stage_graph' -- a graph dictionary created by build_stage_graph
+            'target_list' -- an optional list of target stage names (default is all stages)
+    Returned Value: Returns a set of selected stage names
+    Preconditions: requires target names that exist in the graph
+    """
+
+    # Select all stages if no targets are provided
+    if target_list is None:
+        return set(stage_graph.keys())
+
+    # Traverse upstream from each target
+    selected = set()
+    search_list = list(target_list)
+    while len(search_list) > 0:
+        name = search_list.pop()
+        if name not in stage_graph:
+            raise ValueError(f'Stage {name} is not defined.')
+        if name not in selected:
+            selected.add(name)
+            search_list.extend(stage_graph[name]['upstream'])
+
+    return selected
+
+# Define a function to check whether the outputs of a stage are current
+def check_stage(stage):
+    """
+    Description: calculates the cache key of a stage from its command and the content of its inputs and checks whether all outputs are current
+    Inputs: 'stage' -- a stage dictionary created by define_stage
+    Returned Value: Returns a tuple of whether the outputs are current, the cache key, and the input dictionary of signatures and hashes
+    Preconditions: requires the inputs of the stage to exist
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.outputCache import calculate_cache_key
+    from package_GeospatialProcessing.outputCache import check_cache
+    from package_GeospatialProcessing.outputCache import hash_input
+    from package_GeospatialProcessing.outputCache import read_cache_manifest
+
+    # Hash inputs, reusing hashes recorded for unchanged inputs
+    recorded_inputs = dict()
+    for output_path in stage['outputs']:
+        manifest = read_cache_manifest(output_path)
+        if manifest is not None:
+            recorded_inputs = manifest.get('inputs', dict())
+            break
+    input_dictionary = {input_path: hash_input(input_path, recorded_inputs.get(input_path))
+                        for input_path in stage['inputs']}
+
+    # Calculate the stage key from the command and inputs
+    cache_key = calculate_cache_key('stage:' + stage['name'], input_dictionary, {'command': stage['command']})
+    current = all(check_cache(output_path, cache_key) for output_path in stage['outputs'])
+
+    return current, cache_key, input_dictionary
+
+# Define a function to run a stage
+def run_stage(stage, log_folder):
+    """
+    Description: executes the command of a stage and writes its messages to a log file
+    Inputs: 'stage' -- a stage dictionary created by define_stage
+            'log_folder' -- a folder to store the log of the stage
+    Returned Value: Returns the return code of the stage process
+    Preconditions: requires a command that can be executed from the working directory
+    """
+
+    # Import packages
+    import os
+    import subprocess
+
+    # Execute the stage
+    log_file = os.path.join(log_folder, stage['name'] + '.log')
+    with open(log_file, 'w', encoding='utf-8') as log:
+        completed = subprocess.run(stage['command'], stdout=log, stderr=subprocess.STDOUT)
+
+    return completed.returncode
+
+# Define a function to run a pipeline
+def run_pipeline(stage_list, log_folder, cores=None, memory=None, target_list=None, dry_run=False):
+    """
+    Description: runs the stages of a pipeline in dependency order with independent stages in parallel, skipping stages whose outputs are current
+    Inputs: 'stage_list' -- a list of stage dictionaries created by define_stage
+            'log_folder' -- a folder to store the log of each stage
+            'cores' -- an optional budget of processor cores shared by running stages (default is the number of processors)
+            'memory' -- an optional budget of memory in gigabytes shared by running stages (default is no limit)
+            'target_list' -- an optional list of stage names to build with their upstream stages (default is all stages)
+            'dry_run' -- a boolean value to report stages that would run without running them
+    Returned Value: Returns a dictionary of stage name to status of "current", "completed", "failed", "blocked", or "stale"
+    Preconditions: requires stages defined with define_stage and external inputs that exist, where file outputs and folder outputs recorded with other inputs are deleted before a stale stage runs, folder outputs without a record are kept so that interrupted stages resume, and stages must exit with a non-zero code on failure
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.outputCache import delete_output
+    from package_GeospatialProcessing.outputCache import read_cache_manifest
+    from package_GeospatialProcessing.outputCache import write_cache_manifest
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import wait
+    import datetime
+    import math
+    import os
+    import time
+
+    # Set default resource budget
+    if cores is None:
+        cores = os.cpu_count()
+    if memory is None:
+        memory = math.inf
+
+    # Build graph and select stages
+    stage_graph, stage_order = build_stage_graph(stage_list)
+    priority_dictionary = calculate_stage_priority(stage_graph, stage_order)
+    selected = select_stages(stage_graph, target_list)
+    if os.path.exists(log_folder) == 0:
+        os.makedirs(log_folder)
+
+    # Run stages as their upstream stages finish
+    print(f'Running {len(selected)} pipeline stages with {cores} cores...')
+    pipeline_start = time.time()
+    status_dictionary = dict()
+    pending = set(selected)
+    checking = dict()
+    checked = dict()
+    running = dict()
+    used_cores = 0
+    used_memory = 0
+    with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as executor:
+        while len(pending) > 0 or len(running) > 0 or len(checking) > 0:
+            # Identify stages whose selected upstream stages are finished
+            ready_list = []
+            for name in pending:
+                upstream = stage_graph[name]['upstream'] & selected
+                if any(status_dictionary.get(upstream_name) in ('failed', 'blocked') for upstream_name in upstream):
+                    status_dictionary[name] = 'blocked'
+                elif all(status_dictionary.get(upstream_name) in ('current', 'completed', 'stale')
+                         for upstream_name in upstream):
+                    ready_list.append(name)
+            pending = {name for name in pending if name not in status_dictionary}
+            ready_list.sort(key=lambda name: (-priority_dictionary[name], stage_order.index(name)))
+
+            # Hash the inputs of ready stages in worker threads so that hashing does not delay running stages
+            for name in ready_list:
+                if name not in checked and name not in checking.values():
+                    checking[executor.submit(check_stage, stage_graph[name]['stage'])] = name
+
+            # Start checked stages on the critical path first within the resource budget
+            for name in ready_list:
+                if name not in checked:
+                    continue
+                stage = stage_graph[name]['stage']
+                current, cache_key, input_dictionary = checked[name]
+                if current:
+                    print(f'\tStage {name} is current.')
+                    status_dictionary[name] = 'current'
+                    pending.discard(name)
+                    continue
+                if dry_run:
+                    print(f'\tStage {name} would run.')
+                    status_dictionary[name] = 'stale'
+                    pending.discard(name)
+                    continue
+                # Wait for running stages that share a workspace
+                shared = any(check_path_overlap(workspace, running_workspace)
+                             for workspace in stage['workspaces']
+                             for running_name in [entry[0] for entry in running.values()]
+                             for running_workspace in stage_graph[running_name]['stage']['workspaces'])
+                if shared:
+                    continue
+                # Allow a stage that exceeds the budget to run alone
+                fits = (used_cores + stage['cores'] <= cores and used_memory + stage['memory'] <= memory)
+                if fits or len(running) == 0:
+                    print(f'\tStarting stage {name}...')
+                    # Delete stale outputs, where folders recorded with other inputs are deleted because stage scripts skip existing files
+                    for output_path in stage['outputs']:
+                        if os.path.isfile(output_path) or read_cache_manifest(output_path) is not None:
+                            delete_output(output_path)
+                    future = executor.submit(run_stage, stage, log_folder)
+                    running[future] = (name, cache_key, input_dictionary, time.time())
+                    used_cores += stage['cores']
+                    used_memory += stage['memory']
+                    pending.discard(name)
+
+            # Continue if stages were skipped and others may now be ready
+            if len(running) == 0 and len(checking) == 0:
+                continue
+
+            # Wait for a running stage or an input check to finish
+            finished, unfinished = wait(list(running.keys()) + list(checking.keys()), return_when=FIRST_COMPLETED)
+            for future in finished:
+                if future in checking:
+                    checked[checking.pop(future)] = future.result()
+                    continue
+                name, cache_key, input_dictionary, stage_start = running.pop(future)
+                stage = stage_graph[name]['stage']
+                used_cores -= stage['cores']
+                used_memory -= stage['memory']
+                stage_elapsed = int(time.time() - stage_start)
+                try:
+                    return_code = future.result()
+                except Exception as error:
+                    return_code = error
+                missing_list = [output_path for output_path in stage['outputs'] if os.path.exists(output_path) == 0]
+                if return_code == 0 and len(missing_list) == 0:
+                    for output_path in stage['outputs']:
+                        write_cache_manifest(output_path, cache_key, 'stage:' + name, input_dictionary,
+                                             {'command': stage['command']})
+                    status_dictionary[name] = 'completed'
+                    print(f'\tStage {name} completed (Elapsed time: {datetime.timedelta(seconds=stage_elapsed)}).')
+                else:
+                    status_dictionary[name] = 'failed'
+                    print(f'\tERROR: Stage {name} failed with return code {return_code}. See {name}.log.')
+    # End timing
+    pipeline_elapsed = int(time.time() - pipeline_start)
+    pipeline_success_time = datetime.datetime.now()
+    # Report success
+    for status in ('current', 'completed', 'stale', 'failed', 'blocked'):
+        status_count = len([name for name in status_dictionary if status_dictionary[name] == status])
+        if status_count > 0:
+            print(f'\t{status_count} stages {status}.')
+    print(
+        f'Completed at {pipeline_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=pipeline_elapsed)})')
+    print('----------')
+
+    return status_dictionary
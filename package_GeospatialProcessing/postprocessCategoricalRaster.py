@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Post-process categorical rasters
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-27
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Post-process categorical rasters" is a function that generalizes a predicted raster, applies a minimum mapping unit, and adds manually delineated classes.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
+# Description: "Post-process categorical rasters" is a function that generalizes a predicted raster, applies a minimum mapping unit, and adds manually delineated classes. The native option removes regions below the minimum mapping unit and replaces them from the nearest retained cell in a single streaming job, and evaluates the removal and added class conditions as fused expressions.
 # ---------------------------------------------------------------------------
 
 # Define a function to post-process categorical raster
@@ -21,11 +21,20 @@ def postprocess_categorical_raster(**kwargs):
             'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area raster (must be first), the predicted raster, the infrastructure feature class, the infrastructure raster, the segments feature class, the pipeline raster, and the stream raster
             'output_array' -- an array containing the output raster
+            'native' -- an optional boolean value that if True applies the minimum mapping unit with the native sieve engine (default is False)
     Returned Value: Returns a raster to disk
     Preconditions: requires a predicted categorical raster
     """
 
     # Import packages
+    from package_GeospatialProcessing.calculateNativeSieve import calculate_native_sieve
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.rasterExpression import con
+    from package_GeospatialProcessing.rasterExpression import evaluate_expression
+    from package_GeospatialProcessing.rasterExpression import map_algebra
+    from package_GeospatialProcessing.rasterExpression import raster_input
+    from package_GeospatialProcessing.rasterExpression import set_null
+    from package_GeospatialProcessing.rasterExpression import where_clause
     import arcpy
     from arcpy.sa import BoundaryClean
     from arcpy.sa import Con
@@ -58,6 +67,7 @@ def postprocess_categorical_raster(**kwargs):
     pipeline_raster = kwargs['input_array'][5]
     stream_raster = kwargs['input_array'][6]
     output_raster = kwargs['output_array'][0]
+    native = kwargs.get('native', False)
 
     # Define work folder
     work_folder = os.path.split(input_raster)[0]
@@ -71,6 +81,9 @@ def postprocess_categorical_raster(**kwargs):
     infrastructure_zonal = os.path.join(infrastructure_folder, 'zonal_developed.tif')
     pipeline_zonal = os.path.join(infrastructure_folder, 'zonal_pipelines.tif')
     input_integer = os.path.join(work_folder, 'integer.tif')
+    majority_raster = os.path.join(work_folder, 'majority.tif')
+    removed_raster = os.path.join(work_folder, 'removed.tif')
+    nibble_raster = os.path.join(work_folder, 'nibble.tif')
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -227,106 +240,174 @@ def postprocess_categorical_raster(**kwargs):
     # Calculate regions
     print(f'\tCalculating regions...')
     iteration_start = time.time()
-    # Create conditional raster for sensitivity to pipelines and infrastructure
-    proximity_raster = Con(raster_majority, 1, 0, conditional_statement)
-    # Set null where infrastructure has contaminated predictions
-    print('\t\tRemoving infrastructure errors...')
-    raster_remove_1 = SetNull((Raster(infrastructure_zonal) > 0) & (proximity_raster == 1),
-                              raster_majority)
-    # Set null where pipelines have contaminated predictions
-    print('\t\tRemoving pipeline errors...')
-    raster_remove_2 = SetNull((Raster(pipeline_zonal) > 0) & (proximity_raster == 1),
-                              raster_remove_1)
-    # Calculate regions
-    print('\t\tCalculating contiguous value areas...')
-    raster_regions = RegionGroup(raster_remove_2,
-                                 'FOUR',
-                                 'WITHIN',
-                                 'NO_LINK',
-                                 f'{water_value}')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+    if native == True:
+        # Export generalized raster
+        print('\t\tExporting generalized raster...')
+        arcpy.management.CopyRaster(raster_majority,
+                                    majority_raster,
+                                    '',
+                                    '',
+                                    '-128',
+                                    'NONE',
+                                    'NONE',
+                                    '8_BIT_SIGNED',
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+        # Create conditional expression for sensitivity to pipelines and infrastructure
+        majority_node = raster_input(majority_raster)
+        proximity_node = where_clause(majority_node, conditional_statement)
+        # Set null where infrastructure and pipelines have contaminated predictions
+        print('\t\tRemoving infrastructure and pipeline errors...')
+        remove_node = majority_node
+        for zonal_raster in (infrastructure_zonal, pipeline_zonal):
+            remove_node = set_null(map_algebra('&',
+                                               map_algebra('>', raster_input(zonal_raster), 0),
+                                               map_algebra('==', proximity_node, 1)),
+                                   remove_node)
+        evaluate_expression(remove_node, majority_raster, removed_raster, 'int8', -128)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Create nibble mask
-    print(f'\tCreating mask raster of removed zones...')
-    iteration_start = time.time()
-    # Remove zones below minimum mapping unit
-    print('\t\tRemoving contiguous areas below minimum mapping unit...')
-    criteria = f'COUNT > {minimum_count}'
-    raster_mask_1 = ExtractByAttributes(raster_regions,
-                                        criteria)
-    # Set null for water
-    raster_mask = SetNull(raster_mask_1 == 0, raster_mask_1)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Remove regions below minimum mapping unit and replace removed data
+        print(f'\tApplying minimum mapping unit...')
+        iteration_start = time.time()
+        calculate_native_sieve(majority_raster,
+                               nibble_raster,
+                               minimum_count,
+                               region_raster=removed_raster,
+                               excluded_value=water_value)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+    else:
+        # Create conditional raster for sensitivity to pipelines and infrastructure
+        proximity_raster = Con(raster_majority, 1, 0, conditional_statement)
+        # Set null where infrastructure has contaminated predictions
+        print('\t\tRemoving infrastructure errors...')
+        raster_remove_1 = SetNull((Raster(infrastructure_zonal) > 0) & (proximity_raster == 1),
+                                  raster_majority)
+        # Set null where pipelines have contaminated predictions
+        print('\t\tRemoving pipeline errors...')
+        raster_remove_2 = SetNull((Raster(pipeline_zonal) > 0) & (proximity_raster == 1),
+                                  raster_remove_1)
+        # Calculate regions
+        print('\t\tCalculating contiguous value areas...')
+        raster_regions = RegionGroup(raster_remove_2,
+                                     'FOUR',
+                                     'WITHIN',
+                                     'NO_LINK',
+                                     f'{water_value}')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Replace removed data
-    print(f'\tReplacing removed data...')
-    iteration_start = time.time()
-    # Nibble raster
-    raster_nibble = Nibble(raster_majority,
-                           raster_mask,
-                           'ALL_VALUES',
-                           'PRESERVE_NODATA')
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+        # Create nibble mask
+        print(f'\tCreating mask raster of removed zones...')
+        iteration_start = time.time()
+        # Remove zones below minimum mapping unit
+        print('\t\tRemoving contiguous areas below minimum mapping unit...')
+        criteria = f'COUNT > {minimum_count}'
+        raster_mask_1 = ExtractByAttributes(raster_regions,
+                                            criteria)
+        # Set null for water
+        raster_mask = SetNull(raster_mask_1 == 0, raster_mask_1)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Replace removed data
+        print(f'\tReplacing removed data...')
+        iteration_start = time.time()
+        # Nibble raster
+        raster_nibble = Nibble(raster_majority,
+                               raster_mask,
+                               'ALL_VALUES',
+                               'PRESERVE_NODATA')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
     # Add missing values for water, infrastructure, pipelines, and stream corridors
-    print(f'\tAdding missing values...')
-    iteration_start = time.time()
-    # Add stream corridors
-    raster_modified_1 = Con(Raster(stream_raster) > 0, stream_value, raster_nibble)
-    # Add water
-    raster_modified_2 = Con(raster_majority == water_value, water_value, raster_modified_1)
-    # Add pipelines
-    raster_modified_3 = Con(Raster(pipeline_raster) > 0, pipelines_value, raster_modified_2)
-    # Add infrastructure
-    raster_modified_4 = Con(Raster(infrastructure_raster) > 0, infrastructure_value, raster_modified_3)
-    # End timing
-    iteration_end = time.time()
-    iteration_elapsed = int(iteration_end - iteration_start)
-    iteration_success_time = datetime.datetime.now()
-    # Report success
-    print(
-        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
-    print('\t----------')
+    if native == True:
+        print(f'\tAdding missing values and exporting final raster...')
+        iteration_start = time.time()
+        # Add stream corridors, water, pipelines, and infrastructure in a fused expression
+        modified_node = con(map_algebra('>', raster_input(stream_raster), 0), stream_value, raster_input(nibble_raster))
+        modified_node = con(map_algebra('==', raster_input(majority_raster), water_value), water_value, modified_node)
+        modified_node = con(map_algebra('>', raster_input(pipeline_raster), 0), pipelines_value, modified_node)
+        modified_node = con(map_algebra('>', raster_input(infrastructure_raster), 0), infrastructure_value, modified_node)
+        # Export final raster
+        evaluate_expression(modified_node, majority_raster, output_raster, 'int8', -128)
+    else:
+        print(f'\tAdding missing values...')
+        iteration_start = time.time()
+        # Add stream corridors
+        raster_modified_1 = Con(Raster(stream_raster) > 0, stream_value, raster_nibble)
+        # Add water
+        raster_modified_2 = Con(raster_majority == water_value, water_value, raster_modified_1)
+        # Add pipelines
+        raster_modified_3 = Con(Raster(pipeline_raster) > 0, pipelines_value, raster_modified_2)
+        # Add infrastructure
+        raster_modified_4 = Con(Raster(infrastructure_raster) > 0, infrastructure_value, raster_modified_3)
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
 
-    # Export final raster
-    print(f'\tExporting final raster...')
-    iteration_start = time.time()
-    # Export extracted raster
-    arcpy.management.CopyRaster(raster_modified_4,
-                                output_raster,
-                                '',
-                                '',
-                                '-128',
-                                'NONE',
-                                'NONE',
-                                '8_BIT_SIGNED',
-                                'NONE',
-                                'NONE',
-                                'TIFF',
-                                'NONE',
-                                'CURRENT_SLICE',
-                                'NO_TRANSPOSE')
+        # Export final raster
+        print(f'\tExporting final raster...')
+        iteration_start = time.time()
+        # Export extracted raster
+        arcpy.management.CopyRaster(raster_modified_4,
+                                    output_raster,
+                                    '',
+                                    '',
+                                    '-128',
+                                    'NONE',
+                                    'NONE',
+                                    '8_BIT_SIGNED',
+                                    'NONE',
+                                    'NONE',
+                                    'TIFF',
+                                    'NONE',
+                                    'CURRENT_SLICE',
+                                    'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(output_raster, resampling='nearest')
     # Create raster attribute table
     arcpy.management.BuildRasterAttributeTable(output_raster, 'Overwrite')
     # Calculate attribute label field
@@ -350,8 +431,9 @@ def postprocess_categorical_raster(**kwargs):
     print('\t----------')
 
     # Delete intermediate datasets
-    if arcpy.Exists(input_integer) == 1:
-        arcpy.management.Delete(input_integer)
+    for dataset in (input_integer, majority_raster, removed_raster, nibble_raster):
+        if arcpy.Exists(dataset) == 1:
+            arcpy.management.Delete(dataset)
 
     # Return success message
     out_process = f'Successfully post-processed categorical raster.'
@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Post-process continuous rasters
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-27
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Post-process continuous rasters" is a function that corrects a continuous raster or set of rasters based on values from a categorical raster.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
+# Description: "Post-process continuous rasters" is a function that corrects a continuous raster or set of rasters based on values from a categorical raster. The native option evaluates the mean and corrections as a fused expression and writes only the final raster.
 # ---------------------------------------------------------------------------
 
 # Define a function to post-process continuous raster
@@ -17,11 +17,19 @@ def postprocess_continuous_raster(**kwargs):
             'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area raster (must be first), the categorical raster (must be second), the infrastructure raster (must be third), and the raster or rasters (if calculate_mean is True) to post-process
             'output_array' -- an array containing the output raster
+            'native' -- an optional boolean value that if True evaluates the corrections with the native expression engine (default is False)
     Returned Value: Returns a raster to disk
     Preconditions: requires one or more predicted continuous rasters
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.rasterExpression import cell_mean
+    from package_GeospatialProcessing.rasterExpression import con
+    from package_GeospatialProcessing.rasterExpression import evaluate_expression
+    from package_GeospatialProcessing.rasterExpression import map_algebra
+    from package_GeospatialProcessing.rasterExpression import raster_input
+    from package_GeospatialProcessing.rasterExpression import where_clause
     import arcpy
     from arcpy.sa import CellStatistics
     from arcpy.sa import Con
@@ -41,20 +49,59 @@ def postprocess_continuous_raster(**kwargs):
     infrastructure_raster = kwargs['input_array'].pop(0)
     input_rasters = kwargs['input_array']
     output_raster = kwargs['output_array'][0]
+    native = kwargs.get('native', False)
 
     # Determine no data value
     if data_type == '8_BIT_SIGNED':
         no_data_value = '-128'
+        output_type = 'int8'
     elif data_type == '8_BIT_UNSIGNED':
         no_data_value = '255'
+        output_type = 'uint8'
     elif data_type == '16_BIT_SIGNED':
         no_data_value = '-32768'
+        output_type = 'int16'
     elif data_type == '16_BIT_UNSIGNED':
         no_data_value = '65535'
+        output_type = 'uint16'
     else:
         no_data_value = -999
         print('\tERROR: Select a valid data type.')
-        quit()
+        quit(1)
+
+    # Correct values with the native expression engine
+    if native == True:
+        print(f'\tCorrecting values to 0 and exporting final raster...')
+        iteration_start = time.time()
+        # Calculate mean if calculate_mean is set to True
+        if calculate_mean == True:
+            mean_node = cell_mean([raster_input(raster) for raster in input_rasters])
+        else:
+            mean_node = raster_input(input_rasters[0])
+        # Create conditional expression for non-vegetated areas
+        correct_node = where_clause(raster_input(categorical_raster), conditional_statement)
+        # Set values to 0 where infrastructure exists
+        remove_node = con(map_algebra('==', raster_input(infrastructure_raster), 1), 0, mean_node)
+        # Set values to 0 for non-vegetated areas
+        remove_node = con(map_algebra('==', correct_node, 1), 0, remove_node)
+        # Export final raster
+        evaluate_expression(remove_node, area_raster, output_raster, output_type, int(no_data_value))
+        # Rewrite as a tiled and compressed raster with overviews
+        write_cloud_optimized_raster(output_raster, resampling='average')
+        # Create raster attribute table
+        arcpy.management.BuildRasterAttributeTable(output_raster, 'Overwrite')
+        # End timing
+        iteration_end = time.time()
+        iteration_elapsed = int(iteration_end - iteration_start)
+        iteration_success_time = datetime.datetime.now()
+        # Report success
+        print(
+            f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+        print('\t----------')
+
+        # Return success message
+        out_process = f'Successfully post-processed continuous raster.'
+        return out_process
 
     # Set overwrite option
     arcpy.env.overwriteOutput = True
@@ -124,6 +171,8 @@ def postprocess_continuous_raster(**kwargs):
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(output_raster, resampling='average')
     # Create raster attribute table
     arcpy.management.BuildRasterAttributeTable(output_raster, 'Overwrite')
     # End timing
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Raster blocks
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Raster blocks" is a set of functions that divide aligned rasters into blocks, read blocks with an optional halo of neighboring cells, and convert float blocks to integer output values so that native engines can process rasters larger than memory in a single pass.
+# ---------------------------------------------------------------------------
+
+# Define a function to generate block windows
+def generate_blocks(height, width, block_size):
+    """
+    Description: divides a raster grid into rectangular blocks
+    Inputs: 'height' -- the number of rows in the raster
+            'width' -- the number of columns in the raster
+            'block_size' -- the maximum number of rows and columns in a block
+    Returned Value: Returns a list of (row offset, column offset, number of rows, number of columns) tuples
+    Preconditions: requires the raster dimensions
+    """
+
+    # Create the list of blocks in row-major order
+    block_list = []
+    for row_offset in range(0, height, block_size):
+        for column_offset in range(0, width, block_size):
+            block_list.append((row_offset,
+                               column_offset,
+                               min(block_size, height - row_offset),
+                               min(block_size, width - column_offset)))
+
+    return block_list
+
+# Define a function to read a block with a halo
+def read_block(dataset, block, halo=0, band=1):
+    """
+    Description: reads a block of a raster as 64-bit float values with no data as NaN, padding the block with a halo of neighboring cells
+    Inputs: 'dataset' -- an open rasterio dataset
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+            'halo' -- the number of neighboring cells to read on each side of the block
+            'band' -- the band number to read
+    Returned Value: Returns a float array of shape (rows + 2 * halo, columns + 2 * halo) where cells outside the raster are NaN
+    Preconditions: requires an open rasterio dataset
+    """
+
+    # Import packages
+    import numpy as np
+    from rasterio.windows import Window
+
+    # Parse block
+    row_offset, column_offset, block_rows, block_columns = block
+
+    # Clip the expanded window to the raster extent
+    row_start = min(max(row_offset - halo, 0), dataset.height)
+    row_end = max(min(row_offset + block_rows + halo, dataset.height), 0)
+    column_start = min(max(column_offset - halo, 0), dataset.width)
+    column_end = max(min(column_offset + block_columns + halo, dataset.width), 0)
+
+    # Return no data if the expanded window does not overlap the raster
+    if row_end <= row_start or column_end <= column_start:
+        return np.full((block_rows + 2 * halo, block_columns + 2 * halo), np.nan)
+
+    # Read the clipped window
+    window = Window(column_start, row_start, column_end - column_start, row_end - row_start)
+    values = dataset.read(band, window=window).astype('float64')
+    if dataset.nodata is not None:
+        values[values == dataset.nodata] = np.nan
+
+    # Pad the window with NaN where the halo extends beyond the raster
+    padding = ((row_start - (row_offset - halo), (row_offset + block_rows + halo) - row_end),
+               (column_start - (column_offset - halo), (column_offset + block_columns + halo) - column_end))
+    if any(value > 0 for pair in padding for value in pair):
+        values = np.pad(values, padding, mode='constant', constant_values=np.nan)
+
+    return values
+
+# Define a function to read a block with a halo from an array
+def read_array_block(array, block, halo=0):
+    """
+    Description: reads a block of a two-dimensional array held in memory or memory mapped, padding the block with a halo of neighboring cells
+    Inputs: 'array' -- a two-dimensional float array or memory map with NaN as no data
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+            'halo' -- the number of neighboring cells to read on each side of the block
+    Returned Value: Returns a float array of shape (rows + 2 * halo, columns + 2 * halo) where cells outside the array are NaN
+    Preconditions: requires a two-dimensional float array
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Parse block
+    row_offset, column_offset, block_rows, block_columns = block
+    height, width = array.shape
+
+    # Copy the clipped window into a block padded with NaN
+    values = np.full((block_rows + 2 * halo, block_columns + 2 * halo), np.nan)
+    row_start = max(row_offset - halo, 0)
+    row_end = min(row_offset + block_rows + halo, height)
+    column_start = max(column_offset - halo, 0)
+    column_end = min(column_offset + block_columns + halo, width)
+    values[row_start - (row_offset - halo):row_end - (row_offset - halo),
+           column_start - (column_offset - halo):column_end - (column_offset - halo)] = array[row_start:row_end,
+                                                                                             column_start:column_end]
+
+    return values
+
+# Define a function to read a block from a raster with a different extent
+def read_aligned_block(dataset, reference_dataset, block, halo=0, band=1):
+    """
+    Description: reads the cells of a raster that fall within a block of a reference raster, where the raster shares the cell size and cell alignment of the reference but may have a different extent
+    Inputs: 'dataset' -- an open rasterio dataset to read
+            'reference_dataset' -- an open rasterio dataset that defines the block grid
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple on the reference grid
+            'halo' -- the number of neighboring cells to read on each side of the block
+            'band' -- the band number to read
+    Returned Value: Returns a float array on the reference grid where cells outside the raster are NaN
+    Preconditions: requires rasters that share cell size and snap alignment
+    """
+
+    # Determine the offset of the reference grid within the raster grid
+    column_shift, row_shift = ~dataset.transform * (reference_dataset.transform.c, reference_dataset.transform.f)
+    column_shift = int(round(column_shift))
+    row_shift = int(round(row_shift))
+
+    # Read the shifted block
+    row_offset, column_offset, block_rows, block_columns = block
+    shifted_block = (row_offset + row_shift, column_offset + column_shift, block_rows, block_columns)
+    values = read_block(dataset, shifted_block, halo=halo, band=band)
+
+    return values
+
+# Define a function to check raster alignment
+def check_alignment(reference_dataset, dataset):
+    """
+    Description: checks that a raster shares the grid of a reference raster
+    Inputs: 'reference_dataset' -- an open rasterio dataset that defines the grid
+            'dataset' -- an open rasterio dataset to compare against the reference
+    Returned Value: Returns True if the coordinate system, transform, and dimensions match, otherwise False
+    Preconditions: requires open rasterio datasets
+    """
+
+    # Compare grid properties
+    if reference_dataset.crs != dataset.crs:
+        return False
+    if reference_dataset.width != dataset.width or reference_dataset.height != dataset.height:
+        return False
+    if not reference_dataset.transform.almost_equals(dataset.transform):
+        return False
+
+    return True
+
+# Define a function to convert a float block to integer values
+def convert_integer(values, conversion_factor, mask, dtype='int16', nodata=-32768):
+    """
+    Description: converts a float block to integer values by multiplying by a conversion factor and truncating after adding 0.5, matching Int((x * factor) + 0.5)
+    Inputs: 'values' -- a float array
+            'conversion_factor' -- a number to multiply the values by before conversion to integer
+            'mask' -- a boolean array that is True where output values are valid
+            'dtype' -- the integer data type of the output
+            'nodata' -- the no data value of the output
+    Returned Value: Returns an integer array with no data where the mask is False or the values are NaN
+    Preconditions: requires a float array and a mask of the same shape
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Determine valid cells
+    valid = mask & np.isfinite(values)
+
+    # Convert valid values to integer within the range of the data type
+    type_info = np.iinfo(dtype)
+    integer_values = np.full(values.shape, nodata, dtype=dtype)
+    converted = np.trunc((values[valid] * conversion_factor) + 0.5)
+    integer_values[valid] = np.clip(converted, type_info.min, type_info.max).astype(dtype)
+
+    return integer_values
+
+# Define a function to create a raster profile for block outputs
+def create_block_profile(reference_dataset, dtype='int16', nodata=-32768, count=1):
+    """
+    Description: creates a tiled and compressed GeoTIFF profile on the grid of a reference raster for outputs written block by block
+    Inputs: 'reference_dataset' -- an open rasterio dataset that defines the grid
+            'dtype' -- the data type of the output
+            'nodata' -- the no data value of the output
+            'count' -- the number of bands in the output
+    Returned Value: Returns a profile dictionary that can be passed to rasterio.open
+    Preconditions: requires an open rasterio dataset and block sizes that are multiples of 512 so that blocks write whole tiles
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import select_predictor
+
+    # Create profile
+    profile = {'driver': 'GTiff',
+               'dtype': dtype,
+               'nodata': nodata,
+               'count': count,
+               'width': reference_dataset.width,
+               'height': reference_dataset.height,
+               'crs': reference_dataset.crs,
+               'transform': reference_dataset.transform,
+               'tiled': True,
+               'blockxsize': 512,
+               'blockysize': 512,
+               'compress': 'DEFLATE',
+               'predictor': select_predictor(dtype),
+               'BIGTIFF': 'IF_SAFER'}
+
+    return profile
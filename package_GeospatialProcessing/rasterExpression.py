@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Raster expression
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Raster expression" is a set of functions that record map algebra operations as a lazy expression graph and evaluate the fused expression block by block. Operations follow the no data rules of the equivalent Spatial Analyst tools, intermediate results exist only in memory for the current block, and only the final output raster is written.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a raster input node
+def raster_input(input_raster, band=1):
+    """
+    Description: creates an expression node that reads a raster
+    Inputs: 'input_raster' -- a file path for an input raster that shares the cell alignment of the output grid, optionally followed by /Band_<number> to select a band as in arcpy
+            'band' -- the band number to read
+    Returned Value: Returns an expression node
+    Preconditions: requires an input raster on disk
+    """
+
+    # Import packages
+    import os
+    import re
+
+    # Parse a band selected with the arcpy band path syntax
+    band_match = re.match(r'^(.+)[/\\]Band_(\d+)$', input_raster)
+    if band_match is not None and not os.path.exists(input_raster):
+        input_raster = band_match.group(1)
+        band = int(band_match.group(2))
+
+    # Create node
+    node = {'operation': 'raster', 'inputs': [], 'raster': input_raster, 'band': band}
+
+    return node
+
+# Define a function to create an operation node
+def create_node(operation, *inputs, **parameters):
+    """
+    Description: creates an expression node that applies an operation to input nodes or constants
+    Inputs: 'operation' -- the name of the operation
+            'inputs' -- expression nodes or numeric constants
+            'parameters' -- additional parameters of the operation
+    Returned Value: Returns an expression node
+    Preconditions: requires an operation supported by evaluate_node
+    """
+
+    # Create node
+    node = {'operation': operation, 'inputs': list(inputs)}
+    node.update(parameters)
+
+    return node
+
+# Define a function to combine nodes with an operator
+def map_algebra(operator, first, second):
+    """
+    Description: combines two expression nodes or constants with an arithmetic, comparison, or boolean operator, where no data in either input results in no data
+    Inputs: 'operator' -- one of '+', '-', '*', '/', '>', '>=', '<', '<=', '==', '!=', '&', or '|'
+            'first' -- an expression node or numeric constant
+            'second' -- an expression node or numeric constant
+    Returned Value: Returns an expression node
+    Preconditions: comparison and boolean operators return 1 for true and 0 for false
+    """
+
+    # Check operator
+    if operator not in ['+', '-', '*', '/', '>', '>=', '<', '<=', '==', '!=', '&', '|']:
+        print(f'\t\tERROR: Operator {operator} is not supported.')
+        quit(1)
+
+    return create_node('operator', first, second, operator=operator)
+
+# Define a function to create a conditional node
+def con(condition, true_value, false_value=None):
+    """
+    Description: selects between two values based on a condition, matching Con
+    Inputs: 'condition' -- an expression node that is true where non-zero
+            'true_value' -- an expression node or numeric constant returned where the condition is true
+            'false_value' -- an optional expression node or numeric constant returned where the condition is false (default is no data)
+    Returned Value: Returns an expression node that is no data where the condition is no data
+    Preconditions: requires a condition expression node
+    """
+
+    return create_node('con', condition, true_value, false_value)
+
+# Define a function to create a set null node
+def set_null(condition, false_value):
+    """
+    Description: sets cells to no data where a condition is true, matching SetNull
+    Inputs: 'condition' -- an expression node that is true where non-zero
+            'false_value' -- an expression node or numeric constant returned where the condition is false
+    Returned Value: Returns an expression node that is no data where the condition is true or no data
+    Preconditions: requires a condition expression node
+    """
+
+    return create_node('set_null', condition, false_value)
+
+# Define a function to create an is null node
+def is_null(value):
+    """
+    Description: identifies no data cells, matching IsNull
+    Inputs: 'value' -- an expression node
+    Returned Value: Returns an expression node that is 1 where the input is no data and 0 otherwise
+    Preconditions: requires an expression node
+    """
+
+    return create_node('is_null', value)
+
+# Define a function to create an integer node
+def integer(value):
+    """
+    Description: truncates values toward zero, matching Int
+    Inputs: 'value' -- an expression node
+    Returned Value: Returns an expression node
+    Preconditions: requires an expression node
+    """
+
+    return create_node('integer', value)
+
+# Define a function to create an extract by mask node
+def extract_by_mask(value, mask):
+    """
+    Description: sets cells to no data where a mask is no data, matching ExtractByMask on an aligned mask raster
+    Inputs: 'value' -- an expression node
+            'mask' -- an expression node that defines the mask
+    Returned Value: Returns an expression node
+    Preconditions: requires expression nodes on the output grid
+    """
+
+    return create_node('extract_by_mask', value, mask)
+
+# Define a function to create a cell mean node
+def cell_mean(value_list):
+    """
+    Description: calculates the mean of expression nodes for each cell ignoring no data, matching CellStatistics with MEAN and DATA
+    Inputs: 'value_list' -- a list of expression nodes
+    Returned Value: Returns an expression node that is no data where all inputs are no data
+    Preconditions: requires a list of expression nodes
+    """
+
+    return create_node('cell_mean', *value_list)
+
+# Define a function to create a node from a where clause
+def where_clause(value, statement):
+    """
+    Description: converts a conditional statement such as 'VALUE = 1 Or VALUE = 2' into an expression node, matching the where clause of Con
+    Inputs: 'value' -- an expression node that the statement refers to as VALUE
+            'statement' -- a conditional statement of comparisons of VALUE with numbers using =, <>, >, >=, <, or <=, joined by And or Or without parentheses
+    Returned Value: Returns an expression node that is 1 where the statement is true, 0 where it is false, and no data where the input is no data
+    Preconditions: requires a statement in which And takes precedence over Or
+    """
+
+    # Import packages
+    import re
+
+    # Define operators
+    operator_dictionary = {'=': '==', '<>': '!=', '>': '>', '>=': '>=', '<': '<', '<=': '<='}
+
+    # Parse statement into comparisons joined by And within terms joined by Or
+    statement_node = None
+    for term in re.split(r'\s+or\s+', statement.strip(), flags=re.IGNORECASE):
+        term_node = None
+        for comparison in re.split(r'\s+and\s+', term.strip(), flags=re.IGNORECASE):
+            match = re.fullmatch(r'\s*VALUE\s*(<>|>=|<=|=|>|<)\s*(-?\d+(?:\.\d+)?)\s*', comparison, flags=re.IGNORECASE)
+            if match is None:
+                print(f'\t\tERROR: Conditional statement "{statement}" could not be parsed.')
+                quit(1)
+            comparison_node = map_algebra(operator_dictionary[match.group(1)], value, float(match.group(2)))
+            term_node = comparison_node if term_node is None else map_algebra('&', term_node, comparison_node)
+        statement_node = term_node if statement_node is None else map_algebra('|', statement_node, term_node)
+
+    return statement_node
+
+# Define a function to list the rasters of an expression
+def list_rasters(expression):
+    """
+    Description: lists the unique raster inputs of an expression graph
+    Inputs: 'expression' -- an expression node
+    Returned Value: Returns a list of (raster, band) tuples
+    Preconditions: requires an expression node
+    """
+
+    # Traverse the graph without revisiting shared nodes
+    raster_list = []
+    visited = set()
+    node_list = [expression]
+    while node_list:
+        node = node_list.pop()
+        if not isinstance(node, dict) or id(node) in visited:
+            continue
+        visited.add(id(node))
+        if node['operation'] == 'raster' and (node['raster'], node['band']) not in raster_list:
+            raster_list.append((node['raster'], node['band']))
+        node_list.extend(node['inputs'])
+
+    return raster_list
+
+# Define a function to evaluate an expression node for a block
+def evaluate_node(node, block_values, shape, cache):
+    """
+    Description: evaluates an expression node for a block with no data as NaN
+    Inputs: 'node' -- an expression node or numeric constant
+            'block_values' -- a dictionary of (raster, band) tuples and float blocks read for the current block
+            'shape' -- the shape of the current block
+            'cache' -- a dictionary of node ids and evaluated blocks so that shared nodes are evaluated once per block
+    Returned Value: Returns a float array of the block shape
+    Preconditions: requires blocks for every raster in the expression
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Return constants and cached nodes
+    if node is None:
+        return np.full(shape, np.nan)
+    if not isinstance(node, dict):
+        return np.full(shape, float(node))
+    if id(node) in cache:
+        return cache[id(node)]
+
+    # Evaluate inputs
+    operation = node['operation']
+    if operation == 'raster':
+        result = block_values[(node['raster'], node['band'])]
+        cache[id(node)] = result
+        return result
+    inputs = [evaluate_node(input_node, block_values, shape, cache) for input_node in node['inputs']]
+
+    # Evaluate operation
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if operation == 'operator':
+            first, second = inputs
+            operator = node['operator']
+            if operator == '+':
+                result = first + second
+            elif operator == '-':
+                result = first - second
+            elif operator == '*':
+                result = first * second
+            elif operator == '/':
+                result = np.where(second == 0, np.nan, first / second)
+            elif operator == '>':
+                result = (first > second).astype('float64')
+            elif operator == '>=':
+                result = (first >= second).astype('float64')
+            elif operator == '<':
+                result = (first < second).astype('float64')
+            elif operator == '<=':
+                result = (first <= second).astype('float64')
+            elif operator == '==':
+                result = (first == second).astype('float64')
+            elif operator == '!=':
+                result = (first != second).astype('float64')
+            elif operator == '&':
+                result = ((first != 0) & (second != 0)).astype('float64')
+            else:
+                result = ((first != 0) | (second != 0)).astype('float64')
+            result[np.isnan(first) | np.isnan(second)] = np.nan
+        elif operation == 'con':
+            condition, true_value, false_value = inputs
+            result = np.where(condition != 0, true_value, false_value)
+            result[np.isnan(condition)] = np.nan
+        elif operation == 'set_null':
+            condition, false_value = inputs
+            result = np.where((condition != 0) | np.isnan(condition), np.nan, false_value)
+        elif operation == 'is_null':
+            result = np.isnan(inputs[0]).astype('float64')
+        elif operation == 'integer':
+            result = np.trunc(inputs[0])
+        elif operation == 'extract_by_mask':
+            value, mask = inputs
+            result = np.where(np.isnan(mask), np.nan, value)
+        elif operation == 'cell_mean':
+            stack = np.stack(inputs)
+            count = np.sum(np.isfinite(stack), axis=0)
+            result = np.where(count > 0, np.nansum(stack, axis=0) / np.maximum(count, 1), np.nan)
+        else:
+            print(f'\t\tERROR: Expression operation {operation} is not supported.')
+            quit(1)
+
+    # Cache result
+    cache[id(node)] = result
+
+    return result
+
+# Define a function to evaluate an expression to a raster
+def evaluate_expression(expression, reference_raster, output_raster, dtype='int16', nodata=-32768, block_size=2048):
+    """
+    Description: evaluates a fused expression block by block and writes only the final result
+    Inputs: 'expression' -- an expression node
+            'reference_raster' -- a raster that defines the output grid
+            'output_raster' -- a file path for the output raster
+            'dtype' -- the data type of the output
+            'nodata' -- the no data value of the output
+            'block_size' -- the number of rows and columns processed per block
+    Returned Value: Returns a raster dataset on disk, where values are truncated toward zero and clipped to the range of integer data types
+    Preconditions: requires input rasters that share the cell alignment of the reference raster
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+
+    # Open input rasters once
+    raster_list = list_rasters(expression)
+    dataset_dictionary = {}
+    for raster, band in raster_list:
+        if raster not in dataset_dictionary:
+            dataset_dictionary[raster] = rasterio.open(raster)
+
+    try:
+        with rasterio.open(reference_raster) as reference_dataset:
+            output_profile = create_block_profile(reference_dataset, dtype, nodata)
+            block_list = generate_blocks(reference_dataset.height, reference_dataset.width, block_size)
+            with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+                for block in block_list:
+                    row_offset, column_offset, block_rows, block_columns = block
+
+                    # Read each input raster once per block
+                    block_values = {}
+                    for raster, band in raster_list:
+                        block_values[(raster, band)] = read_aligned_block(dataset_dictionary[raster],
+                                                                          reference_dataset,
+                                                                          block,
+                                                                          band=band)
+
+                    # Evaluate fused expression
+                    result = evaluate_node(expression, block_values, (block_rows, block_columns), {})
+
+                    # Convert result to output data type
+                    valid = np.isfinite(result)
+                    output_block = np.full((block_rows, block_columns), nodata, dtype=dtype)
+                    if np.issubdtype(np.dtype(dtype), np.integer):
+                        type_info = np.iinfo(dtype)
+                        output_block[valid] = np.clip(np.trunc(result[valid]), type_info.min, type_info.max).astype(dtype)
+                    else:
+                        output_block[valid] = result[valid].astype(dtype)
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    output_dataset.write(output_block, 1, window=window)
+    finally:
+        # Close input rasters
+        for dataset in dataset_dictionary.values():
+            dataset.close()
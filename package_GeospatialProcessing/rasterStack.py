@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Raster stack
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Raster stack" is a set of functions that index many single band covariate rasters under stable covariate names as a virtual stack. The alignment of the rasters is validated once when the stack is created, and all bands of the stack can then be read for a block of a target grid in a single call.
+# ---------------------------------------------------------------------------
+
+# Define a function to list rasters from folders under covariate names
+def list_stack_rasters(folder_list, name_dictionary=None):
+    """
+    Description: lists the tif rasters in a set of folders under stable covariate names
+    Inputs: 'folder_list' -- a list of folders containing single band rasters
+            'name_dictionary' -- an optional dictionary of raster file name without extension to covariate name (default names are the lower case file names)
+    Returned Value: Returns a dictionary of covariate name to raster path in folder order
+    Preconditions: requires folders of tif rasters with unique covariate names
+    """
+
+    # Import packages
+    import os
+
+    # Use an empty name dictionary if none is provided
+    if name_dictionary is None:
+        name_dictionary = dict()
+
+    # List rasters in each folder
+    raster_dictionary = dict()
+    for folder in folder_list:
+        for file_name in sorted(os.listdir(folder)):
+            raster_name, extension = os.path.splitext(file_name)
+            if extension.lower() not in ('.tif', '.tiff'):
+                continue
+            covariate_name = name_dictionary.get(raster_name, raster_name.lower())
+            if covariate_name in raster_dictionary:
+                raise ValueError(f'Covariate name {covariate_name} is used by more than one raster.')
+            raster_dictionary[covariate_name] = os.path.join(folder, file_name)
+
+    return raster_dictionary
+
+# Define a function to check whether a grid is snapped to another grid
+def check_snap(reference_transform, transform):
+    """
+    Description: checks that the cell edges of a grid fall on the cell edges of a reference grid with the same cell size
+    Inputs: 'reference_transform' -- the affine transform of the reference grid
+            'transform' -- the affine transform of the grid to compare
+    Returned Value: Returns True if the cell sizes match and the origins differ by whole cells, otherwise False
+    Preconditions: requires north-up affine transforms
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Compare cell sizes
+    if not np.allclose((reference_transform.a, reference_transform.e), (transform.a, transform.e)):
+        return False
+
+    # Compare origins in cells of the reference grid
+    column_shift, row_shift = ~reference_transform * (transform.c, transform.f)
+    if not np.allclose((column_shift, row_shift), (round(column_shift), round(row_shift)), atol=1e-6):
+        return False
+
+    return True
+
+# Define a function to create a virtual raster stack
+def create_raster_stack(raster_dictionary, reference_raster=None):
+    """
+    Description: creates a virtual stack of single band rasters and validates their alignment once
+    Inputs: 'raster_dictionary' -- a dictionary of covariate name to raster path
+            'reference_raster' -- an optional raster that defines the stack grid (default is the first raster)
+    Returned Value: Returns a stack dictionary with the grid properties and a band dictionary of covariate name to raster path, data type, no data value, and whether the band is snapped to the stack grid
+    Preconditions: requires single band rasters in a shared coordinate system, where rasters with the cell size of the stack grid must be snapped to it and rasters with another cell size are resampled on read
+    """
+
+    # Import packages
+    import rasterio
+
+    # Define the stack grid
+    if reference_raster is None:
+        reference_raster = list(raster_dictionary.values())[0]
+    with rasterio.open(reference_raster) as reference_dataset:
+        raster_stack = {'reference': reference_raster,
+                        'crs': reference_dataset.crs,
+                        'transform': reference_dataset.transform,
+                        'width': reference_dataset.width,
+                        'height': reference_dataset.height,
+                        'bands': dict()}
+
+    # Validate the alignment of each raster
+    for covariate_name, raster_path in raster_dictionary.items():
+        with rasterio.open(raster_path) as dataset:
+            if dataset.count != 1:
+                raise ValueError(f'{raster_path} must have a single band.')
+            if dataset.crs != raster_stack['crs']:
+                raise ValueError(f'{raster_path} does not share the coordinate system of the stack.')
+            snapped = check_snap(raster_stack['transform'], dataset.transform)
+            if not snapped and abs(dataset.transform.a) == abs(raster_stack['transform'].a):
+                raise ValueError(f'{raster_path} is not snapped to the stack grid.')
+            raster_stack['bands'][covariate_name] = {'path': raster_path,
+                                                     'dtype': dataset.dtypes[0],
+                                                     'nodata': dataset.nodata,
+                                                     'snapped': snapped}
+
+    return raster_stack
+
+# Define a function to open a raster stack on a target grid
+def open_raster_stack(raster_stack, target_dataset=None):
+    """
+    Description: opens the bands of a raster stack for reading on a target grid
+    Inputs: 'raster_stack' -- a stack dictionary created by create_raster_stack
+            'target_dataset' -- an optional open rasterio dataset that defines the grid of reads (default is the stack grid)
+    Returned Value: Returns a stack reader dictionary of the target dataset, the band datasets by covariate name, and the list of datasets to close
+    Preconditions: requires a target grid snapped to the stack grid
+    """
+
+    # Import packages
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+
+    # Open the stack grid if no target is provided
+    open_list = []
+    if target_dataset is None:
+        target_dataset = rasterio.open(raster_stack['reference'])
+        open_list.append(target_dataset)
+
+    # Check that the target grid is snapped to the stack grid
+    if target_dataset.crs != raster_stack['crs'] or not check_snap(raster_stack['transform'], target_dataset.transform):
+        for dataset in open_list:
+            dataset.close()
+        raise ValueError('The target grid is not snapped to the stack grid.')
+
+    # Open each band and resample bands with another cell size to the target grid by nearest neighbor
+    stack_reader = {'target': target_dataset, 'datasets': dict(), 'open': open_list}
+    try:
+        for covariate_name, band_properties in raster_stack['bands'].items():
+            dataset = rasterio.open(band_properties['path'])
+            open_list.append(dataset)
+            if not band_properties['snapped']:
+                dataset = WarpedVRT(dataset,
+                                    crs=target_dataset.crs,
+                                    transform=target_dataset.transform,
+                                    width=target_dataset.width,
+                                    height=target_dataset.height,
+                                    resampling=Resampling.nearest)
+                open_list.append(dataset)
+            stack_reader['datasets'][covariate_name] = dataset
+    except Exception:
+        close_raster_stack(stack_reader)
+        raise
+
+    return stack_reader
+
+# Define a function to close a raster stack
+def close_raster_stack(stack_reader):
+    """
+    Description: closes the datasets opened for a raster stack
+    Inputs: 'stack_reader' -- a stack reader dictionary created by open_raster_stack
+    Returned Value: Returns no value
+    Preconditions: requires a stack reader dictionary
+    """
+
+    # Close datasets in reverse order of opening
+    for dataset in reversed(stack_reader['open']):
+        dataset.close()
+    stack_reader['open'] = []
+
+# Define a function to read all bands of a raster stack for a block
+def read_stack_block(stack_reader, block, covariate_list=None, halo=0):
+    """
+    Description: reads the bands of a raster stack for a block of the target grid
+    Inputs: 'stack_reader' -- a stack reader dictionary created by open_raster_stack
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple on the target grid
+            'covariate_list' -- an optional list of covariate names to read (default is all bands in stack order)
+            'halo' -- the number of neighboring cells to read on each side of the block
+    Returned Value: Returns a float array of shape (bands, rows + 2 * halo, columns + 2 * halo) with no data as NaN
+    Preconditions: requires an open stack reader
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+    import numpy as np
+
+    # Read each band on the target grid
+    if covariate_list is None:
+        covariate_list = list(stack_reader['datasets'].keys())
+    row_offset, column_offset, block_rows, block_columns = block
+    values = np.empty((len(covariate_list), block_rows + 2 * halo, block_columns + 2 * halo))
+    for index, covariate_name in enumerate(covariate_list):
+        values[index] = read_aligned_block(stack_reader['datasets'][covariate_name],
+                                           stack_reader['target'],
+                                           block,
+                                           halo=halo)
+
+    return values
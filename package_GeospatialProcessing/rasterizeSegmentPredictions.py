@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Rasterize segment predictions
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Rasterize segment predictions" is a set of functions that paint predicted values from segment tables onto the cells of a segment raster. Predicted values are indexed by segment identifier in lookup arrays so that the segment raster is read once per grid and every table of every target is written as a band of a multi-band output raster, without reading or rasterizing segment polygons.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a segment lookup from prediction tables
+def create_segment_lookup(table_list, target_field, segment_field='segment_id'):
+    """
+    Description: creates a lookup array of predicted values indexed by segment identifier with one row per prediction table
+    Inputs: 'table_list' -- a list of csv tables of predictions, one per output band
+            'target_field' -- the field containing the predicted values
+            'segment_field' -- the field containing the segment identifiers
+    Returned Value: Returns a float32 array of shape (tables, largest segment identifier + 1) with NaN for segments without predictions
+    Preconditions: requires csv tables with non-negative integer segment identifiers
+    """
+
+    # Import packages
+    import numpy as np
+    import pandas as pd
+
+    # Read only the segment and target fields of each table
+    table_data = [pd.read_csv(table_path, usecols=[segment_field, target_field]) for table_path in table_list]
+
+    # Size the lookup to the largest segment identifier
+    maximum_id = max([int(data[segment_field].max()) if len(data) > 0 else 0 for data in table_data])
+    segment_lookup = np.full((len(table_list), maximum_id + 1), np.nan, dtype='float32')
+
+    # Index predicted values by segment identifier
+    for index, data in enumerate(table_data):
+        segment_ids = data[segment_field].to_numpy(dtype='int64')
+        segment_lookup[index, segment_ids] = data[target_field].to_numpy(dtype='float32')
+
+    return segment_lookup
+
+# Define a function to rasterize segment predictions to multi-band rasters
+def rasterize_segment_predictions(**kwargs):
+    """
+    Description: paints predicted values from segment tables onto a segment raster as multi-band rasters
+    Inputs: 'target_dictionary' -- a dictionary of output raster to a dictionary of the target 'field', the list of prediction 'tables' (one per band), and the list of band 'names'
+            'segment_field' -- an optional field containing the segment identifiers (default is 'segment_id')
+            'nodata' -- an optional no data value for the output rasters (default is -32768)
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'input_array' -- an array containing the segment raster (must be first) and the prediction tables
+            'output_array' -- an array containing the output rasters
+    Returned Value: Returns 32-bit float multi-band rasters to disk with one band per prediction table
+    Preconditions: requires a segment raster of integer segment identifiers and prediction tables with the segment identifiers of the raster
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterBlocks import read_block
+    import datetime
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import time
+
+    # Parse key word argument inputs
+    target_dictionary = kwargs['target_dictionary']
+    segment_field = kwargs.get('segment_field', 'segment_id')
+    nodata = kwargs.get('nodata', -32768)
+    block_size = kwargs.get('block_size', 2048)
+    segment_raster = kwargs['input_array'][0]
+    output_list = kwargs['output_array']
+
+    # Create a segment lookup for each output
+    print(f'\tReading predictions for {len(output_list)} targets...')
+    iteration_start = time.time()
+    lookup_dictionary = dict()
+    for output_raster in output_list:
+        target_properties = target_dictionary[output_raster]
+        lookup_dictionary[output_raster] = create_segment_lookup(target_properties['tables'],
+                                                                 target_properties['field'],
+                                                                 segment_field)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Paint all bands of all outputs from a single read of the segment raster
+    band_count = sum([segment_lookup.shape[0] for segment_lookup in lookup_dictionary.values()])
+    print(f'\tPainting {band_count} bands from segment identifiers...')
+    iteration_start = time.time()
+    temporary_dictionary = {output_raster: os.path.splitext(output_raster)[0] + '_temporary.tif'
+                            for output_raster in output_list}
+    with rasterio.open(segment_raster) as segment_dataset:
+        # Open temporary outputs so that interrupted outputs are not mistaken for complete outputs
+        output_datasets = dict()
+        try:
+            for output_raster in output_list:
+                output_profile = create_block_profile(segment_dataset,
+                                                      'float32',
+                                                      nodata,
+                                                      lookup_dictionary[output_raster].shape[0])
+                output_dataset = rasterio.open(temporary_dictionary[output_raster], 'w', **output_profile)
+                output_datasets[output_raster] = output_dataset
+                for index, band_name in enumerate(target_dictionary[output_raster]['names']):
+                    output_dataset.set_band_description(index + 1, str(band_name))
+
+            # Look up the predicted values of the segments in each block
+            for block in generate_blocks(segment_dataset.height, segment_dataset.width, block_size):
+                row_offset, column_offset, block_rows, block_columns = block
+                window = Window(column_offset, row_offset, block_columns, block_rows)
+                segment_block = read_block(segment_dataset, block)
+                segment_valid = np.isfinite(segment_block) & (segment_block >= 0)
+                segment_block = np.where(segment_valid, segment_block, 0).astype('int64')
+                for output_raster in output_list:
+                    segment_lookup = lookup_dictionary[output_raster]
+                    valid = segment_valid & (segment_block < segment_lookup.shape[1])
+                    lookup_index = np.where(valid, segment_block, 0)
+                    # Write band by band to bound the memory of each block
+                    for index in range(segment_lookup.shape[0]):
+                        output_block = segment_lookup[index][lookup_index]
+                        output_block[~valid | np.isnan(output_block)] = nodata
+                        output_datasets[output_raster].write(output_block, index + 1, window=window)
+        finally:
+            for output_dataset in output_datasets.values():
+                output_dataset.close()
+
+    # Move the completed rasters to the output paths
+    for output_raster in output_list:
+        os.replace(temporary_dictionary[output_raster], output_raster)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully rasterized {band_count} bands to {len(output_list)} rasters.'
+    return outprocess
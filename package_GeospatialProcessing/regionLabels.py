@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Region labels
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. Numba is used to compile the union-find kernels if it is installed.
+# Description: "Region labels" is a set of functions that label four-connected regions of equal value block by block with union-find. Each block is labelled independently, regions are merged across block edges, and region sizes are accumulated in the same pass so that regions can be filtered by cell count without additional raster passes.
+# ---------------------------------------------------------------------------
+
+# Import packages at the module level so that kernels can be compiled
+import numpy as np
+
+# Define a kernel to label the regions of a block
+def label_kernel(values, labels, start_label):
+    """
+    Description: labels four-connected regions of equal value within a block with consecutive labels
+    Inputs: 'values' -- a two-dimensional float64 array with NaN as no data
+            'labels' -- a two-dimensional int64 array to store labels, where cells without data are -1
+            'start_label' -- the first label assigned in the block
+    Returned Value: Returns the number of labels assigned in the block
+    Preconditions: requires a labels array of the same shape as the values array
+    """
+
+    # Assign provisional labels and union equal neighbors above and to the left
+    rows, columns = values.shape
+    parent = np.empty(rows * columns, dtype=np.int64)
+    count = 0
+    for row in range(rows):
+        for column in range(columns):
+            value = values[row, column]
+            if np.isnan(value):
+                labels[row, column] = -1
+                continue
+            up = -1
+            left = -1
+            if row > 0 and labels[row - 1, column] >= 0 and values[row - 1, column] == value:
+                up = labels[row - 1, column]
+            if column > 0 and labels[row, column - 1] >= 0 and values[row, column - 1] == value:
+                left = labels[row, column - 1]
+            if up < 0 and left < 0:
+                parent[count] = count
+                labels[row, column] = count
+                count += 1
+            elif up < 0:
+                labels[row, column] = left
+            elif left < 0:
+                labels[row, column] = up
+            else:
+                # Union the roots so that the smaller label is the root
+                while parent[up] != up:
+                    up = parent[up]
+                while parent[left] != left:
+                    left = parent[left]
+                if up < left:
+                    parent[left] = up
+                    labels[row, column] = up
+                else:
+                    parent[up] = left
+                    labels[row, column] = left
+
+    # Resolve roots and number them consecutively
+    compact = np.empty(count, dtype=np.int64)
+    number = 0
+    for index in range(count):
+        if parent[index] == index:
+            compact[index] = number
+            number += 1
+        else:
+            parent[index] = parent[parent[index]]
+            compact[index] = compact[parent[index]]
+    for row in range(rows):
+        for column in range(columns):
+            if labels[row, column] >= 0:
+                labels[row, column] = compact[labels[row, column]] + start_label
+
+    return number
+
+# Define a kernel to merge regions across block edges
+def union_kernel(parent, first_labels, second_labels, label_values):
+    """
+    Description: merges the regions of adjacent cells on either side of a block edge where the cells share a value
+    Inputs: 'parent' -- a one-dimensional int64 array of parent labels in which each root is the smallest label of its region
+            'first_labels' -- a one-dimensional int64 array of labels along one side of the edge
+            'second_labels' -- a one-dimensional int64 array of labels along the other side of the edge
+            'label_values' -- a one-dimensional float64 array of the value of each label
+    Returned Value: Returns the number of merges
+    Preconditions: requires labels from label_kernel with a global label offset per block
+    """
+
+    # Union the roots of adjacent labels with equal values
+    merges = 0
+    for index in range(first_labels.shape[0]):
+        first = first_labels[index]
+        second = second_labels[index]
+        if first < 0 or second < 0 or label_values[first] != label_values[second]:
+            continue
+        while parent[first] != first:
+            first = parent[first]
+        while parent[second] != second:
+            second = parent[second]
+        if first < second:
+            parent[second] = first
+            merges += 1
+        elif second < first:
+            parent[first] = second
+            merges += 1
+
+    return merges
+
+# Define a kernel to flatten the union-find forest
+def flatten_kernel(parent):
+    """
+    Description: points every label directly to the root of its region
+    Inputs: 'parent' -- a one-dimensional int64 array of parent labels in which each parent is smaller than or equal to its child
+    Returned Value: Returns the number of regions
+    Preconditions: requires a parent array from label_kernel and union_kernel
+    """
+
+    # Resolve labels in increasing order so that each parent is already resolved
+    regions = 0
+    for index in range(parent.shape[0]):
+        if parent[index] == index:
+            regions += 1
+        else:
+            parent[index] = parent[parent[index]]
+
+    return regions
+
+# Define a function to label the regions of a raster
+def label_regions(dataset, reference_dataset, labels, block_list, excluded_value=None):
+    """
+    Description: labels four-connected regions of equal value in a raster block by block and calculates the number of cells in each region
+    Inputs: 'dataset' -- an open rasterio dataset of categorical values that shares the cell alignment of the reference raster
+            'reference_dataset' -- an open rasterio dataset that defines the block grid
+            'labels' -- a two-dimensional int64 array or memory map on the reference grid to store labels, where cells without data are -1
+            'block_list' -- a list of blocks from generate_blocks
+            'excluded_value' -- an optional value that is not labelled
+    Returned Value: Returns an int64 array that maps each label to its region label and an int64 array of the cell count of the region of each label
+    Preconditions: requires an open rasterio dataset aligned to the reference grid
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.compileKernel import compile_kernel
+    from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+
+    # Compile kernels
+    label_function = compile_kernel(label_kernel)
+    union_function = compile_kernel(union_kernel)
+    flatten_function = compile_kernel(flatten_kernel)
+
+    # Label each block and record the value and cell count of each label
+    value_list = []
+    count_list = []
+    start_label = 0
+    for block in block_list:
+        row_offset, column_offset, block_rows, block_columns = block
+        values = read_aligned_block(dataset, reference_dataset, block)
+        if excluded_value is not None:
+            values[values == excluded_value] = np.nan
+        block_labels = np.empty((block_rows, block_columns), dtype=np.int64)
+        number = label_function(values, block_labels, start_label)
+        valid = block_labels >= 0
+        label_values = np.empty(number, dtype=np.float64)
+        label_values[block_labels[valid] - start_label] = values[valid]
+        value_list.append(label_values)
+        count_list.append(np.bincount(block_labels[valid] - start_label, minlength=number))
+        labels[row_offset:row_offset + block_rows, column_offset:column_offset + block_columns] = block_labels
+        start_label += number
+    label_values = np.concatenate(value_list) if value_list else np.empty(0, dtype=np.float64)
+    label_counts = np.concatenate(count_list) if count_list else np.empty(0, dtype=np.int64)
+
+    # Merge regions across the top and left edges of each block
+    parent = np.arange(start_label, dtype=np.int64)
+    for block in block_list:
+        row_offset, column_offset, block_rows, block_columns = block
+        if row_offset > 0:
+            union_function(parent,
+                           np.asarray(labels[row_offset - 1, column_offset:column_offset + block_columns]),
+                           np.asarray(labels[row_offset, column_offset:column_offset + block_columns]),
+                           label_values)
+        if column_offset > 0:
+            union_function(parent,
+                           np.asarray(labels[row_offset:row_offset + block_rows, column_offset - 1]),
+                           np.asarray(labels[row_offset:row_offset + block_rows, column_offset]),
+                           label_values)
+    flatten_function(parent)
+
+    # Calculate the cell count of the region of each label
+    region_counts = np.bincount(parent, weights=label_counts, minlength=start_label).astype(np.int64)
+    label_region_counts = region_counts[parent]
+
+    return parent, label_region_counts
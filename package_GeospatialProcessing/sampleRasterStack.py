@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Sample raster stack
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Sample raster stack" is a set of functions that extract the values of all bands of a raster stack at a table of point locations. Points are sorted by the block of the stack grid that contains them so that each block is read once for all points and all bands, and values can optionally be summarized from the cells whose centers fall within a buffer around each point, replacing the buffer, rasterize, and raster to point sequence.
+# ---------------------------------------------------------------------------
+
+# Define a function to locate points on a grid
+def locate_points(transform, x_coordinates, y_coordinates):
+    """
+    Description: calculates the row and column of the grid cells that contain a set of points
+    Inputs: 'transform' -- the affine transform of the grid
+            'x_coordinates' -- an array of point x coordinates in the coordinate system of the grid
+            'y_coordinates' -- an array of point y coordinates in the coordinate system of the grid
+    Returned Value: Returns a tuple of integer row and column arrays
+    Preconditions: requires an affine transform such as the transform of a rasterio dataset
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Convert coordinates to fractional cell indices and truncate towards negative infinity
+    columns, rows = ~transform * (np.asarray(x_coordinates, dtype='float64'), np.asarray(y_coordinates, dtype='float64'))
+
+    return np.floor(rows).astype('int64'), np.floor(columns).astype('int64')
+
+# Define a function to summarize buffered cell values
+def summarize_buffer(values, statistic):
+    """
+    Description: summarizes the cell values within the buffers of a set of points
+    Inputs: 'values' -- a float array of shape (bands, points, cells) with NaN for cells outside the buffer or without data
+            'statistic' -- a string value of the statistic: "MEAN", "STD", "RANGE", "MINIMUM", "MAXIMUM", "SUM", or "MEDIAN"
+    Returned Value: Returns a float array of shape (bands, points) with NaN for points without values
+    Preconditions: requires a three-dimensional float array
+    """
+
+    # Import packages
+    import numpy as np
+    import warnings
+
+    # Calculate statistic while ignoring warnings for points without values
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        if statistic == 'MEAN':
+            summary = np.nanmean(values, axis=2)
+        elif statistic == 'STD':
+            # Calculate the population standard deviation to match ZonalStatistics
+            summary = np.nanstd(values, axis=2)
+        elif statistic == 'RANGE':
+            summary = np.nanmax(values, axis=2) - np.nanmin(values, axis=2)
+        elif statistic == 'MINIMUM':
+            summary = np.nanmin(values, axis=2)
+        elif statistic == 'MAXIMUM':
+            summary = np.nanmax(values, axis=2)
+        elif statistic == 'SUM':
+            summary = np.where(np.isfinite(values).any(axis=2), np.nansum(values, axis=2), np.nan)
+        elif statistic == 'MEDIAN':
+            summary = np.nanmedian(values, axis=2)
+        else:
+            raise ValueError(f'Statistic {statistic} is not supported.')
+
+    return summary
+
+# Define a function to sample a raster stack at points
+def sample_stack_points(stack_reader, x_coordinates, y_coordinates, covariate_list=None, radius=None,
+                        statistic='MEAN', block_size=2048):
+    """
+    Description: extracts the values of the bands of a raster stack at points by reading each block that contains points once
+    Inputs: 'stack_reader' -- a stack reader dictionary created by open_raster_stack
+            'x_coordinates' -- an array of point x coordinates in the coordinate system of the stack
+            'y_coordinates' -- an array of point y coordinates in the coordinate system of the stack
+            'covariate_list' -- an optional list of covariate names to sample (default is all bands in stack order)
+            'radius' -- an optional buffer radius in map units as a number or an array with one radius per point, where values are summarized from the cells whose centers fall within the buffer and the cell that contains the point
+            'statistic' -- the statistic used to summarize buffered values (default is 'MEAN')
+            'block_size' -- the number of rows and columns read per block
+    Returned Value: Returns a float array of shape (points, covariates) with NaN for points outside the grid or without data
+    Preconditions: requires an open stack reader and point coordinates in the coordinate system of the stack
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterStack import read_stack_block
+    import math
+    import numpy as np
+
+    # Locate points on the target grid
+    if covariate_list is None:
+        covariate_list = list(stack_reader['datasets'].keys())
+    target_dataset = stack_reader['target']
+    transform = target_dataset.transform
+    x_coordinates = np.asarray(x_coordinates, dtype='float64')
+    y_coordinates = np.asarray(y_coordinates, dtype='float64')
+    point_rows, point_columns = locate_points(transform, x_coordinates, y_coordinates)
+    point_count = len(point_rows)
+    output_values = np.full((point_count, len(covariate_list)), np.nan)
+
+    # Define the cells that can fall within each buffer
+    halo = 0
+    if radius is not None:
+        radius = np.broadcast_to(np.asarray(radius, dtype='float64'), (point_count,))
+        cell_size = min(abs(transform.a), abs(transform.e))
+        maximum_radius = float(np.nanmax(radius)) if point_count > 0 else 0
+        halo = int(math.ceil(maximum_radius / cell_size + 0.5))
+    row_shifts, column_shifts = np.mgrid[-halo:halo + 1, -halo:halo + 1]
+    row_shifts = row_shifts.ravel()
+    column_shifts = column_shifts.ravel()
+    center_cell = (row_shifts == 0) & (column_shifts == 0)
+
+    # Sort points within the grid by block
+    inside = (point_rows >= 0) & (point_rows < target_dataset.height) \
+        & (point_columns >= 0) & (point_columns < target_dataset.width)
+    point_index = np.flatnonzero(inside)
+    block_columns_count = int(math.ceil(target_dataset.width / block_size))
+    block_keys = (point_rows[point_index] // block_size) * block_columns_count \
+        + point_columns[point_index] // block_size
+    sort_order = np.argsort(block_keys, kind='stable')
+    point_index = point_index[sort_order]
+    block_keys = block_keys[sort_order]
+    unique_keys, key_starts = np.unique(block_keys, return_index=True)
+    key_ends = np.append(key_starts[1:], len(block_keys))
+
+    # Limit the number of gathered values held in memory at once
+    chunk_size = max(1, 16777216 // (len(covariate_list) * len(row_shifts)))
+
+    # Read each block that contains points once for all bands
+    for block_key, key_start, key_end in zip(unique_keys, key_starts, key_ends):
+        row_offset = int(block_key // block_columns_count) * block_size
+        column_offset = int(block_key % block_columns_count) * block_size
+        block = (row_offset,
+                 column_offset,
+                 min(block_size, target_dataset.height - row_offset),
+                 min(block_size, target_dataset.width - column_offset))
+        block_values = read_stack_block(stack_reader, block, covariate_list, halo=halo)
+
+        # Gather values for the points of the block
+        for chunk_start in range(key_start, key_end, chunk_size):
+            chunk_index = point_index[chunk_start:min(chunk_start + chunk_size, key_end)]
+            local_rows = point_rows[chunk_index] - row_offset + halo
+            local_columns = point_columns[chunk_index] - column_offset + halo
+            if radius is None:
+                output_values[chunk_index] = block_values[:, local_rows, local_columns].T
+                continue
+            # Select the cells whose centers fall within the buffer of each point
+            cell_rows = point_rows[chunk_index][:, np.newaxis] + row_shifts[np.newaxis, :]
+            cell_columns = point_columns[chunk_index][:, np.newaxis] + column_shifts[np.newaxis, :]
+            center_x = transform.c + (cell_columns + 0.5) * transform.a + (cell_rows + 0.5) * transform.b
+            center_y = transform.f + (cell_columns + 0.5) * transform.d + (cell_rows + 0.5) * transform.e
+            distance = np.hypot(center_x - x_coordinates[chunk_index][:, np.newaxis],
+                                center_y - y_coordinates[chunk_index][:, np.newaxis])
+            within = (distance <= radius[chunk_index][:, np.newaxis]) | center_cell[np.newaxis, :]
+            cell_values = block_values[:,
+                                       local_rows[:, np.newaxis] + row_shifts[np.newaxis, :],
+                                       local_columns[:, np.newaxis] + column_shifts[np.newaxis, :]]
+            cell_values[:, ~within] = np.nan
+            output_values[chunk_index] = summarize_buffer(cell_values, statistic).T
+
+    return output_values
+
+# Define a function to sample a raster stack to a point table
+def sample_raster_stack(**kwargs):
+    """
+    Description: extracts the values of the bands of a raster stack at the points of a table and writes the table with a column for each covariate
+    Inputs: 'raster_stack' -- an optional stack dictionary created by create_raster_stack (default is a stack of the input rasters named by file name without extension)
+            'covariate_list' -- an optional list of covariate names to sample (default is all bands in stack order)
+            'x_field' -- an optional name of the x coordinate field (default is 'POINT_X')
+            'y_field' -- an optional name of the y coordinate field (default is 'POINT_Y')
+            'radius' -- an optional buffer radius in map units within which to summarize values
+            'radius_field' -- an optional name of a field containing a buffer radius for each point
+            'statistic' -- an optional statistic to summarize buffered values of "MEAN", "STD", "RANGE", "MINIMUM", "MAXIMUM", "SUM", or "MEDIAN" (default is 'MEAN')
+            'block_size' -- an optional number of rows and columns read per block (default is 2048)
+            'input_array' -- an array containing the input csv point table (must be first) and the covariate rasters
+            'output_array' -- an array containing the output csv table
+    Returned Value: Returns a csv table to disk with the input fields and a column for each covariate
+    Preconditions: requires point coordinates in the coordinate system of the raster stack
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterStack import close_raster_stack
+    from package_GeospatialProcessing.rasterStack import create_raster_stack
+    from package_GeospatialProcessing.rasterStack import open_raster_stack
+    import datetime
+    import numpy as np
+    import os
+    import pandas as pd
+    import time
+
+    # Parse key word argument inputs
+    raster_stack = kwargs.get('raster_stack', None)
+    covariate_list = kwargs.get('covariate_list', None)
+    x_field = kwargs.get('x_field', 'POINT_X')
+    y_field = kwargs.get('y_field', 'POINT_Y')
+    radius = kwargs.get('radius', None)
+    radius_field = kwargs.get('radius_field', None)
+    statistic = kwargs.get('statistic', 'MEAN')
+    block_size = kwargs.get('block_size', 2048)
+    input_table = kwargs['input_array'][0]
+    raster_list = kwargs['input_array'][1:]
+    output_table = kwargs['output_array'][0]
+
+    # Create a raster stack from the input rasters if none is provided
+    if raster_stack is None:
+        raster_stack = create_raster_stack({os.path.splitext(os.path.split(raster_path)[1])[0]: raster_path
+                                            for raster_path in raster_list})
+    if covariate_list is None:
+        covariate_list = list(raster_stack['bands'].keys())
+
+    # Read points
+    point_data = pd.read_csv(input_table)
+    if radius_field is not None:
+        radius = point_data[radius_field].fillna(0).to_numpy(dtype='float64')
+
+    # Sample covariates at points
+    print(f'\tSampling {len(covariate_list)} covariates at {len(point_data)} points...')
+    iteration_start = time.time()
+    stack_reader = open_raster_stack(raster_stack)
+    try:
+        sample_values = sample_stack_points(stack_reader,
+                                            point_data[x_field].to_numpy(),
+                                            point_data[y_field].to_numpy(),
+                                            covariate_list=covariate_list,
+                                            radius=radius,
+                                            statistic=statistic,
+                                            block_size=block_size)
+    finally:
+        close_raster_stack(stack_reader)
+
+    # Add a column for each covariate
+    covariate_data = dict()
+    for index, covariate_name in enumerate(covariate_list):
+        covariate_values = sample_values[:, index]
+        # Preserve integer values of integer covariates sampled without a buffer
+        if radius is None and np.issubdtype(np.dtype(raster_stack['bands'][covariate_name]['dtype']), np.integer):
+            covariate_values = pd.array(covariate_values, dtype='Float64').astype('Int64')
+        covariate_data[covariate_name] = covariate_values
+    output_data = pd.concat([point_data, pd.DataFrame(covariate_data, index=point_data.index)], axis=1)
+
+    # Write the table to a temporary file so that interrupted outputs are not mistaken for complete outputs
+    temporary_table = os.path.splitext(output_table)[0] + '_temporary.csv'
+    output_data.to_csv(temporary_table, header=True, index=False, sep=',', encoding='utf-8')
+    os.replace(temporary_table, output_table)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully sampled {len(covariate_list)} covariates at {len(point_data)} points.'
+    return outprocess
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Stream download
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in a Python 3.8+ environment with Requests installed.
+# Description: "Stream download" is a set of functions that download files over HTTP by streaming each response to disk in chunks. Downloads are written to partial files that resume from their current size with range requests that are validated against the entity tag or modification time of the file when the download started, are verified by size and optional checksum, and are renamed to the output file once complete. Many files are downloaded in a bounded pool of threads that each reuse a single connection session, and failed downloads are retried with backoff.
+# ---------------------------------------------------------------------------
+
+# Define a function to stream a download to disk
+def stream_download(session, url, output_file, expected_size=None, expected_md5=None, params=None,
+                    chunk_size=8388608):
+    """
+    Description: streams a url to disk in chunks, resuming a partial download if one exists
+    Inputs: 'session' -- a requests session
+            'url' -- the url to download
+            'output_file' -- the file path to save the download
+            'expected_size' -- an optional size in bytes that the completed file must match
+            'expected_md5' -- an optional hexadecimal md5 checksum that the completed file must match
+            'params' -- an optional dictionary of query parameters for the request
+            'chunk_size' -- the number of bytes streamed to disk per write
+    Returned Value: Returns the number of bytes downloaded and a file to local disk
+    Preconditions: requires a server that honors or ignores range requests, where a server that sends an entity tag or modification time must send the full file when a resumed file has changed
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.downloadManifest import calculate_md5
+    import os
+
+    # Stream to a partial file with a different extension so that interrupted downloads are not processed as outputs
+    partial_file = output_file + '.partial'
+    validator_file = partial_file + '.validator'
+
+    # Resume from the end of an existing partial file
+    offset = 0
+    if os.path.exists(partial_file) == 1:
+        offset = os.path.getsize(partial_file)
+        if expected_size is not None and offset > expected_size:
+            os.remove(partial_file)
+            offset = 0
+
+    # Download the remaining bytes
+    downloaded = 0
+    if expected_size is None or offset < expected_size:
+        headers = {'Range': f'bytes={offset}-'} if offset > 0 else {}
+        # Ask the server to send the full file instead of the range if the file changed since the partial download started
+        if offset > 0 and os.path.exists(validator_file) == 1:
+            with open(validator_file, 'r', encoding='utf-8') as validator_handler:
+                headers['If-Range'] = validator_handler.read()
+        with session.get(url, params=params, headers=headers, stream=True, timeout=(60, 300)) as response:
+            if response.status_code == 416:
+                os.remove(partial_file)
+                if os.path.exists(validator_file) == 1:
+                    os.remove(validator_file)
+                raise ValueError(f'Partial download of {url} could not be resumed.')
+            response.raise_for_status()
+            # Append when the range is honored, otherwise restart from the beginning
+            if response.status_code == 206:
+                write_mode = 'ab'
+            else:
+                write_mode = 'wb'
+                offset = 0
+                # Record the strong entity tag or modification time of the file to validate a later resume
+                validator = response.headers.get('ETag')
+                if validator is None or validator.startswith('W/'):
+                    validator = response.headers.get('Last-Modified')
+                if validator is not None:
+                    with open(validator_file, 'w', encoding='utf-8') as validator_handler:
+                        validator_handler.write(validator)
+                elif os.path.exists(validator_file) == 1:
+                    os.remove(validator_file)
+            # Determine the full size from the response if it was not provided
+            content_length = response.headers.get('Content-Length')
+            if expected_size is None and content_length is not None and 'Content-Encoding' not in response.headers:
+                expected_size = offset + int(content_length)
+            with open(partial_file, write_mode) as file_handler:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file_handler.write(chunk)
+                    downloaded += len(chunk)
+
+    # Verify the size and checksum before moving the completed file to the output path
+    if expected_size is not None and os.path.getsize(partial_file) != expected_size:
+        raise ValueError(f'Download of {url} is incomplete.')
+    if expected_md5 is not None:
+        if calculate_md5(partial_file).lower() != expected_md5.lower():
+            os.remove(partial_file)
+            raise ValueError(f'Download of {url} does not match its checksum.')
+    os.replace(partial_file, output_file)
+    if os.path.exists(validator_file) == 1:
+        os.remove(validator_file)
+
+    return downloaded
+
+# Define a function to download files in parallel threads
+def download_files(download_list, create_session, workers=8, retry_count=3):
+    """
+    Description: downloads a list of files in a bounded pool of threads, skipping files that already exist with the expected size and resuming failed downloads with exponential backoff
+    Inputs: 'download_list' -- a list of dictionaries with 'url' and 'output' keys and optional 'size', 'md5', and 'params' keys
+            'create_session' -- a function that returns a new requests session, called once per thread so that each thread reuses its connections
+            'workers' -- the number of files downloaded at the same time
+            'retry_count' -- the number of times a failed download is resumed before the file is reported as failed
+    Returned Value: Returns a dictionary of 'skipped', 'completed', or 'failed' status by output file name and files to local disk
+    Preconditions: requires output file names that are unique within the list
+    """
+
+    # Import packages
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import as_completed
+    import datetime
+    import os
+    import requests
+    import threading
+    import time
+
+    # Create one session per thread
+    thread_data = threading.local()
+
+    def get_session():
+        if getattr(thread_data, 'session', None) is None:
+            thread_data.session = create_session()
+        return thread_data.session
+
+    # Define a task that resumes a download until it completes or exhausts its retries
+    def download_task(download_item):
+        for attempt in range(retry_count + 1):
+            try:
+                return stream_download(get_session(),
+                                       download_item['url'],
+                                       download_item['output'],
+                                       expected_size=download_item.get('size'),
+                                       expected_md5=download_item.get('md5'),
+                                       params=download_item.get('params'))
+            except (requests.RequestException, OSError, ValueError) as error:
+                if attempt == retry_count:
+                    raise
+                print(f'\tRetrying {os.path.split(download_item["output"])[1]} after error: {error}')
+                time.sleep(2 ** attempt)
+
+    # Skip files that already exist with the expected size
+    status_dictionary = dict()
+    task_list = []
+    for download_item in download_list:
+        output_name = os.path.split(download_item['output'])[1]
+        if os.path.exists(download_item['output']) == 1 \
+                and (download_item.get('size') is None or os.path.getsize(download_item['output']) == download_item['size']):
+            status_dictionary[output_name] = 'skipped'
+        else:
+            task_list.append(download_item)
+    print(f'\tDownloading {len(task_list)} of {len(download_list)} files with {workers} threads...')
+
+    # Download files in a bounded pool of threads
+    iteration_start = time.time()
+    total_bytes = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_dictionary = {executor.submit(download_task, download_item): download_item
+                             for download_item in task_list}
+        count = 1
+        for future in as_completed(future_dictionary):
+            output_name = os.path.split(future_dictionary[future]['output'])[1]
+            try:
+                total_bytes += future.result()
+                status_dictionary[output_name] = 'completed'
+                print(f'\tSaved {output_name} ({count} of {len(task_list)}).')
+            except Exception as error:
+                status_dictionary[output_name] = 'failed'
+                print(f'\tERROR: Download of {output_name} failed ({count} of {len(task_list)}): {error}')
+            count += 1
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tDownloaded {round(total_bytes / 1048576, 1)} MB.')
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    return status_dictionary
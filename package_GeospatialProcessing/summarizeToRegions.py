@@ -2,9 +2,9 @@
 # ---------------------------------------------------------------------------
 # Summarize to regions
 # Author: Timm Nawrocki
-# Last Updated: 2022-12-23
-# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation.
-# Description: "Summarize to regions" is a function that summarizes a continuous raster to regions defined by a categorical raster.
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an ArcGIS Pro Python 3.7 installation with rasterio.
+# Description: "Summarize to regions" is a function that summarizes a continuous raster to regions defined by a categorical raster. The native option labels regions with union-find and summarizes the continuous raster to them in the same streaming job.
 # ---------------------------------------------------------------------------
 
 # Define a function to summarize continuous rasters to categorical regions
@@ -14,11 +14,14 @@ def summarize_to_regions(**kwargs):
     Inputs: 'work_geodatabase' -- a geodatabase to store temporary results
             'input_array' -- an array containing the area raster (must be first), the continuous raster, and the categorical raster
             'output_array' -- an array containing the output raster
+            'native' -- an optional boolean value that if True labels and summarizes regions with the native region engine (default is False)
+            'block_size' -- an optional number of rows and columns processed per block by the native region engine (default is 2048)
     Returned Value: Returns a raster to disk
     Preconditions: requires a continuous raster and categorical raster
     """
 
     # Import packages
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
     import arcpy
     from arcpy.sa import Int
     from arcpy.sa import Raster
@@ -34,6 +37,113 @@ def summarize_to_regions(**kwargs):
     continuous_raster = kwargs['input_array'][1]
     categorical_raster = kwargs['input_array'][2]
     output_raster = kwargs['output_array'][0]
+    native = kwargs.get('native', False)
+    block_size = kwargs.get('block_size', 2048)
+
+    # Summarize continuous raster to regions with the native region engine
+    if native == True:
+        # Import packages
+        from package_GeospatialProcessing.rasterBlocks import create_block_profile
+        from package_GeospatialProcessing.rasterBlocks import generate_blocks
+        from package_GeospatialProcessing.rasterBlocks import read_aligned_block
+        from package_GeospatialProcessing.regionLabels import label_regions
+        import numpy as np
+        import rasterio
+        import shutil
+        import tempfile
+        from rasterio.windows import Window
+
+        # Create a scratch folder for memory-mapped working arrays
+        work_folder = tempfile.mkdtemp(prefix='regions_', dir=os.path.split(output_raster)[0])
+
+        try:
+            with rasterio.open(area_raster) as area_dataset, \
+                    rasterio.open(continuous_raster) as continuous_dataset, \
+                    rasterio.open(categorical_raster) as categorical_dataset:
+                # Determine raster properties
+                rows = area_dataset.height
+                columns = area_dataset.width
+                block_list = generate_blocks(rows, columns, block_size)
+
+                # Copy categorical raster to 8-bit signed integer as in the arcpy path
+                print(f'\tCalculating regions...')
+                iteration_start = time.time()
+                input_integer = os.path.join(work_folder, 'integer.tif')
+                integer_profile = create_block_profile(area_dataset, 'int8', -128)
+                with rasterio.open(input_integer, 'w', **integer_profile) as integer_dataset:
+                    for block in block_list:
+                        row_offset, column_offset, block_rows, block_columns = block
+                        window = Window(column_offset, row_offset, block_columns, block_rows)
+                        categorical_block = read_aligned_block(categorical_dataset, area_dataset, block)
+                        valid = np.isfinite(categorical_block)
+                        integer_block = np.full((block_rows, block_columns), -128, dtype='int8')
+                        integer_block[valid] = np.clip(np.trunc(categorical_block[valid]), -127, 127).astype('int8')
+                        integer_dataset.write(integer_block, 1, window=window)
+
+                # Label regions
+                labels = np.memmap(os.path.join(work_folder, 'labels.dat'), dtype='int64', mode='w+', shape=(rows, columns))
+                with rasterio.open(input_integer) as integer_dataset:
+                    parent, region_counts = label_regions(integer_dataset, area_dataset, labels, block_list)
+                # End timing
+                iteration_end = time.time()
+                iteration_elapsed = int(iteration_end - iteration_start)
+                iteration_success_time = datetime.datetime.now()
+                # Report success
+                print(
+                    f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+                print('\t----------')
+
+                # Accumulate continuous values to regions
+                print(f'\tCalculating zonal statistics...')
+                iteration_start = time.time()
+                region_sum = np.zeros(parent.shape[0])
+                region_count = np.zeros(parent.shape[0])
+                for block in block_list:
+                    row_offset, column_offset, block_rows, block_columns = block
+                    block_labels = np.asarray(labels[row_offset:row_offset + block_rows,
+                                                     column_offset:column_offset + block_columns])
+                    continuous_block = read_aligned_block(continuous_dataset, area_dataset, block)
+                    valid = (block_labels >= 0) & np.isfinite(continuous_block)
+                    # Accumulate only the regions in the block
+                    block_regions, region_index = np.unique(parent[block_labels[valid]], return_inverse=True)
+                    np.add.at(region_sum, block_regions, np.bincount(region_index, weights=continuous_block[valid],
+                                                                     minlength=block_regions.size))
+                    np.add.at(region_count, block_regions, np.bincount(region_index, minlength=block_regions.size))
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    region_mean = region_sum / region_count
+
+                # Export mean of each region as integer
+                output_profile = create_block_profile(area_dataset, 'int8', -128)
+                with rasterio.open(output_raster, 'w', **output_profile) as output_dataset:
+                    for block in block_list:
+                        row_offset, column_offset, block_rows, block_columns = block
+                        window = Window(column_offset, row_offset, block_columns, block_rows)
+                        block_labels = np.asarray(labels[row_offset:row_offset + block_rows,
+                                                         column_offset:column_offset + block_columns])
+                        mean_block = np.full((block_rows, block_columns), np.nan)
+                        mean_block[block_labels >= 0] = region_mean[parent[block_labels[block_labels >= 0]]]
+                        valid = np.isfinite(mean_block)
+                        output_block = np.full((block_rows, block_columns), -128, dtype='int8')
+                        output_block[valid] = np.clip(np.trunc(mean_block[valid]), -127, 127).astype('int8')
+                        output_dataset.write(output_block, 1, window=window)
+                del labels
+                # Rewrite as a tiled and compressed raster with overviews
+                write_cloud_optimized_raster(output_raster, resampling='average')
+                # End timing
+                iteration_end = time.time()
+                iteration_elapsed = int(iteration_end - iteration_start)
+                iteration_success_time = datetime.datetime.now()
+                # Report success
+                print(
+                    f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+                print('\t----------')
+        finally:
+            # Remove working arrays
+            shutil.rmtree(work_folder, ignore_errors=True)
+
+        # Return success message
+        out_process = f'Successfully summarized continuous raster.'
+        return out_process
 
     # Define intermediate datasets
     input_integer = os.path.join(os.path.split(categorical_raster)[0], 'integer.tif')
@@ -117,6 +227,8 @@ def summarize_to_regions(**kwargs):
                                 'NONE',
                                 'CURRENT_SLICE',
                                 'NO_TRANSPOSE')
+    # Rewrite as a tiled and compressed raster with overviews
+    write_cloud_optimized_raster(output_raster, resampling='average')
     # End timing
     iteration_end = time.time()
     iteration_elapsed = int(iteration_end - iteration_start)
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Temporal reduction
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio. Numba is used to compile the reduction kernel if it is installed.
+# Description: "Temporal reduction" is a set of functions that summarize a time series raster over time for each cell. All years of a block are read in one call and the mean, standard deviation, Theil-Sen slope, Mann-Kendall statistic and significance, and change from the first to the last year are calculated in a single pass. Blocks are reduced in parallel worker processes with a bounded number of blocks in memory.
+# ---------------------------------------------------------------------------
+
+# Import packages at the module level so that kernels can be compiled once per worker process
+import functools
+import math
+import numpy as np
+
+# Define the reductions in output band order
+reduction_names = ['mean', 'std', 'sen_slope', 'mk_z', 'mk_p', 'change']
+
+# Define a kernel to reduce the time series of each cell
+def reduction_kernel(values, years, minimum_count, output):
+    """
+    Description: calculates the temporal reductions of the time series of each cell
+    Inputs: 'values' -- a two-dimensional float64 array of shape (years, cells) with NaN as no data
+            'years' -- a one-dimensional float64 array of the year of each row
+            'minimum_count' -- the minimum number of years with data for a cell to be reduced
+            'output' -- a two-dimensional float64 array of shape (reductions, cells) to store the mean, population standard deviation, Theil-Sen slope per year, Mann-Kendall z statistic, two-sided Mann-Kendall p value, and last minus first value
+    Returned Value: Returns the number of cells reduced
+    Preconditions: requires an output array filled with NaN
+    """
+
+    # Allocate work arrays for the largest time series
+    year_count, cell_count = values.shape
+    series = np.empty(year_count, dtype=np.float64)
+    series_years = np.empty(year_count, dtype=np.float64)
+    slopes = np.empty(year_count * (year_count - 1) // 2, dtype=np.float64)
+    reduced = 0
+    for cell in range(cell_count):
+        # Collect years with data
+        count = 0
+        for index in range(year_count):
+            value = values[index, cell]
+            if not np.isnan(value):
+                series[count] = value
+                series_years[count] = years[index]
+                count += 1
+        if count < minimum_count or count < 2:
+            continue
+
+        # Calculate the mean and population standard deviation
+        total = 0.0
+        for index in range(count):
+            total += series[index]
+        mean = total / count
+        square = 0.0
+        for index in range(count):
+            square += (series[index] - mean) ** 2
+        output[0, cell] = mean
+        output[1, cell] = math.sqrt(square / count)
+
+        # Calculate pairwise slopes and the Mann-Kendall statistic
+        pair_count = 0
+        statistic = 0.0
+        for first in range(count - 1):
+            for second in range(first + 1, count):
+                difference = series[second] - series[first]
+                slopes[pair_count] = difference / (series_years[second] - series_years[first])
+                pair_count += 1
+                if difference > 0:
+                    statistic += 1.0
+                elif difference < 0:
+                    statistic -= 1.0
+        output[2, cell] = np.median(slopes[:pair_count])
+
+        # Calculate the variance of the statistic with a correction for tied values
+        variance = count * (count - 1) * (2 * count + 5)
+        ordered = np.sort(series[:count])
+        tie_length = 1
+        for index in range(1, count + 1):
+            if index < count and ordered[index] == ordered[index - 1]:
+                tie_length += 1
+            else:
+                if tie_length > 1:
+                    variance -= tie_length * (tie_length - 1) * (2 * tie_length + 5)
+                tie_length = 1
+        variance = variance / 18.0
+
+        # Calculate the continuity corrected z statistic and two-sided p value
+        if variance > 0:
+            if statistic > 0:
+                z_statistic = (statistic - 1.0) / math.sqrt(variance)
+            elif statistic < 0:
+                z_statistic = (statistic + 1.0) / math.sqrt(variance)
+            else:
+                z_statistic = 0.0
+            output[3, cell] = z_statistic
+            output[4, cell] = math.erfc(abs(z_statistic) / math.sqrt(2.0))
+
+        # Calculate the change from the first to the last year with data
+        output[5, cell] = series[count - 1] - series[0]
+        reduced += 1
+
+    return reduced
+
+# Define a function to compile the reduction kernel once per process
+@functools.lru_cache(maxsize=1)
+def compile_reduction_kernel():
+    """
+    Description: compiles the reduction kernel and reuses the compiled kernel for later blocks in the same process
+    Inputs: None
+    Returned Value: Returns the compiled reduction kernel, or the plain Python kernel if numba is not installed
+    Preconditions: None
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.compileKernel import compile_kernel
+
+    return compile_kernel(reduction_kernel)
+
+# Define a function to reduce a block of a time series raster
+def reduce_time_series_block(input_raster, block, minimum_count=3):
+    """
+    Description: reads all years of a block of a time series raster in one call and calculates the temporal reductions of each cell
+    Inputs: 'input_raster' -- a time series raster with one band per year
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+            'minimum_count' -- the minimum number of years with data for a cell to be reduced
+    Returned Value: Returns a tuple of the block and a float32 array of shape (reductions, rows, columns) with NaN where cells are not reduced
+    Preconditions: requires a time series raster that records the year of each band
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.timeSeriesRaster import read_time_series_years
+    import rasterio
+    from rasterio.windows import Window
+
+    # Read all years of the block
+    row_offset, column_offset, block_rows, block_columns = block
+    with rasterio.open(input_raster) as input_dataset:
+        years = np.array(read_time_series_years(input_dataset), dtype=np.float64)
+        window = Window(column_offset, row_offset, block_columns, block_rows)
+        values = input_dataset.read(window=window, out_dtype='float64')
+        if input_dataset.nodata is not None:
+            values[values == input_dataset.nodata] = np.nan
+
+    # Reduce the time series of each cell
+    output = np.full((len(reduction_names), block_rows * block_columns), np.nan)
+    compile_reduction_kernel()(values.reshape(len(years), -1), years, minimum_count, output)
+
+    return block, output.reshape(len(reduction_names), block_rows, block_columns).astype('float32')
+
+# Define a function to reduce a time series raster
+def reduce_time_series(**kwargs):
+    """
+    Description: summarizes a time series raster over time for each cell and writes one band per reduction
+    Inputs: 'minimum_count' -- an optional minimum number of years with data for a cell to be reduced (default is 3)
+            'workers' -- an optional number of worker processes (default is the number of processors)
+            'block_size' -- an optional number of rows and columns processed per block (default is 512)
+            'nodata' -- an optional no data value for the output (default is -32768)
+            'input_array' -- an array containing the time series raster
+            'output_array' -- an array containing the output raster
+    Returned Value: Returns a 32-bit float raster to disk with bands for the mean, standard deviation, Theil-Sen slope per year, Mann-Kendall z statistic, Mann-Kendall p value, and change from the first to the last year with data
+    Preconditions: requires a time series raster created by merge_time_series and a calling script protected by if __name__ == '__main__'
+    """
+
+    # Import packages
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import wait
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.timeSeriesRaster import read_time_series_years
+    import datetime
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import time
+
+    # Parse key word argument inputs
+    minimum_count = kwargs.get('minimum_count', 3)
+    workers = kwargs.get('workers', os.cpu_count())
+    block_size = kwargs.get('block_size', 512)
+    nodata = kwargs.get('nodata', -32768)
+    input_raster = kwargs['input_array'][0]
+    output_raster = kwargs['output_array'][0]
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+
+    with rasterio.open(input_raster) as input_dataset:
+        year_list = read_time_series_years(input_dataset)
+        block_list = generate_blocks(input_dataset.height, input_dataset.width, block_size)
+        output_profile = create_block_profile(input_dataset, 'float32', nodata, len(reduction_names))
+        output_profile.update({'tiled': True,
+                               'blockxsize': 256,
+                               'blockysize': 256,
+                               'compress': 'DEFLATE',
+                               'predictor': 3})
+
+    # Reduce blocks in parallel worker processes and write them as they complete
+    print(f'\tReducing {len(year_list)} years from {year_list[0]} to {year_list[-1]} in {len(block_list)} blocks...')
+    iteration_start = time.time()
+    with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+        for index, reduction_name in enumerate(reduction_names):
+            output_dataset.set_band_description(index + 1, reduction_name)
+        output_dataset.update_tags(TIME_SERIES_YEARS=','.join([str(year) for year in year_list]))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Limit the number of blocks in memory to twice the number of workers
+            pending = set()
+            block_iterator = iter(block_list)
+            while True:
+                for block in block_iterator:
+                    pending.add(executor.submit(reduce_time_series_block, input_raster, block, minimum_count))
+                    if len(pending) >= workers * 2:
+                        break
+                if len(pending) == 0:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block, output_block = future.result()
+                    row_offset, column_offset, block_rows, block_columns = block
+                    output_block[np.isnan(output_block)] = nodata
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    output_dataset.write(output_block, window=window)
+
+    # Move the completed raster to the output path
+    os.replace(temporary_raster, output_raster)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully reduced a time series of {len(year_list)} years.'
+    return outprocess
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Time series raster
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Time series raster" is a set of functions that write annual rasters of a metric as a single multi-band time series raster with one band per year. Time series rasters are pixel interleaved with square internal tiles so that all years of a block are stored together and can be read in one call, and the year of each band is recorded in the raster metadata.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a time series profile
+def create_time_series_profile(reference_dataset, year_list, dtype='float32', nodata=-32768, tile_size=256):
+    """
+    Description: creates a GeoTIFF profile for a pixel interleaved and tiled time series raster on the grid of a reference raster
+    Inputs: 'reference_dataset' -- an open rasterio dataset that defines the grid
+            'year_list' -- a list of the years of the bands
+            'dtype' -- the data type of the output
+            'nodata' -- the no data value of the output
+            'tile_size' -- the number of rows and columns of the internal tiles
+    Returned Value: Returns a profile dictionary that can be passed to rasterio.open
+    Preconditions: requires an open rasterio dataset and a tile size that is a multiple of 16
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import create_block_profile
+    import numpy as np
+
+    # Store all years of a tile together and compress with a predictor for the data type
+    profile = create_block_profile(reference_dataset, dtype, nodata, len(year_list))
+    profile.update({'interleave': 'pixel',
+                    'tiled': True,
+                    'blockxsize': tile_size,
+                    'blockysize': tile_size,
+                    'compress': 'DEFLATE',
+                    'predictor': 3 if np.issubdtype(np.dtype(dtype), np.floating) else 2})
+
+    return profile
+
+# Define a function to write the years of a time series raster
+def write_time_series_years(dataset, year_list):
+    """
+    Description: records the year of each band of a time series raster as band descriptions and metadata tags
+    Inputs: 'dataset' -- a rasterio dataset open for writing
+            'year_list' -- a list of the years of the bands
+    Returned Value: Returns no value
+    Preconditions: requires a dataset with one band per year
+    """
+
+    # Record years for the raster and for each band
+    dataset.update_tags(TIME_SERIES_YEARS=','.join([str(year) for year in year_list]))
+    for index, year in enumerate(year_list):
+        dataset.set_band_description(index + 1, str(year))
+        dataset.update_tags(index + 1, YEAR=str(year))
+
+# Define a function to read the years of a time series raster
+def read_time_series_years(dataset):
+    """
+    Description: reads the year of each band of a time series raster
+    Inputs: 'dataset' -- an open rasterio dataset
+    Returned Value: Returns a list of integer years in band order
+    Preconditions: requires a time series raster written with write_time_series_years or band descriptions of years
+    """
+
+    # Read the years from the raster metadata or from the band descriptions
+    year_text = dataset.tags().get('TIME_SERIES_YEARS')
+    if year_text is not None:
+        return [int(year) for year in year_text.split(',')]
+    if all([description is not None and description.isdigit() for description in dataset.descriptions]):
+        return [int(description) for description in dataset.descriptions]
+    raise ValueError(f'{dataset.name} does not record the years of its bands.')
+
+# Define a function to merge grid time series to a single time series raster
+def merge_time_series(**kwargs):
+    """
+    Description: merges multi-band grid rasters with one band per year into a single time series raster on the grid of an area raster
+    Inputs: 'year_list' -- a list of the years of the bands
+            'nodata' -- an optional no data value for the output (default is -32768)
+            'tile_size' -- an optional number of rows and columns of the internal tiles (default is 256)
+            'block_size' -- an optional number of rows and columns processed per block (default is 1024)
+            'input_array' -- an array containing the area raster (must be first) and the grid rasters
+            'output_array' -- an array containing the output time series raster
+    Returned Value: Returns a 32-bit float time series raster to disk, where overlapping grids are merged by maximum
+    Preconditions: requires grid rasters with one band per year that are snapped to the area raster
+    """
+
+    # Import packages
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    from package_GeospatialProcessing.rasterStack import check_snap
+    import datetime
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.windows import Window
+    import time
+
+    # Parse key word argument inputs
+    year_list = kwargs['year_list']
+    nodata = kwargs.get('nodata', -32768)
+    tile_size = kwargs.get('tile_size', 256)
+    block_size = kwargs.get('block_size', 1024)
+    area_raster = kwargs['input_array'][0]
+    grid_rasters = kwargs['input_array'][1:]
+    output_raster = kwargs['output_array'][0]
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+
+    print(f'\tMerging {len(grid_rasters)} grid rasters to a time series of {len(year_list)} years...')
+    iteration_start = time.time()
+    with rasterio.open(area_raster) as area_dataset:
+        # Locate each grid on the area grid
+        grid_list = []
+        for grid_raster in grid_rasters:
+            with rasterio.open(grid_raster) as grid_dataset:
+                if grid_dataset.count != len(year_list):
+                    raise ValueError(f'{grid_raster} must have one band for each of {len(year_list)} years.')
+                if grid_dataset.crs != area_dataset.crs or not check_snap(area_dataset.transform, grid_dataset.transform):
+                    raise ValueError(f'{grid_raster} is not snapped to the area raster.')
+                column_shift, row_shift = ~area_dataset.transform * (grid_dataset.transform.c, grid_dataset.transform.f)
+                grid_list.append((grid_raster, int(round(row_shift)), int(round(column_shift)),
+                                  grid_dataset.height, grid_dataset.width))
+
+        # Align processing blocks to the internal tiles
+        block_size = max(tile_size, block_size - block_size % tile_size)
+        output_profile = create_time_series_profile(area_dataset, year_list, 'float32', nodata, tile_size)
+        with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+            write_time_series_years(output_dataset, year_list)
+            grid_datasets = dict()
+            try:
+                for block in generate_blocks(area_dataset.height, area_dataset.width, block_size):
+                    row_offset, column_offset, block_rows, block_columns = block
+                    values = np.full((len(year_list), block_rows, block_columns), np.nan, dtype='float32')
+                    # Read all years of each overlapping grid in one call
+                    for grid_raster, grid_row, grid_column, grid_height, grid_width in grid_list:
+                        row_start = max(row_offset, grid_row)
+                        row_end = min(row_offset + block_rows, grid_row + grid_height)
+                        column_start = max(column_offset, grid_column)
+                        column_end = min(column_offset + block_columns, grid_column + grid_width)
+                        if row_start >= row_end or column_start >= column_end:
+                            continue
+                        if grid_raster not in grid_datasets:
+                            grid_datasets[grid_raster] = rasterio.open(grid_raster)
+                        grid_dataset = grid_datasets[grid_raster]
+                        grid_window = Window(column_start - grid_column, row_start - grid_row,
+                                             column_end - column_start, row_end - row_start)
+                        grid_values = grid_dataset.read(window=grid_window, out_dtype='float32')
+                        if grid_dataset.nodata is not None:
+                            grid_values[grid_values == grid_dataset.nodata] = np.nan
+                        block_values = values[:,
+                                              row_start - row_offset:row_end - row_offset,
+                                              column_start - column_offset:column_end - column_offset]
+                        # Merge overlapping grids by maximum as in the previous mosaics
+                        block_values[:] = np.fmax(block_values, grid_values)
+                    values[np.isnan(values)] = nodata
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    output_dataset.write(values, window=window)
+            finally:
+                for grid_dataset in grid_datasets.values():
+                    grid_dataset.close()
+
+    # Move the completed raster to the output path
+    os.replace(temporary_raster, output_raster)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully merged a time series of {len(year_list)} years.'
+    return outprocess
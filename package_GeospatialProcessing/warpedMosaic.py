@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Warped mosaic
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Warped mosaic" is a set of functions that treat a folder of source raster tiles as a virtual mosaic on an output grid. A catalog indexes the footprint of each tile in the output coordinate system so that reading a window of the mosaic opens only the overlapping tiles, warps them to the output grid in memory, and composites them with later tiles taking precedence. The mosaic can be read block by block by native engines or written to a single raster in parallel without projected tile intermediates.
+# ---------------------------------------------------------------------------
+
+# Define a function to create a catalog of tile footprints
+def create_tile_catalog(tile_list, output_crs, input_crs=None):
+    """
+    Description: creates a catalog of the footprints of source raster tiles in the output coordinate system
+    Inputs: 'tile_list' -- a list of source raster tiles in composite order, where later tiles take precedence
+            'output_crs' -- the output coordinate system as an EPSG code, WKT string, or rasterio CRS
+            'input_crs' -- an optional coordinate system to assign to the source tiles, which is required if the tiles do not define one
+    Returned Value: Returns a catalog dictionary with the tile paths, input and output coordinate systems as WKT, and a list of tile footprints as (left, bottom, right, top) in the output coordinate system
+    Preconditions: requires source tiles readable by rasterio
+    """
+
+    # Import packages
+    import rasterio
+    from rasterio.crs import CRS
+    from rasterio.warp import transform_bounds
+
+    # Parse coordinate systems
+    output_crs = CRS.from_user_input(output_crs)
+    if input_crs is not None:
+        input_crs = CRS.from_user_input(input_crs)
+
+    # Record the footprint of each tile in the output coordinate system
+    footprint_list = []
+    crs_list = []
+    for tile_raster in tile_list:
+        with rasterio.open(tile_raster) as tile_dataset:
+            tile_crs = input_crs if input_crs is not None else tile_dataset.crs
+            if tile_crs is None:
+                raise ValueError(f'{tile_raster} does not define a coordinate system and no input coordinate system was provided.')
+            footprint_list.append(tuple(transform_bounds(tile_crs, output_crs, *tile_dataset.bounds, densify_pts=21)))
+            crs_list.append(tile_crs.to_wkt())
+
+    # Create catalog
+    catalog = {'tiles': list(tile_list),
+               'tile_crs': crs_list,
+               'output_crs': output_crs.to_wkt(),
+               'footprints': footprint_list}
+
+    return catalog
+
+# Define a function to read a window of a warped mosaic
+def read_mosaic_window(catalog, transform, height, width, resampling='bilinear'):
+    """
+    Description: reads a window of the virtual mosaic by warping only the overlapping source tiles to the window grid in memory
+    Inputs: 'catalog' -- a tile catalog created by create_tile_catalog
+            'transform' -- the affine transform of the window in the output coordinate system
+            'height' -- the number of rows in the window
+            'width' -- the number of columns in the window
+            'resampling' -- the name of a rasterio resampling method
+    Returned Value: Returns a float64 array of shape (height, width) with NaN where no tile has data
+    Preconditions: requires a catalog with footprints in the output coordinate system of the transform
+    """
+
+    # Import packages
+    import numpy as np
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.warp import reproject
+
+    # Determine the bounds of the window
+    left, top = transform * (0, 0)
+    right, bottom = transform * (width, height)
+    left, right = min(left, right), max(left, right)
+    bottom, top = min(bottom, top), max(bottom, top)
+
+    # Select tiles whose footprint overlaps the window
+    footprints = np.array(catalog['footprints'], dtype='float64').reshape(-1, 4)
+    overlap = (footprints[:, 0] < right) & (footprints[:, 2] > left) \
+        & (footprints[:, 1] < top) & (footprints[:, 3] > bottom)
+
+    # Warp and composite overlapping tiles in catalog order
+    values = np.full((height, width), np.nan)
+    tile_values = np.empty((height, width))
+    for index in np.flatnonzero(overlap):
+        with rasterio.open(catalog['tiles'][index]) as tile_dataset:
+            tile_values.fill(np.nan)
+            reproject(source=rasterio.band(tile_dataset, 1),
+                      destination=tile_values,
+                      src_crs=catalog['tile_crs'][index],
+                      src_nodata=tile_dataset.nodata,
+                      dst_transform=transform,
+                      dst_crs=catalog['output_crs'],
+                      dst_nodata=np.nan,
+                      resampling=Resampling[resampling])
+        valid = np.isfinite(tile_values)
+        values[valid] = tile_values[valid]
+
+    return values
+
+# Define a function to read a block of a warped mosaic with a halo
+def read_mosaic_block(catalog, reference_dataset, block, halo=0, resampling='bilinear'):
+    """
+    Description: reads a block of the virtual mosaic on the grid of a reference raster, padding the block with a halo of neighboring cells in the same way as read_block
+    Inputs: 'catalog' -- a tile catalog created by create_tile_catalog
+            'reference_dataset' -- an open rasterio dataset or profile dictionary with a 'transform' that defines the block grid
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+            'halo' -- the number of neighboring cells to read on each side of the block
+            'resampling' -- the name of a rasterio resampling method
+    Returned Value: Returns a float64 array of shape (rows + 2 * halo, columns + 2 * halo) with NaN where no tile has data
+    Preconditions: requires a reference grid in the output coordinate system of the catalog
+    """
+
+    # Import packages
+    from rasterio.windows import Window
+    from rasterio.windows import transform as window_transform
+
+    # Determine the transform of the expanded block
+    row_offset, column_offset, block_rows, block_columns = block
+    reference_transform = reference_dataset['transform'] if isinstance(reference_dataset, dict) \
+        else reference_dataset.transform
+    window = Window(column_offset - halo, row_offset - halo, block_columns + 2 * halo, block_rows + 2 * halo)
+
+    return read_mosaic_window(catalog,
+                              window_transform(window, reference_transform),
+                              block_rows + 2 * halo,
+                              block_columns + 2 * halo,
+                              resampling)
+
+# Define a function to warp a block of a mosaic in a worker process
+def warp_mosaic_block(catalog, profile, block, resampling='bilinear'):
+    """
+    Description: warps a block of the virtual mosaic and converts it to output values
+    Inputs: 'catalog' -- a tile catalog created by create_tile_catalog
+            'profile' -- the output profile dictionary that defines the grid and no data value
+            'block' -- a (row offset, column offset, number of rows, number of columns) tuple
+            'resampling' -- the name of a rasterio resampling method
+    Returned Value: Returns a tuple of the block and a float32 array with the output no data value where no tile has data
+    Preconditions: requires a catalog with footprints in the output coordinate system of the profile
+    """
+
+    # Import packages
+    import numpy as np
+
+    # Warp block and set no data
+    values = read_mosaic_block(catalog, profile, block, resampling=resampling)
+    values[np.isnan(values)] = profile['nodata']
+
+    return block, values.astype('float32')
+
+# Define a function to write a warped mosaic of source tiles
+def merge_warped_tiles(**kwargs):
+    """
+    Description: writes a float raster from source tiles by warping and compositing the overlapping tiles of each block in parallel worker processes
+    Inputs: 'tile_folder' -- a folder containing the source raster tiles
+            'cell_size' -- a cell size for the output raster
+            'input_projection' -- an optional EPSG code to assign to the source tiles (default is the coordinate system of each tile)
+            'output_projection' -- the EPSG code for the output projection
+            'resampling' -- an optional rasterio resampling method (default is 'bilinear')
+            'workers' -- an optional number of worker processes (default is the number of processors)
+            'block_size' -- an optional number of rows and columns processed per block (default is 2048)
+            'nodata' -- an optional no data value for the output (default is -2147483648)
+            'input_array' -- an array containing the snap raster
+            'output_array' -- an array containing the output raster
+    Returned Value: Returns a 32-bit float raster to disk on the snap grid that covers the footprints of the source tiles, where later tiles in name order take precedence
+    Preconditions: requires GeoTIFF source tiles and a calling script protected by if __name__ == '__main__'
+    """
+
+    # Import packages
+    from concurrent.futures import FIRST_COMPLETED
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures import wait
+    from package_GeospatialProcessing.cloudOptimizedRaster import select_predictor
+    from package_GeospatialProcessing.cloudOptimizedRaster import write_cloud_optimized_raster
+    from package_GeospatialProcessing.rasterBlocks import generate_blocks
+    import datetime
+    import glob
+    import math
+    import numpy as np
+    import os
+    import rasterio
+    from rasterio.crs import CRS
+    from rasterio.transform import Affine
+    from rasterio.windows import Window
+    import time
+
+    # Parse key word argument inputs
+    tile_folder = kwargs['tile_folder']
+    cell_size = kwargs['cell_size']
+    input_projection = kwargs.get('input_projection', None)
+    output_projection = kwargs['output_projection']
+    resampling = kwargs.get('resampling', 'bilinear')
+    workers = kwargs.get('workers', os.cpu_count())
+    block_size = kwargs.get('block_size', 2048)
+    nodata = kwargs.get('nodata', -2147483648)
+    snap_raster = kwargs['input_array'][0]
+    output_raster = kwargs['output_array'][0]
+
+    # Write to a temporary raster so that interrupted outputs are not mistaken for complete outputs
+    temporary_raster = os.path.splitext(output_raster)[0] + '_temporary.tif'
+
+    # Create a catalog of tile footprints
+    print('\tIndexing source tile footprints...')
+    iteration_start = time.time()
+    tile_list = sorted(glob.glob(os.path.join(tile_folder, '*.tif')))
+    if len(tile_list) == 0:
+        raise ValueError(f'{tile_folder} does not contain any tiles.')
+    output_crs = CRS.from_epsg(output_projection)
+    catalog = create_tile_catalog(tile_list, output_crs, input_projection)
+
+    # Define the output grid on the snap grid over the union of the tile footprints
+    with rasterio.open(snap_raster) as snap_dataset:
+        origin_x = snap_dataset.transform.c
+        origin_y = snap_dataset.transform.f
+    footprints = np.array(catalog['footprints'])
+    left = origin_x + math.floor((footprints[:, 0].min() - origin_x) / cell_size) * cell_size
+    right = origin_x + math.ceil((footprints[:, 2].max() - origin_x) / cell_size) * cell_size
+    bottom = origin_y + math.floor((footprints[:, 1].min() - origin_y) / cell_size) * cell_size
+    top = origin_y + math.ceil((footprints[:, 3].max() - origin_y) / cell_size) * cell_size
+    output_profile = {'driver': 'GTiff',
+                      'dtype': 'float32',
+                      'nodata': nodata,
+                      'count': 1,
+                      'width': int(round((right - left) / cell_size)),
+                      'height': int(round((top - bottom) / cell_size)),
+                      'crs': output_crs,
+                      'transform': Affine(cell_size, 0, left, 0, -cell_size, top),
+                      'tiled': True,
+                      'blockxsize': 512,
+                      'blockysize': 512,
+                      'compress': 'DEFLATE',
+                      'predictor': select_predictor('float32'),
+                      'BIGTIFF': 'IF_SAFER'}
+    block_list = generate_blocks(output_profile['height'], output_profile['width'], block_size)
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(f'\tIndexed {len(tile_list)} tiles for an output of {output_profile["height"]} rows and {output_profile["width"]} columns.')
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Warp blocks in parallel worker processes and write them as they complete
+    print(f'\tWarping {len(block_list)} blocks from source tiles...')
+    iteration_start = time.time()
+    worker_profile = {'transform': output_profile['transform'], 'nodata': nodata}
+    with rasterio.open(temporary_raster, 'w', **output_profile) as output_dataset:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Limit the number of blocks in memory to twice the number of workers
+            pending = set()
+            block_iterator = iter(block_list)
+            while True:
+                for block in block_iterator:
+                    pending.add(executor.submit(warp_mosaic_block, catalog, worker_profile, block, resampling))
+                    if len(pending) >= workers * 2:
+                        break
+                if len(pending) == 0:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block, output_block = future.result()
+                    row_offset, column_offset, block_rows, block_columns = block
+                    window = Window(column_offset, row_offset, block_columns, block_rows)
+                    output_dataset.write(output_block, 1, window=window)
+
+    # Move the completed raster to the output path and add overviews
+    os.replace(temporary_raster, output_raster)
+    write_cloud_optimized_raster(output_raster, resampling='average')
+    # End timing
+    iteration_end = time.time()
+    iteration_elapsed = int(iteration_end - iteration_start)
+    iteration_success_time = datetime.datetime.now()
+    # Report success
+    print(
+        f'\tCompleted at {iteration_success_time.strftime("%Y-%m-%d %H:%M")} (Elapsed time: {datetime.timedelta(seconds=iteration_elapsed)})')
+    print('\t----------')
+
+    # Return success message
+    outprocess = f'Successfully created composite raster from {len(tile_list)} tiles.'
+    return outprocess
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test fixtures
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution.
+# Description: "Test fixtures" defines a local HTTP file server that honors range requests validated by entity tags so that downloads can be tested for resume, unsatisfiable ranges, interrupted responses, and concurrency without network access. Paths can also be routed to functions that answer with generated content such as the JSON of an API stub.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import hashlib
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+# Define a local file server with range support
+class FileServer:
+
+    def __init__(self):
+        # Define the content of each path, paths that ignore ranges, paths that drop their next response, and requests
+        self.files = dict()
+        self.ignore_range = set()
+        self.truncate_once = set()
+        self.request_list = []
+        # Define functions that answer paths from the query and headers, a delay before file content, and concurrency
+        self.routes = dict()
+        self.delay = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class FileHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                range_header = self.headers.get('Range')
+                server.request_list.append((path, range_header))
+                # Answer routed paths with the status and content returned by their function
+                if path in server.routes:
+                    status, content = server.routes[path](parse_qs(urlparse(self.path).query), self.headers)
+                    self.send_response(status)
+                    self.send_header('Content-Length', str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                    return
+                if path not in server.files:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                data = server.files[path]
+                entity_tag = f'"{hashlib.md5(data).hexdigest()}"'
+                # Respond with the requested range, or with 416 if the range starts beyond the content, unless the content changed since the entity tag in If-Range
+                start = 0
+                if_range = self.headers.get('If-Range')
+                if range_header is not None and path not in server.ignore_range \
+                        and (if_range is None or if_range == entity_tag):
+                    start = int(range_header.split('=')[1].split('-')[0])
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header('Content-Range', f'bytes */{len(data)}')
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header('Content-Range', f'bytes {start}-{len(data) - 1}/{len(data)}')
+                else:
+                    self.send_response(200)
+                content = data[start:]
+                self.send_header('ETag', entity_tag)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                # Drop the connection halfway through the content once if requested
+                if path in server.truncate_once:
+                    server.truncate_once.discard(path)
+                    self.wfile.write(content[:len(content) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                # Count the responses that are sent at the same time
+                with server.lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    time.sleep(server.delay)
+                    self.wfile.write(content)
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+        self.http_server = ThreadingHTTPServer(('127.0.0.1', 0), FileHandler)
+        self.thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, path):
+        return f'http://127.0.0.1:{self.http_server.server_port}{path}'
+
+    def close(self):
+        self.http_server.shutdown()
+        self.http_server.server_close()
+
+# Define a fixture that serves files from a local server for the duration of a test
+@pytest.fixture
+def file_server():
+    server = FileServer()
+    yield server
+    server.close()
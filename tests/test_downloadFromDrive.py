@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test download from Google Drive
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with Google Auth and Requests installed.
+# Description: "Test download from Google Drive" checks against a local stub of the Drive API v2 that folder listings follow every page, that folders are synchronized with the most recent file of each title, and that folders are downloaded in parallel threads and only changed files are downloaded again.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import hashlib
+import json
+import os
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.credentials import Credentials
+from package_GeospatialProcessing.downloadFromDrive import download_drive_folder
+from package_GeospatialProcessing.downloadManifest import read_download_manifest
+from package_GeospatialProcessing.listFromDrive import list_from_drive
+
+# Define the folder and the access token of the stub
+FOLDER_ID = 'folder1'
+TOKEN = 'drive-token'
+
+# Define a function to serve the files of a Drive folder from a Drive API v2 stub
+def serve_drive_folder(file_server, file_list, page_limit=1000):
+    for file_meta in file_list:
+        file_server.files[f'/drive/v2/files/{file_meta["id"]}'] = file_meta['data']
+
+    # List files of the folder by page, where the page token is the position of the next file
+    def list_files(query, headers):
+        if headers.get('Authorization') != f'Bearer {TOKEN}':
+            return 401, b''
+        if query['q'][0] != f"'{FOLDER_ID}' in parents and trashed = false":
+            return 400, b''
+        start = int(query.get('pageToken', ['0'])[0])
+        page_size = min(int(query['maxResults'][0]), page_limit)
+        response = {'items': [{'id': file_meta['id'],
+                               'title': file_meta['title'],
+                               'fileSize': str(len(file_meta['data'])),
+                               'md5Checksum': hashlib.md5(file_meta['data']).hexdigest(),
+                               'modifiedDate': file_meta['modified']}
+                              for file_meta in file_list[start:start + page_size]]}
+        if start + page_size < len(file_list):
+            response['nextPageToken'] = str(start + page_size)
+        return 200, json.dumps(response).encode('utf-8')
+    file_server.routes['/drive/v2/files'] = list_files
+
+    return file_server.url('/drive/v2')
+
+# Define a function to create the files of a folder
+def create_files(count):
+    return [{'id': f'id{number:02d}',
+             'title': f'tile_{number:02d}.tif',
+             'data': os.urandom(50000 + number * 1000),
+             'modified': f'2022-01-{number + 1:02d}T00:00:00.000Z'} for number in range(count)]
+
+# Define a function to list the files downloaded from the server
+def list_downloads(file_server):
+    return sorted(path for path, range_header in file_server.request_list if path.startswith('/drive/v2/files/'))
+
+# Define a function to count the file list requests
+def count_listings(file_server):
+    return [path for path, range_header in file_server.request_list].count('/drive/v2/files')
+
+# Test that the file list follows the next page token until the last page
+def test_list_from_drive_follows_pages(file_server):
+    file_list = create_files(5)
+    api_url = serve_drive_folder(file_server, file_list, page_limit=2)
+    with AuthorizedSession(Credentials(token=TOKEN)) as session:
+        listed = list_from_drive(session, FOLDER_ID, api_url)
+    assert [file_meta['id'] for file_meta in listed] == [file_meta['id'] for file_meta in file_list]
+    assert [file_meta['size'] for file_meta in listed] == [len(file_meta['data']) for file_meta in file_list]
+    assert listed[0]['md5'] == hashlib.md5(file_list[0]['data']).hexdigest()
+    assert listed[0]['modified'] == file_list[0]['modified']
+    assert count_listings(file_server) == 3
+
+# Test that only the most recent file of a repeated title is downloaded
+def test_drive_folder_keeps_latest_title(file_server, tmp_path):
+    file_list = create_files(2)
+    repeated = {'id': 'id00_old', 'title': 'tile_00.tif', 'data': os.urandom(40000),
+                'modified': '2021-12-01T00:00:00.000Z'}
+    api_url = serve_drive_folder(file_server, file_list + [repeated], page_limit=2)
+    output_folder = str(tmp_path / 'drive')
+    status_dictionary = download_drive_folder(Credentials(token=TOKEN), FOLDER_ID, output_folder, workers=2,
+                                              retry_count=0, api_url=api_url)
+    assert status_dictionary == {'tile_00.tif': 'completed', 'tile_01.tif': 'completed'}
+    assert '/drive/v2/files/id00_old' not in list_downloads(file_server)
+    assert open(os.path.join(output_folder, 'tile_00.tif'), 'rb').read() == file_list[0]['data']
+    assert read_download_manifest(output_folder)['tile_00.tif']['id'] == 'id00'
+
+# Test that a folder is downloaded in parallel threads and that only changed files are downloaded again
+def test_drive_folder_syncs_in_parallel(file_server, tmp_path):
+    file_list = create_files(12)
+    api_url = serve_drive_folder(file_server, file_list, page_limit=5)
+    file_server.delay = 0.2
+    output_folder = str(tmp_path / 'drive')
+    status_dictionary = download_drive_folder(Credentials(token=TOKEN), FOLDER_ID, output_folder, workers=4,
+                                              retry_count=0, api_url=api_url)
+    assert status_dictionary == {file_meta['title']: 'completed' for file_meta in file_list}
+    assert 1 < file_server.max_active <= 4
+    assert count_listings(file_server) == 3
+    for file_meta in file_list:
+        assert open(os.path.join(output_folder, file_meta['title']), 'rb').read() == file_meta['data']
+
+    # Rerun the synchronization without changes
+    file_server.request_list.clear()
+    status_dictionary = download_drive_folder(Credentials(token=TOKEN), FOLDER_ID, output_folder, workers=4,
+                                              retry_count=0, api_url=api_url)
+    assert set(status_dictionary.values()) == {'skipped'}
+    assert list_downloads(file_server) == []
+
+    # Change one file in Drive and rerun the synchronization
+    file_server.request_list.clear()
+    file_list[3].update({'data': os.urandom(60000), 'modified': '2022-02-01T00:00:00.000Z'})
+    file_server.files['/drive/v2/files/id03'] = file_list[3]['data']
+    status_dictionary = download_drive_folder(Credentials(token=TOKEN), FOLDER_ID, output_folder, workers=4,
+                                              retry_count=0, api_url=api_url)
+    assert status_dictionary['tile_03.tif'] == 'completed'
+    assert [status for title, status in status_dictionary.items() if title != 'tile_03.tif'] == ['skipped'] * 11
+    assert list_downloads(file_server) == ['/drive/v2/files/id03']
+    assert open(os.path.join(output_folder, 'tile_03.tif'), 'rb').read() == file_list[3]['data']
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test download manifest
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with Requests installed.
+# Description: "Test download manifest" checks that synchronized folders skip recorded files, download files that are corrupt locally or changed upstream without resuming stale partial downloads, resume partial downloads only while the remote file is unchanged, and record files that fail their size or checksum only as partial downloads.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import hashlib
+import os
+import requests
+from package_GeospatialProcessing.downloadManifest import read_download_manifest
+from package_GeospatialProcessing.downloadManifest import sync_downloads
+
+# Define file content
+FILE_DATA = {'first.bin': os.urandom(200000), 'second.bin': os.urandom(150000)}
+
+# Define a function to serve files and list them as remote files
+def serve_files(file_server, output_folder):
+    download_list = []
+    for name, data in FILE_DATA.items():
+        file_server.files[f'/{name}'] = data
+        download_list.append({'url': file_server.url(f'/{name}'),
+                              'output': os.path.join(output_folder, name),
+                              'id': name,
+                              'size': len(data),
+                              'md5': hashlib.md5(data).hexdigest(),
+                              'modified': '2022-01-01'})
+    return download_list
+
+# Define a function to list the paths requested from the server
+def list_requests(file_server):
+    return sorted(path for path, range_header in file_server.request_list)
+
+# Test that recorded files are skipped on a rerun
+def test_sync_skips_recorded_files(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = serve_files(file_server, output_folder)
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'completed', 'second.bin': 'completed'}
+    assert sorted(read_download_manifest(output_folder)) == ['first.bin', 'second.bin']
+    file_server.request_list.clear()
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'skipped', 'second.bin': 'skipped'}
+    assert file_server.request_list == []
+
+# Test that files with a wrong local size or checksum are downloaded again
+def test_sync_downloads_corrupt_files(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = serve_files(file_server, output_folder)
+    sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0)
+    file_server.request_list.clear()
+
+    # Truncate one file and overwrite the other with content of the same size
+    with open(os.path.join(output_folder, 'first.bin'), 'r+b') as first_file:
+        first_file.truncate(1000)
+    second_file = os.path.join(output_folder, 'second.bin')
+    second_status = os.stat(second_file)
+    with open(second_file, 'wb') as second_handler:
+        second_handler.write(bytes(len(FILE_DATA['second.bin'])))
+    os.utime(second_file, ns=(second_status.st_atime_ns, second_status.st_mtime_ns + 1000000000))
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'completed', 'second.bin': 'completed'}
+    assert list_requests(file_server) == ['/first.bin', '/second.bin']
+    for name, data in FILE_DATA.items():
+        assert open(os.path.join(output_folder, name), 'rb').read() == data
+
+# Test that files changed upstream are downloaded from the beginning rather than resumed
+def test_sync_downloads_changed_files(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = serve_files(file_server, output_folder)
+    sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0)
+    file_server.request_list.clear()
+
+    # Change the first file upstream and leave a stale partial download
+    changed_data = os.urandom(200000)
+    file_server.files['/first.bin'] = changed_data
+    download_list[0].update({'md5': hashlib.md5(changed_data).hexdigest(), 'modified': '2023-01-01'})
+    with open(os.path.join(output_folder, 'first.bin.partial'), 'wb') as partial:
+        partial.write(b'stale')
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'completed', 'second.bin': 'skipped'}
+    assert file_server.request_list == [('/first.bin', None)]
+    assert open(os.path.join(output_folder, 'first.bin'), 'rb').read() == changed_data
+    assert read_download_manifest(output_folder)['first.bin']['modified'] == '2023-01-01'
+
+# Test that files that fail their size or checksum are reported as failed and recorded only as partial downloads
+def test_sync_excludes_mismatched_files(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = serve_files(file_server, output_folder)
+    download_list[0]['md5'] = '0' * 32
+    download_list[1]['size'] += 100
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'failed', 'second.bin': 'failed'}
+    manifest = read_download_manifest(output_folder)
+    assert list(manifest) == ['second.bin']
+    assert manifest['second.bin']['partial'] is True
+    assert os.path.exists(os.path.join(output_folder, 'first.bin')) is False
+    assert os.path.exists(os.path.join(output_folder, 'second.bin')) is False
+
+# Define a function to interrupt the download of the first file and leave a partial download without a checksum
+def interrupt_download(file_server, output_folder):
+    download_list = serve_files(file_server, output_folder)
+    for download_item in download_list:
+        download_item['md5'] = None
+    file_server.truncate_once.add('/first.bin')
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'failed', 'second.bin': 'completed'}
+    assert read_download_manifest(output_folder)['first.bin']['partial'] is True
+    # Write the bytes that a larger file would have streamed to the partial download before the interruption
+    with open(os.path.join(output_folder, 'first.bin.partial'), 'wb') as partial:
+        partial.write(FILE_DATA['first.bin'][:50000])
+    file_server.request_list.clear()
+    return download_list
+
+# Test that a partial download is resumed when the remote file is unchanged
+def test_sync_resumes_unchanged_partial(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = interrupt_download(file_server, output_folder)
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'completed', 'second.bin': 'skipped'}
+    assert file_server.request_list == [('/first.bin', 'bytes=50000-')]
+    assert open(os.path.join(output_folder, 'first.bin'), 'rb').read() == FILE_DATA['first.bin']
+    assert 'partial' not in read_download_manifest(output_folder)['first.bin']
+
+# Test that a partial download is discarded when the remote file changed without a checksum
+def test_sync_discards_changed_partial(file_server, tmp_path):
+    output_folder = str(tmp_path / 'downloads')
+    download_list = interrupt_download(file_server, output_folder)
+    changed_data = os.urandom(len(FILE_DATA['first.bin']))
+    file_server.files['/first.bin'] = changed_data
+    download_list[0]['modified'] = '2023-01-01'
+    assert sync_downloads(download_list, output_folder, requests.Session, workers=2, retry_count=0) \
+        == {'first.bin': 'completed', 'second.bin': 'skipped'}
+    assert file_server.request_list == [('/first.bin', None)]
+    assert open(os.path.join(output_folder, 'first.bin'), 'rb').read() == changed_data
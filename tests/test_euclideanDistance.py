@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test Euclidean distance
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy.
+# Description: "Test Euclidean distance" checks the separable Euclidean distance transform and its lower envelope of parabolas against brute-force distances to every source cell, including the nearest source indices used for allocation and grids without sources.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import numpy as np
+import pytest
+from package_GeospatialProcessing.euclideanDistance import distance_transform
+from package_GeospatialProcessing.euclideanDistance import lower_envelope_kernel
+from package_GeospatialProcessing.euclideanDistance import row_distance
+
+# Define a function to calculate brute-force distances to the nearest source
+def brute_force_distance(source):
+    source_rows, source_columns = np.nonzero(source)
+    row_grid, column_grid = np.mgrid[0:source.shape[0], 0:source.shape[1]]
+    distance = np.hypot(row_grid[:, :, None] - source_rows, column_grid[:, :, None] - source_columns)
+    return distance.min(axis=2)
+
+# Test that distances and nearest source indices match brute-force distances
+@pytest.mark.parametrize('density', [0.002, 0.03, 0.3])
+def test_distance_transform_matches_brute_force(density):
+    generator = np.random.default_rng(11)
+    source = generator.random((37, 53)) < density
+    source[20, 40] = True
+    cell_size = 10
+    distance, nearest_row, nearest_column = distance_transform(source, cell_size, return_indices=True)
+    expected = brute_force_distance(source) * cell_size
+    np.testing.assert_allclose(distance, expected, rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(distance_transform(source, cell_size), expected, rtol=1e-12, atol=1e-9)
+
+    # Check that each nearest source is a source cell at the nearest distance
+    assert source[nearest_row, nearest_column].all()
+    row_grid, column_grid = np.mgrid[0:source.shape[0], 0:source.shape[1]]
+    nearest_distance = np.hypot(row_grid - nearest_row, column_grid - nearest_column) * cell_size
+    np.testing.assert_allclose(nearest_distance, expected, rtol=1e-12, atol=1e-9)
+
+# Test that a grid without sources is infinitely distant with no nearest source
+def test_distance_transform_without_sources():
+    distance, nearest_row, nearest_column = distance_transform(np.zeros((6, 9), dtype=bool), return_indices=True)
+    assert np.isinf(distance).all()
+    assert (nearest_row == -1).all()
+    assert (nearest_column == -1).all()
+
+# Test that the lower envelope matches a brute-force search of columns with and without compilation
+@pytest.mark.parametrize('compiled', [True, False])
+def test_row_distance_matches_brute_force(compiled):
+    generator = np.random.default_rng(13)
+    column_distance = generator.integers(0, 12, (15, 30)).astype('float64')
+    column_distance[generator.random((15, 30)) < 0.4] = np.inf
+    column_distance[3] = np.inf
+    column_distance[7, :] = np.inf
+    column_distance[7, 29] = 2
+    if compiled == True:
+        distance, nearest = row_distance(column_distance)
+    else:
+        distance = np.empty(column_distance.shape, dtype=np.float64)
+        nearest = np.empty(column_distance.shape, dtype=np.int64)
+        lower_envelope_kernel(np.square(column_distance), distance, nearest)
+
+    # Calculate the squared distance from each column to every column with a source
+    columns = np.arange(column_distance.shape[1])
+    candidates = np.square(columns[:, None] - columns[None, :])[None, :, :] + np.square(column_distance)[:, None, :]
+    expected = candidates.min(axis=2)
+    np.testing.assert_array_equal(distance, expected)
+    assert (nearest[3] == -1).all()
+    valid = np.isfinite(expected)
+    row_index, column_index = np.nonzero(valid)
+    np.testing.assert_array_equal(candidates[row_index, column_index, nearest[valid]], expected[valid])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test extract segment covariates
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy, pandas, and rasterio.
+# Description: "Test extract segment covariates" checks that segment statistics accumulated block by block from a raster stack match statistics calculated directly from all cells of each segment, including covariates with no data.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import numpy as np
+import pandas as pd
+import rasterio
+from rasterio.transform import from_origin
+from package_GeospatialProcessing.extractSegmentCovariates import extract_segment_covariates
+from package_GeospatialProcessing.rasterStack import create_raster_stack
+
+# Define a function to write a single band raster
+def write_raster(raster_path, values, nodata):
+    profile = {'driver': 'GTiff',
+               'height': values.shape[0],
+               'width': values.shape[1],
+               'count': 1,
+               'dtype': values.dtype,
+               'crs': 'EPSG:3338',
+               'transform': from_origin(0, 1000, 10, 10),
+               'nodata': nodata}
+    with rasterio.open(raster_path, 'w', **profile) as dataset:
+        dataset.write(values, 1)
+
+# Test that block statistics match direct statistics for segments that span blocks
+def test_segment_statistics_match_direct_statistics(tmp_path):
+    generator = np.random.default_rng(3)
+    rows, columns = 50, 45
+    # Create segments of irregular size that span block boundaries with cells outside segments
+    segment_values = (np.arange(rows)[:, None] // 7 * 10 + np.arange(columns)[None, :] // 11 + 1).astype('int32')
+    segment_values[generator.random((rows, columns)) < 0.05] = 0
+    first_values = generator.normal(500, 50, (rows, columns)).astype('float32')
+    second_values = generator.normal(-3, 2, (rows, columns)).astype('float32')
+    second_values[generator.random((rows, columns)) < 0.2] = np.nan
+    write_raster(str(tmp_path / 'segments.tif'), segment_values, 0)
+    write_raster(str(tmp_path / 'first.tif'), first_values, np.nan)
+    write_raster(str(tmp_path / 'second.tif'), second_values, np.nan)
+
+    # Extract statistics with blocks smaller than the segments
+    raster_stack = create_raster_stack({'first': str(tmp_path / 'first.tif'), 'second': str(tmp_path / 'second.tif')})
+    statistic_dictionary = {'first_mean': ('first', 'MEAN'),
+                            'first_std': ('first', 'STD'),
+                            'first_rng': ('first', 'RANGE'),
+                            'second_mean': ('second', 'MEAN'),
+                            'second_min': ('second', 'MINIMUM'),
+                            'second_max': ('second', 'MAXIMUM')}
+    output_table = str(tmp_path / 'segments.csv')
+    extract_segment_covariates(raster_stack=raster_stack,
+                               statistic_dictionary=statistic_dictionary,
+                               block_size=16,
+                               input_array=[str(tmp_path / 'segments.tif')],
+                               output_array=[output_table])
+    output_data = pd.read_csv(output_table).set_index('segment_id')
+
+    # Calculate statistics directly from all cells of each segment
+    cell_data = pd.DataFrame({'segment_id': segment_values.ravel(),
+                              'first': first_values.ravel().astype('float64'),
+                              'second': second_values.ravel().astype('float64')})
+    cell_data = cell_data[cell_data['segment_id'] != 0]
+    first_group = cell_data.groupby('segment_id')['first']
+    second_group = cell_data.groupby('segment_id')['second']
+    assert list(output_data.index) == sorted(cell_data['segment_id'].unique())
+    np.testing.assert_allclose(output_data['first_mean'], first_group.mean(), rtol=1e-9)
+    np.testing.assert_allclose(output_data['first_std'], first_group.std(ddof=0), rtol=1e-6)
+    np.testing.assert_allclose(output_data['first_rng'], first_group.max() - first_group.min(), rtol=1e-9)
+    np.testing.assert_allclose(output_data['second_mean'], second_group.mean(), rtol=1e-9)
+    np.testing.assert_allclose(output_data['second_min'], second_group.min(), rtol=1e-9)
+    np.testing.assert_allclose(output_data['second_max'], second_group.max(), rtol=1e-9)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test flow routing
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Test flow routing" checks native D8 flow accumulation against a brute-force reference that follows every cell downslope.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import numpy as np
+import pytest
+from package_Geomorphometry.flowRouting import NEIGHBOR_COLUMNS
+from package_Geomorphometry.flowRouting import NEIGHBOR_ROWS
+from package_Geomorphometry.flowRouting import accumulate_flow
+from package_Geomorphometry.flowRouting import fill_depressions
+from package_Geomorphometry.flowRouting import flow_direction_d8
+from package_Geomorphometry.flowRouting import receiver_kernel
+
+# Define a function to create a synthetic elevation surface
+def create_surface(rows=80, columns=80, seed=0):
+    generator = np.random.default_rng(seed)
+    row_grid, column_grid = np.mgrid[0:rows, 0:columns]
+    elevation = 0.5 * row_grid + 0.3 * column_grid + 2 * np.sin(row_grid / 7) * np.cos(column_grid / 5)
+    elevation = elevation + generator.uniform(0, 0.2, (rows, columns))
+    return fill_depressions(elevation.astype('float64'))
+
+# Define a function to calculate brute-force D8 accumulation
+def brute_force_accumulation(filled, cell_size):
+    rows, columns = filled.shape
+    receivers = np.full((rows, columns, 2), -1, dtype=int)
+    for row in range(rows):
+        for column in range(columns):
+            best_drop = 0
+            for k in range(8):
+                neighbor_row = row + NEIGHBOR_ROWS[k]
+                neighbor_column = column + NEIGHBOR_COLUMNS[k]
+                if not (0 <= neighbor_row < rows and 0 <= neighbor_column < columns):
+                    continue
+                distance = cell_size * (np.sqrt(2) if k % 2 == 1 else 1)
+                drop = (filled[row, column] - filled[neighbor_row, neighbor_column]) / distance
+                if drop > best_drop:
+                    best_drop = drop
+                    receivers[row, column] = (neighbor_row, neighbor_column)
+    accumulation = np.zeros((rows, columns))
+    for row in range(rows):
+        for column in range(columns):
+            current_row, current_column = receivers[row, column]
+            while current_row >= 0:
+                accumulation[current_row, current_column] += 1
+                current_row, current_column = receivers[current_row, current_column]
+    return accumulation
+
+# Test that D8 accumulation matches the brute-force reference for stored angle precisions
+@pytest.mark.parametrize('angle_type', ['float32', 'float64'])
+def test_d8_accumulation_matches_reference(angle_type):
+    filled = create_surface()
+    padded = np.pad(filled, 1, constant_values=np.nan)
+    flow_angle = flow_direction_d8(padded, 10, 1).astype(angle_type)
+    accumulation = accumulate_flow(flow_angle, filled)
+    reference = brute_force_accumulation(filled, 10)
+    assert reference.max() > 1000
+    np.testing.assert_allclose(accumulation, reference)
+
+# Test that single precision cardinal and diagonal angles route to one receiver
+def test_receiver_snaps_single_precision_angles():
+    elevation = np.zeros(9)
+    for k in range(8):
+        angle = np.full(9, np.float32(k * np.pi / 4))
+        receiver_1, receiver_2, proportion_1, proportion_2 = receiver_kernel(4, angle, elevation, 3, 3)
+        assert receiver_1 == (1 + NEIGHBOR_ROWS[k]) * 3 + 1 + NEIGHBOR_COLUMNS[k]
+        assert receiver_2 == -1
+        assert proportion_1 == 1.0 and proportion_2 == 0.0
+
+# Test the native flow function end to end against the brute-force reference
+def test_native_flow_matches_reference(tmp_path):
+    from package_Geomorphometry.calculateNativeFlow import calculate_native_flow
+    import rasterio
+    from rasterio.transform import from_origin
+    filled = create_surface()
+    elevation_raster = str(tmp_path / 'elevation.tif')
+    accumulation_raster = str(tmp_path / 'accumulation.tif')
+    profile = {'driver': 'GTiff', 'dtype': 'float32', 'nodata': -2147483648, 'count': 1,
+               'width': filled.shape[1], 'height': filled.shape[0], 'crs': 'EPSG:3338',
+               'transform': from_origin(0, 800, 10, 10)}
+    with rasterio.open(elevation_raster, 'w', **profile) as elevation_dataset:
+        elevation_dataset.write(filled.astype('float32'), 1)
+    calculate_native_flow(elevation_raster, accumulation_raster, method='D8', block_size=32)
+    with rasterio.open(elevation_raster) as elevation_dataset:
+        stored = fill_depressions(elevation_dataset.read(1).astype('float64'))
+    with rasterio.open(accumulation_raster) as accumulation_dataset:
+        accumulation = accumulation_dataset.read(1)
+    np.testing.assert_allclose(accumulation, brute_force_accumulation(stored, 10), rtol=1e-6)
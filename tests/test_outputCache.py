@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test output cache
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution.
+# Description: "Test output cache" checks that the identity of a processing function changes when a helper module that it imports within its body changes and that inputs hashed by the caller are not hashed again.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import importlib
+import linecache
+import sys
+from package_GeospatialProcessing import arcpyGeoprocessing
+from package_GeospatialProcessing import outputCache
+from package_GeospatialProcessing.outputCache import cache_geoprocessing
+from package_GeospatialProcessing.outputCache import hash_input
+from package_GeospatialProcessing.outputCache import identify_function
+from package_GeospatialProcessing.outputCache import list_dependent_modules
+from package_GeospatialProcessing.outputCache import read_cache_manifest
+
+# Define a function to write a package with a processing function that imports a helper from another package
+def write_packages(folder, helper_value):
+    (folder / 'package_Processing').mkdir(exist_ok=True)
+    (folder / 'package_Helpers').mkdir(exist_ok=True)
+    (folder / 'package_Processing' / '__init__.py').write_text('')
+    (folder / 'package_Helpers' / '__init__.py').write_text('from package_Helpers.helperModule import helper\n')
+    (folder / 'package_Helpers' / 'helperModule.py').write_text(f'def helper():\n    return {helper_value}\n')
+    (folder / 'package_Processing' / 'processModule.py').write_text(
+        'def process(**kwargs):\n'
+        '    from package_Helpers import helper\n'
+        '    import os\n'
+        '    return helper()\n')
+
+# Test that changing an imported helper changes the function identity
+def test_identity_follows_imported_helpers(tmp_path, monkeypatch):
+    write_packages(tmp_path, 1)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    process_module = importlib.import_module('package_Processing.processModule')
+    assert list_dependent_modules(process_module.process) == ['package_Helpers', 'package_Helpers.helperModule',
+                                                             'package_Processing.processModule']
+    first_identity = identify_function(process_module.process)
+    assert identify_function(process_module.process) == first_identity
+
+    # Change the helper and reload it as a new session would
+    write_packages(tmp_path, 2)
+    linecache.checkcache()
+    for module_name in [name for name in sys.modules if name.startswith(('package_Helpers', 'package_Processing'))]:
+        del sys.modules[module_name]
+    process_module = importlib.import_module('package_Processing.processModule')
+    assert identify_function(process_module.process) != first_identity
+    for module_name in [name for name in sys.modules if name.startswith(('package_Helpers', 'package_Processing'))]:
+        del sys.modules[module_name]
+
+# Test that inputs hashed by the caller are used as given and only the remaining inputs are hashed
+def test_cache_uses_caller_hashes(tmp_path, monkeypatch):
+    write_packages(tmp_path, 1)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    process_module = importlib.import_module('package_Processing.processModule')
+    shared_input = tmp_path / 'shared.tif'
+    grid_input = tmp_path / 'grid.tif'
+    output_table = tmp_path / 'grid.csv'
+    shared_input.write_bytes(b'shared')
+    grid_input.write_bytes(b'grid')
+
+    # Record hashed inputs and write outputs without arcpy
+    hashed_list = []
+    def record_hash(input_path, recorded_input=None):
+        hashed_list.append(input_path)
+        return hash_input(input_path, recorded_input)
+    def write_outputs(geoprocessing_function, check_output=True, check_input=True, **kwargs):
+        for output_path in kwargs['output_array']:
+            with open(output_path, 'w') as output_file:
+                output_file.write('output')
+    monkeypatch.setattr(outputCache, 'hash_input', record_hash)
+    monkeypatch.setattr(arcpyGeoprocessing, 'arcpy_geoprocessing', write_outputs)
+
+    # Run the function with the shared input hashed by the caller, then again with the same hash
+    input_dictionary = {str(shared_input): hash_input(str(shared_input))}
+    kwargs = {'input_array': [str(grid_input), str(shared_input)], 'output_array': [str(output_table)]}
+    assert cache_geoprocessing(process_module.process, input_dictionary=input_dictionary, **kwargs) \
+        == 'Cached 1 outputs.'
+    assert hashed_list == [str(grid_input)]
+    assert read_cache_manifest(str(output_table))['inputs'][str(shared_input)] == input_dictionary[str(shared_input)]
+    assert 'input_dictionary' not in read_cache_manifest(str(output_table))['parameters']
+    assert cache_geoprocessing(process_module.process, input_dictionary=input_dictionary, **kwargs) \
+        == 'Reused 1 current outputs.'
+    for module_name in [name for name in sys.modules if name.startswith(('package_Helpers', 'package_Processing'))]:
+        del sys.modules[module_name]
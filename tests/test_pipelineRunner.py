@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test pipeline runner
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution.
+# Description: "Test pipeline runner" checks that stages with shared outputs are rejected, folder outputs are rebuilt when their inputs change, slow input checks do not delay independent stages, stages that share a workspace run one at a time, and failed stages are not recorded as current.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import os
+import sys
+import time
+import pytest
+from package_GeospatialProcessing import pipelineRunner
+from package_GeospatialProcessing.pipelineRunner import build_stage_graph
+from package_GeospatialProcessing.pipelineRunner import define_stage
+from package_GeospatialProcessing.pipelineRunner import run_pipeline
+
+# Define a stage script that records its start and end times, writes an output folder, and exits with a code
+STAGE_SCRIPT = '''
+import os, sys, time
+output_folder, trace_file, exit_code = sys.argv[1], sys.argv[2], int(sys.argv[3])
+with open(trace_file, 'a') as trace:
+    trace.write(f'start {os.path.basename(output_folder)} {time.time()}\\n')
+time.sleep(0.3)
+os.makedirs(output_folder, exist_ok=True)
+with open(os.path.join(output_folder, 'output.txt'), 'w') as output:
+    output.write('output')
+with open(trace_file, 'a') as trace:
+    trace.write(f'end {os.path.basename(output_folder)} {time.time()}\\n')
+sys.exit(exit_code)
+'''
+
+# Define a stage script that copies its input into an output folder only if the copy does not already exist
+SKIP_SCRIPT = '''
+import os, sys
+input_file, output_folder = sys.argv[1], sys.argv[2]
+os.makedirs(output_folder, exist_ok=True)
+output_file = os.path.join(output_folder, 'copy.txt')
+if os.path.exists(output_file) == 0:
+    with open(input_file) as source, open(output_file, 'w') as output:
+        output.write(source.read())
+'''
+
+# Define a function to create a test stage
+def create_stage(folder, name, exit_code=0, workspace_list=None):
+    script_path = os.path.join(folder, 'stage.py')
+    if os.path.exists(script_path) == 0:
+        with open(script_path, 'w') as script_file:
+            script_file.write(STAGE_SCRIPT)
+        with open(os.path.join(folder, 'input.txt'), 'w') as input_file:
+            input_file.write('input')
+    return define_stage(name,
+                        [sys.executable, script_path, os.path.join(folder, name), os.path.join(folder, 'trace.txt'),
+                         str(exit_code)],
+                        [os.path.join(folder, 'input.txt')],
+                        [os.path.join(folder, name)],
+                        workspace_list=workspace_list)
+
+# Test that stages cannot write the same output
+def test_shared_outputs_are_rejected(tmp_path):
+    first_stage = create_stage(str(tmp_path), 'first')
+    second_stage = create_stage(str(tmp_path), 'second')
+    second_stage['outputs'] = first_stage['outputs']
+    with pytest.raises(ValueError):
+        build_stage_graph([first_stage, second_stage])
+
+# Test that stages sharing a workspace do not overlap in time
+def test_shared_workspace_runs_serially(tmp_path):
+    workspace = str(tmp_path / 'work.gdb')
+    stage_list = [create_stage(str(tmp_path), 'first', workspace_list=[workspace]),
+                  create_stage(str(tmp_path), 'second', workspace_list=[workspace])]
+    status_dictionary = run_pipeline(stage_list, str(tmp_path / 'logs'), cores=8)
+    assert status_dictionary == {'first': 'completed', 'second': 'completed'}
+    with open(tmp_path / 'trace.txt') as trace:
+        events = sorted((float(time), event) for event, name, time in (line.split() for line in trace))
+    assert [event for time, event in events] == ['start', 'end', 'start', 'end']
+
+# Test that a stage exiting with an error is rerun even when its output exists
+def test_failed_stage_is_not_current(tmp_path):
+    stage_list = [create_stage(str(tmp_path), 'failing', exit_code=1)]
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['failing'] == 'failed'
+    assert os.path.exists(tmp_path / 'failing')
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['failing'] == 'failed'
+
+# Test that a folder output is rebuilt when its input changes even if the stage skips existing files
+def test_changed_input_rebuilds_folder_output(tmp_path):
+    script_path = tmp_path / 'skip.py'
+    script_path.write_text(SKIP_SCRIPT)
+    input_file = tmp_path / 'input.txt'
+    input_file.write_text('first')
+    output_folder = tmp_path / 'output'
+    stage_list = [define_stage('copy', [sys.executable, str(script_path), str(input_file), str(output_folder)],
+                               [str(input_file)], [str(output_folder)])]
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['copy'] == 'completed'
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['copy'] == 'current'
+    input_file.write_text('second')
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['copy'] == 'completed'
+    assert (output_folder / 'copy.txt').read_text() == 'second'
+    assert run_pipeline(stage_list, str(tmp_path / 'logs'))['copy'] == 'current'
+
+# Test that a stage whose inputs are slow to hash does not delay an independent stage
+def test_slow_check_does_not_delay_dispatch(tmp_path, monkeypatch):
+    check_stage = pipelineRunner.check_stage
+    check_end = dict()
+    def slow_check(stage):
+        if stage['name'] == 'slow':
+            time.sleep(1)
+        check_end[stage['name']] = time.time()
+        return check_stage(stage)
+    monkeypatch.setattr(pipelineRunner, 'check_stage', slow_check)
+    stage_list = [create_stage(str(tmp_path), 'slow'), create_stage(str(tmp_path), 'fast')]
+    status_dictionary = run_pipeline(stage_list, str(tmp_path / 'logs'), cores=8)
+    assert status_dictionary == {'slow': 'completed', 'fast': 'completed'}
+    with open(tmp_path / 'trace.txt') as trace:
+        start_dictionary = {name: float(event_time) for event, name, event_time in (line.split() for line in trace)
+                            if event == 'start'}
+    assert start_dictionary['fast'] < check_end['slow']
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test raster expression
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Test raster expression" checks that conditional statements parsed from where clauses, operations with no data, and fused expressions evaluated block by block match the same calculations in numpy, and that shared nodes and rasters are evaluated and read once per block.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+from package_GeospatialProcessing import rasterBlocks
+from package_GeospatialProcessing import rasterExpression
+from package_GeospatialProcessing.rasterExpression import cell_mean
+from package_GeospatialProcessing.rasterExpression import con
+from package_GeospatialProcessing.rasterExpression import evaluate_expression
+from package_GeospatialProcessing.rasterExpression import evaluate_node
+from package_GeospatialProcessing.rasterExpression import extract_by_mask
+from package_GeospatialProcessing.rasterExpression import integer
+from package_GeospatialProcessing.rasterExpression import is_null
+from package_GeospatialProcessing.rasterExpression import list_rasters
+from package_GeospatialProcessing.rasterExpression import map_algebra
+from package_GeospatialProcessing.rasterExpression import raster_input
+from package_GeospatialProcessing.rasterExpression import set_null
+from package_GeospatialProcessing.rasterExpression import where_clause
+
+# Define integer class values with no data and continuous values with no data
+GENERATOR = np.random.default_rng(7)
+CLASS_VALUES = GENERATOR.integers(0, 8, (40, 35)).astype('float64')
+CLASS_VALUES[GENERATOR.random((40, 35)) < 0.1] = np.nan
+CONTINUOUS_VALUES = GENERATOR.normal(0, 3, (40, 35))
+CONTINUOUS_VALUES[GENERATOR.random((40, 35)) < 0.1] = np.nan
+CONTINUOUS_VALUES[0, :5] = 0
+
+# Define a function to evaluate an expression on the test values
+def evaluate(expression):
+    block_values = {('class.tif', 1): CLASS_VALUES, ('continuous.tif', 1): CONTINUOUS_VALUES}
+    return evaluate_node(expression, block_values, CLASS_VALUES.shape, {})
+
+# Define a function to set cells to NaN where any input is NaN
+def propagate_nan(result, *inputs):
+    result = np.asarray(result, dtype='float64').copy()
+    for values in inputs:
+        result[np.isnan(values)] = np.nan
+    return result
+
+# Test that where clauses match the same conditions in numpy with And taking precedence over Or
+@pytest.mark.parametrize('statement, expected', [
+    ('VALUE = 1 Or VALUE = 2', lambda values: (values == 1) | (values == 2)),
+    ('VALUE >= 2 And VALUE < 5', lambda values: (values >= 2) & (values < 5)),
+    ('VALUE <> 3', lambda values: values != 3),
+    ('value > 6 or VALUE = 0 AND VALUE <= 4', lambda values: (values > 6) | ((values == 0) & (values <= 4))),
+    ('VALUE < 2 And VALUE >= 1 Or VALUE > 3 And VALUE <= 4.5',
+     lambda values: ((values < 2) & (values >= 1)) | ((values > 3) & (values <= 4.5))),
+    ('VALUE > -1.5', lambda values: values > -1.5)])
+def test_where_clause_matches_numpy(statement, expected):
+    with np.errstate(invalid='ignore'):
+        expected_values = propagate_nan(expected(CLASS_VALUES), CLASS_VALUES)
+    np.testing.assert_array_equal(evaluate(where_clause(raster_input('class.tif'), statement)), expected_values)
+
+# Test that a where clause that cannot be parsed exits with an error
+def test_where_clause_rejects_statement():
+    with pytest.raises(SystemExit):
+        where_clause(raster_input('class.tif'), 'VALUE IN (1, 2)')
+
+# Test that operations follow the no data rules of the equivalent Spatial Analyst tools
+def test_operations_propagate_no_data():
+    classes = raster_input('class.tif')
+    continuous = raster_input('continuous.tif')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Arithmetic and comparisons are no data where either input is no data and division by zero is no data
+        np.testing.assert_array_equal(evaluate(map_algebra('+', classes, continuous)), CLASS_VALUES + CONTINUOUS_VALUES)
+        np.testing.assert_array_equal(evaluate(map_algebra('/', classes, continuous)),
+                                      np.where(CONTINUOUS_VALUES == 0, np.nan, CLASS_VALUES / CONTINUOUS_VALUES))
+        np.testing.assert_array_equal(evaluate(map_algebra('>', continuous, classes)),
+                                      propagate_nan(CONTINUOUS_VALUES > CLASS_VALUES, CLASS_VALUES, CONTINUOUS_VALUES))
+        np.testing.assert_array_equal(evaluate(map_algebra('|', classes, continuous)),
+                                      propagate_nan((CLASS_VALUES != 0) | (CONTINUOUS_VALUES != 0),
+                                                    CLASS_VALUES, CONTINUOUS_VALUES))
+        # Con is no data where the condition is no data and where the false value is omitted
+        condition = map_algebra('>', continuous, 0)
+        np.testing.assert_array_equal(evaluate(con(condition, classes, 5)),
+                                      propagate_nan(np.where(CONTINUOUS_VALUES > 0, CLASS_VALUES, 5), CONTINUOUS_VALUES))
+        np.testing.assert_array_equal(evaluate(con(condition, 1)),
+                                      propagate_nan(np.where(CONTINUOUS_VALUES > 0, 1, np.nan), CONTINUOUS_VALUES))
+        # Set null is no data where the condition is true or no data
+        np.testing.assert_array_equal(evaluate(set_null(condition, classes)),
+                                      np.where((CONTINUOUS_VALUES > 0) | np.isnan(CONTINUOUS_VALUES), np.nan,
+                                               CLASS_VALUES))
+    # Is null, integer, extract by mask, and cell mean
+    np.testing.assert_array_equal(evaluate(is_null(classes)), np.isnan(CLASS_VALUES).astype('float64'))
+    np.testing.assert_array_equal(evaluate(integer(continuous)), np.trunc(CONTINUOUS_VALUES))
+    np.testing.assert_array_equal(evaluate(extract_by_mask(continuous, classes)),
+                                  propagate_nan(CONTINUOUS_VALUES, CLASS_VALUES))
+    stack = np.stack([CLASS_VALUES, CONTINUOUS_VALUES])
+    count = np.isfinite(stack).sum(axis=0)
+    expected_mean = np.where(count > 0, np.nansum(stack, axis=0) / np.maximum(count, 1), np.nan)
+    np.testing.assert_allclose(evaluate(cell_mean([classes, continuous])), expected_mean)
+
+# Test that shared nodes are evaluated once per block and rasters are listed once
+def test_shared_nodes_are_evaluated_once(monkeypatch):
+    evaluate_original = rasterExpression.evaluate_node
+    operation_list = []
+    def count_evaluation(node, block_values, shape, cache):
+        if isinstance(node, dict) and id(node) not in cache:
+            operation_list.append(node['operation'])
+        return evaluate_original(node, block_values, shape, cache)
+    monkeypatch.setattr(rasterExpression, 'evaluate_node', count_evaluation)
+
+    # Use one sum in the condition and both branches of a conditional
+    total = map_algebra('+', raster_input('class.tif'), raster_input('continuous.tif'))
+    expression = con(map_algebra('>', total, 0), total, map_algebra('-', 0, total))
+    assert sorted(list_rasters(expression)) == [('class.tif', 1), ('continuous.tif', 1)]
+    with np.errstate(invalid='ignore'):
+        total_values = CLASS_VALUES + CONTINUOUS_VALUES
+        np.testing.assert_array_equal(count_evaluation(expression, {('class.tif', 1): CLASS_VALUES,
+                                                                    ('continuous.tif', 1): CONTINUOUS_VALUES},
+                                                       CLASS_VALUES.shape, {}),
+                                      propagate_nan(np.abs(total_values), total_values))
+    assert sorted(operation_list) == ['con', 'operator', 'operator', 'operator', 'raster', 'raster']
+
+# Test that a fused expression evaluated in blocks matches numpy and reads each raster once per block
+def test_expression_blocks_match_numpy(tmp_path, monkeypatch):
+    profile = {'driver': 'GTiff', 'height': 40, 'width': 35, 'count': 1, 'dtype': 'float32', 'crs': 'EPSG:3338',
+               'transform': from_origin(0, 400, 10, 10), 'nodata': -9999}
+    for name, values in [('class.tif', CLASS_VALUES), ('continuous.tif', CONTINUOUS_VALUES)]:
+        with rasterio.open(str(tmp_path / name), 'w', **profile) as dataset:
+            dataset.write(np.where(np.isnan(values), -9999, values).astype('float32'), 1)
+
+    # Count the blocks read from each raster
+    read_original = rasterBlocks.read_aligned_block
+    read_list = []
+    def count_read(dataset, reference_dataset, block, halo=0, band=1):
+        read_list.append((dataset.name, block))
+        return read_original(dataset, reference_dataset, block, halo=halo, band=band)
+    monkeypatch.setattr(rasterBlocks, 'read_aligned_block', count_read)
+
+    # Scale continuous values in classes 1 and 2 and set other classes to the class value
+    classes = raster_input(str(tmp_path / 'class.tif'))
+    continuous = raster_input(str(tmp_path / 'continuous.tif'))
+    expression = con(where_clause(classes, 'VALUE = 1 Or VALUE = 2'),
+                     map_algebra('*', raster_input(str(tmp_path / 'continuous.tif')), 10),
+                     map_algebra('+', classes, map_algebra('*', is_null(continuous), 100)))
+    evaluate_expression(expression, str(tmp_path / 'class.tif'), str(tmp_path / 'output.tif'), block_size=16)
+    with rasterio.open(str(tmp_path / 'output.tif')) as dataset:
+        output_values = dataset.read(1)
+
+    # Calculate the same expression in numpy
+    continuous_values = CONTINUOUS_VALUES.astype('float32').astype('float64')
+    with np.errstate(invalid='ignore'):
+        expected = np.where((CLASS_VALUES == 1) | (CLASS_VALUES == 2), continuous_values * 10,
+                            CLASS_VALUES + np.isnan(continuous_values) * 100)
+    expected[np.isnan(CLASS_VALUES)] = np.nan
+    expected_values = np.where(np.isnan(expected), -32768, np.trunc(np.nan_to_num(expected))).astype('int16')
+    np.testing.assert_array_equal(output_values, expected_values)
+    assert len(read_list) == 2 * 9
+    assert len(set(read_list)) == len(read_list)
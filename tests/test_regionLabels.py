@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test region labels
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Test region labels" checks that regions labelled block by block and merged across block edges with union-find match four-connected regions found by a breadth-first search of the whole raster, and that the minimum-count sieve keeps retained regions and fills removed cells from the nearest retained cell.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import numpy as np
+import pytest
+import rasterio
+from collections import deque
+from rasterio.transform import from_origin
+from package_GeospatialProcessing.calculateNativeSieve import calculate_native_sieve
+from package_GeospatialProcessing.rasterBlocks import generate_blocks
+from package_GeospatialProcessing.regionLabels import label_regions
+
+# Define a function to write a single band raster
+def write_raster(raster_path, values, nodata):
+    profile = {'driver': 'GTiff',
+               'height': values.shape[0],
+               'width': values.shape[1],
+               'count': 1,
+               'dtype': values.dtype,
+               'crs': 'EPSG:3338',
+               'transform': from_origin(0, 1000, 10, 10),
+               'nodata': nodata}
+    with rasterio.open(raster_path, 'w', **profile) as dataset:
+        dataset.write(values, 1)
+
+# Define a function to label four-connected regions of equal value with a breadth-first search
+def search_regions(values, valid):
+    rows, columns = values.shape
+    regions = np.full((rows, columns), -1, dtype=int)
+    sizes = []
+    for row in range(rows):
+        for column in range(columns):
+            if not valid[row, column] or regions[row, column] >= 0:
+                continue
+            region = len(sizes)
+            regions[row, column] = region
+            queue = deque([(row, column)])
+            size = 0
+            while queue:
+                cell_row, cell_column = queue.popleft()
+                size += 1
+                for neighbor_row, neighbor_column in [(cell_row - 1, cell_column), (cell_row + 1, cell_column),
+                                                      (cell_row, cell_column - 1), (cell_row, cell_column + 1)]:
+                    if 0 <= neighbor_row < rows and 0 <= neighbor_column < columns \
+                            and valid[neighbor_row, neighbor_column] \
+                            and regions[neighbor_row, neighbor_column] < 0 \
+                            and values[neighbor_row, neighbor_column] == values[cell_row, cell_column]:
+                        regions[neighbor_row, neighbor_column] = region
+                        queue.append((neighbor_row, neighbor_column))
+            sizes.append(size)
+    return regions, np.array(sizes, dtype=int)
+
+# Define a function to create categorical values with no data
+def create_classes(rows=50, columns=45, seed=0):
+    generator = np.random.default_rng(seed)
+    values = generator.integers(1, 4, (rows, columns)).astype('int16')
+    values[generator.random((rows, columns)) < 0.1] = -1
+    return values
+
+# Define a function to create a comb of one value whose teeth cross block edges and join only at the last row
+def create_comb(rows=50, columns=45):
+    values = np.full((rows, columns), 2, dtype='int16')
+    values[:, ::2] = 1
+    values[-1, :] = 1
+    values[0, 1::4] = -1
+    return values
+
+# Test that regions labelled in blocks match regions found by a breadth-first search of the whole raster
+@pytest.mark.parametrize('create_values', [create_classes, create_comb])
+@pytest.mark.parametrize('excluded_value', [None, 2])
+def test_labels_match_breadth_first_search(tmp_path, create_values, excluded_value):
+    values = create_values()
+    rows, columns = values.shape
+    raster_path = str(tmp_path / 'classes.tif')
+    write_raster(raster_path, values, -1)
+
+    # Label regions with blocks of 16 cells
+    labels = np.empty((rows, columns), dtype=np.int64)
+    with rasterio.open(raster_path) as dataset:
+        parent, region_counts = label_regions(dataset, dataset, labels, generate_blocks(rows, columns, 16),
+                                              excluded_value=excluded_value)
+
+    # Compare the partition of cells and the region sizes with the breadth-first search
+    valid = values != -1
+    if excluded_value is not None:
+        valid = valid & (values != excluded_value)
+    regions, sizes = search_regions(values, valid)
+    np.testing.assert_array_equal(labels < 0, ~valid)
+    region_labels = parent[labels[valid]]
+    pairs = set(zip(regions[valid].tolist(), region_labels.tolist()))
+    assert len(pairs) == len(sizes)
+    assert len(set(region_labels.tolist())) == len(sizes)
+    np.testing.assert_array_equal(region_counts[labels[valid]], sizes[regions[valid]])
+
+# Test that the sieve keeps regions above the minimum count and fills removed cells from the nearest retained cell
+def test_sieve_fills_from_nearest_retained_cell(tmp_path):
+    generator = np.random.default_rng(5)
+    rows, columns = 40, 36
+    # Create patches of classes with scattered single cells and no data
+    values = np.kron(generator.integers(1, 4, (8, 6)), np.ones((5, 6), dtype=int)).astype('int16')
+    noise = generator.random((rows, columns)) < 0.08
+    values[noise] = generator.integers(4, 6, noise.sum())
+    values[generator.random((rows, columns)) < 0.05] = -1
+    input_raster = str(tmp_path / 'classes.tif')
+    output_raster = str(tmp_path / 'sieved.tif')
+    write_raster(input_raster, values, -1)
+    minimum_count = 4
+    calculate_native_sieve(input_raster, output_raster, minimum_count, block_size=16)
+    with rasterio.open(output_raster) as dataset:
+        output_values = dataset.read(1)
+        assert dataset.nodata == -1
+
+    # Compare retained and filled cells with a brute-force search of retained cells
+    valid = values != -1
+    regions, sizes = search_regions(values, valid)
+    retained = valid.copy()
+    retained[valid] = sizes[regions[valid]] > minimum_count
+    assert 0 < (valid & ~retained).sum() < retained.sum()
+    np.testing.assert_array_equal(output_values[retained], values[retained])
+    np.testing.assert_array_equal(output_values[~valid], -1)
+    retained_rows, retained_columns = np.nonzero(retained)
+    for row, column in zip(*np.nonzero(valid & ~retained)):
+        distance = np.hypot(retained_rows - row, retained_columns - column)
+        nearest = np.abs(distance - distance.min()) < 1e-9
+        assert output_values[row, column] in set(values[retained_rows[nearest], retained_columns[nearest]].tolist())
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test stream download
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with Requests installed.
+# Description: "Test stream download" checks that streamed downloads resume with range requests, restart when the server ignores the range or the file changed since the partial download started, remove partial downloads that cannot be resumed, reject downloads that do not match their size or checksum, and are retried after an interrupted response.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import hashlib
+import os
+import pytest
+import requests
+from package_GeospatialProcessing.streamDownload import download_files
+from package_GeospatialProcessing.streamDownload import stream_download
+
+# Define file content
+FILE_DATA = os.urandom(250000)
+
+# Define a function to write a partial download
+def write_partial(output_file, data):
+    with open(output_file + '.partial', 'wb') as partial:
+        partial.write(data)
+
+# Test that a partial download resumes from its current size
+def test_stream_download_resumes(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    output_file = str(tmp_path / 'file.bin')
+    write_partial(output_file, FILE_DATA[:50000])
+    with requests.Session() as session:
+        downloaded = stream_download(session, file_server.url('/file.bin'), output_file,
+                                     expected_size=len(FILE_DATA), expected_md5=hashlib.md5(FILE_DATA).hexdigest())
+    assert downloaded == len(FILE_DATA) - 50000
+    assert file_server.request_list == [('/file.bin', 'bytes=50000-')]
+    assert open(output_file, 'rb').read() == FILE_DATA
+    assert os.path.exists(output_file + '.partial') is False
+
+# Test that a download restarts from the beginning when the server ignores the range
+def test_stream_download_restarts_without_range(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    file_server.ignore_range.add('/file.bin')
+    output_file = str(tmp_path / 'file.bin')
+    write_partial(output_file, FILE_DATA[:50000])
+    with requests.Session() as session:
+        downloaded = stream_download(session, file_server.url('/file.bin'), output_file)
+    assert downloaded == len(FILE_DATA)
+    assert open(output_file, 'rb').read() == FILE_DATA
+
+# Test that an interrupted download restarts from the beginning when the file changed on the server
+def test_stream_download_restarts_changed_file(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    file_server.truncate_once.add('/file.bin')
+    output_file = str(tmp_path / 'file.bin')
+    with requests.Session() as session:
+        with pytest.raises(requests.exceptions.RequestException):
+            stream_download(session, file_server.url('/file.bin'), output_file, chunk_size=1024)
+        assert 0 < os.path.getsize(output_file + '.partial') < len(FILE_DATA)
+        # Replace the file with different content of the same size
+        changed_data = os.urandom(len(FILE_DATA))
+        file_server.files['/file.bin'] = changed_data
+        stream_download(session, file_server.url('/file.bin'), output_file)
+    assert file_server.request_list[-1][1] is not None
+    assert open(output_file, 'rb').read() == changed_data
+    assert os.path.exists(output_file + '.partial.validator') is False
+
+# Test that a partial download that cannot be resumed is removed
+def test_stream_download_removes_unsatisfiable_partial(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    output_file = str(tmp_path / 'file.bin')
+    write_partial(output_file, FILE_DATA + b'extra')
+    with requests.Session() as session:
+        with pytest.raises(ValueError, match='could not be resumed'):
+            stream_download(session, file_server.url('/file.bin'), output_file)
+        assert os.path.exists(output_file + '.partial') is False
+        # The next attempt downloads the full file
+        stream_download(session, file_server.url('/file.bin'), output_file)
+    assert file_server.request_list == [('/file.bin', f'bytes={len(FILE_DATA) + 5}-'), ('/file.bin', None)]
+    assert open(output_file, 'rb').read() == FILE_DATA
+
+# Test that a download shorter than the expected size is kept as a partial download
+def test_stream_download_rejects_size(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    output_file = str(tmp_path / 'file.bin')
+    with requests.Session() as session:
+        with pytest.raises(ValueError, match='incomplete'):
+            stream_download(session, file_server.url('/file.bin'), output_file, expected_size=len(FILE_DATA) + 100)
+    assert os.path.exists(output_file) is False
+    assert os.path.getsize(output_file + '.partial') == len(FILE_DATA)
+
+# Test that a download that does not match its checksum is removed
+def test_stream_download_rejects_checksum(file_server, tmp_path):
+    file_server.files['/file.bin'] = FILE_DATA
+    output_file = str(tmp_path / 'file.bin')
+    with requests.Session() as session:
+        with pytest.raises(ValueError, match='checksum'):
+            stream_download(session, file_server.url('/file.bin'), output_file,
+                            expected_size=len(FILE_DATA), expected_md5='0' * 32)
+    assert os.path.exists(output_file) is False
+    assert os.path.exists(output_file + '.partial') is False
+
+# Test that interrupted downloads are retried and existing files are skipped
+def test_download_files_retries_interrupted(file_server, tmp_path):
+    file_server.files['/first.bin'] = FILE_DATA
+    file_server.files['/second.bin'] = FILE_DATA[::-1]
+    file_server.files['/third.bin'] = FILE_DATA[:1000]
+    file_server.truncate_once.add('/first.bin')
+    (tmp_path / 'third.bin').write_bytes(FILE_DATA[:1000])
+    download_list = [{'url': file_server.url(f'/{name}'), 'output': str(tmp_path / name), 'size': len(data)}
+                     for name, data in [('first.bin', FILE_DATA), ('second.bin', FILE_DATA[::-1]),
+                                        ('third.bin', FILE_DATA[:1000])]]
+    status_dictionary = download_files(download_list, requests.Session, workers=2, retry_count=1)
+    assert status_dictionary == {'first.bin': 'completed', 'second.bin': 'completed', 'third.bin': 'skipped'}
+    assert [path for path, range_header in file_server.request_list].count('/first.bin') == 2
+    assert (tmp_path / 'first.bin').read_bytes() == FILE_DATA
+    assert (tmp_path / 'second.bin').read_bytes() == FILE_DATA[::-1]
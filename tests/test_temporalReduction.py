@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# ---------------------------------------------------------------------------
+# Test temporal reduction
+# Author: Timm Nawrocki
+# Last Updated: 2026-10-19
+# Usage: Must be executed with pytest in an Anaconda Python 3.9+ distribution with numpy and rasterio.
+# Description: "Test temporal reduction" checks the mean, standard deviation, Theil-Sen slope, Mann-Kendall statistic and significance, and change of each cell against direct calculations from the time series of the cell, including years without data, tied values, and cells below the minimum count, both for the kernel and for a time series raster reduced in parallel blocks.
+# ---------------------------------------------------------------------------
+
+# Import packages
+import math
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+from package_GeospatialProcessing.temporalReduction import reduce_time_series
+from package_GeospatialProcessing.temporalReduction import reduction_kernel
+from package_GeospatialProcessing.temporalReduction import reduction_names
+from package_GeospatialProcessing.timeSeriesRaster import write_time_series_years
+
+# Define years with a gap
+YEARS = [2000, 2001, 2002, 2003, 2004, 2006, 2007, 2008, 2010, 2011]
+
+# Define a function to calculate the reductions of one time series directly
+def reduce_series(values, years, minimum_count):
+    valid = ~np.isnan(values)
+    series = values[valid]
+    series_years = np.asarray(years, dtype='float64')[valid]
+    count = len(series)
+    if count < max(minimum_count, 2):
+        return [np.nan] * len(reduction_names)
+    first, second = np.triu_indices(count, 1)
+    slopes = (series[second] - series[first]) / (series_years[second] - series_years[first])
+    statistic = np.sign(series[second] - series[first]).sum()
+    tie_counts = np.unique(series, return_counts=True)[1]
+    variance = (count * (count - 1) * (2 * count + 5)
+                - (tie_counts * (tie_counts - 1) * (2 * tie_counts + 5)).sum()) / 18
+    if variance > 0:
+        z_statistic = (statistic - np.sign(statistic)) / math.sqrt(variance)
+        p_value = math.erfc(abs(z_statistic) / math.sqrt(2))
+    else:
+        z_statistic = np.nan
+        p_value = np.nan
+    return [series.mean(), series.std(), np.median(slopes), z_statistic, p_value, series[-1] - series[0]]
+
+# Define a function to create time series values with trends, ties, and years without data
+def create_series(cell_count, seed=0):
+    generator = np.random.default_rng(seed)
+    trend = generator.normal(0, 0.5, cell_count)
+    values = trend[None, :] * (np.array(YEARS)[:, None] - 2000) + generator.normal(10, 2, (len(YEARS), cell_count))
+    # Round values so that some series contain tied values
+    values = np.round(values)
+    values[generator.random(values.shape) < 0.2] = np.nan
+    values[:, 0] = 5
+    values[:-3, 1] = np.nan
+    values[-3:, 1] = [4, 6, 9]
+    values[:, 2] = np.nan
+    return values
+
+# Test that the kernel matches direct calculations for each cell
+@pytest.mark.parametrize('minimum_count', [2, 5])
+def test_kernel_matches_direct_reduction(minimum_count):
+    values = create_series(300)
+    output = np.full((len(reduction_names), values.shape[1]), np.nan)
+    reduced = reduction_kernel(values, np.array(YEARS, dtype='float64'), minimum_count, output)
+    expected = np.array([reduce_series(values[:, cell], YEARS, minimum_count) for cell in range(values.shape[1])]).T
+    np.testing.assert_allclose(output, expected, rtol=1e-12, atol=1e-12)
+    assert reduced == np.isfinite(expected[0]).sum()
+
+    # Check that constant series have no trend statistic and short series are not reduced
+    assert output[2, 0] == 0 and np.isnan(output[3, 0]) and np.isnan(output[4, 0])
+    assert np.isnan(output[:, 2]).all()
+    assert np.isnan(output[0, 1]) == (minimum_count > 3)
+
+# Test that a time series raster reduced in parallel blocks matches direct calculations for each cell
+def test_reduced_raster_matches_direct_reduction(tmp_path):
+    rows, columns = 40, 35
+    values = create_series(rows * columns, seed=1)
+    profile = {'driver': 'GTiff', 'height': rows, 'width': columns, 'count': len(YEARS), 'dtype': 'float32',
+               'crs': 'EPSG:3338', 'transform': from_origin(0, 400, 10, 10), 'nodata': -9999}
+    input_raster = str(tmp_path / 'series.tif')
+    output_raster = str(tmp_path / 'reduced.tif')
+    with rasterio.open(input_raster, 'w', **profile) as dataset:
+        dataset.write(np.where(np.isnan(values), -9999, values).reshape(len(YEARS), rows, columns).astype('float32'))
+        write_time_series_years(dataset, YEARS)
+    reduce_time_series(minimum_count=4, workers=2, block_size=16, input_array=[input_raster],
+                       output_array=[output_raster])
+
+    # Compare each band with the direct calculations
+    expected = np.array([reduce_series(values[:, cell], YEARS, 4) for cell in range(rows * columns)]).T
+    expected = expected.reshape(len(reduction_names), rows, columns)
+    with rasterio.open(output_raster) as dataset:
+        assert list(dataset.descriptions) == reduction_names
+        output_values = dataset.read(masked=True)
+    for index in range(len(reduction_names)):
+        np.testing.assert_array_equal(output_values.mask[index], np.isnan(expected[index]))
+        np.testing.assert_allclose(output_values[index].compressed(), expected[index][~np.isnan(expected[index])],
+                                   rtol=1e-6, atol=1e-6)